@@ -1,29 +1,62 @@
 """
 셀 API 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Dict, Any, Optional, Union
 from pydantic import BaseModel
 
 from app.api.schemas import (
-    CellCreate, CellUpdate, CellResponse, CellResolvedResponse
+    CellCreate, CellUpdate, CellResponse, CellResolvedResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.cell_service import CellService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, CELL_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 from app.services.world_editor.id_generator import IDGenerator
 
 router = APIRouter()
 cell_service = CellService()
-
-
-@router.get("/", response_model=List[CellResponse])
-async def get_cells():
-    """모든 셀 조회"""
+cell_list = ListQueryService(CELL_LIST)
+
+
+@router.get("/", response_model=Union[List[CellResponse], ListPageResponse])
+async def get_cells(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: cell_id,cell_name)")
+):
+    """모든 셀 조회 (limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await cell_list.fetch_page(limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         return await cell_service.get_all_cells()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get cells: {str(e)}")
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_cells(request: BatchGetRequest):
+    """여러 셀 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await cell_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_cells(request: BatchUpdateRequest):
+    """여러 셀 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await cell_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/location/{location_id}", response_model=List[CellResponse])
 async def get_cells_by_location(location_id: str):
     """특정 위치의 모든 셀 조회"""
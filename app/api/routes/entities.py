@@ -1,28 +1,61 @@
 """
 엔티티(NPC) API 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Union
 
 from app.api.schemas import (
-    EntityCreate, EntityUpdate, EntityResponse
+    EntityCreate, EntityUpdate, EntityResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.entity_service import EntityService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, ENTITY_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 from app.services.world_editor.id_generator import IDGenerator
 
 router = APIRouter()
 entity_service = EntityService()
-
-
-@router.get("/", response_model=List[EntityResponse])
-async def get_entities():
-    """모든 엔티티 조회"""
+entity_list = ListQueryService(ENTITY_LIST)
+
+
+@router.get("/", response_model=Union[List[EntityResponse], ListPageResponse])
+async def get_entities(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: entity_id,entity_name)")
+):
+    """모든 엔티티 조회 (limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await entity_list.fetch_page(limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         return await entity_service.get_all_entities()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get entities: {str(e)}")
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_entities(request: BatchGetRequest):
+    """여러 엔티티 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await entity_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_entities(request: BatchUpdateRequest):
+    """여러 엔티티 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await entity_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/cell/{cell_id}", response_model=List[EntityResponse])
 async def get_entities_by_cell(cell_id: str):
     """특정 셀의 모든 엔티티 조회"""
@@ -2,27 +2,61 @@
 Items API 라우터
 """
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from app.api.schemas import (
-    ItemCreate, ItemUpdate, ItemResponse
+    ItemCreate, ItemUpdate, ItemResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.item_service import ItemService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, ITEM_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 
 router = APIRouter()
 item_service = ItemService()
+item_list = ListQueryService(ITEM_LIST)
 
 
-@router.get("/", response_model=List[ItemResponse])
+@router.get("/", response_model=Union[List[ItemResponse], ListPageResponse])
 async def get_items(
-    item_type: Optional[str] = Query(None, description="아이템 타입 필터")
+    item_type: Optional[str] = Query(None, description="아이템 타입 필터"),
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: item_id,base_property_name)")
 ):
-    """모든 Item 조회 (필터링 가능)"""
+    """모든 Item 조회 (필터링 가능, limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await item_list.fetch_page(
+                limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields), filters={'item_type': item_type}
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     if item_type:
         return await item_service.get_items_by_type(item_type)
     return await item_service.get_all_items()
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_items(request: BatchGetRequest):
+    """여러 Item 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await item_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_items(request: BatchUpdateRequest):
+    """여러 Item 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await item_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{item_id}", response_model=ItemResponse)
 async def get_item(item_id: str):
     """특정 Item 조회"""
@@ -1,28 +1,61 @@
 """
 위치 API 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Union
 
 from app.api.schemas import (
-    LocationCreate, LocationUpdate, LocationResponse, LocationResolvedResponse
+    LocationCreate, LocationUpdate, LocationResponse, LocationResolvedResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.location_service import LocationService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, LOCATION_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 from app.services.world_editor.id_generator import IDGenerator
 
 router = APIRouter()
 location_service = LocationService()
-
-
-@router.get("/", response_model=List[LocationResponse])
-async def get_locations():
-    """모든 위치 조회"""
+location_list = ListQueryService(LOCATION_LIST)
+
+
+@router.get("/", response_model=Union[List[LocationResponse], ListPageResponse])
+async def get_locations(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: location_id,location_name)")
+):
+    """모든 위치 조회 (limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await location_list.fetch_page(limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         return await location_service.get_all_locations()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get locations: {str(e)}")
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_locations(request: BatchGetRequest):
+    """여러 위치 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await location_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_locations(request: BatchUpdateRequest):
+    """여러 위치 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await location_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/region/{region_id}", response_model=List[LocationResponse])
 async def get_locations_by_region(region_id: str):
     """특정 지역의 모든 위치 조회"""
@@ -1,27 +1,60 @@
 """
 핀 API 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Union
 
 from app.api.schemas import (
-    PinPositionCreate, PinPositionUpdate, PinPositionResponse
+    PinPositionCreate, PinPositionUpdate, PinPositionResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.pin_service import PinService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, PIN_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 
 router = APIRouter()
 pin_service = PinService()
+pin_list = ListQueryService(PIN_LIST)
 
 
-@router.get("/", response_model=List[PinPositionResponse])
-async def get_pins():
-    """모든 핀 조회"""
+@router.get("/", response_model=Union[List[PinPositionResponse], ListPageResponse])
+async def get_pins(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: pin_id,x,y)")
+):
+    """모든 핀 조회 (limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await pin_list.fetch_page(limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         return await pin_service.get_all_pins()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get pins: {str(e)}")
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_pins(request: BatchGetRequest):
+    """여러 핀 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await pin_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_pins(request: BatchUpdateRequest):
+    """여러 핀 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await pin_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{pin_id}", response_model=PinPositionResponse)
 async def get_pin(pin_id: str):
     """특정 핀 조회"""
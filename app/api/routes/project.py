@@ -2,11 +2,14 @@
 프로젝트 관리 API 라우터
 """
 from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi.responses import StreamingResponse
 from typing import Dict, Any
 import json
 
-from app.api.schemas import ProjectExportResponse, ProjectImportResponse, ValidationResponse
-from app.services.world_editor.project_service import ProjectService
+from app.api.schemas import (
+    ProjectExportResponse, ProjectImportResponse, ProjectBulkImportResponse, ValidationResponse
+)
+from app.services.world_editor.project_service import ProjectService, iter_ndjson_lines
 from app.services.world_editor.validation_service import ValidationService
 from common.utils.logger import logger
 
@@ -30,6 +33,16 @@ async def export_project():
         raise HTTPException(status_code=500, detail=f"프로젝트 내보내기 실패: {str(e)}")
 
 
+@router.get("/export/stream")
+async def export_project_stream():
+    """프로젝트 전체 데이터 NDJSON 스트리밍 내보내기 (테이블 행 단위)"""
+    return StreamingResponse(
+        project_service.stream_export(),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="project.ndjson"'}
+    )
+
+
 @router.post("/import", response_model=ProjectImportResponse)
 async def import_project(project_data: Dict[str, Any]):
     """프로젝트 데이터 가져오기"""
@@ -64,6 +77,31 @@ async def import_project_file(file: UploadFile = File(...)):
         raise HTTPException(status_code=500, detail=f"프로젝트 파일 가져오기 실패: {str(e)}")
 
 
+@router.post("/import/ndjson", response_model=ProjectBulkImportResponse)
+async def import_project_ndjson(file: UploadFile = File(...)):
+    """프로젝트 NDJSON 파일 가져오기 (스테이징 COPY + 병합, 한 트랜잭션)"""
+    async def read_chunks():
+        while True:
+            chunk = await file.read(1 << 20)
+            if not chunk:
+                break
+            yield chunk
+    
+    try:
+        result = await project_service.bulk_import(iter_ndjson_lines(read_chunks()))
+        return {
+            'success': True,
+            'stats': result['stats'],
+            'timings_ms': result['timings_ms'],
+            'message': f"프로젝트 가져오기 완료: {sum(result['stats'].values())}행"
+        }
+    except (ValueError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"유효하지 않은 NDJSON 파일: {str(e)}")
+    except Exception as e:
+        logger.error(f"프로젝트 NDJSON 가져오기 실패: {e}")
+        raise HTTPException(status_code=500, detail=f"프로젝트 NDJSON 가져오기 실패: {str(e)}")
+
+
 @router.post("/import/entities")
 async def import_entities(entities: list):
     """엔티티 데이터 가져오기"""
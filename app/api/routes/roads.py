@@ -1,27 +1,60 @@
 """
 도로 API 라우터
 """
-from fastapi import APIRouter, HTTPException
-from typing import List
+from fastapi import APIRouter, HTTPException, Query
+from typing import List, Optional, Union
 
 from app.api.schemas import (
-    RoadCreate, RoadUpdate, RoadResponse
+    RoadCreate, RoadUpdate, RoadResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.road_service import RoadService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, ROAD_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 
 router = APIRouter()
 road_service = RoadService()
+road_list = ListQueryService(ROAD_LIST)
 
 
-@router.get("/", response_model=List[RoadResponse])
-async def get_roads():
-    """모든 도로 조회"""
+@router.get("/", response_model=Union[List[RoadResponse], ListPageResponse])
+async def get_roads(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: road_id,path_coordinates)")
+):
+    """모든 도로 조회 (limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await road_list.fetch_page(limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     try:
         return await road_service.get_all_roads()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get roads: {str(e)}")
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_roads(request: BatchGetRequest):
+    """여러 도로 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await road_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_roads(request: BatchUpdateRequest):
+    """여러 도로 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await road_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/{road_id}", response_model=RoadResponse)
 async def get_road(road_id: str):
     """특정 도로 조회"""
@@ -2,23 +2,56 @@
 World Objects API 라우터
 """
 from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from app.api.schemas import (
-    WorldObjectCreate, WorldObjectUpdate, WorldObjectResponse
+    WorldObjectCreate, WorldObjectUpdate, WorldObjectResponse,
+    ListPageResponse, BatchGetRequest, BatchUpdateRequest, BatchResponse
 )
 from app.services.world_editor.world_object_service import WorldObjectService
+from app.services.world_editor.list_query_service import (
+    ListQueryService, WORLD_OBJECT_LIST, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, parse_fields
+)
 
 router = APIRouter()
 world_object_service = WorldObjectService()
+world_object_list = ListQueryService(WORLD_OBJECT_LIST)
 
 
-@router.get("/", response_model=List[WorldObjectResponse])
-async def get_world_objects():
-    """모든 World Object 조회"""
+@router.get("/", response_model=Union[List[WorldObjectResponse], ListPageResponse])
+async def get_world_objects(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE, description="페이지 크기 (지정 시 키셋 페이지 응답)"),
+    cursor: Optional[str] = Query(None, description="이전 페이지의 next_cursor"),
+    fields: Optional[str] = Query(None, description="응답 필드 (쉼표 구분, 예: object_id,object_name)")
+):
+    """모든 World Object 조회 (limit/cursor/fields 지정 시 ID 순서 키셋 페이지)"""
+    if limit or cursor or fields:
+        try:
+            return await world_object_list.fetch_page(limit or DEFAULT_PAGE_SIZE, cursor, parse_fields(fields))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    
     return await world_object_service.get_all_world_objects()
 
 
+@router.post("/batch-get", response_model=BatchResponse)
+async def batch_get_world_objects(request: BatchGetRequest):
+    """여러 World Object 일괄 조회 (요청 순서 유지)"""
+    try:
+        return await world_object_list.batch_get(request.ids, request.fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/batch", response_model=BatchResponse)
+async def batch_update_world_objects(request: BatchUpdateRequest):
+    """여러 World Object 일괄 변경 (한 트랜잭션)"""
+    try:
+        return await world_object_list.batch_update(request.updates)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router.get("/cell/{cell_id}", response_model=List[WorldObjectResponse])
 async def get_world_objects_by_cell(cell_id: str):
     """특정 Cell의 모든 World Object 조회"""
@@ -598,6 +598,34 @@ class SearchResponse(BaseModel):
     results: List[SearchResultItem]
     total: int
     entity_type_counts: Dict[str, int] = Field(default_factory=dict)
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+
+
+# =====================================================
+# 목록 페이지/일괄 처리 스키마
+# =====================================================
+
+class ListPageResponse(BaseModel):
+    """키셋 페이지 목록 응답 (fields 지정 시 해당 필드만 포함)"""
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (없으면 마지막 페이지)")
+
+
+class BatchGetRequest(BaseModel):
+    """일괄 조회 요청"""
+    ids: List[str] = Field(..., description="조회할 ID 목록 (최대 1000개)")
+    fields: Optional[List[str]] = Field(None, description="응답 필드 (없으면 전체)")
+
+
+class BatchUpdateRequest(BaseModel):
+    """일괄 변경 요청 (항목마다 기본 키 + 변경할 필드)"""
+    updates: List[Dict[str, Any]] = Field(..., description="변경 항목 목록 (최대 1000개)")
+
+
+class BatchResponse(BaseModel):
+    """일괄 조회/변경 응답"""
+    items: List[Dict[str, Any]]
+    missing: List[str] = Field(default_factory=list, description="존재하지 않는 ID")
 
 
 # =====================================================
@@ -639,6 +667,14 @@ class ProjectImportResponse(BaseModel):
     message: str
 
 
+class ProjectBulkImportResponse(BaseModel):
+    """프로젝트 NDJSON 가져오기 응답 스키마"""
+    success: bool
+    stats: Dict[str, int]
+    timings_ms: Dict[str, float] = Field(default_factory=dict, description="섹션별 스테이징+병합 시간")
+    message: str
+
+
 class ValidationResponse(BaseModel):
     """검증 응답 스키마"""
     success: bool
@@ -15,7 +15,16 @@ class DatabaseSettings(BaseSettings):
     user: str = Field(default="postgres", alias="DB_USER")
     password: str = Field(default="", alias="DB_PASSWORD")
     database: str = Field(default="rpg_engine", alias="DB_NAME")
-    
+
+    # 연결 풀 설정 (프로세스 단위 공유 풀)
+    pool_min_size: int = Field(default=2, alias="DB_POOL_MIN_SIZE")
+    pool_max_size: int = Field(default=10, alias="DB_POOL_MAX_SIZE")
+    pool_acquire_timeout: float = Field(default=30.0, alias="DB_POOL_ACQUIRE_TIMEOUT")
+    pool_max_inactive_lifetime: float = Field(default=300.0, alias="DB_POOL_MAX_INACTIVE_LIFETIME")
+    command_timeout: float = Field(default=60.0, alias="DB_COMMAND_TIMEOUT")
+    # json/jsonb 컬럼을 연결 단계에서 Python 객체로 디코딩
+    json_codecs: bool = Field(default=True, alias="DB_JSON_CODECS")
+
     model_config = {
         "env_file": ".env",
         "env_file_encoding": "utf-8",
@@ -50,7 +59,71 @@ GAME_CONFIG = {
     "max_players_per_session": 1,
     "save_interval_seconds": 300,  # 5분
     "session_timeout_minutes": 60,  # 1시간
-    "default_inventory_size": 20
+    # 메모리에 유지할 최대 GameSession 수 (app.core.session_registry)
+    "max_resident_sessions": 1000,
+    "default_inventory_size": 20,
+    # 행동/이벤트 로그 배치 기록 (database.log_sink)
+    "log_sink_queue_size": 10000,
+    "log_sink_batch_size": 500,
+    "log_sink_flush_interval_seconds": 1.0,
+    "log_sink_backpressure": "block",  # block | drop_oldest | spill_to_file
+    # TimeSystem 대기 이벤트를 game_data.time_events에 저장/복원
+    "time_event_persistence": False,
+    # TimeSystem session_states 체크포인트 주기 (게임 분)
+    "time_checkpoint_interval_minutes": 1,
+    # NPCBehavior.execute_all_routines 최대 동시 실행 NPC 수 (None이면 연결 풀 크기 기준)
+    "npc_routine_concurrency": None,
+    # 엔티티 상태 write-behind (database.entity_state_store)
+    "entity_state_write_behind": os.getenv("ENTITY_STATE_WRITE_BEHIND", "false").lower() == "true",
+    "entity_state_flush_interval_seconds": 1.0,
+    "entity_state_max_dirty_age_seconds": 5.0,  # 미기록 변경 최대 유지 시간 (크래시 시 유실 범위)
+    "entity_state_max_dirty_entities": 5000,
+    # 세션 게임 시계 session_states 기록 주기 (초, app.systems.session_clock)
+    "session_clock_flush_interval_seconds": 1.0,
+    # 게임플레이 델타 WebSocket (app.systems.session_deltas)
+    "session_delta_buffer_size": 256,  # resume 재전송 버퍼 (넘으면 스냅샷으로 재동기화)
+    "session_delta_actions_debounce_seconds": 0.05,
+    # 저장 슬롯 스냅샷 (database.save_slot_store)
+    "save_snapshot_codec": "zstd",  # zstd (zstandard 설치 시, 없으면 zlib) | zlib
+    "save_max_incremental_chain": 8,  # 전체 스냅샷 뒤에 이어 붙일 최대 증분 저장 수
+    "save_incremental_max_ratio": 0.5,  # 바뀐 행 비율이 이 값을 넘으면 전체 스냅샷으로 저장
+    # 유휴 세션 회수 (app.core.session_reaper, session_timeout_minutes 기준)
+    "session_reaper_enabled": os.getenv("SESSION_REAPER_ENABLED", "false").lower() == "true",
+    "session_reaper_interval_seconds": 60.0,
+    "session_reaper_batch_size": 10,  # 한 번에 회수할 최대 세션 수
+    "session_reaper_pause_seconds": 0.5  # 세션 사이 대기 (DB 부하 분산)
+}
+
+# 매니저 캐시 설정 (common.utils.ttl_cache.TTLCache)
+CACHE_CONFIG = {
+    "entity": {"max_size": 20000, "ttl_seconds": 600},
+    "entity_template": {"max_size": 2000, "ttl_seconds": 300},
+    "cell": {"max_size": 5000, "ttl_seconds": 600},
+    "cell_content": {"max_size": 1000, "ttl_seconds": 60},
+    "cell_occupancy": {"max_size": 2000, "ttl_seconds": 300},
+    "effect_carrier": {"max_size": 5000, "ttl_seconds": 1800},
+    "object_state": {"max_size": 20000, "ttl_seconds": 300},
+    # ActionService: 세션별 game_cell_id -> runtime_cell_id 맵, 오브젝트 템플릿별 액션 기술자, 액션 목록 메모이즈
+    "cell_reference_map": {"max_size": 1000, "ttl_seconds": 1800},
+    "object_action_descriptor": {"max_size": 5000, "ttl_seconds": 300},
+    "available_actions": {"max_size": 2000, "ttl_seconds": 60},
+    # 월드 에디터 셀 공간 인덱스 (Entity/World Object 종류별 셀 격자)
+    "spatial_index_cell": {"max_size": 500, "ttl_seconds": 300}
+}
+
+# 월드 에디터 WebSocket 팬아웃 설정 (app.ui.backend.websocket_hub)
+WEBSOCKET_CONFIG = {
+    "send_queue_size": 256,  # 연결별 송신 큐 크기 (가득 차면 느린 소비자로 퇴출)
+    "send_timeout_seconds": 5.0,
+    "coalesce_interval_seconds": 0.05  # 같은 오브젝트 연속 업데이트를 합쳐 보내는 주기
+}
+
+# 요청 트레이싱 설정 (common.utils.tracing)
+TRACING_CONFIG = {
+    "enabled": os.getenv("TRACING_ENABLED", "false").lower() == "true",
+    "buffer_size": int(os.getenv("TRACING_BUFFER_SIZE", "500")),
+    # 설정 시 완료된 트레이스를 JSONL 파일로도 기록 (별도 스레드)
+    "jsonl_path": os.getenv("TRACING_JSONL_PATH") or None
 }
 
 # 로그 디렉토리 설정
@@ -4,6 +4,8 @@ import json
 import asyncio
 from datetime import datetime
 from database.connection import DatabaseConnection
+from database.entity_state_store import entity_state_store
+from app.systems.session_clock import session_clock
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
@@ -168,6 +170,8 @@ class GameManager:
         """초기 NPC들을 생성합니다."""
         # NPC 생성은 선택적 (실패해도 게임 시작은 계속)
         try:
+            npc_specs = []
+            
             # 현재 셀의 game_cell_id 찾기
             pool = await self.db.pool
             async with pool.acquire() as conn:
@@ -193,22 +197,22 @@ class GameManager:
                         game_cell_id
                     )
                     
-                    # 각 NPC 인스턴스 생성
+                    # NPC 인스턴스 일괄 생성 (하나의 트랜잭션)
+                    npc_specs = []
                     for npc_template in npc_templates:
-                        try:
-                            entity_props = json.loads(npc_template['entity_properties']) if isinstance(npc_template['entity_properties'], str) else npc_template['entity_properties']
-                            default_pos = entity_props.get('default_position', {'x': 0, 'y': 0, 'z': 0})
-                            if isinstance(default_pos, str):
-                                default_pos = json.loads(default_pos)
-                            
-                            await self.instance_factory.create_npc_instance(
-                                game_entity_id=npc_template['entity_id'],
-                                session_id=session_id,
-                                runtime_cell_id=cell_runtime_id,
-                                position=default_pos
-                            )
-                        except Exception as e:
-                            print(f"NPC {npc_template['entity_id']} 생성 실패 (무시): {e}")
+                        entity_props = json.loads(npc_template['entity_properties']) if isinstance(npc_template['entity_properties'], str) else npc_template['entity_properties']
+                        default_pos = entity_props.get('default_position', {'x': 0, 'y': 0, 'z': 0})
+                        if isinstance(default_pos, str):
+                            default_pos = json.loads(default_pos)
+                        
+                        npc_specs.append({
+                            "game_entity_id": npc_template['entity_id'],
+                            "runtime_cell_id": cell_runtime_id,
+                            "position": default_pos
+                        })
+            
+            if npc_specs:
+                await self.instance_factory.create_npc_instances(npc_specs, session_id)
         except Exception as e:
             print(f"초기 NPC 생성 실패 (무시): {e}")
     
@@ -345,6 +349,9 @@ class GameManager:
             return
         
         try:
+            # 삭제될 세션의 미기록 상태 변경은 버림
+            await entity_state_store.discard_session(self.current_session_id)
+            
             # DB FK CASCADE가 모든 런타임/레퍼런스 레이어 정리를 담당
             pool = await self.db.pool
             async with pool.acquire() as conn:
@@ -356,6 +363,10 @@ class GameManager:
                     self.current_session_id
                 )
             
+            # 세션 레지스트리에서 해제
+            from app.core.session_registry import session_registry
+            session_registry.on_end(self.current_session_id)
+            
             # 상태 초기화
             self.current_session_id = None
             self.current_player_id = None
@@ -369,6 +380,10 @@ class GameManager:
             return False
         
         try:
+            # write-behind 모드의 미기록 엔티티 상태와 세션 게임 시간을 먼저 기록
+            await entity_state_store.flush(self.current_session_id)
+            await session_clock.flush(self.current_session_id)
+            
             # 세션 메타데이터에 저장 시간 추가
             pool = await self.db.pool
             async with pool.acquire() as conn:
@@ -1,24 +1,44 @@
 from typing import Dict, List, Any, Optional
+import asyncio
 import json
 import uuid
 from datetime import datetime
 from database.connection import DatabaseConnection
+from database.entity_state_store import entity_state_store
+from database.session_storage import session_storage
+from app.systems.session_clock import session_clock
 from app.managers.cell_manager import CellManager
 from app.core.game_manager import GameManager
 
 class GameSession:
     """게임 세션을 관리하는 클래스"""
     
-    def __init__(self, session_id: str):
+    def __init__(self, session_id: str, db_connection: Optional[DatabaseConnection] = None):
         self.session_id = session_id
-        self.db = DatabaseConnection()
+        # 세션 레지스트리에서 생성할 때는 공유 DatabaseConnection을 전달받음
+        self.db = db_connection or DatabaseConnection()
         # CellManager와 GameManager는 필요할 때만 초기화 (의존성 주입 복잡도 때문에)
         self._cell_manager: Optional[CellManager] = None
         self._game_manager: Optional[GameManager] = None
         
         # 세션 정보 캐시
         self._session_info: Optional[Dict[str, Any]] = None
-        self._player_entities: Optional[List[Dict[str, Any]]] = None
+        # 플레이어 참조(ID/타입)만 캐시 - 스탯/인벤토리/위치는 전투/아이템/제작 등 세션 밖에서도
+        # 바뀌므로 조회마다 entity_state_store에서 읽음
+        self._player_refs: Optional[List[Dict[str, Any]]] = None
+        # 동시 요청의 플레이어 조회를 한 번으로 합침
+        self._player_lock = asyncio.Lock()
+    
+    @property
+    def player_id(self) -> Optional[str]:
+        """캐시된 플레이어 런타임 엔티티 ID (조회 전이면 None)"""
+        if not self._player_refs:
+            return None
+        return self._player_refs[0]['runtime_entity_id']
+    
+    def invalidate_player_cache(self) -> None:
+        """플레이어 참조 캐시 무효화 (플레이어 엔티티가 바뀐 경우)"""
+        self._player_refs = None
     
     @property
     def cell_manager(self) -> CellManager:
@@ -96,35 +116,23 @@ class GameSession:
 
     async def move_player(self, player_id: str, target_cell_id: str, new_position: Dict[str, float]) -> bool:
         """플레이어를 이동시킵니다."""
-        # DatabaseConnection 초기화 보장
-        if not self.db._is_initialized:
-            await self.db.initialize()
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            try:
-                # current_position JSONB에 runtime_cell_id 포함
-                position_data = {
-                    **new_position,
-                    'runtime_cell_id': target_cell_id
-                }
-                
-                await conn.execute(
-                    """
-                    UPDATE runtime_data.entity_states
-                    SET current_position = $1,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE runtime_entity_id = $2
-                    """,
-                    json.dumps(position_data),
-                    player_id
-                )
-                
-                # 캐시 무효화
-                self._player_entities = None
-                return True
-            except Exception as e:
-                print(f"플레이어 이동 오류: {e}")
-                return False
+        try:
+            # current_position JSONB에 runtime_cell_id 포함
+            position_data = {
+                **new_position,
+                'runtime_cell_id': target_cell_id
+            }
+            
+            # write-through이면 즉시 UPDATE, write-behind이면 다음 flush에서 기록
+            await entity_state_store.set_fields(
+                player_id,
+                session_id=self.session_id,
+                current_position=position_data
+            )
+            return True
+        except Exception as e:
+            print(f"플레이어 이동 오류: {e}")
+            return False
 
     async def start_npc_dialogue(self, player_id: str, npc_id: str) -> Optional[str]:
         """NPC와의 대화를 시작합니다."""
@@ -260,11 +268,31 @@ class GameSession:
         return self._session_info
 
     async def get_player_entities(self) -> List[Dict[str, Any]]:
-        """플레이어 엔티티들을 조회합니다."""
-        if self._player_entities is None:
-            # DatabaseConnection 초기화 보장
-            if not self.db._is_initialized:
-                await self.db.initialize()
+        """플레이어 엔티티들을 조회합니다. (참조는 캐시, 상태는 entity_state_store에서 매번 조회)"""
+        players = []
+        for ref in await self._get_player_refs():
+            state = await entity_state_store.get(ref['runtime_entity_id']) or {}
+            position = state.get('current_position')
+            players.append({
+                **ref,
+                'current_stats': state.get('current_stats'),
+                'current_position': position,
+                'runtime_cell_id': position.get('runtime_cell_id') if isinstance(position, dict) else None,
+                'active_effects': state.get('active_effects'),
+                'inventory': state.get('inventory'),
+                'equipped_items': state.get('equipped_items')
+            })
+        return players
+    
+    async def _get_player_refs(self) -> List[Dict[str, Any]]:
+        """플레이어 엔티티 참조 조회 (세션 동안 바뀌지 않으므로 캐시)"""
+        if self._player_refs is not None:
+            return self._player_refs
+        
+        async with self._player_lock:
+            if self._player_refs is not None:
+                return self._player_refs
+            
             pool = await self.db.pool
             async with pool.acquire() as conn:
                 rows = await conn.fetch(
@@ -273,23 +301,19 @@ class GameSession:
                         er.runtime_entity_id,
                         er.game_entity_id,
                         er.entity_type,
-                        er.is_player,
-                        es.current_stats,
-                        es.current_position,
-                        es.current_position->>'runtime_cell_id' as runtime_cell_id,
-                        es.active_effects,
-                        es.inventory,
-                        es.equipped_items
+                        er.is_player
                     FROM reference_layer.entity_references er
-                    LEFT JOIN runtime_data.entity_states es ON er.runtime_entity_id = es.runtime_entity_id
                     WHERE er.session_id = $1 AND er.is_player = TRUE
                     """,
                     self.session_id
                 )
                 
-                self._player_entities = [dict(row) for row in rows]
-        
-        return self._player_entities
+                refs = [dict(row) for row in rows]
+            
+            # 플레이어가 아직 없으면 (세션 생성 중 등) 캐시하지 않음
+            if refs:
+                self._player_refs = refs
+            return refs
 
     async def get_npc_entities(self) -> List[Dict[str, Any]]:
         """NPC 엔티티들을 조회합니다."""
@@ -321,112 +345,52 @@ class GameSession:
 
     async def get_player_inventory(self, player_id: str) -> Dict[str, Any]:
         """플레이어의 인벤토리를 조회합니다."""
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            row = await conn.fetchrow(
-                """
-                SELECT inventory, equipped_items
-                FROM runtime_data.entity_states
-                WHERE runtime_entity_id = $1
-                """,
-                player_id
-            )
-            
-            if row:
-                return {
-                    'inventory': row['inventory'],
-                    'equipment': row['equipped_items']
-                }
-            return {'inventory': {}, 'equipment': {}}
+        # write-behind 모드의 미기록 변경까지 반영
+        state = await entity_state_store.get(player_id)
+        if state:
+            return {
+                'inventory': state['inventory'],
+                'equipment': state['equipped_items']
+            }
+        return {'inventory': {}, 'equipment': {}}
 
     async def update_player_stats(self, player_id: str, new_stats: Dict[str, Any]) -> bool:
         """플레이어 스탯을 업데이트합니다."""
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            try:
-                await conn.execute(
-                    """
-                    UPDATE runtime_data.entity_states
-                    SET current_stats = $1,
-                        updated_at = CURRENT_TIMESTAMP
-                    WHERE runtime_entity_id = $2
-                    """,
-                    json.dumps(new_stats),
-                    player_id
-                )
-                
-                # 캐시 무효화
-                self._player_entities = None
-                return True
-            except Exception as e:
-                print(f"스탯 업데이트 오류: {e}")
-                return False
+        try:
+            await entity_state_store.set_fields(
+                player_id,
+                session_id=self.session_id,
+                current_stats=new_stats
+            )
+            return True
+        except Exception as e:
+            print(f"스탯 업데이트 오류: {e}")
+            return False
 
     async def end_session(self) -> None:
         """게임 세션을 종료합니다."""
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            try:
-                async with conn.transaction():
-                    # 1. 먼저 active_sessions에서 플레이어 참조 제거
-                    await conn.execute(
-                        """
-                        UPDATE runtime_data.active_sessions
-                        SET player_runtime_entity_id = NULL
-                        WHERE session_id = $1
-                        """,
-                        self.session_id
-                    )
-                    
-                    # 2. 엔티티 상태 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM runtime_data.entity_states
-                        WHERE runtime_entity_id IN (
-                            SELECT runtime_entity_id FROM reference_layer.entity_references
-                            WHERE session_id = $1
-                        )
-                        """,
-                        self.session_id
-                    )
-                    
-                    # 3. 엔티티 참조 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM reference_layer.entity_references
-                        WHERE session_id = $1
-                        """,
-                        self.session_id
-                    )
-                    
-                    # 4. 셀 참조 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM reference_layer.cell_references
-                        WHERE session_id = $1
-                        """,
-                        self.session_id
-                    )
-                    
-                    # 5. 세션 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM runtime_data.active_sessions
-                        WHERE session_id = $1
-                        """,
-                        self.session_id
-                    )
-                
-                # 캐시 초기화
-                self._session_info = None
-                self._player_entities = None
-                
-            except Exception as e:
-                print(f"세션 종료 오류: {e}")
+        try:
+            # 세션 행 일괄 정리 (분할 테이블은 세션 파티션 DROP, 미기록 상태 변경은 버림)
+            await session_storage.purge(self.session_id)
+            
+            # 캐시 초기화 및 세션 레지스트리에서 해제
+            self._session_info = None
+            self._player_refs = None
+            from app.core.session_registry import session_registry
+            session_registry.on_end(self.session_id)
+            if self._cell_manager is not None:
+                await self._cell_manager.invalidate_session_cache(self.session_id)
+                await self._cell_manager.entity_manager.invalidate_session_cache(self.session_id)
+            
+        except Exception as e:
+            print(f"세션 종료 오류: {e}")
 
     async def save_session_state(self) -> bool:
         """세션 상태를 저장합니다."""
         try:
+            # write-behind 모드의 미기록 상태 변경과 세션 게임 시간을 먼저 기록
+            await entity_state_store.flush(self.session_id)
+            await session_clock.flush(self.session_id)
             pool = await self.db.pool
             async with pool.acquire() as conn:
                 await conn.execute(
@@ -0,0 +1,224 @@
+"""
+유휴 세션 회수기
+
+종료되지 않고 남은 세션(버려진 테스트/NPC 세션 등)의 런타임 행을 요청 경로 밖에서 정리합니다.
+
+- 주기(session_reaper_interval_seconds)마다 한 번 실행하는 백그라운드 태스크
+  (애플리케이션 시작 시 start(), GAME_CONFIG["session_reaper_enabled"]가 켜져 있을 때만)
+- 한 번 실행할 때:
+  1. 메모리에 상주 중인 세션과 게임 화면이 연결된 세션의 last_active_at을 한 번의 UPDATE로 갱신
+     (last_active_at은 세션 시작 시에만 기록되므로)
+  2. last_active_at이 session_timeout_minutes보다 오래된 세션을 최대 batch_size개 조회
+     (스냅샷 없는 이전 저장 슬롯이 참조하는 세션은 제외 - 세션이 있어야 불러올 수 있음)
+  3. 세션마다 session_storage.purge() 후 pause_seconds 대기
+- 회수한 세션/행 수와 소요 시간을 통계로 유지 (/health/db)
+
+사용 예:
+    from app.core.session_reaper import session_reaper
+
+    session_reaper.start()                 # 애플리케이션 시작 시
+    reaped = await session_reaper.run_once()
+    await session_reaper.close()
+"""
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from app.config.app_config import GAME_CONFIG
+from app.core.session_registry import session_registry
+from app.systems.session_deltas import session_deltas
+from database.connection import DatabaseConnection
+from database.session_storage import SessionStorage, session_storage
+from common.utils.logger import logger
+
+_IDLE_SESSIONS_SQL = """
+    SELECT s.session_id::text
+    FROM runtime_data.active_sessions s
+    WHERE COALESCE(s.last_active_at, s.created_at) < NOW() - $1::float8 * INTERVAL '1 minute'
+      AND s.session_id <> ALL($2::uuid[])
+      AND NOT EXISTS (
+          SELECT 1 FROM runtime_data.save_slots ss
+          WHERE ss.session_id = s.session_id AND ss.chain_length = 0
+      )
+    ORDER BY COALESCE(s.last_active_at, s.created_at)
+    LIMIT $3
+"""
+
+
+@dataclass
+class SessionReaperMetrics:
+    """유휴 세션 회수 통계"""
+    passes: int = 0
+    sessions_reaped: int = 0
+    rows_reclaimed: int = 0
+    failures: int = 0
+    seconds_spent: float = 0.0
+    last_pass_ms: float = 0.0
+    last_pass_reaped: int = 0
+
+
+class SessionReaper:
+    """유휴 세션 회수기"""
+
+    def __init__(self,
+                 db_connection: Optional[DatabaseConnection] = None,
+                 storage: Optional[SessionStorage] = None,
+                 enabled: Optional[bool] = None,
+                 timeout_minutes: Optional[float] = None,
+                 interval_seconds: Optional[float] = None,
+                 batch_size: Optional[int] = None,
+                 pause_seconds: Optional[float] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+            storage: 세션 정리기 (기본: 전역 session_storage)
+            enabled: start() 시 백그라운드 태스크 실행 여부 (기본: GAME_CONFIG["session_reaper_enabled"])
+            timeout_minutes: 회수 기준 유휴 시간 (기본: GAME_CONFIG["session_timeout_minutes"])
+            interval_seconds: 실행 주기 (초)
+            batch_size: 한 번에 회수할 최대 세션 수
+            pause_seconds: 세션 사이 대기 (초)
+        """
+        self._db = db_connection
+        self.storage = storage or session_storage
+        self.enabled = GAME_CONFIG["session_reaper_enabled"] if enabled is None else enabled
+        self.timeout_minutes = timeout_minutes or GAME_CONFIG["session_timeout_minutes"]
+        self.interval_seconds = interval_seconds or GAME_CONFIG["session_reaper_interval_seconds"]
+        self.batch_size = batch_size or GAME_CONFIG["session_reaper_batch_size"]
+        self.pause_seconds = (GAME_CONFIG["session_reaper_pause_seconds"]
+                              if pause_seconds is None else pause_seconds)
+        self.metrics = SessionReaperMetrics()
+
+        self._task: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    def _bind_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._stop = asyncio.Event()
+            self._lock = asyncio.Lock()
+            self._task = None
+
+    def start(self) -> None:
+        """백그라운드 회수 태스크 시작 (비활성화 상태면 무시)"""
+        if not self.enabled:
+            return
+        self._bind_loop()
+        self._stop.clear()
+        if self._task is None or self._task.done():
+            self._task = self._loop.create_task(self._run_loop())
+            logger.info(f"Session reaper: started (timeout={self.timeout_minutes} min, "
+                        f"interval={self.interval_seconds}s, batch={self.batch_size})")
+
+    async def _run_loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                await asyncio.wait_for(self._stop.wait(), timeout=self.interval_seconds)
+                break
+            except asyncio.TimeoutError:
+                pass
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Session reaper: pass failed: {e}")
+
+    def _protected_ids(self) -> List[str]:
+        """회수하지 않을 세션 (상주 중이거나 게임 화면이 연결된 세션)"""
+        return list(set(session_registry.active_ids()) | set(session_deltas.connected_sessions()))
+
+    async def run_once(self) -> int:
+        """
+        유휴 세션 한 묶음 회수
+
+        Returns:
+            회수한 세션 수
+        """
+        self._bind_loop()
+        async with self._lock:
+            started = time.perf_counter()
+            reaped = 0
+            try:
+                protected = self._protected_ids()
+                pool = await self.db.pool
+                async with pool.acquire() as conn:
+                    if protected:
+                        await conn.execute(
+                            """
+                            UPDATE runtime_data.active_sessions
+                            SET last_active_at = NOW()
+                            WHERE session_id = ANY($1::uuid[])
+                            """,
+                            protected
+                        )
+                    candidates = [
+                        record[0] for record in
+                        await conn.fetch(_IDLE_SESSIONS_SQL, float(self.timeout_minutes), protected, self.batch_size)
+                    ]
+
+                for index, session_id in enumerate(candidates):
+                    # 조회 이후 다시 사용된 세션은 건너뜀
+                    if session_id in session_registry or session_deltas.position(session_id) is not None:
+                        continue
+                    try:
+                        reclaimed = await self.storage.purge(session_id)
+                    except Exception as e:
+                        self.metrics.failures += 1
+                        logger.warning(f"Session reaper: failed to purge session {session_id}: {e}")
+                        continue
+                    session_registry.on_end(session_id)
+                    reaped += 1
+                    self.metrics.sessions_reaped += 1
+                    self.metrics.rows_reclaimed += sum(reclaimed.values())
+                    if self.pause_seconds and index < len(candidates) - 1:
+                        await asyncio.sleep(self.pause_seconds)
+            finally:
+                elapsed = time.perf_counter() - started
+                self.metrics.passes += 1
+                self.metrics.seconds_spent += elapsed
+                self.metrics.last_pass_ms = elapsed * 1000
+                self.metrics.last_pass_reaped = reaped
+
+            if reaped:
+                logger.info(f"Session reaper: reaped {reaped} idle sessions in {self.metrics.last_pass_ms:.1f} ms")
+            return reaped
+
+    async def close(self) -> None:
+        """백그라운드 태스크 종료 (진행 중인 회수는 끝까지 실행)"""
+        task, self._task = self._task, None
+        if task is None or task.done() or self._loop is not asyncio.get_running_loop():
+            return
+        self._stop.set()
+        try:
+            await task
+        except Exception:
+            pass
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None and not self._task.done(),
+            "timeout_minutes": self.timeout_minutes,
+            "passes": metrics.passes,
+            "sessions_reaped": metrics.sessions_reaped,
+            "rows_reclaimed": metrics.rows_reclaimed,
+            "failures": metrics.failures,
+            "seconds_spent": round(metrics.seconds_spent, 3),
+            "last_pass_ms": round(metrics.last_pass_ms, 2),
+            "last_pass_reaped": metrics.last_pass_reaped,
+            "storage": self.storage.snapshot(),
+        }
+
+
+# 전역 유휴 세션 회수기
+session_reaper = SessionReaper()
@@ -0,0 +1,193 @@
+"""
+GameSession 레지스트리
+
+활성 세션마다 GameSession 하나를 메모리에 유지하여 요청마다 GameSession을 새로 만들지 않습니다.
+- 모든 GameSession이 하나의 DatabaseConnection(공유 풀 참조)을 사용
+- 플레이어 엔티티/현재 셀/매니저 캐시가 요청 사이에 유지됨
+- GAME_CONFIG["session_timeout_minutes"] 동안 사용되지 않은 세션은 제거
+- GAME_CONFIG["max_resident_sessions"] 초과 시 가장 오래 사용되지 않은 세션부터 제거 (LRU)
+
+사용 예:
+    from app.core.session_registry import session_registry
+
+    session = session_registry.get(session_id)
+    player_entities = await session.get_player_entities()
+
+세션 수명 주기 훅:
+    await session_registry.on_start(session_id)   # 새 게임 시작
+    session_registry.on_load(session_id)          # 저장된 게임 불러오기 (세션 캐시 무효화 후 재구성)
+    session_registry.on_end(session_id)           # 세션 종료
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+from app.config.app_config import GAME_CONFIG
+from app.core.game_session import GameSession
+from app.core.state_version import state_versions
+from app.systems.session_clock import session_clock
+from app.systems.session_deltas import session_deltas
+from common.utils.ttl_cache import invalidate_session_caches
+from database.connection import DatabaseConnection
+from common.utils.logger import logger
+
+
+class _ResidentSession:
+    __slots__ = ("session", "last_access")
+
+    def __init__(self, session: GameSession, last_access: float):
+        self.session = session
+        self.last_access = last_access
+
+
+class SessionRegistry:
+    """활성 GameSession 레지스트리 (유휴 만료 + LRU 상한)"""
+
+    def __init__(self,
+                 max_sessions: Optional[int] = None,
+                 idle_timeout_minutes: Optional[float] = None,
+                 db_connection: Optional[DatabaseConnection] = None):
+        """
+        Args:
+            max_sessions: 최대 상주 세션 수 (기본: GAME_CONFIG["max_resident_sessions"])
+            idle_timeout_minutes: 유휴 세션 제거 시간 (기본: GAME_CONFIG["session_timeout_minutes"])
+            db_connection: 세션들이 공유할 DB 연결 (기본: 최초 사용 시 생성)
+        """
+        self.max_sessions = max_sessions or GAME_CONFIG["max_resident_sessions"]
+        timeout_minutes = idle_timeout_minutes or GAME_CONFIG["session_timeout_minutes"]
+        self.idle_timeout_seconds = timeout_minutes * 60
+        self._db = db_connection
+        self._sessions: "OrderedDict[str, _ResidentSession]" = OrderedDict()
+        self._created = 0
+        self._evicted = 0
+
+    @property
+    def db(self) -> DatabaseConnection:
+        """세션 공유 DatabaseConnection (지연 생성)"""
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    def get(self, session_id: str) -> GameSession:
+        """세션의 GameSession 조회 (없으면 생성하여 등록)"""
+        session_id = str(session_id)
+        now = time.monotonic()
+
+        resident = self._sessions.get(session_id)
+        if resident is not None:
+            if now - resident.last_access <= self.idle_timeout_seconds:
+                resident.last_access = now
+                self._sessions.move_to_end(session_id)
+                return resident.session
+            self._remove(session_id, "idle")
+
+        session = GameSession(session_id, db_connection=self.db)
+        self._sessions[session_id] = _ResidentSession(session, now)
+        self._created += 1
+        self._evict(now)
+        return session
+
+    def peek(self, session_id: str) -> Optional[GameSession]:
+        """등록된 GameSession 조회 (생성/접근 시간 갱신 없음)"""
+        resident = self._sessions.get(str(session_id))
+        return resident.session if resident is not None else None
+
+    # ------------------------------------------------------------------
+    # 수명 주기 훅
+    # ------------------------------------------------------------------
+
+    async def on_start(self, session_id: str) -> GameSession:
+        """새 게임 시작 시 세션 등록 및 초기화"""
+        self._remove(str(session_id), "restart")
+        state_versions.bump(session_id)
+        session_clock.discard(session_id)
+        session = self.get(session_id)
+        await session.initialize_session()
+        return session
+
+    def on_load(self, session_id: str) -> GameSession:
+        """저장된 게임을 불러올 때 기존 캐시를 버리고 세션 재등록"""
+        self._remove(str(session_id), "load")
+        state_versions.bump(session_id)
+        session_clock.discard(session_id)
+        # 서비스별 매니저 캐시(오브젝트 상태/엔티티/셀 컨텐츠 등)에 남은 저장 이후 상태 제거
+        invalidate_session_caches(session_id)
+        # 연결된 게임 화면은 스냅샷으로 다시 동기화
+        session_deltas.resync(session_id)
+        return self.get(session_id)
+
+    def on_end(self, session_id: str) -> None:
+        """세션 종료 시 등록 해제"""
+        self._remove(str(session_id), "end")
+        state_versions.discard(session_id)
+        session_clock.discard(session_id)
+        session_deltas.discard(session_id)
+
+    def invalidate_player(self, runtime_entity_id: str) -> None:
+        """플레이어 엔티티를 캐시한 세션의 플레이어 참조 캐시 무효화 (플레이어 엔티티 교체/삭제 시)"""
+        runtime_entity_id = str(runtime_entity_id)
+        for resident in self._sessions.values():
+            if str(resident.session.player_id) == runtime_entity_id:
+                resident.session.invalidate_player_cache()
+
+    # ------------------------------------------------------------------
+    # 제거
+    # ------------------------------------------------------------------
+
+    def evict_idle(self) -> int:
+        """유휴 시간이 지난 세션 제거 (제거된 수 반환)"""
+        return self._evict(time.monotonic())
+
+    def active_ids(self) -> List[str]:
+        """유휴 시간이 지나지 않은 상주 세션 ID 목록 (유휴 세션 회수 제외 대상)"""
+        self._evict(time.monotonic())
+        return list(self._sessions)
+
+    def _evict(self, now: float) -> int:
+        removed = 0
+        # OrderedDict는 접근 순서이므로 앞쪽부터 유휴 세션 확인
+        while self._sessions:
+            session_id, resident = next(iter(self._sessions.items()))
+            if now - resident.last_access <= self.idle_timeout_seconds:
+                break
+            self._remove(session_id, "idle")
+            removed += 1
+
+        while len(self._sessions) > self.max_sessions:
+            session_id = next(iter(self._sessions))
+            self._remove(session_id, "capacity")
+            removed += 1
+        return removed
+
+    def _remove(self, session_id: str, reason: str) -> None:
+        if self._sessions.pop(session_id, None) is not None:
+            self._evicted += 1
+            logger.debug(f"GameSession 해제: session_id={session_id}, reason={reason}")
+
+    def clear(self) -> None:
+        """모든 세션 해제 (테스트/애플리케이션 종료 시)"""
+        self._sessions.clear()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: object) -> bool:
+        return str(session_id) in self._sessions
+
+    def stats(self) -> Dict[str, Any]:
+        """레지스트리 통계"""
+        return {
+            "resident": len(self._sessions),
+            "max_sessions": self.max_sessions,
+            "idle_timeout_seconds": self.idle_timeout_seconds,
+            "created": self._created,
+            "evicted": self._evicted,
+        }
+
+
+# 전역 세션 레지스트리
+session_registry = SessionRegistry()
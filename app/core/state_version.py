@@ -0,0 +1,48 @@
+"""
+세션 상태 버전
+
+세션의 게임 상태(오브젝트 상태, 저장 불러오기 등)가 바뀔 때마다 버전을 올립니다.
+상태로부터 계산한 결과(예: 사용 가능한 액션 목록)를 (세션, 셀, 버전) 단위로 메모이즈하고,
+버전이 바뀌면 다시 계산하도록 하는 데 사용합니다.
+
+- 버전은 전역 카운터에서 발급하므로 같은 세션에서 같은 값이 다시 나오지 않음
+- 세션 종료 시 discard()로 제거
+
+사용 예:
+    from app.core.state_version import state_versions
+
+    state_versions.bump(session_id)          # 상태 변경 후
+    version = state_versions.get(session_id)  # 메모이즈 키 구성 시
+"""
+import itertools
+from typing import Any, Dict
+
+
+class SessionStateVersions:
+    """세션별 상태 버전"""
+
+    def __init__(self):
+        self._versions: Dict[str, int] = {}
+        self._counter = itertools.count(1)
+
+    def get(self, session_id: str) -> int:
+        """세션의 현재 상태 버전 (변경이 없었으면 0)"""
+        return self._versions.get(str(session_id), 0)
+
+    def bump(self, session_id: str) -> int:
+        """세션 상태 변경 반영 (새 버전 반환)"""
+        version = next(self._counter)
+        self._versions[str(session_id)] = version
+        return version
+
+    def discard(self, session_id: str) -> None:
+        """세션 종료 시 버전 제거"""
+        self._versions.pop(str(session_id), None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태"""
+        return {"sessions": len(self._versions)}
+
+
+# 전역 세션 상태 버전
+state_versions = SessionStateVersions()
@@ -12,6 +12,7 @@ from app.managers.cell_manager import CellManager, CellType, CellStatus
 from app.managers.effect_carrier_manager import EffectCarrierManager
 from app.managers.object_state_manager import ObjectStateManager
 from app.managers.inventory_manager import InventoryManager
+from app.systems.session_clock import frozen_clock
 from app.handlers.object_interactions import (
     InformationInteractionHandler,
     StateChangeInteractionHandler,
@@ -43,12 +44,14 @@ from app.handlers.time_interactions import (
     WaitHandler,
 )
 from database.connection import DatabaseConnection
+from database.log_sink import BatchedLogSink
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
 from common.utils.logger import logger
 from common.utils.jsonb_handler import parse_jsonb_data
 from app.handlers.action_result import ActionResult, ActionType
+from app.config.app_config import GAME_CONFIG
 
 
 class ActionHandler:
@@ -89,6 +92,18 @@ class ActionHandler:
         self.inventory_manager = inventory_manager
         self.logger = logger
         
+        # 행동 로그는 백그라운드 싱크에서 배치 기록 (행동 처리 경로에서 분리)
+        self.action_log_sink = BatchedLogSink(
+            db_connection,
+            "action_logs",
+            columns=("session_id", "entity_id", "action", "success", "message", "timestamp"),
+            max_queue_size=GAME_CONFIG["log_sink_queue_size"],
+            batch_size=GAME_CONFIG["log_sink_batch_size"],
+            flush_interval=GAME_CONFIG["log_sink_flush_interval_seconds"],
+            policy=GAME_CONFIG["log_sink_backpressure"],
+            before_flush=self._ensure_log_sessions
+        )
+        
         # 오브젝트 상호작용 핸들러 초기화
         self._init_object_interaction_handlers()
         
@@ -189,8 +204,15 @@ class ActionHandler:
                            entity_id: str, 
                            target_id: Optional[str] = None,
                            parameters: Optional[Dict[str, Any]] = None,
-                           session_id: str = None) -> ActionResult:
-        """행동 실행"""
+                           session_id: str = None,
+                           advance_clock: bool = True) -> ActionResult:
+        """
+        행동 실행
+        
+        Args:
+            advance_clock: False이면 행동의 시간 소모를 세션 게임 시계에 적용하지 않음
+                (플레이어가 아닌 행위자 - NPC 루틴)
+        """
         try:
             self.logger.info(f"Executing action: {action_type} by player {entity_id}, target_id: {target_id}")
             
@@ -210,7 +232,11 @@ class ActionHandler:
                 self.logger.error(f"Unknown action type: {action_type}")
                 return ActionResult.failure_result(f"Unknown action type: {action_type}")
             
-            result = await handler(entity_id, target_id, parameters)
+            if advance_clock:
+                result = await handler(entity_id, target_id, parameters)
+            else:
+                with frozen_clock():
+                    result = await handler(entity_id, target_id, parameters)
             
             # 행동 로그 기록 (세션 ID 전달)
             action_name = str(action_type)  # action_type은 이미 문자열
@@ -288,42 +314,43 @@ class ActionHandler:
         return await self.use_item_handler.handle(entity_id, target_id, parameters)
     
     async def _log_action(self, entity_id: str, action: str, result: ActionResult, session_id: str = None):
-        """행동 로그 기록"""
+        """행동 로그 적재 (실제 기록은 action_log_sink가 배치로 수행)"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                # 세션 ID가 제공되지 않으면 에러 발생
-                if not session_id:
-                    raise ValueError("session_id는 필수입니다. 세션 중심 설계에 따라 유효한 세션 ID를 제공해야 합니다.")
-                
-                # 먼저 세션 생성 (존재하지 않는 경우)
-                await conn.execute("""
-                    INSERT INTO runtime_data.active_sessions 
-                    (session_id, session_name, session_state, created_at, updated_at)
-                    VALUES ($1, $2, $3, NOW(), NOW())
-                    ON CONFLICT (session_id) DO NOTHING
-                """, 
+            # 세션 ID가 제공되지 않으면 에러 발생
+            if not session_id:
+                raise ValueError("session_id는 필수입니다. 세션 중심 설계에 따라 유효한 세션 ID를 제공해야 합니다.")
+            
+            await self.action_log_sink.enqueue((
                 session_id,
-                f"Session {session_id[:8]}",
-                "active"
-                )
-                
-                # 행동 로그 저장 (log_id는 자동 생성, 올바른 스키마 사용)
-                await conn.execute("""
-                    INSERT INTO runtime_data.action_logs 
-                    (session_id, entity_id, action, success, message, timestamp)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                """, 
-                session_id, 
                 entity_id,
-                action, 
-                result.success, 
-                result.message, 
+                action,
+                result.success,
+                result.message,
                 datetime.now()
-                )
+            ))
         except Exception as e:
             self.logger.error(f"Failed to log action: {str(e)}")
     
+    @staticmethod
+    async def _ensure_log_sessions(conn, records: List[Tuple]) -> None:
+        """배치에 포함된 세션이 active_sessions에 존재하도록 보장 (FK)"""
+        session_ids = list({str(record[0]) for record in records})
+        await conn.execute("""
+            INSERT INTO runtime_data.active_sessions 
+            (session_id, session_name, session_state, created_at, updated_at)
+            SELECT sid, 'Session ' || left(sid::text, 8), 'active', NOW(), NOW()
+            FROM unnest($1::uuid[]) AS sid
+            ON CONFLICT (session_id) DO NOTHING
+        """, session_ids)
+    
+    async def flush_action_logs(self) -> int:
+        """대기 중인 행동 로그 즉시 기록"""
+        return await self.action_log_sink.flush()
+    
+    async def close(self):
+        """남은 행동 로그를 기록하고 싱크 종료"""
+        await self.action_log_sink.close()
+    
     async def _load_action_responses(self, target_name: str) -> Dict[str, List[str]]:
         """DB에서 액션별 응답 템플릿 로드"""
         try:
@@ -501,8 +528,7 @@ class ActionHandler:
             'db_connection': self.db,
             'entity_manager': self.entity_manager,
             'cell_manager': self.cell_manager,
-            # TODO: TimeSystem 추가 필요
-            'time_system': None,
+            # 시간 소모는 세션 게임 시계(session_clock)로 적용
         }
         
         self.wait_handler = WaitHandler(**handler_kwargs)
@@ -11,6 +11,7 @@ from app.managers.cell_manager import CellManager
 from app.managers.inventory_manager import InventoryManager
 from app.managers.object_state_manager import ObjectStateManager
 from app.managers.effect_carrier_manager import EffectCarrierManager
+from app.systems.session_clock import SessionClockService, clock_frozen, session_clock
 from database.connection import DatabaseConnection
 from common.utils.logger import logger
 
@@ -27,6 +28,7 @@ class ActionHandlerBase(ABC):
         object_state_manager: Optional[ObjectStateManager] = None,
         effect_carrier_manager: Optional[EffectCarrierManager] = None,
         time_system: Optional[Any] = None,  # TimeSystem 타입은 나중에 정의
+        clock: Optional[SessionClockService] = None,
     ):
         """
         액션 핸들러 초기화
@@ -38,7 +40,8 @@ class ActionHandlerBase(ABC):
             inventory_manager: 인벤토리 관리자
             object_state_manager: 오브젝트 상태 관리자
             effect_carrier_manager: Effect Carrier 관리자
-            time_system: 시간 시스템
+            time_system: 시간 시스템 (주입 시 세션 시계 대신 사용)
+            clock: 세션 게임 시계 (기본: 전역 session_clock)
         """
         self.db = db_connection
         self.entity_manager = entity_manager
@@ -47,6 +50,7 @@ class ActionHandlerBase(ABC):
         self.object_state_manager = object_state_manager
         self.effect_carrier_manager = effect_carrier_manager
         self.time_system = time_system
+        self.clock = clock or session_clock
         self.logger = logger
     
     @abstractmethod
@@ -69,19 +73,30 @@ class ActionHandlerBase(ABC):
         """
         pass
     
-    async def _apply_time_cost(self, time_cost: int) -> None:
+    async def _apply_time_cost(self, time_cost: int, session_id: Optional[str] = None) -> None:
         """
         시간 소모 적용
         
+        time_system이 주입되었으면 그것을, 아니면 세션 게임 시계를 진행합니다.
+        플레이어가 아닌 행위자의 액션(frozen_clock() 안, NPC 루틴)은 시간을 소모하지 않습니다.
+        실패는 액션 결과에 영향을 주지 않습니다.
+        
         Args:
             time_cost: 소모할 시간 (분)
+            session_id: 세션 ID (세션 게임 시계 사용 시)
         """
-        if self.time_system and time_cost > 0:
-            try:
+        if time_cost <= 0 or clock_frozen():
+            return
+        try:
+            if self.time_system:
                 await self.time_system.advance_time(minutes=time_cost)
-                self.logger.info(f"시간 {time_cost}분 소모됨")
-            except Exception as e:
-                self.logger.error(f"시간 소모 실패: {str(e)}")
+            elif session_id:
+                await self.clock.advance(session_id, time_cost)
+            else:
+                return
+            self.logger.info(f"시간 {time_cost}분 소모됨")
+        except Exception as e:
+            self.logger.error(f"시간 소모 실패: {str(e)}")
     
     async def _apply_effect_carrier(
         self,
@@ -68,47 +68,40 @@ class DialogueHandler(ActionHandlerBase):
             return ActionResult.failure_result(f"대화 실패: {str(e)}")
     
     async def _load_action_responses(self, target_name: str) -> Dict[str, list]:
-        """DB에서 액션별 응답 템플릿 로드"""
+        """대화 카탈로그에서 액션별 응답 템플릿 로드"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                from common.utils.jsonb_handler import parse_jsonb_data
-                
-                # game_data.dialogue_contexts 테이블에서 액션별 응답 로드
-                responses = await conn.fetch("""
-                    SELECT title, content, available_topics
-                    FROM game_data.dialogue_contexts
-                    WHERE entity_id IS NULL OR entity_id = ''
-                    ORDER BY priority DESC
-                """)
-                
-                # 응답을 주제별로 분류
-                action_responses = {
-                    "greeting": [],
-                    "trade": [],
-                    "farewell": []
-                }
+            from app.managers.dialogue_catalog import dialogue_catalog
+            
+            # 전역 대화 컨텍스트(entity_id 없음, 우선순위 내림차순)에서 액션별 응답 로드
+            index = await dialogue_catalog.get_index(self.db)
+            
+            # 응답을 주제별로 분류
+            action_responses = {
+                "greeting": [],
+                "trade": [],
+                "farewell": []
+            }
+            
+            for response in index.global_contexts:
+                title = response['title'].lower()
+                content = response['content']
+                topics = response['available_topics']
                 
-                for response in responses:
-                    title = response['title'].lower()
-                    content = response['content']
-                    topics = parse_jsonb_data(response['available_topics']) or {}
-                    
-                    # 주제별 응답 분류
-                    if 'greeting' in title or 'greeting' in topics:
-                        action_responses['greeting'].append(f"{target_name}: {content}")
-                    
-                    if 'trade' in title or 'trade' in topics:
-                        action_responses['trade'].append(f"{target_name}: {content}")
-                    
-                    if 'farewell' in title or 'farewell' in topics:
-                        action_responses['farewell'].append(f"{target_name}: {content}")
+                # 주제별 응답 분류
+                if 'greeting' in title or 'greeting' in topics:
+                    action_responses['greeting'].append(f"{target_name}: {content}")
                 
-                # 기본 응답이 없으면 기본값 설정
-                if not any(action_responses.values()):
-                    action_responses = self._get_default_action_responses(target_name)
+                if 'trade' in title or 'trade' in topics:
+                    action_responses['trade'].append(f"{target_name}: {content}")
                 
-                return action_responses
+                if 'farewell' in title or 'farewell' in topics:
+                    action_responses['farewell'].append(f"{target_name}: {content}")
+            
+            # 기본 응답이 없으면 기본값 설정
+            if not any(action_responses.values()):
+                action_responses = self._get_default_action_responses(target_name)
+            
+            return action_responses
                 
         except Exception as e:
             self.logger.error(f"Failed to load action responses: {str(e)}")
@@ -5,6 +5,7 @@
 from typing import Dict, Any, Optional
 from app.handlers.action_handler_base import ActionHandlerBase
 from app.handlers.action_result import ActionResult
+from database.entity_state_store import entity_state_store
 
 
 class ConsumptionItemHandler(ActionHandlerBase):
@@ -29,27 +30,16 @@ class ConsumptionItemHandler(ActionHandlerBase):
         item_id = parameters["item_id"]
         session_id = parameters.get("session_id") if parameters else None
         
-        # 인벤토리에서 아이템 확인
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            entity_state = await conn.fetchrow(
-                """
-                SELECT inventory
-                FROM runtime_data.entity_states
-                WHERE runtime_entity_id = $1
-                """,
-                entity_id
-            )
-            
-            if not entity_state:
-                return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
-            
-            import json
-            inventory = json.loads(entity_state['inventory']) if isinstance(entity_state['inventory'], str) else entity_state['inventory']
-            quantities = inventory.get("quantities", {})
-            
-            if quantities.get(item_id, 0) < 1:
-                return ActionResult.failure_result(f"인벤토리에 '{item_id}' 아이템이 없습니다.")
+        # 인벤토리에서 아이템 확인 (write-behind 모드에서는 메모리 상태)
+        entity_state = await entity_state_store.get(entity_id)
+        if not entity_state:
+            return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
+        
+        inventory = entity_state['inventory'] or {}
+        quantities = inventory.get("quantities", {})
+        
+        if quantities.get(item_id, 0) < 1:
+            return ActionResult.failure_result(f"인벤토리에 '{item_id}' 아이템이 없습니다.")
         
         # 아이템 템플릿 조회
         from database.repositories.game_data import GameDataRepository
@@ -92,24 +82,14 @@ class ConsumptionItemHandler(ActionHandlerBase):
                 self.logger.warning(f"Effect Carrier 적용 실패: {effect_result.message}")
         
         # 인벤토리에서 아이템 제거 (소비 가능 아이템)
-        remove_result = await self.inventory_manager.remove_item_from_inventory(
-            entity_id,
-            item_id,
-            quantity=1
-        )
-        
-        if not remove_result:
+        try:
+            await self.inventory_manager.apply_delta(entity_id, {item_id: -1})
+        except ValueError:
             return ActionResult.failure_result("인벤토리에서 아이템을 제거할 수 없습니다.")
         
         # TimeSystem 연동
         time_cost = item_properties.get('interactions', {}).get('eat', {}).get('time_cost', 5)
-        if time_cost > 0:
-            from app.systems.time_system import TimeSystem
-            time_system = TimeSystem()
-            try:
-                await time_system.advance_time(minutes=time_cost)
-            except Exception as e:
-                self.logger.warning(f"TimeSystem 연동 실패: {str(e)}")
+        await self._apply_time_cost(time_cost, session_id)
         
         item_name = item_template.get('item_name', item_id)
         
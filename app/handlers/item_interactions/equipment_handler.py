@@ -5,6 +5,7 @@
 from typing import Dict, Any, Optional
 from app.handlers.action_handler_base import ActionHandlerBase
 from app.handlers.action_result import ActionResult
+from database.entity_state_store import entity_state_store
 
 
 class EquipmentItemHandler(ActionHandlerBase):
@@ -25,27 +26,16 @@ class EquipmentItemHandler(ActionHandlerBase):
         
         item_id = parameters["item_id"]
         
-        # 인벤토리에서 아이템 확인
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            entity_state = await conn.fetchrow(
-                """
-                SELECT inventory, equipped_items
-                FROM runtime_data.entity_states
-                WHERE runtime_entity_id = $1
-                """,
-                entity_id
-            )
-            
-            if not entity_state:
-                return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
-            
-            import json
-            inventory = json.loads(entity_state['inventory']) if isinstance(entity_state['inventory'], str) else entity_state['inventory']
-            quantities = inventory.get("quantities", {})
-            
-            if quantities.get(item_id, 0) < 1:
-                return ActionResult.failure_result(f"인벤토리에 '{item_id}' 아이템이 없습니다.")
+        # 인벤토리에서 아이템 확인 (write-behind 모드에서는 메모리 상태)
+        entity_state = await entity_state_store.get(entity_id)
+        if not entity_state:
+            return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
+        
+        inventory = entity_state['inventory'] or {}
+        quantities = inventory.get("quantities", {})
+        
+        if quantities.get(item_id, 0) < 1:
+            return ActionResult.failure_result(f"인벤토리에 '{item_id}' 아이템이 없습니다.")
         
         # 아이템 템플릿 조회하여 장착 가능 여부 확인
         from database.repositories.game_data import GameDataRepository
@@ -67,38 +57,24 @@ class EquipmentItemHandler(ActionHandlerBase):
             return ActionResult.failure_result(f"'{item_id}'는 장착할 수 없는 아이템입니다.")
         
         # 기존 장착 아이템 확인 및 해제
-        equipped_items = json.loads(entity_state['equipped_items']) if isinstance(entity_state['equipped_items'], str) else entity_state['equipped_items']
+        equipped_items = entity_state['equipped_items']
         if not equipped_items:
             equipped_items = {}
         
+        # 아이템 장착 (인벤토리에서 제거, 기존 장착 아이템은 인벤토리로 - 한 트랜잭션)
+        delta = {item_id: -1}
         old_item_id = equipped_items.get(equipment_slot)
         if old_item_id:
-            # 기존 장착 아이템을 인벤토리에 추가
-            await self.inventory_manager.add_item_to_inventory(entity_id, old_item_id, quantity=1)
-        
-        # 아이템 장착 (인벤토리에서 제거, 장착 슬롯에 추가)
-        remove_result = await self.inventory_manager.remove_item_from_inventory(
-            entity_id,
-            item_id,
-            quantity=1
-        )
+            delta[old_item_id] = delta.get(old_item_id, 0) + 1
         
-        if not remove_result:
+        try:
+            await self.inventory_manager.apply_delta(entity_id, delta)
+        except ValueError:
             return ActionResult.failure_result("인벤토리에서 아이템을 제거할 수 없습니다.")
         
         # equipped_items 업데이트
         equipped_items[equipment_slot] = item_id
-        async with pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE runtime_data.entity_states
-                SET equipped_items = $1::jsonb,
-                    updated_at = NOW()
-                WHERE runtime_entity_id = $2
-                """,
-                json.dumps(equipped_items),
-                entity_id
-            )
+        await entity_state_store.set_fields(entity_id, equipped_items=equipped_items)
         
         item_name = item_template.get('item_name', item_id)
         
@@ -122,25 +98,14 @@ class EquipmentItemHandler(ActionHandlerBase):
         
         item_id = parameters["item_id"]
         
-        # 장착 슬롯에서 아이템 확인
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            entity_state = await conn.fetchrow(
-                """
-                SELECT equipped_items
-                FROM runtime_data.entity_states
-                WHERE runtime_entity_id = $1
-                """,
-                entity_id
-            )
-            
-            if not entity_state:
-                return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
-            
-            import json
-            equipped_items = json.loads(entity_state['equipped_items']) if isinstance(entity_state['equipped_items'], str) else entity_state['equipped_items']
-            if not equipped_items:
-                return ActionResult.failure_result("장착된 아이템이 없습니다.")
+        # 장착 슬롯에서 아이템 확인 (write-behind 모드에서는 메모리 상태)
+        entity_state = await entity_state_store.get(entity_id)
+        if not entity_state:
+            return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
+        
+        equipped_items = entity_state['equipped_items']
+        if not equipped_items:
+            return ActionResult.failure_result("장착된 아이템이 없습니다.")
         
         # 장착된 아이템 찾기
         equipment_slot = None
@@ -157,17 +122,7 @@ class EquipmentItemHandler(ActionHandlerBase):
         
         # 장착 슬롯에서 제거
         del equipped_items[equipment_slot]
-        async with pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE runtime_data.entity_states
-                SET equipped_items = $1::jsonb,
-                    updated_at = NOW()
-                WHERE runtime_entity_id = $2
-                """,
-                json.dumps(equipped_items),
-                entity_id
-            )
+        await entity_state_store.set_fields(entity_id, equipped_items=equipped_items)
         
         from database.repositories.game_data import GameDataRepository
         game_data_repo = GameDataRepository(self.db)
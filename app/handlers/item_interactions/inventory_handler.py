@@ -5,6 +5,7 @@
 from typing import Dict, Any, Optional
 from app.handlers.action_handler_base import ActionHandlerBase
 from app.handlers.action_result import ActionResult
+from database.entity_state_store import entity_state_store
 
 
 class InventoryItemHandler(ActionHandlerBase):
@@ -32,34 +33,23 @@ class InventoryItemHandler(ActionHandlerBase):
         if not session_id:
             return ActionResult.failure_result("세션 ID가 필요합니다.")
         
-        # 인벤토리에서 아이템 확인
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            entity_state = await conn.fetchrow(
-                """
-                SELECT inventory, current_position
-                FROM runtime_data.entity_states
-                WHERE runtime_entity_id = $1
-                """,
-                entity_id
-            )
-            
-            if not entity_state:
-                return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
-            
-            import json
-            inventory = json.loads(entity_state['inventory']) if isinstance(entity_state['inventory'], str) else entity_state['inventory']
-            quantities = inventory.get("quantities", {})
-            
-            if quantities.get(item_id, 0) < 1:
-                return ActionResult.failure_result(f"인벤토리에 '{item_id}' 아이템이 없습니다.")
-            
-            # 현재 셀 조회
-            current_position = json.loads(entity_state['current_position']) if isinstance(entity_state['current_position'], str) else entity_state['current_position']
-            current_cell_id = current_position.get('runtime_cell_id')
-            
-            if not current_cell_id:
-                return ActionResult.failure_result("현재 위치한 셀을 찾을 수 없습니다.")
+        # 인벤토리에서 아이템 확인 (write-behind 모드에서는 메모리 상태)
+        entity_state = await entity_state_store.get(entity_id)
+        if not entity_state:
+            return ActionResult.failure_result("엔티티 상태를 찾을 수 없습니다.")
+        
+        inventory = entity_state['inventory'] or {}
+        quantities = inventory.get("quantities", {})
+        
+        if quantities.get(item_id, 0) < 1:
+            return ActionResult.failure_result(f"인벤토리에 '{item_id}' 아이템이 없습니다.")
+        
+        # 현재 셀 조회
+        current_position = entity_state['current_position'] or {}
+        current_cell_id = current_position.get('runtime_cell_id')
+        
+        if not current_cell_id:
+            return ActionResult.failure_result("현재 위치한 셀을 찾을 수 없습니다.")
         
         # 인벤토리에서 아이템 제거
         remove_result = await self.inventory_manager.remove_item_from_inventory(
@@ -73,6 +63,8 @@ class InventoryItemHandler(ActionHandlerBase):
         
         # 셀 contents에 아이템 추가 (간단한 구현: 셀의 contents JSONB에 item_id 추가)
         # TODO: 더 정교한 구현은 오브젝트 생성 또는 셀 contents 구조에 맞춰 구현 필요
+        import json
+        pool = await self.db.pool
         async with pool.acquire() as conn:
             cell_state = await conn.fetchrow(
                 """
@@ -8,6 +8,7 @@ from app.managers.object_state_manager import ObjectStateManager
 from app.managers.entity_manager import EntityManager
 from app.managers.inventory_manager import InventoryManager
 from app.managers.effect_carrier_manager import EffectCarrierManager
+from app.systems.session_clock import SessionClockService, clock_frozen, session_clock
 from database.connection import DatabaseConnection
 from common.utils.logger import logger
 from app.handlers.action_result import ActionResult
@@ -23,7 +24,8 @@ class ObjectInteractionHandlerBase(ABC):
         object_state_manager: Optional[ObjectStateManager] = None,
         entity_manager: Optional[EntityManager] = None,
         inventory_manager: Optional[InventoryManager] = None,
-        effect_carrier_manager: Optional[EffectCarrierManager] = None
+        effect_carrier_manager: Optional[EffectCarrierManager] = None,
+        clock: Optional[SessionClockService] = None
     ):
         """
         초기화
@@ -34,14 +36,34 @@ class ObjectInteractionHandlerBase(ABC):
             entity_manager: 엔티티 관리자 (선택사항)
             inventory_manager: 인벤토리 관리자 (선택사항)
             effect_carrier_manager: Effect Carrier 관리자 (선택사항)
+            clock: 세션 게임 시계 (기본: 전역 session_clock)
         """
         self.db = db_connection
         self.object_state_manager = object_state_manager
         self.entity_manager = entity_manager
         self.inventory_manager = inventory_manager
         self.effect_carrier_manager = effect_carrier_manager
+        self.clock = clock or session_clock
         self.logger = logger
     
+    async def _apply_time_cost(self, time_cost: int, session_id: Optional[str]) -> None:
+        """
+        세션 게임 시계에 시간 소모 적용 (실패는 액션 결과에 영향을 주지 않음)
+        
+        플레이어가 아닌 행위자의 액션(frozen_clock() 안, NPC 루틴)은 시간을 소모하지 않습니다.
+        
+        Args:
+            time_cost: 소모할 시간 (분)
+            session_id: 세션 ID
+        """
+        if time_cost <= 0 or not session_id or clock_frozen():
+            return
+        try:
+            await self.clock.advance(session_id, time_cost)
+            self.logger.debug(f"시간 {time_cost}분 소모됨")
+        except Exception as e:
+            self.logger.warning(f"시간 소모 실패: {str(e)}")
+    
     async def _parse_object_id(
         self,
         target_id: Union[str, UUID],
@@ -180,19 +180,7 @@ class ConsumptionInteractionHandler(ObjectInteractionHandlerBase):
             
             # TimeSystem 연동
             time_cost = item_properties.get('interactions', {}).get('eat', {}).get('time_cost', 5)
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             item_name = item_template.get('item_name', item_id)
             object_name = object_state.get('object_name', '오브젝트')
@@ -334,19 +322,7 @@ class ConsumptionInteractionHandler(ObjectInteractionHandlerBase):
             
             # TimeSystem 연동
             time_cost = drink_config.get('time_cost', 5)
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             self.logger.info(
                 f"마시기 완료: entity_id={entity_id}, object_name={object_name}, "
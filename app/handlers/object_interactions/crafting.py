@@ -55,13 +55,11 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
             # 4. 실패: 일부 재료만 소모
             consumed_items = self._determine_consumed_items_on_failure(input_items, item_carriers)
             
-            # 재료 소모
-            for item_id in consumed_items:
-                await self.inventory_manager.remove_item_from_inventory(
-                    entity_id,
-                    item_id,
-                    quantity=1
-                )
+            # 재료 소모 (한 트랜잭션)
+            try:
+                await self.inventory_manager.apply_delta(entity_id, self.inventory_manager.item_delta(consumed_items, -1))
+            except ValueError as e:
+                return ActionResult.failure_result(f"조합에 필요한 재료가 부족합니다: {str(e)}")
             
             return ActionResult.failure_result(
                 f"조합 실패 (성공률: {success_rate:.1%}). 일부 재료가 소모되었습니다.",
@@ -71,15 +69,14 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
                 }
             )
         
-        # 5. 성공: 모든 재료 소모
-        for item_id in input_items:
-            await self.inventory_manager.remove_item_from_inventory(
-                entity_id,
-                item_id,
-                quantity=1
-            )
+        # 5. 성공: 재료 확인 (부족하면 아무것도 만들거나 소모하지 않음)
+        combine_delta = self.inventory_manager.item_delta(input_items, -1)
+        try:
+            await self.inventory_manager.check_delta(entity_id, combine_delta)
+        except ValueError as e:
+            return ActionResult.failure_result(f"조합에 필요한 재료가 부족합니다: {str(e)}")
         
-        # 6. 조합된 아이템 생성
+        # 6. 조합된 아이템 생성 (실패하면 재료는 그대로)
         result_item_id = await self._create_combined_item(
             input_items,
             item_carriers,
@@ -87,27 +84,20 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
         )
         
         if not result_item_id:
-            # 실패 시 재료 복구
-            for item_id in input_items:
-                await self.inventory_manager.add_item_to_inventory(entity_id, item_id, quantity=1)
             return ActionResult.failure_result("조합된 아이템 생성에 실패했습니다.")
         
-        # 7. 결과 아이템을 인벤토리에 추가
-        await self.inventory_manager.add_item_to_inventory(
-            entity_id,
-            result_item_id,
-            quantity=1
-        )
+        # 7. 재료 소모 + 결과 아이템 추가 (한 트랜잭션)
+        combine_delta[result_item_id] = combine_delta.get(result_item_id, 0) + 1
+        try:
+            await self.inventory_manager.apply_delta(entity_id, combine_delta)
+        except ValueError as e:
+            # 확인 이후 재료가 사라진 경우: 인벤토리는 그대로이므로 만든 아이템 템플릿만 제거
+            await self._delete_combined_item(result_item_id)
+            return ActionResult.failure_result(f"조합에 필요한 재료가 부족합니다: {str(e)}")
         
         # 8. TimeSystem 연동
         time_cost = 10  # 기본 10분
-        if time_cost > 0:
-            from app.systems.time_system import TimeSystem
-            time_system = TimeSystem()
-            try:
-                await time_system.advance_time(minutes=time_cost)
-            except Exception as e:
-                self.logger.warning(f"TimeSystem 연동 실패: {str(e)}")
+        await self._apply_time_cost(time_cost, session_id)
         
         effect_carrier_count = len(item_carriers)
         message = f"조합 성공! {result_item_id}을(를) 획득했습니다."
@@ -338,6 +328,15 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
             self.logger.error(f"조합된 아이템 생성 실패: {str(e)}")
             return None
     
+    async def _delete_combined_item(self, item_id: str) -> None:
+        """인벤토리에 들어가지 못한 조합 아이템 템플릿 제거"""
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM game_data.items WHERE item_id = $1", item_id)
+        except Exception as e:
+            self.logger.error(f"조합된 아이템 제거 실패: {str(e)}")
+    
     async def handle_craft(
         self,
         entity_id: str,
@@ -380,43 +379,22 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
         # 필요한 재료 확인 (인벤토리)
         required_items = cook_config.get('required_items', [])
         
-        # 재료 소모
-        for item_id in required_items:
-            remove_result = await self.inventory_manager.remove_item_from_inventory(
-                entity_id,
-                item_id,
-                quantity=1
-            )
-            if not remove_result:
-                # 실패 시 재료 복구
-                for consumed in required_items[:required_items.index(item_id)]:
-                    await self.inventory_manager.add_item_to_inventory(entity_id, consumed, quantity=1)
-                return ActionResult.failure_result(f"요리에 필요한 재료가 없습니다: {item_id}")
-        
-        # 결과 음식 아이템 생성
+        # 결과 음식 아이템 확인
         result_item_id = cook_config.get('result_item_id')
         if not result_item_id:
-            # 재료 복구
-            for item_id in required_items:
-                await self.inventory_manager.add_item_to_inventory(entity_id, item_id, quantity=1)
             return ActionResult.failure_result("요리 결과 아이템이 정의되지 않았습니다.")
         
-        # 결과 아이템을 인벤토리에 추가
-        await self.inventory_manager.add_item_to_inventory(
-            entity_id,
-            result_item_id,
-            quantity=1
-        )
+        # 재료 소모 + 결과 아이템 추가 (한 트랜잭션, 재료가 부족하면 아무것도 바뀌지 않음)
+        cook_delta = self.inventory_manager.item_delta(required_items, -1)
+        cook_delta[result_item_id] = cook_delta.get(result_item_id, 0) + 1
+        try:
+            await self.inventory_manager.apply_delta(entity_id, cook_delta)
+        except ValueError as e:
+            return ActionResult.failure_result(f"요리에 필요한 재료가 없습니다: {str(e)}")
         
         # TimeSystem 연동 (요리는 더 긴 시간 소모)
         time_cost = cook_config.get('time_cost', 60)
-        if time_cost > 0:
-            from app.systems.time_system import TimeSystem
-            time_system = TimeSystem()
-            try:
-                await time_system.advance_time(minutes=time_cost)
-            except Exception as e:
-                self.logger.warning(f"TimeSystem 연동 실패: {str(e)}")
+        await self._apply_time_cost(time_cost, session_id)
         
         object_name = object_state.get('object_name', '오브젝트')
         
@@ -456,19 +434,15 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
         interactions = properties.get('interactions', {})
         repair_config = interactions.get('repair', {})
         
-        # 필요한 재료 확인
+        # 필요한 재료 확인 (부족하면 오브젝트 상태도 바꾸지 않음)
         required_items = repair_config.get('required_items', [])
-        for item_id in required_items:
-            # 인벤토리에서 재료 소모
-            remove_result = await self.inventory_manager.remove_item_from_inventory(
-                entity_id,
-                item_id,
-                quantity=1
-            )
-            if not remove_result:
-                return ActionResult.failure_result(f"수리에 필요한 재료가 없습니다: {item_id}")
+        repair_delta = self.inventory_manager.item_delta(required_items, -1)
+        try:
+            await self.inventory_manager.check_delta(entity_id, repair_delta)
+        except ValueError as e:
+            return ActionResult.failure_result(f"수리에 필요한 재료가 없습니다: {str(e)}")
         
-        # 오브젝트 상태 업데이트
+        # 오브젝트 상태 업데이트 (실패하면 재료는 그대로)
         updated_state = await self._update_object_state(
             runtime_object_id,
             game_object_id,
@@ -477,22 +451,26 @@ class CraftingInteractionHandler(ObjectInteractionHandlerBase):
         )
         
         if not updated_state:
-            # 실패 시 재료 복구
-            for item_id in required_items:
-                await self.inventory_manager.add_item_to_inventory(entity_id, item_id, quantity=1)
             return ActionResult.failure_result("오브젝트 상태를 업데이트할 수 없습니다.")
         
+        # 재료 소모 (한 트랜잭션)
+        try:
+            await self.inventory_manager.apply_delta(entity_id, repair_delta)
+        except ValueError as e:
+            # 확인 이후 재료가 사라진 경우: 인벤토리는 그대로이므로 오브젝트 상태만 되돌림
+            await self._update_object_state(
+                runtime_object_id,
+                game_object_id,
+                session_id,
+                state=object_state.get('current_state')
+            )
+            return ActionResult.failure_result(f"수리에 필요한 재료가 없습니다: {str(e)}")
+        
         object_name = object_state.get('object_name', '오브젝트')
         
         # TimeSystem 연동
         time_cost = repair_config.get('time_cost', 30)
-        if time_cost > 0:
-            from app.systems.time_system import TimeSystem
-            time_system = TimeSystem()
-            try:
-                await time_system.advance_time(minutes=time_cost)
-            except Exception as e:
-                self.logger.warning(f"TimeSystem 연동 실패: {str(e)}")
+        await self._apply_time_cost(time_cost, session_id)
         
         return ActionResult.success_result(
             f"{object_name}을(를) 수리했습니다.",
@@ -50,24 +50,13 @@ class DestructionInteractionHandler(ObjectInteractionHandlerBase):
         
         # 결과 아이템을 인벤토리에 추가
         if result_items and self.inventory_manager:
-            for item_id in result_items:
-                await self.inventory_manager.add_item_to_inventory(
-                    entity_id,
-                    item_id,
-                    quantity=1
-                )
+            await self.inventory_manager.apply_delta(entity_id, self.inventory_manager.item_delta(result_items))
         
         object_name = object_state.get('object_name', '오브젝트')
         
         # TimeSystem 연동
         time_cost = destroy_config.get('time_cost', 10)
-        if time_cost > 0:
-            from app.systems.time_system import TimeSystem
-            time_system = TimeSystem()
-            try:
-                await time_system.advance_time(minutes=time_cost)
-            except Exception as e:
-                self.logger.warning(f"TimeSystem 연동 실패: {str(e)}")
+        await self._apply_time_cost(time_cost, session_id)
         
         return ActionResult.success_result(
             f"{object_name}을(를) 파괴했습니다.",
@@ -129,23 +118,13 @@ class DestructionInteractionHandler(ObjectInteractionHandlerBase):
         if not updated_state:
             return ActionResult.failure_result("오브젝트 상태를 업데이트할 수 없습니다.")
         
-        # 결과 부품 아이템을 인벤토리에 추가
-        for item_id in result_items:
-            await self.inventory_manager.add_item_to_inventory(
-                entity_id,
-                item_id,
-                quantity=1
-            )
+        # 결과 부품 아이템을 인벤토리에 추가 (한 트랜잭션)
+        if result_items:
+            await self.inventory_manager.apply_delta(entity_id, self.inventory_manager.item_delta(result_items))
         
         # TimeSystem 연동 (분해는 시간 소모)
         time_cost = dismantle_config.get('time_cost', 30)
-        if time_cost > 0:
-            from app.systems.time_system import TimeSystem
-            time_system = TimeSystem()
-            try:
-                await time_system.advance_time(minutes=time_cost)
-            except Exception as e:
-                self.logger.warning(f"TimeSystem 연동 실패: {str(e)}")
+        await self._apply_time_cost(time_cost, session_id)
         
         object_name = object_state.get('object_name', '오브젝트')
         
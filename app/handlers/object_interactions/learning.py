@@ -93,19 +93,7 @@ class LearningInteractionHandler(ObjectInteractionHandlerBase):
             
             # TimeSystem 연동
             time_cost = read_config.get('time_cost', 30)
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             self.logger.info(
                 f"읽기 완료: entity_id={entity_id}, object_name={object_name}, "
@@ -204,19 +192,7 @@ class LearningInteractionHandler(ObjectInteractionHandlerBase):
             
             # TimeSystem 연동 (공부는 read보다 더 많은 시간 소모)
             time_cost = study_config.get('time_cost', 120)  # 기본 2시간
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             self.logger.info(
                 f"공부하기 완료: entity_id={entity_id}, object_name={object_name}, "
@@ -296,19 +272,7 @@ class LearningInteractionHandler(ObjectInteractionHandlerBase):
             # TimeSystem 연동
             write_config = properties.get('interactions', {}).get('write', {})
             time_cost = write_config.get('time_cost', 15)
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             # 아이템 생성 (필요시) - write_config에 result_item_id가 있으면 생성
             result_item_id = write_config.get('result_item_id')
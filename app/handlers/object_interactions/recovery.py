@@ -100,19 +100,7 @@ class RecoveryInteractionHandler(ObjectInteractionHandlerBase):
             
             # TimeSystem 연동 (30분)
             time_cost = rest_config.get('time_cost', 30)
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             self.logger.info(
                 f"휴식 완료: entity_id={entity_id}, object_name={object_name}, "
@@ -224,19 +212,7 @@ class RecoveryInteractionHandler(ObjectInteractionHandlerBase):
             
             # TimeSystem 연동 (480분 = 8시간)
             time_cost = sleep_config.get('time_cost', 480)
-            if time_cost > 0:
-                from app.systems.time_system import TimeSystem
-                time_system = TimeSystem()
-                try:
-                    await time_system.advance_time(minutes=time_cost)
-                    self.logger.debug(f"TimeSystem 연동 성공: {time_cost}분 진행")
-                except Exception as e:
-                    self.logger.warning(
-                        f"TimeSystem 연동 실패: {str(e)}",
-                        exc_info=True,
-                        extra={"time_cost": time_cost, "context": context}
-                    )
-                    # TimeSystem 실패는 치명적이지 않으므로 계속 진행
+            await self._apply_time_cost(time_cost, session_id)
             
             # 피로도 감소 처리
             # Note: EntityManager에 피로도 관리 기능이 추가되면 여기서 처리
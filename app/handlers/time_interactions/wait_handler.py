@@ -22,10 +22,9 @@ class WaitHandler(ActionHandlerBase):
             # 대기 시간 설정 (기본 1시간)
             wait_hours = parameters.get("hours", 1) if parameters else 1
             
-            # TimeSystem 연동
-            if self.time_system:
-                wait_minutes = wait_hours * 60
-                await self._apply_time_cost(wait_minutes)
+            # 세션 게임 시계 연동
+            session_id = parameters.get("session_id") if parameters else None
+            await self._apply_time_cost(wait_hours * 60, session_id)
             
             # 대기 데이터 생성
             wait_data = {
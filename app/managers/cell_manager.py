@@ -1,7 +1,7 @@
 """
 셀 관리 모듈
 """
-from typing import Dict, List, Optional, Any, Tuple, Union
+from typing import Dict, FrozenSet, List, Optional, Any, Tuple, Union
 from uuid import UUID
 import uuid
 import asyncio
@@ -14,9 +14,12 @@ from database.connection import DatabaseConnection
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
+from database.cell_occupancy import cell_occupancy, cell_key
 from app.managers.entity_manager import EntityManager, EntityData, EntityType, EntityStatus
 from app.managers.effect_carrier_manager import EffectCarrierManager
 from common.utils.logger import logger
+from common.utils.ttl_cache import TTLCache
+from app.config.app_config import CACHE_CONFIG
 
 
 class CellType(str, Enum):
@@ -115,10 +118,9 @@ class CellManager:
         self.effect_carrier_manager = effect_carrier_manager
         self.logger = logger
         
-        # 셀 캐시
-        self._cell_cache: Dict[str, CellData] = {}
-        self._content_cache: Dict[str, CellContent] = {}
-        self._cache_lock = asyncio.Lock()
+        # 셀 캐시 (크기 제한 + TTL, 세션 단위 무효화)
+        self._cell_cache = TTLCache("cell", **CACHE_CONFIG["cell"])
+        self._content_cache = TTLCache("cell_content", **CACHE_CONFIG["cell_content"])
     
     async def create_cell(self, 
                          static_cell_id: str,
@@ -199,8 +201,7 @@ class CellManager:
             )
             
             # 캐시에 추가
-            async with self._cache_lock:
-                self._cell_cache[runtime_cell_id] = cell_data
+            self._cell_cache.set(runtime_cell_id, cell_data, session_id=str(session_id))
             
             return CellResult.success_result(
                 cell_data, 
@@ -227,11 +228,10 @@ class CellManager:
         """
         try:
             # 캐시에서 먼저 확인
-            async with self._cache_lock:
-                cache_key = str(cell_id)
-                if cache_key in self._cell_cache:
-                    cell = self._cell_cache[cache_key]
-                    return CellResult.success_result(cell, message="캐시에서 조회")
+            cache_key = str(cell_id)
+            cell = self._cell_cache.get(cache_key)
+            if cell is not None:
+                return CellResult.success_result(cell, message="캐시에서 조회")
             
             # 데이터베이스에서 조회
             # 원칙: UUID는 runtime_cell_id → reference_layer → game_cell_id (VARCHAR)
@@ -260,8 +260,7 @@ class CellManager:
                 return CellResult.error_result(f"셀 '{cell_id}'를 찾을 수 없습니다.")
             
             # 캐시에 추가
-            async with self._cache_lock:
-                self._cell_cache[str(cell_id)] = cell_data
+            self._cell_cache.set(cache_key, cell_data)
             
             return CellResult.success_result(cell_data, message="데이터베이스에서 조회")
             
@@ -319,21 +318,22 @@ class CellManager:
                 return cell_result
             
             # 컨텐츠 캐시 확인
-            async with self._cache_lock:
-                if cell_id in self._content_cache:
-                    content = self._content_cache[cell_id]
-                    return CellResult.success_result(
-                        cell_result.cell, 
-                        content, 
-                        "캐시에서 컨텐츠 조회"
-                    )
-            
-            # 컨텐츠 로딩
-            content = await self._load_cell_content_from_db(cell_id)
+            content = self._content_cache.get(cell_id)
+            if content is not None:
+                return CellResult.success_result(
+                    cell_result.cell, 
+                    content, 
+                    "캐시에서 컨텐츠 조회"
+                )
             
-            # 캐시에 추가
-            async with self._cache_lock:
-                self._content_cache[cell_id] = content
+            # 컨텐츠 로딩 (같은 셀의 동시 진입은 한 번만 로드)
+            async with self._content_cache.lock(cell_id):
+                content = self._content_cache.peek(cell_id)
+                if content is None:
+                    content = await self._load_cell_content_from_db(cell_id)
+                    
+                    # 캐시에 추가 (셀과 같은 세션 태그)
+                    self._content_cache.set(cell_id, content, session_id=self._cell_cache.session_of(str(cell_id)))
             
             return CellResult.success_result(
                 cell_result.cell, 
@@ -470,8 +470,7 @@ class CellManager:
             # 런타임 셀은 매핑만 저장되므로 별도 저장 불필요
             
             # 캐시 업데이트
-            async with self._cache_lock:
-                self._cell_cache[cell_id] = updated_cell
+            self._cell_cache.set(str(cell_id), updated_cell)
             
             return CellResult.success_result(
                 updated_cell,
@@ -502,9 +501,8 @@ class CellManager:
             cells = await self._load_cells_from_db(cell_type, status)
             
             # 캐시 업데이트
-            async with self._cache_lock:
-                for cell in cells:
-                    self._cell_cache[cell.cell_id] = cell
+            for cell in cells:
+                self._cell_cache.set(cell.cell_id, cell)
             
             return cells
             
@@ -516,23 +514,23 @@ class CellManager:
         """셀 삭제"""
         try:
             # 캐시에서 셀 조회
-            async with self._cache_lock:
-                if cell_id in self._cell_cache:
-                    cell = self._cell_cache[cell_id]
-                    
-                    # DB에서 삭제
-                    await self._delete_cell_from_db(cell_id)
-                    
-                    # 캐시에서 제거
-                    del self._cell_cache[cell_id]
-                    
-                    self.logger.info(f"Cell '{cell_id}' deleted successfully")
-                    return CellResult.success_result(
-                        cell,
-                        message=f"Cell '{cell_id}' deleted successfully"
-                    )
-                else:
-                    return CellResult.error_result(f"Cell '{cell_id}' not found in cache")
+            cache_key = str(cell_id)
+            cell = self._cell_cache.get(cache_key)
+            if cell is not None:
+                # DB에서 삭제
+                await self._delete_cell_from_db(cell_id)
+                
+                # 캐시에서 제거
+                self._cell_cache.invalidate(cache_key)
+                self._content_cache.invalidate(cell_id)
+                
+                self.logger.info(f"Cell '{cell_id}' deleted successfully")
+                return CellResult.success_result(
+                    cell,
+                    message=f"Cell '{cell_id}' deleted successfully"
+                )
+            else:
+                return CellResult.error_result(f"Cell '{cell_id}' not found in cache")
                     
         except Exception as e:
             self.logger.error(f"Failed to delete cell '{cell_id}': {str(e)}")
@@ -634,63 +632,15 @@ class CellManager:
             cell_id: runtime_cell_id (UUID) 또는 game_cell_id (VARCHAR)
         
         원칙: UUID인 경우 reference_layer를 통해 game_cell_id 변환
+        
+        오브젝트 수와 무관하게 고정된 쿼리 수로 동작합니다:
+        셀 레퍼런스 해석 1회, 런타임 오브젝트/레퍼런스/상태 일괄 생성 2회,
+        엔티티 조회 1회, 오브젝트 + 런타임 상태 조회 1회
         """
         try:
             pool = await self.db.pool
             async with pool.acquire() as conn:
-                # UUID인 경우 runtime_cell_id로 간주하고 reference_layer에서 game_cell_id 찾기
-                if isinstance(cell_id, UUID):
-                    cell_ref = await conn.fetchrow("""
-                        SELECT game_cell_id, session_id
-                        FROM reference_layer.cell_references
-                        WHERE runtime_cell_id = $1
-                    """, cell_id)
-                else:
-                    # str인 경우 UUID 형식인지 확인
-                    # UUID 형식이면 runtime_cell_id로 간주
-                    try:
-                        cell_uuid = UUID(str(cell_id))
-                        # UUID 형식이면 runtime_cell_id로 처리
-                        cell_ref = await conn.fetchrow("""
-                            SELECT game_cell_id, session_id
-                            FROM reference_layer.cell_references
-                            WHERE runtime_cell_id = $1
-                        """, cell_uuid)
-                        if not cell_ref:
-                            # reference_layer에 없으면 runtime_cells에서 찾기
-                            cell_ref = await conn.fetchrow("""
-                                SELECT game_cell_id, session_id
-                                FROM runtime_data.runtime_cells
-                                WHERE runtime_cell_id = $1
-                            """, cell_uuid)
-                    except (ValueError, TypeError):
-                        # UUID 형식이 아니면 game_cell_id로 간주
-                        cell_ref = await conn.fetchrow("""
-                            SELECT game_cell_id, session_id
-                            FROM reference_layer.cell_references
-                            WHERE game_cell_id = $1
-                            LIMIT 1
-                        """, cell_id)
-                
-                if not cell_ref:
-                    # cell_references에 없으면 runtime_cells에서 찾기 (UUID인 경우)
-                    if isinstance(cell_id, UUID):
-                        cell_ref = await conn.fetchrow("""
-                            SELECT game_cell_id, session_id
-                            FROM runtime_data.runtime_cells
-                            WHERE runtime_cell_id = $1
-                        """, cell_id)
-                    else:
-                        # str이고 UUID 형식인지 다시 확인
-                        try:
-                            cell_uuid = UUID(str(cell_id))
-                            cell_ref = await conn.fetchrow("""
-                                SELECT game_cell_id, session_id
-                                FROM runtime_data.runtime_cells
-                                WHERE runtime_cell_id = $1
-                            """, cell_uuid)
-                        except (ValueError, TypeError):
-                            pass  # game_cell_id로 처리했지만 찾지 못함
+                cell_ref = await self._resolve_cell_reference(conn, cell_id)
                 
                 game_cell_id = cell_ref['game_cell_id'] if cell_ref else None
                 session_id = cell_ref['session_id'] if cell_ref else None
@@ -703,9 +653,14 @@ class CellManager:
                     self.logger.warning(f"session_id를 찾을 수 없음: cell_id={cell_id}, cell_ref={cell_ref}")
                 
                 # 셀 내 엔티티 조회 (3-Layer 구조 사용)
-                # current_position JSONB에서 runtime_cell_id 추출
-                # 원칙: UUID를 문자열로 변환하여 비교
-                entity_rows = await conn.fetch("""
+                # runtime_cell_id(UUID)는 생성 컬럼 current_cell_id 인덱스로 조회,
+                # UUID가 아닌 셀 ID는 current_position JSONB 문자열 비교
+                runtime_cell_key = cell_key(cell_id)
+                if runtime_cell_key:
+                    cell_predicate, cell_param = "es.current_cell_id = $1::uuid", runtime_cell_key
+                else:
+                    cell_predicate, cell_param = "es.current_position->>'runtime_cell_id' = $1::text", str(cell_id)
+                entity_rows = await conn.fetch(f"""
                     SELECT 
                         re.runtime_entity_id,
                         ge.entity_name as name,
@@ -714,11 +669,11 @@ class CellManager:
                         ge.entity_properties,
                         es.current_stats,
                         es.current_position
-                    FROM reference_layer.entity_references re
+                    FROM runtime_data.entity_states es
+                    JOIN reference_layer.entity_references re ON re.runtime_entity_id = es.runtime_entity_id
                     JOIN game_data.entities ge ON re.game_entity_id = ge.entity_id
-                    LEFT JOIN runtime_data.entity_states es ON re.runtime_entity_id = es.runtime_entity_id
-                    WHERE es.current_position->>'runtime_cell_id' = $1::text
-                """, str(cell_id))
+                    WHERE {cell_predicate}
+                """, cell_param)
                 
                 self.logger.debug(f"엔티티 조회 결과: {len(entity_rows)}개")
                 
@@ -726,121 +681,31 @@ class CellManager:
                 # 레퍼런스 레이어를 통해 game_object_id → runtime_object_id 변환
                 object_rows = []
                 if game_cell_id and session_id:
-                    # 1. game_data.world_objects에서 default_cell_id가 현재 셀인 오브젝트 찾기
-                    game_objects = await conn.fetch("""
+                    async with conn.transaction():
+                        await self._materialize_cell_objects(conn, game_cell_id, session_id, cell_id)
+                    
+                    # 오브젝트 정의 + 레퍼런스 + 런타임 상태를 한 번에 조회
+                    object_rows = await conn.fetch("""
                         SELECT 
+                            orf.runtime_object_id,
                             wo.object_id as game_object_id,
                             wo.object_name,
                             wo.object_description as description,
                             wo.object_type,
                             wo.interaction_type,
                             wo.default_position,
-                            wo.properties
+                            wo.properties,
+                            os.current_state
                         FROM game_data.world_objects wo
+                        JOIN reference_layer.object_references orf
+                            ON orf.game_object_id = wo.object_id AND orf.session_id = $2
+                        LEFT JOIN runtime_data.object_states os
+                            ON os.runtime_object_id = orf.runtime_object_id
                         WHERE wo.default_cell_id = $1
-                    """, game_cell_id)
-                    
-                    self.logger.debug(f"게임 데이터에서 오브젝트 조회: game_cell_id={game_cell_id}, 오브젝트 수={len(game_objects)}")
+                        ORDER BY wo.object_id
+                    """, game_cell_id, session_id)
                     
-                    # 2. 각 오브젝트에 대해 레퍼런스 레이어에서 runtime_object_id 조회 또는 생성
-                    for game_obj in game_objects:
-                        game_object_id = game_obj['game_object_id']
-                        
-                        # object_references에서 조회
-                        object_ref = await conn.fetchrow(
-                            """
-                            SELECT runtime_object_id FROM reference_layer.object_references
-                            WHERE game_object_id = $1 AND session_id = $2
-                            """,
-                            game_object_id,
-                            session_id
-                        )
-                        
-                        if object_ref:
-                            # 레퍼런스 레이어에 있으면 사용
-                            runtime_object_id = object_ref['runtime_object_id']
-                        else:
-                            # 레퍼런스 레이어에 없으면 새로 생성하고 등록
-                            runtime_object_id = uuid.uuid4()
-                            
-                            # Foreign Key 제약조건을 위해 runtime_objects를 먼저 생성
-                            await conn.execute(
-                                """
-                                INSERT INTO runtime_data.runtime_objects 
-                                (runtime_object_id, game_object_id, session_id)
-                                VALUES ($1, $2, $3)
-                                """,
-                                runtime_object_id,
-                                game_object_id,
-                                session_id
-                            )
-                            
-                            # 그 다음 object_references에 등록
-                            await conn.execute(
-                                """
-                                INSERT INTO reference_layer.object_references 
-                                (runtime_object_id, game_object_id, session_id, object_type)
-                                VALUES ($1, $2, $3, $4)
-                                """,
-                                runtime_object_id,
-                                game_object_id,
-                                session_id,
-                                game_obj['object_type']
-                            )
-                        
-                        # object_states 생성 또는 업데이트 (current_position 포함)
-                        # object_ref가 이미 있어도 object_states가 없을 수 있으므로 항상 확인
-                        import json
-                        from app.common.utils.uuid_helper import normalize_uuid
-                        
-                        default_pos = parse_jsonb_data(game_obj.get('default_position', {}))
-                        current_position = {
-                            **(default_pos if default_pos else {}),
-                            'runtime_cell_id': normalize_uuid(cell_id)  # JSONB 저장용 문자열로 정규화
-                        }
-                        
-                        # object_states가 있는지 확인
-                        existing_state = await conn.fetchrow("""
-                            SELECT runtime_object_id FROM runtime_data.object_states
-                            WHERE runtime_object_id = $1
-                        """, runtime_object_id)
-                        
-                        if not existing_state:
-                            # object_states가 없으면 생성
-                            await conn.execute(
-                                """
-                                INSERT INTO runtime_data.object_states 
-                                (runtime_object_id, current_state, current_position)
-                                VALUES ($1, $2, $3)
-                                """,
-                                runtime_object_id,
-                                json.dumps({}),  # 기본 상태
-                                json.dumps(current_position)
-                            )
-                        else:
-                            # object_states가 있으면 current_position 업데이트
-                            await conn.execute(
-                                """
-                                UPDATE runtime_data.object_states
-                                SET current_position = $1
-                                WHERE runtime_object_id = $2
-                                """,
-                                json.dumps(current_position),
-                                runtime_object_id
-                            )
-                        
-                        # object_rows에 추가
-                        object_rows.append({
-                            'runtime_object_id': runtime_object_id,
-                            'game_object_id': game_object_id,
-                            'object_name': game_obj['object_name'],
-                            'object_description': game_obj['description'],
-                            'object_type': game_obj['object_type'],
-                            'interaction_type': game_obj['interaction_type'],
-                            'default_position': game_obj['default_position'],
-                            'properties': game_obj['properties']
-                        })
-                        self.logger.debug(f"오브젝트 추가: {game_obj['object_name']} (game_object_id={game_object_id}, runtime_object_id={runtime_object_id})")
+                    self.logger.debug(f"게임 데이터에서 오브젝트 조회: game_cell_id={game_cell_id}, 오브젝트 수={len(object_rows)}")
                 else:
                     if not game_cell_id:
                         self.logger.warning(f"game_cell_id가 없어서 오브젝트를 조회하지 않음: cell_id={cell_id}")
@@ -875,44 +740,25 @@ class CellManager:
                     entities.append(entity_data)
                 
                 # 오브젝트 데이터 변환
+                from app.common.utils.uuid_helper import normalize_uuid
                 objects = []
                 for row in object_rows:
                     position_data = parse_jsonb_data(row.get('default_position', {}))
-                    properties = parse_jsonb_data(row.get('properties', {}))
-                    runtime_object_id = row['runtime_object_id']
+                    properties = parse_jsonb_data(row.get('properties', {})) or {}
                     
-                    # 런타임 상태에서 contents 확인 및 병합
-                    runtime_state = await conn.fetchrow(
-                        """
-                        SELECT current_state FROM runtime_data.object_states
-                        WHERE runtime_object_id = $1
-                        """,
-                        runtime_object_id
-                    )
-                    
-                    if runtime_state and runtime_state.get('current_state'):
-                        state_dict = parse_jsonb_data(runtime_state['current_state'])
-                        # 런타임 상태에 'contents' 키가 명시적으로 있으면 사용
+                    # 런타임 상태의 state/contents를 properties에 병합 (런타임 값 우선)
+                    state_dict = parse_jsonb_data(row.get('current_state')) or {}
+                    if state_dict:
+                        properties = properties.copy()
                         if 'contents' in state_dict:
-                            # properties의 contents를 런타임 상태로 덮어쓰기
-                            properties = properties.copy()
                             properties['contents'] = state_dict['contents']
-                    
-                    # 런타임 상태에서 state 확인 및 properties에 추가
-                    if runtime_state and runtime_state.get('current_state'):
-                        state_dict = parse_jsonb_data(runtime_state['current_state'])
-                        # state를 properties에 추가
                         if 'state' in state_dict:
                             properties['state'] = state_dict['state']
                             properties['current_state'] = state_dict['state']
-                        # contents도 properties에 추가 (이미 위에서 처리했지만 확실히)
-                        if 'contents' in state_dict and 'contents' not in properties:
-                            properties['contents'] = state_dict['contents']
                     
                     # runtime_object_id는 이미 레퍼런스 레이어를 통해 확보됨
                     # UUID 헬퍼 함수로 문자열로 정규화 (JSONB와의 호환성, 프론트엔드 호환성)
-                    from app.common.utils.uuid_helper import normalize_uuid
-                    runtime_object_id_str = normalize_uuid(runtime_object_id)
+                    runtime_object_id_str = normalize_uuid(row['runtime_object_id'])
                     objects.append({
                         'object_id': runtime_object_id_str,  # 프론트엔드 호환성을 위해 object_id 추가
                         'runtime_object_id': runtime_object_id_str,  # 문자열로 정규화
@@ -939,6 +785,110 @@ class CellManager:
             self.logger.error(traceback.format_exc())
             return CellContent()
     
+    async def _resolve_cell_reference(self, conn, cell_id: Union[str, UUID]) -> Optional[Any]:
+        """
+        셀 ID를 (game_cell_id, session_id)로 해석
+        
+        Args:
+            conn: 데이터베이스 연결
+            cell_id: runtime_cell_id (UUID/UUID 문자열) 또는 game_cell_id (VARCHAR)
+        
+        원칙: runtime_cell_id는 reference_layer 우선, 없으면 runtime_cells에서 조회 (단일 쿼리)
+        """
+        if isinstance(cell_id, UUID):
+            cell_uuid = cell_id
+        else:
+            try:
+                cell_uuid = UUID(str(cell_id))
+            except (ValueError, TypeError):
+                cell_uuid = None
+        
+        if cell_uuid is None:
+            # UUID 형식이 아니면 game_cell_id로 간주
+            return await conn.fetchrow("""
+                SELECT game_cell_id, session_id
+                FROM reference_layer.cell_references
+                WHERE game_cell_id = $1
+                LIMIT 1
+            """, cell_id)
+        
+        return await conn.fetchrow("""
+            SELECT game_cell_id, session_id FROM (
+                SELECT game_cell_id, session_id, 0 AS priority
+                FROM reference_layer.cell_references
+                WHERE runtime_cell_id = $1
+                UNION ALL
+                SELECT game_cell_id, session_id, 1 AS priority
+                FROM runtime_data.runtime_cells
+                WHERE runtime_cell_id = $1
+            ) refs
+            ORDER BY priority
+            LIMIT 1
+        """, cell_uuid)
+    
+    async def _materialize_cell_objects(self,
+                                        conn,
+                                        game_cell_id: str,
+                                        session_id: Union[str, UUID],
+                                        cell_id: Union[str, UUID]) -> None:
+        """
+        셀의 모든 게임 오브젝트에 대해 런타임 오브젝트/레퍼런스/상태를 일괄 생성
+        
+        Args:
+            conn: 데이터베이스 연결 (트랜잭션 내부에서 호출)
+            game_cell_id: 게임 셀 ID
+            session_id: 세션 ID
+            cell_id: 오브젝트 current_position에 기록할 런타임 셀 ID
+        
+        주의: uq_object_references_session_object, uq_object_states_runtime_object
+        제약조건이 필요합니다 (database/migrations/add_cell_content_bulk_load_constraints.sql)
+        """
+        from app.common.utils.uuid_helper import normalize_uuid
+        
+        # 1. 레퍼런스가 없는 오브젝트에 대해 object_references + runtime_objects 생성
+        #    ON CONFLICT로 동시 로딩 시에도 세션당 하나의 런타임 오브젝트만 유지
+        #    (FK 검사는 문장 종료 시점에 수행되므로 CTE 순서와 무관)
+        await conn.execute("""
+            WITH new_refs AS (
+                INSERT INTO reference_layer.object_references
+                    (runtime_object_id, game_object_id, session_id, object_type)
+                SELECT uuid_generate_v4(), wo.object_id, $2, wo.object_type
+                FROM game_data.world_objects wo
+                WHERE wo.default_cell_id = $1
+                  AND NOT EXISTS (
+                      SELECT 1 FROM reference_layer.object_references orf
+                      WHERE orf.game_object_id = wo.object_id AND orf.session_id = $2
+                  )
+                ON CONFLICT (session_id, game_object_id) DO NOTHING
+                RETURNING runtime_object_id, game_object_id
+            )
+            INSERT INTO runtime_data.runtime_objects (runtime_object_id, game_object_id, session_id)
+            SELECT runtime_object_id, game_object_id, $2
+            FROM new_refs
+        """, game_cell_id, session_id)
+        
+        # 2. object_states 생성 또는 current_position 갱신
+        #    (기본 위치 + runtime_cell_id, 변경이 없는 행은 다시 쓰지 않음)
+        await conn.execute("""
+            INSERT INTO runtime_data.object_states
+                (runtime_object_id, current_state, current_position)
+            SELECT
+                orf.runtime_object_id,
+                '{}'::jsonb,
+                CASE WHEN jsonb_typeof(wo.default_position) = 'object'
+                     THEN wo.default_position
+                     ELSE '{}'::jsonb
+                END || jsonb_build_object('runtime_cell_id', $3::text)
+            FROM game_data.world_objects wo
+            JOIN reference_layer.object_references orf
+                ON orf.game_object_id = wo.object_id AND orf.session_id = $2
+            WHERE wo.default_cell_id = $1
+            ON CONFLICT (runtime_object_id) DO UPDATE
+                SET current_position = EXCLUDED.current_position
+                WHERE runtime_data.object_states.current_position
+                      IS DISTINCT FROM EXCLUDED.current_position
+        """, game_cell_id, session_id, normalize_uuid(cell_id))
+    
     async def _load_cells_from_db(self, 
                                  session_id: str = None,
                                  cell_type: Optional[CellType] = None) -> List[CellData]:
@@ -1064,6 +1014,7 @@ class CellManager:
                     updated_at = NOW()
                     WHERE runtime_entity_id = $2
                 """, runtime_cell_id, runtime_entity_id)
+                cell_occupancy.move(runtime_entity_id, runtime_cell_id)
                 
                 self.logger.info(f"Player {runtime_entity_id} added to cell {runtime_cell_id} (SSOT: entity_states.current_position)")
                 
@@ -1095,6 +1046,7 @@ class CellManager:
                 updated_at = NOW()
                 WHERE runtime_entity_id = $1
             """, runtime_entity_id)
+            cell_occupancy.remove(runtime_entity_id)
             
             self.logger.info(f"Player {runtime_entity_id} removed from cell {runtime_cell_id} (SSOT: entity_states.current_position)")
                 
@@ -1134,11 +1086,10 @@ class CellManager:
                     updated_at = NOW()
                     WHERE runtime_entity_id = $2
                 """, runtime_cell_id, runtime_entity_id)
+            cell_occupancy.move(runtime_entity_id, runtime_cell_id)
             
             # 컨텐츠 캐시 무효화
-            async with self._cache_lock:
-                if runtime_cell_id in self._content_cache:
-                    del self._content_cache[runtime_cell_id]
+            self._content_cache.invalidate(runtime_cell_id)
             
             self.logger.info(f"Entity {runtime_entity_id} added to cell {runtime_cell_id}")
             return CellResult.success_result(
@@ -1177,11 +1128,10 @@ class CellManager:
                     updated_at = NOW()
                     WHERE runtime_entity_id = $1
                 """, runtime_entity_id)
+            cell_occupancy.remove(runtime_entity_id)
             
             # 컨텐츠 캐시 무효화
-            async with self._cache_lock:
-                if runtime_cell_id in self._content_cache:
-                    del self._content_cache[runtime_cell_id]
+            self._content_cache.invalidate(runtime_cell_id)
             
             self.logger.info(f"Entity {runtime_entity_id} removed from cell {runtime_cell_id}")
             return CellResult.success_result(
@@ -1227,11 +1177,12 @@ class CellManager:
                     if not add_result.success:
                         return add_result
                     
-                    # 3. 위치 업데이트 (선택사항 - current_cell_id 유지)
+                    # 3. 위치 업데이트 (선택사항 - runtime_cell_id 유지)
                     if new_position:
-                        # current_cell_id를 유지하면서 좌표만 업데이트
+                        # runtime_cell_id를 유지하면서 좌표만 업데이트
+                        # (키가 없으면 current_cell_id 생성 컬럼이 NULL이 되어 셀에서 빠짐)
                         position_with_cell = new_position.copy()
-                        position_with_cell['current_cell_id'] = to_runtime_cell_id
+                        position_with_cell['runtime_cell_id'] = str(to_runtime_cell_id)
                         
                         await conn.execute("""
                             UPDATE runtime_data.entity_states
@@ -1253,8 +1204,29 @@ class CellManager:
             self.logger.error(f"Failed to move entity between cells: {str(e)}")
             return CellResult.error_result(f"Failed to move entity: {str(e)}", str(e))
     
+    async def get_cell_occupants(self, cell_id: Union[str, UUID]) -> FrozenSet[str]:
+        """
+        셀에 있는 엔티티 ID 집합 조회 (셀 점유 맵 사용)
+        
+        엔티티 상세/오브젝트가 필요 없는 "누가 있는가" 조회용입니다.
+        자주 조회되는 셀은 메모리에서 바로 반환하고, 처음 조회하는 셀만
+        entity_states.current_cell_id 인덱스로 한 번 조회합니다.
+        """
+        return await cell_occupancy.occupants(cell_id)
+    
     async def clear_cache(self) -> None:
         """캐시 초기화"""
-        async with self._cache_lock:
-            self._cell_cache.clear()
-            self._content_cache.clear()
+        self._cell_cache.clear()
+        self._content_cache.clear()
+    
+    async def invalidate_session_cache(self, session_id: str) -> int:
+        """세션에 속한 셀/컨텐츠 캐시 일괄 무효화"""
+        return (self._cell_cache.invalidate_session(session_id) +
+                self._content_cache.invalidate_session(session_id))
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return {
+            "cell": self._cell_cache.snapshot(),
+            "cell_content": self._content_cache.snapshot()
+        }
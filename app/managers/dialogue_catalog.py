@@ -0,0 +1,199 @@
+"""
+대화 카탈로그 (NPC별 대화 컨텍스트/주제 인덱스)
+
+game_data.dialogue_contexts / dialogue_topics를 한 번 읽어 메모리 인덱스로 보관합니다.
+대화 시작/진행 시 카탈로그 조회 쿼리를 실행하지 않습니다.
+
+- 소유 키: dialogue_contexts.entity_id (게임 엔티티 ID 또는 런타임 엔티티 ID)
+  - entity_id가 없는 컨텍스트는 모든 NPC 공용(전역 기본값)
+  - dialogue_id 부분 문자열 매칭(LIKE '%npc_id%')은 사용하지 않음
+- 월드 에디터의 DialogueService / DialogueKnowledgeService가 쓰기 후 invalidate() 호출
+  → 다음 조회 시 다시 로드
+
+사용 예:
+    from app.managers.dialogue_catalog import dialogue_catalog
+
+    index = await dialogue_catalog.get_index()
+    context = index.context_for((npc_id, game_entity_id))
+"""
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+from database.connection import DatabaseConnection
+from common.utils.jsonb_handler import parse_jsonb_data
+from common.utils.logger import logger
+
+
+class DialogueCatalogIndex:
+    """대화 카탈로그 인덱스 (로드 후 읽기 전용, 대화 기록용 컨텍스트 등록만 허용)"""
+
+    def __init__(self, context_rows: Iterable[Any], topic_rows: Iterable[Any]):
+        # dialogue_id -> 컨텍스트
+        self.contexts: Dict[str, Dict[str, Any]] = {}
+        # 소유 키 -> dialogue_id 목록 (dialogue_id 순)
+        self.contexts_by_owner: Dict[str, List[str]] = {}
+        # 소유 키 -> {topic_type -> 주제} (같은 타입은 topic_id가 가장 작은 주제)
+        self.topics_by_owner: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # 전역 컨텍스트 (우선순위 내림차순) / 전역 주제 타입
+        self.global_contexts: List[Dict[str, Any]] = []
+        self.global_topic_types: List[str] = []
+        # 전체 주제 타입 (정렬)
+        self.topic_types: List[str] = []
+        self.default_priority = 1
+
+        for row in context_rows:
+            self.add_context(dict(row), sort=False)
+        for owned in self.contexts_by_owner.values():
+            owned.sort()
+        self.global_contexts.sort(key=lambda context: -(context["priority"] or 0))
+
+        topic_types = set()
+        global_topic_types = set()
+        for row in sorted((dict(row) for row in topic_rows), key=lambda topic: topic["topic_id"]):
+            row["conditions"] = parse_jsonb_data(row.get("conditions")) or {}
+            context = self.contexts.get(row["dialogue_id"])
+            topic_type = row["topic_type"]
+            if context is None or topic_type is None:
+                continue
+            topic_types.add(topic_type)
+            owner = context["entity_id"]
+            if owner:
+                self.topics_by_owner.setdefault(owner, {}).setdefault(topic_type, row)
+            else:
+                global_topic_types.add(topic_type)
+        self.topic_types = sorted(topic_types)
+        self.global_topic_types = sorted(global_topic_types)
+
+        priorities = [context["priority"] for context in self.contexts.values() if context["priority"] is not None]
+        if priorities:
+            self.default_priority = int(sum(priorities) / len(priorities))
+
+    def add_context(self, row: Dict[str, Any], sort: bool = True) -> None:
+        """컨텍스트 등록 (대화 기록용 컨텍스트를 DB 재조회 없이 반영할 때도 사용)"""
+        row["available_topics"] = parse_jsonb_data(row.get("available_topics")) or {}
+        row["constraints"] = parse_jsonb_data(row.get("constraints")) or {}
+        dialogue_id = row["dialogue_id"]
+        if dialogue_id in self.contexts:
+            return
+        self.contexts[dialogue_id] = row
+
+        owner = row.get("entity_id") or None
+        row["entity_id"] = owner
+        if owner:
+            owned = self.contexts_by_owner.setdefault(owner, [])
+            owned.append(dialogue_id)
+            if sort:
+                owned.sort()
+        else:
+            self.global_contexts.append(row)
+
+    def context_for(self, owner_keys: Iterable[Optional[str]]) -> Optional[Dict[str, Any]]:
+        """소유 키 중 처음으로 컨텍스트가 있는 키의 첫 컨텍스트"""
+        for owner in owner_keys:
+            owned = self.contexts_by_owner.get(owner) if owner else None
+            if owned:
+                return self.contexts[owned[0]]
+        return None
+
+    def topic_for(self, owner_keys: Iterable[Optional[str]], topic_type: str) -> Optional[Dict[str, Any]]:
+        """소유 키의 주제 조회"""
+        for owner in owner_keys:
+            topic = self.topics_by_owner.get(owner, {}).get(topic_type) if owner else None
+            if topic is not None:
+                return topic
+        return None
+
+    def owned_topic_types(self, owner_keys: Iterable[Optional[str]]) -> List[str]:
+        """소유 키가 가진 주제 타입 (정렬, 중복 제거)"""
+        topic_types = set()
+        for owner in owner_keys:
+            if owner:
+                topic_types.update(self.topics_by_owner.get(owner, ()))
+        return sorted(topic_types)
+
+    def npc_topic_types(self, owner_keys: Iterable[Optional[str]]) -> List[str]:
+        """NPC 소유 주제 + 전역 주제 타입 (정렬)"""
+        return sorted(set(self.owned_topic_types(owner_keys)) | set(self.global_topic_types))
+
+
+class DialogueCatalog:
+    """대화 카탈로그 (지연 로드 + 쓰기 시 무효화)"""
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+        """
+        self._db = db_connection
+        self._index: Optional[DialogueCatalogIndex] = None
+        self._version = 0
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loads = 0
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    async def get_index(self, db_connection: Optional[DatabaseConnection] = None) -> DialogueCatalogIndex:
+        """
+        카탈로그 인덱스 조회 (없으면 로드)
+
+        Args:
+            db_connection: 로드에 사용할 연결 (기본: 카탈로그 연결)
+        """
+        index = self._index
+        if index is not None:
+            return index
+
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            # 이벤트 루프마다 락 생성 (전역 인스턴스를 여러 루프에서 사용하는 테스트 대비)
+            self._lock, self._lock_loop = asyncio.Lock(), loop
+        async with self._lock:
+            while self._index is None:
+                version = self._version
+                index = await self._load(db_connection or self.db)
+                # 로드 중 무효화되었으면 다시 로드
+                if version == self._version:
+                    self._index = index
+            return self._index
+
+    async def _load(self, db: DatabaseConnection) -> DialogueCatalogIndex:
+        pool = await db.pool
+        async with pool.acquire() as conn:
+            context_rows = await conn.fetch("""
+                SELECT dialogue_id, title, content, entity_id, priority,
+                       entity_personality, available_topics, constraints
+                FROM game_data.dialogue_contexts
+            """)
+            topic_rows = await conn.fetch("""
+                SELECT topic_id, dialogue_id, topic_type, content, conditions
+                FROM game_data.dialogue_topics
+            """)
+        index = DialogueCatalogIndex(context_rows, topic_rows)
+        self.loads += 1
+        logger.info(f"대화 카탈로그 로드: contexts={len(index.contexts)}, topic_types={len(index.topic_types)}")
+        return index
+
+    def invalidate(self) -> None:
+        """카탈로그 무효화 (대화 컨텍스트/주제/지식 쓰기 후 호출)"""
+        self._version += 1
+        self._index = None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태"""
+        index = self._index
+        return {
+            "loaded": index is not None,
+            "loads": self.loads,
+            "contexts": len(index.contexts) if index else 0,
+            "owners": len(index.contexts_by_owner) if index else 0,
+            "topic_types": len(index.topic_types) if index else 0,
+        }
+
+
+# 전역 대화 카탈로그
+dialogue_catalog = DialogueCatalog()
@@ -11,6 +11,7 @@ from enum import Enum
 
 from app.managers.entity_manager import EntityManager, EntityType, EntityStatus
 from app.managers.effect_carrier_manager import EffectCarrierManager
+from app.managers.dialogue_catalog import DialogueCatalog, DialogueCatalogIndex, dialogue_catalog
 from database.connection import DatabaseConnection
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
@@ -112,7 +113,8 @@ class DialogueManager:
                  runtime_data_repo: RuntimeDataRepository,
                  reference_layer_repo: ReferenceLayerRepository,
                  entity_manager: EntityManager,
-                 effect_carrier_manager: Optional[EffectCarrierManager] = None):
+                 effect_carrier_manager: Optional[EffectCarrierManager] = None,
+                 catalog: Optional[DialogueCatalog] = None):
         """
         DialogueManager 초기화
         
@@ -123,6 +125,7 @@ class DialogueManager:
             reference_layer_repo: 참조 레이어 저장소
             entity_manager: 엔티티 관리자
             effect_carrier_manager: Effect Carrier 관리자 (선택사항)
+            catalog: 대화 카탈로그 (기본: 전역 dialogue_catalog)
         """
         self.db = db_connection
         self.game_data = game_data_repo
@@ -130,6 +133,7 @@ class DialogueManager:
         self.reference_layer = reference_layer_repo
         self.entity_manager = entity_manager
         self.effect_carrier_manager = effect_carrier_manager
+        self.catalog = catalog or dialogue_catalog
         self.logger = logger
         
         # 대화 응답 템플릿
@@ -169,13 +173,13 @@ class DialogueManager:
                 return DialogueResult.failure_result(f"{npc.name}과는 대화할 수 없습니다.")
             
             # 대화 컨텍스트 로드
-            dialogue_context = await self._load_dialogue_context(npc_id)
+            dialogue_context = await self._load_dialogue_context(npc_id, npc)
             if not dialogue_context:
                 # 기본 대화 컨텍스트 생성
                 dialogue_context = await self._create_default_dialogue_context(npc, npc_id)
             
             # 대화 주제 로드
-            available_topics = await self._get_available_topics(npc_id, player_id)
+            available_topics = await self._get_available_topics(npc_id, player_id, npc)
             
             # 초기 응답 생성
             npc_response = await self._generate_npc_response(npc, initial_topic, dialogue_context)
@@ -216,12 +220,12 @@ class DialogueManager:
             npc = npc_result.entity
             
             # 대화 컨텍스트 로드
-            dialogue_context = await self._load_dialogue_context(npc_id)
+            dialogue_context = await self._load_dialogue_context(npc_id, npc)
             if not dialogue_context:
                 dialogue_context = await self._create_default_dialogue_context(npc, npc_id)
             
             # 대화 주제 로드
-            topic_data = await self._load_dialogue_topic(npc_id, topic)
+            topic_data = await self._load_dialogue_topic(npc_id, topic, npc)
             
             # NPC 응답 생성
             npc_response = await self._generate_npc_response(npc, topic, dialogue_context, topic_data)
@@ -231,7 +235,7 @@ class DialogueManager:
             await self._save_dialogue_history(session_id, player_id, npc_id, dialogue_context_id, topic, player_message, npc_response)
             
             # 사용 가능한 주제 업데이트
-            available_topics = await self._get_available_topics(npc_id, player_id)
+            available_topics = await self._get_available_topics(npc_id, player_id, npc)
             
             # 대화 데이터 생성
             dialogue_data = {
@@ -292,32 +296,32 @@ class DialogueManager:
             self.logger.error(f"Failed to end dialogue: {str(e)}")
             return DialogueResult.failure_result(f"대화 종료 실패: {str(e)}")
     
-    async def _load_dialogue_context(self, npc_id: str) -> Optional[DialogueContext]:
-        """대화 컨텍스트 로드"""
+    async def _catalog_index(self) -> DialogueCatalogIndex:
+        """대화 카탈로그 인덱스 (최초 1회 로드 후 메모리 조회)"""
+        return await self.catalog.get_index(self.db)
+    
+    @staticmethod
+    def _owner_keys(npc_id: str, npc=None) -> Tuple[Optional[str], ...]:
+        """대화 컨텍스트 소유 키 (런타임 엔티티 ID, 게임 엔티티 ID 순)"""
+        return (str(npc_id), getattr(npc, "game_entity_id", None))
+    
+    async def _load_dialogue_context(self, npc_id: str, npc=None) -> Optional[DialogueContext]:
+        """대화 컨텍스트 로드 (카탈로그 인덱스, NPC 소유 컨텍스트만)"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT dialogue_id, title, content, priority, entity_personality, 
-                           available_topics, constraints
-                    FROM game_data.dialogue_contexts
-                    WHERE dialogue_id LIKE $1
-                    ORDER BY dialogue_id
-                    LIMIT 1
-                """, f"%{npc_id}%")
-                
-                if not row:
-                    return None
-                
-                return DialogueContext(
-                    context_id=row['dialogue_id'],
-                    title=row['title'],
-                    content=row['content'],
-                    priority=row['priority'],
-                    entity_personality=row['entity_personality'],
-                    available_topics=parse_jsonb_data(row['available_topics']) or {},
-                    constraints=parse_jsonb_data(row['constraints']) or {}
-                )
+            index = await self._catalog_index()
+            row = index.context_for(self._owner_keys(npc_id, npc))
+            if not row:
+                return None
+            
+            return DialogueContext(
+                context_id=row['dialogue_id'],
+                title=row['title'],
+                content=row['content'],
+                priority=row['priority'],
+                entity_personality=row['entity_personality'],
+                available_topics=row['available_topics'],
+                constraints=row['constraints']
+            )
         except Exception as e:
             self.logger.error(f"Failed to load dialogue context: {str(e)}")
             return None
@@ -331,7 +335,7 @@ class DialogueManager:
             priority=await self.get_default_priority(),
             entity_personality=npc.properties.get("personality", "친근한"),
             available_topics={
-                "topics": await self.get_available_topics(npc_id),
+                "topics": await self.get_available_topics(npc_id, npc),
                 "default_topic": self.default_topic
             },
             constraints={
@@ -340,54 +344,37 @@ class DialogueManager:
             }
         )
     
-    async def _load_dialogue_topic(self, npc_id: str, topic: str) -> Optional[DialogueTopic]:
-        """대화 주제 로드"""
+    async def _load_dialogue_topic(self, npc_id: str, topic: str, npc=None) -> Optional[DialogueTopic]:
+        """대화 주제 로드 (카탈로그 인덱스)"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                row = await conn.fetchrow("""
-                    SELECT topic_id, dialogue_id, topic_type, content, conditions
-                    FROM game_data.dialogue_topics
-                    WHERE dialogue_id LIKE $1 AND topic_type = $2
-                    LIMIT 1
-                """, f"%{npc_id}%", topic)
-                
-                if not row:
-                    return None
-                
-                return DialogueTopic(
-                    topic_id=row['topic_id'],
-                    dialogue_id=row['dialogue_id'],
-                    topic_type=row['topic_type'],
-                    content=row['content'],
-                    conditions=parse_jsonb_data(row['conditions']) or {}
-                )
+            index = await self._catalog_index()
+            row = index.topic_for(self._owner_keys(npc_id, npc), topic)
+            if not row:
+                return None
+            
+            return DialogueTopic(
+                topic_id=row['topic_id'],
+                dialogue_id=row['dialogue_id'],
+                topic_type=row['topic_type'],
+                content=row['content'],
+                conditions=row['conditions']
+            )
         except Exception as e:
             self.logger.error(f"Failed to load dialogue topic: {str(e)}")
             return None
     
-    async def _get_available_topics(self, npc_id: str, player_id: str) -> List[str]:
-        """사용 가능한 주제 목록 조회"""
+    async def _get_available_topics(self, npc_id: str, player_id: str, npc=None) -> List[str]:
+        """사용 가능한 주제 목록 조회 (NPC 소유 주제 + 전체 기본 주제)"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                rows = await conn.fetch("""
-                    SELECT topic_type
-                    FROM game_data.dialogue_topics
-                    WHERE dialogue_id LIKE $1
-                    ORDER BY topic_type
-                """, f"%{npc_id}%")
-                
-                topics = [row['topic_type'] for row in rows]
-                
-                # 기본 주제 추가
-                # 동적으로 기본 주제 로드
-                default_topics = await self.get_available_topics()
-                for topic in default_topics:
-                    if topic not in topics:
-                        topics.append(topic)
-                
-                return topics
+            index = await self._catalog_index()
+            topics = index.owned_topic_types(self._owner_keys(npc_id, npc))
+            
+            # 기본 주제 추가
+            for topic in index.topic_types:
+                if topic not in topics:
+                    topics.append(topic)
+            
+            return topics
         except Exception as e:
             self.logger.error(f"Failed to get available topics: {str(e)}")
             # 동적으로 기본 주제 반환
@@ -447,21 +434,36 @@ class DialogueManager:
                 "active"
                 )
                 
-                # 먼저 dialogue_contexts에 컨텍스트가 있는지 확인하고 없으면 생성
-                await conn.execute("""
-                    INSERT INTO game_data.dialogue_contexts 
-                    (dialogue_id, title, content, priority, entity_personality, available_topics, constraints)
-                    VALUES ($1, $2, $3, $4, $5, $6, $7)
-                    ON CONFLICT (dialogue_id) DO NOTHING
-                """, 
-                dialogue_context_id,
-                f"Dialogue Context {dialogue_context_id}",
-                f"Context for {npc_id}",
-                1,
-                "neutral",
-                serialize_jsonb_data({"topics": [topic_id] if topic_id else []}),
-                serialize_jsonb_data({"max_response_length": 200})
-                )
+                # dialogue_contexts에 기록용 컨텍스트가 없으면 생성 (NPC 런타임 ID 소유)
+                # 카탈로그에 이미 있으면 INSERT 생략
+                index = await self._catalog_index()
+                if dialogue_context_id not in index.contexts:
+                    context_row = {
+                        "dialogue_id": dialogue_context_id,
+                        "title": f"Dialogue Context {dialogue_context_id}",
+                        "content": f"Context for {npc_id}",
+                        "entity_id": str(npc_id),
+                        "priority": 1,
+                        "entity_personality": "neutral",
+                        "available_topics": {"topics": [topic_id] if topic_id else []},
+                        "constraints": {"max_response_length": 200},
+                    }
+                    await conn.execute("""
+                        INSERT INTO game_data.dialogue_contexts 
+                        (dialogue_id, title, content, entity_id, priority, entity_personality, available_topics, constraints)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
+                        ON CONFLICT (dialogue_id) DO NOTHING
+                    """, 
+                    context_row["dialogue_id"],
+                    context_row["title"],
+                    context_row["content"],
+                    context_row["entity_id"],
+                    context_row["priority"],
+                    context_row["entity_personality"],
+                    serialize_jsonb_data(context_row["available_topics"]),
+                    serialize_jsonb_data(context_row["constraints"])
+                    )
+                    index.add_context(context_row)
                 
                 # 대화 기록 저장 (올바른 스키마 사용)
                 await conn.execute("""
@@ -527,54 +529,48 @@ class DialogueManager:
             return []
     
     async def _load_dialogue_templates(self):
-        """DB에서 대화 템플릿 로드"""
+        """대화 카탈로그에서 대화 템플릿 로드"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                # game_data.dialogue_contexts 테이블에서 대화 템플릿 로드
-                templates = await conn.fetch("""
-                    SELECT title, content, entity_personality, available_topics
-                    FROM game_data.dialogue_contexts
-                    WHERE entity_id IS NULL OR entity_id = ''
-                    ORDER BY dialogue_id
-                """)
+            index = await self._catalog_index()
+            # 카탈로그의 전역 컨텍스트(entity_id 없음)에서 대화 템플릿 구성
+            templates = sorted(index.global_contexts, key=lambda template: template['dialogue_id'])
+            
+            # 템플릿을 주제별로 분류
+            for template in templates:
+                title = template['title'].lower()
+                content = template['content']
+                personality = template['entity_personality'] or "neutral"
+                topics = template['available_topics']
+                
+                # 주제별 템플릿 생성
+                if 'greeting' in title or 'greeting' in topics:
+                    if 'greeting' not in self.response_templates:
+                        self.response_templates['greeting'] = []
+                    self.response_templates['greeting'].append(content)
+                
+                if 'trade' in title or 'trade' in topics:
+                    if 'trade' not in self.response_templates:
+                        self.response_templates['trade'] = []
+                    self.response_templates['trade'].append(content)
                 
-                # 템플릿을 주제별로 분류
-                for template in templates:
-                    title = template['title'].lower()
-                    content = template['content']
-                    personality = template['entity_personality'] or "neutral"
-                    topics = parse_jsonb_data(template['available_topics']) or {}
-                    
-                    # 주제별 템플릿 생성
-                    if 'greeting' in title or 'greeting' in topics:
-                        if 'greeting' not in self.response_templates:
-                            self.response_templates['greeting'] = []
-                        self.response_templates['greeting'].append(content)
-                    
-                    if 'trade' in title or 'trade' in topics:
-                        if 'trade' not in self.response_templates:
-                            self.response_templates['trade'] = []
-                        self.response_templates['trade'].append(content)
-                    
-                    if 'lore' in title or 'lore' in topics:
-                        if 'lore' not in self.response_templates:
-                            self.response_templates['lore'] = []
-                        self.response_templates['lore'].append(content)
-                    
-                    if 'quest' in title or 'quest' in topics:
-                        if 'quest' not in self.response_templates:
-                            self.response_templates['quest'] = []
-                        self.response_templates['quest'].append(content)
-                    
-                    if 'farewell' in title or 'farewell' in topics:
-                        if 'farewell' not in self.response_templates:
-                            self.response_templates['farewell'] = []
-                        self.response_templates['farewell'].append(content)
+                if 'lore' in title or 'lore' in topics:
+                    if 'lore' not in self.response_templates:
+                        self.response_templates['lore'] = []
+                    self.response_templates['lore'].append(content)
                 
-                # 기본 템플릿이 없으면 기본값 설정
-                self._set_default_templates()
+                if 'quest' in title or 'quest' in topics:
+                    if 'quest' not in self.response_templates:
+                        self.response_templates['quest'] = []
+                    self.response_templates['quest'].append(content)
                 
+                if 'farewell' in title or 'farewell' in topics:
+                    if 'farewell' not in self.response_templates:
+                        self.response_templates['farewell'] = []
+                    self.response_templates['farewell'].append(content)
+            
+            # 기본 템플릿이 없으면 기본값 설정
+            self._set_default_templates()
+            
         except Exception as e:
             self.logger.error(f"Failed to load dialogue templates: {str(e)}")
             self._set_default_templates()
@@ -613,28 +609,20 @@ class DialogueManager:
         self.logger.warning("대화 템플릿을 DB에서 로드할 수 없어 빈 템플릿을 사용합니다.")
     
     async def _load_dialogue_topics(self):
-        """DB에서 대화 주제 로드"""
+        """대화 카탈로그에서 대화 주제 로드"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                # game_data.dialogue_topics 테이블에서 주제 로드
-                topics = await conn.fetch("""
-                    SELECT DISTINCT topic_type
-                    FROM game_data.dialogue_topics
-                    ORDER BY topic_type
-                """)
-                
-                self.available_topics = [topic['topic_type'] for topic in topics]
-                
-                # 기본 주제 설정
-                if topics:
-                    # 가장 높은 우선순위의 주제를 기본 주제로 설정
-                    self.default_topic = topics[0]['topic_type']
-                else:
-                    self.default_topic = "greeting"
-                
-                logger.info(f"Loaded {len(self.available_topics)} dialogue topics from database")
-                
+            index = await self._catalog_index()
+            self.available_topics = list(index.topic_types)
+            
+            # 기본 주제 설정
+            if self.available_topics:
+                # 가장 높은 우선순위의 주제를 기본 주제로 설정
+                self.default_topic = self.available_topics[0]
+            else:
+                self.default_topic = "greeting"
+            
+            logger.info(f"Loaded {len(self.available_topics)} dialogue topics from catalog")
+            
         except Exception as e:
             logger.error(f"Failed to load dialogue topics: {str(e)}")
             self._set_default_topics()
@@ -645,25 +633,15 @@ class DialogueManager:
         self.default_topic = "greeting"
         logger.warning("Using default dialogue topics")
     
-    async def get_available_topics(self, npc_id: str = None) -> List[str]:
-        """사용 가능한 대화 주제 조회"""
+    async def get_available_topics(self, npc_id: str = None, npc=None) -> List[str]:
+        """사용 가능한 대화 주제 조회 (npc_id 지정 시 NPC 소유 주제 + 전역 주제)"""
         if not self.available_topics:
             await self._load_dialogue_topics()
         
         if npc_id:
-            # 특정 NPC에 대한 주제 필터링 (향후 확장 가능)
             try:
-                pool = await self.db.pool
-                async with pool.acquire() as conn:
-                    npc_topics = await conn.fetch("""
-                        SELECT DISTINCT dt.topic_type
-                        FROM game_data.dialogue_topics dt
-                        JOIN game_data.dialogue_contexts dc ON dt.dialogue_id = dc.dialogue_id
-                        WHERE (dc.entity_id = $1 OR dc.entity_id IS NULL)
-                        ORDER BY dt.topic_type
-                    """, npc_id)
-                    
-                    return [topic['topic_type'] for topic in npc_topics]
+                index = await self._catalog_index()
+                return index.npc_topic_types(self._owner_keys(npc_id, npc))
             except Exception as e:
                 logger.error(f"Failed to load NPC-specific topics: {str(e)}")
                 return self.available_topics
@@ -671,19 +649,10 @@ class DialogueManager:
         return self.available_topics
     
     async def get_default_priority(self) -> int:
-        """DB에서 기본 우선순위 조회"""
+        """대화 컨텍스트 평균 우선순위 (카탈로그 로드 시 계산)"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                result = await conn.fetchrow("""
-                    SELECT AVG(priority) as avg_priority
-                    FROM game_data.dialogue_contexts
-                """)
-                
-                if result and result['avg_priority']:
-                    return int(result['avg_priority'])
-                return 1  # 기본값
-                
+            index = await self._catalog_index()
+            return index.default_priority or 1
         except Exception as e:
             logger.error(f"Failed to load default priority: {str(e)}")
             return 1
@@ -699,8 +668,8 @@ class DialogueManager:
             npc = npc_result.entity
             
             # 대화 컨텍스트 조회
-            dialogue_context = await self._load_dialogue_context(npc_id)
-            available_topics = await self._get_available_topics(npc_id, "")
+            dialogue_context = await self._load_dialogue_context(npc_id, npc)
+            available_topics = await self._get_available_topics(npc_id, "", npc)
             
             return {
                 "npc_id": npc_id,
@@ -16,6 +16,8 @@ from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
 from common.utils.logger import logger
+from common.utils.ttl_cache import TTLCache
+from app.config.app_config import CACHE_CONFIG
 
 class EffectCarrierType(str, Enum):
     """Effect Carrier 타입 열거형"""
@@ -103,8 +105,8 @@ class EffectCarrierManager:
         self.runtime_data = runtime_data_repo
         self.reference_layer = reference_layer_repo
         self.logger = logger
-        self._cache: Dict[str, EffectCarrierData] = {}
-        self._cache_lock = asyncio.Lock()
+        # Effect Carrier 캐시 (크기 제한 + TTL)
+        self._cache = TTLCache("effect_carrier", **CACHE_CONFIG["effect_carrier"])
     
     async def create_effect_carrier(self, 
                                   name: str, 
@@ -139,8 +141,7 @@ class EffectCarrierManager:
             await self._save_effect_carrier_to_db(effect_carrier)
             
             # 캐시에 저장
-            async with self._cache_lock:
-                self._cache[effect_carrier.effect_id] = effect_carrier
+            self._cache.set(effect_carrier.effect_id, effect_carrier)
             
             self.logger.info(f"Effect Carrier 생성 완료: {effect_carrier.name} ({effect_carrier.carrier_type})")
             return EffectCarrierResult.success_result(
@@ -156,13 +157,12 @@ class EffectCarrierManager:
         """Effect Carrier 조회"""
         try:
             # 캐시에서 먼저 확인
-            async with self._cache_lock:
-                if effect_id in self._cache:
-                    cached_effect = self._cache[effect_id]
-                    return EffectCarrierResult.success_result(
-                        f"Effect Carrier '{cached_effect.name}' 조회 완료",
-                        cached_effect
-                    )
+            cached_effect = self._cache.get(effect_id)
+            if cached_effect is not None:
+                return EffectCarrierResult.success_result(
+                    f"Effect Carrier '{cached_effect.name}' 조회 완료",
+                    cached_effect
+                )
             
             # 데이터베이스에서 조회
             effect_carrier = await self._load_effect_carrier_from_db(effect_id)
@@ -170,8 +170,7 @@ class EffectCarrierManager:
                 return EffectCarrierResult.error_result(f"Effect Carrier '{effect_id}'를 찾을 수 없습니다")
             
             # 캐시에 저장
-            async with self._cache_lock:
-                self._cache[effect_id] = effect_carrier
+            self._cache.set(effect_id, effect_carrier)
             
             return EffectCarrierResult.success_result(
                 f"Effect Carrier '{effect_carrier.name}' 조회 완료",
@@ -212,8 +211,7 @@ class EffectCarrierManager:
             await self._save_effect_carrier_to_db(updated_effect_carrier)
             
             # 캐시 업데이트
-            async with self._cache_lock:
-                self._cache[effect_id] = updated_effect_carrier
+            self._cache.set(effect_id, updated_effect_carrier)
             
             self.logger.info(f"Effect Carrier 수정 완료: {updated_effect_carrier.name}")
             return EffectCarrierResult.success_result(
@@ -241,9 +239,7 @@ class EffectCarrierManager:
             await self._delete_effect_carrier_from_db(effect_id)
             
             # 캐시에서 제거
-            async with self._cache_lock:
-                if effect_id in self._cache:
-                    del self._cache[effect_id]
+            self._cache.invalidate(effect_id)
             
             self.logger.info(f"Effect Carrier 삭제 완료: {effect_carrier.name}")
             return EffectCarrierResult.success_result(
@@ -326,6 +322,14 @@ class EffectCarrierManager:
             self.logger.error(f"엔티티 Effect Carrier 조회 실패: {str(e)}")
             return EffectCarrierResult.error_result(f"엔티티 Effect Carrier 조회 실패: {str(e)}")
     
+    async def clear_cache(self) -> None:
+        """캐시 초기화"""
+        self._cache.clear()
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return self._cache.snapshot()
+    
     async def _save_effect_carrier_to_db(self, effect_carrier: EffectCarrierData) -> None:
         """데이터베이스에 Effect Carrier 저장"""
         try:
@@ -9,14 +9,18 @@ from datetime import datetime
 from common.utils.jsonb_handler import parse_jsonb_data, serialize_jsonb_data
 from common.utils.error_handler import handle_database_error, handle_validation_error, validate_session_id, validate_entity_id
 from common.utils.schema_validator import SchemaValidator
+from common.utils.ttl_cache import TTLCache
 from enum import Enum
 from pydantic import BaseModel, Field
 from database.connection import DatabaseConnection
+from database.entity_state_store import entity_state_store
+from database.cell_occupancy import cell_occupancy
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
 from app.managers.effect_carrier_manager import EffectCarrierManager
 from common.utils.logger import logger
+from app.config.app_config import CACHE_CONFIG
 
 
 class EntityType(str, Enum):
@@ -43,6 +47,7 @@ class EntityData(BaseModel):
     status: EntityStatus = Field(default=EntityStatus.ACTIVE, description="엔티티 상태")
     properties: Dict[str, Any] = Field(default_factory=dict, description="엔티티 속성")
     position: Optional[Dict[str, float]] = Field(default=None, description="위치 정보")
+    game_entity_id: Optional[str] = Field(default=None, description="게임 데이터 엔티티 ID (템플릿)")
     created_at: datetime = Field(default_factory=datetime.now, description="생성 시간")
     updated_at: datetime = Field(default_factory=datetime.now, description="수정 시간")
     
@@ -128,9 +133,11 @@ class EntityManager:
         self.effect_carrier_manager = effect_carrier_manager
         self.logger = logger
         
-        # 엔티티 캐시
-        self._entity_cache: Dict[str, EntityData] = {}
-        self._cache_lock = asyncio.Lock()
+        # 엔티티 캐시 (크기 제한 + TTL, 세션 단위 무효화)
+        self._entity_cache = TTLCache("entity", **CACHE_CONFIG["entity"])
+        
+        # 정적 엔티티 템플릿 캐시 (create_entity/create_entities 공용)
+        self._template_cache = TTLCache("entity_template", **CACHE_CONFIG["entity_template"])
         
         # 스키마 검증기
         self._schema_validator = SchemaValidator(db_connection)
@@ -166,65 +173,20 @@ class EntityManager:
                     error_code="VALIDATION_ERROR"
                 )
             
-            # 정적 엔티티 템플릿 조회
-            template_result = await self.db.execute_query("""
-                SELECT entity_id, entity_type, entity_name, entity_description, 
-                       base_stats, default_equipment, default_abilities, 
-                       default_inventory, entity_properties
-                FROM game_data.entities 
-                WHERE entity_id = $1
-            """, static_entity_id)
+            # 정적 엔티티 템플릿 조회 (템플릿 캐시)
+            template = await self._get_entity_template(static_entity_id)
             
-            if not template_result:
+            if not template:
                 return EntityCreationResult.error(
                     message=f"정적 엔티티 템플릿을 찾을 수 없습니다: {static_entity_id}",
                     error_code="TEMPLATE_NOT_FOUND"
                 )
             
-            template = template_result[0]
-            
             # 런타임 엔티티 인스턴스 ID 생성 (UUID 객체)
             runtime_entity_id = uuid.uuid4()
             
-            # 먼저 세션 생성 (존재하지 않는 경우)
-            await self.db.execute_query("""
-                INSERT INTO runtime_data.active_sessions 
-                (session_id, session_name, session_state, created_at, updated_at)
-                VALUES ($1, $2, $3, NOW(), NOW())
-                ON CONFLICT (session_id) DO NOTHING
-            """, 
-            session_id,
-            f"Session {session_id[:8]}",
-            "active"
-            )
-            
-            # 런타임 엔티티 인스턴스를 runtime_data.runtime_entities에 매핑만 저장
-            await self.db.execute_query("""
-                INSERT INTO runtime_data.runtime_entities 
-                (runtime_entity_id, game_entity_id, session_id, created_at, updated_at)
-                VALUES ($1, $2, $3, NOW(), NOW())
-            """, 
-            runtime_entity_id,
-            static_entity_id,
-            session_id
-            )
-            
-            # reference_layer에 매핑 저장
-            await self.db.execute_query("""
-                INSERT INTO reference_layer.entity_references 
-                (runtime_entity_id, game_entity_id, session_id, entity_type, is_player, created_at)
-                VALUES ($1, $2, $3, $4, $5, NOW())
-            """, 
-            runtime_entity_id, 
-            static_entity_id, 
-            session_id, 
-            template["entity_type"],
-            template["entity_type"] == "player"
-            )
-            
             # JSONB 데이터 파싱 (통일된 처리)
             base_stats = parse_jsonb_data(template["base_stats"])
-            entity_properties = parse_jsonb_data(template["entity_properties"])
             
             # 커스텀 속성 병합
             final_properties = base_stats.copy() if base_stats else {}
@@ -233,34 +195,65 @@ class EntityManager:
             
             # 엔티티 데이터 생성 (정적 템플릿 정보 사용)
             entity_data = EntityData(
-                entity_id=runtime_entity_id,
+                entity_id=str(runtime_entity_id),
                 name=template["entity_name"],
                 entity_type=EntityType(template["entity_type"]),
                 properties=final_properties,
-                position=custom_position or {"x": 0.0, "y": 0.0}
+                position=custom_position or {"x": 0.0, "y": 0.0},
+                game_entity_id=static_entity_id
             )
             
-            # entity_states 테이블에 초기 상태 저장 (MVP 스키마 준수)
-            await self.db.execute_query("""
-                INSERT INTO runtime_data.entity_states 
-                (runtime_entity_id, session_id, current_stats, current_position, active_effects, inventory, equipped_items, created_at, updated_at)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, NOW(), NOW())
-            """, 
-            runtime_entity_id,
-            session_id,
-            serialize_jsonb_data(base_stats or {}),
-            serialize_jsonb_data(custom_position or {"x": 0.0, "y": 0.0}),
-            serialize_jsonb_data([]),  # active_effects
-            serialize_jsonb_data([]),  # inventory
-            serialize_jsonb_data([])   # equipped_items
-            )
+            # 세션/런타임 매핑/레퍼런스/초기 상태를 하나의 트랜잭션에서 저장
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await self._ensure_session(conn, session_id)
+                    
+                    # 런타임 엔티티 인스턴스를 runtime_data.runtime_entities에 매핑만 저장
+                    await conn.execute("""
+                        INSERT INTO runtime_data.runtime_entities 
+                        (runtime_entity_id, game_entity_id, session_id, created_at, updated_at)
+                        VALUES ($1, $2, $3, NOW(), NOW())
+                    """, 
+                    runtime_entity_id,
+                    static_entity_id,
+                    session_id
+                    )
+                    
+                    # reference_layer에 매핑 저장
+                    await conn.execute("""
+                        INSERT INTO reference_layer.entity_references 
+                        (runtime_entity_id, game_entity_id, session_id, entity_type, is_player, created_at)
+                        VALUES ($1, $2, $3, $4, $5, NOW())
+                    """, 
+                    runtime_entity_id, 
+                    static_entity_id, 
+                    session_id, 
+                    template["entity_type"],
+                    template["entity_type"] == "player"
+                    )
+                    
+                    # entity_states 테이블에 초기 상태 저장 (MVP 스키마 준수)
+                    await conn.execute("""
+                        INSERT INTO runtime_data.entity_states 
+                        (runtime_entity_id, session_id, current_stats, current_position, active_effects, inventory, equipped_items, created_at, updated_at)
+                        VALUES ($1, $2, $3, $4, $5, $6, $7, NOW(), NOW())
+                    """, 
+                    runtime_entity_id,
+                    session_id,
+                    serialize_jsonb_data(base_stats or {}),
+                    serialize_jsonb_data(custom_position or {"x": 0.0, "y": 0.0}),
+                    serialize_jsonb_data([]),  # active_effects
+                    serialize_jsonb_data({"items": [], "quantities": {}}),  # inventory
+                    serialize_jsonb_data([])   # equipped_items
+                    )
+            cell_occupancy.track_position(runtime_entity_id, custom_position)
             
             # 캐시에 추가
-            async with self._cache_lock:
-                self._entity_cache[runtime_entity_id] = entity_data
+            self._entity_cache.set(entity_data.entity_id, entity_data, session_id=session_id)
             
             return EntityCreationResult.success(
-                entity_id=runtime_entity_id,
+                entity_id=entity_data.entity_id,
                 entity_data=entity_data,
                 message=f"런타임 엔티티 인스턴스 '{template['entity_name']}' 생성 완료"
             )
@@ -281,6 +274,154 @@ class EntityManager:
                     error_code="UNKNOWN_ERROR"
                 )
     
+    async def create_entities(self,
+                              batch: List[Dict[str, Any]],
+                              session_id: str) -> List[EntityCreationResult]:
+        """
+        정적 엔티티 템플릿에서 런타임 엔티티 인스턴스 일괄 생성
+        
+        템플릿은 한 번에 조회하고, 모든 인스턴스를 하나의 트랜잭션에서 테이블당
+        한 번의 왕복으로 저장합니다. 저장에 실패하면 배치 전체가 롤백됩니다.
+        
+        Args:
+            batch: 생성할 엔티티 목록
+                [{"static_entity_id": str, "custom_properties": dict(선택), "custom_position": dict(선택)}]
+            session_id: 세션 ID
+            
+        Returns:
+            List[EntityCreationResult]: 입력 순서와 같은 순서의 생성 결과
+        """
+        if not validate_session_id(session_id):
+            return [EntityCreationResult.error(
+                message=f"유효하지 않은 세션 ID 형식: {session_id}",
+                error_code="VALIDATION_ERROR"
+            ) for _ in batch]
+        
+        results: List[Optional[EntityCreationResult]] = [None] * len(batch)
+        
+        try:
+            # 템플릿 일괄 조회 (캐시에 없는 것만)
+            templates = await self._get_entity_templates(
+                [spec["static_entity_id"] for spec in batch if validate_entity_id(spec.get("static_entity_id"))]
+            )
+            
+            rows = []
+            pending: List[Tuple[int, EntityData]] = []
+            for index, spec in enumerate(batch):
+                static_entity_id = spec.get("static_entity_id")
+                if not validate_entity_id(static_entity_id):
+                    results[index] = EntityCreationResult.error(
+                        message=f"유효하지 않은 엔티티 ID 형식: {static_entity_id}",
+                        error_code="VALIDATION_ERROR"
+                    )
+                    continue
+                
+                template = templates.get(static_entity_id)
+                if not template:
+                    results[index] = EntityCreationResult.error(
+                        message=f"정적 엔티티 템플릿을 찾을 수 없습니다: {static_entity_id}",
+                        error_code="TEMPLATE_NOT_FOUND"
+                    )
+                    continue
+                
+                runtime_entity_id = uuid.uuid4()
+                base_stats = parse_jsonb_data(template["base_stats"])
+                custom_position = spec.get("custom_position")
+                
+                final_properties = base_stats.copy() if base_stats else {}
+                if spec.get("custom_properties"):
+                    final_properties.update(spec["custom_properties"])
+                
+                pending.append((index, EntityData(
+                    entity_id=str(runtime_entity_id),
+                    name=template["entity_name"],
+                    entity_type=EntityType(template["entity_type"]),
+                    properties=final_properties,
+                    position=custom_position or {"x": 0.0, "y": 0.0},
+                    game_entity_id=static_entity_id
+                )))
+                rows.append({
+                    "runtime_entity_id": runtime_entity_id,
+                    "game_entity_id": static_entity_id,
+                    "session_id": session_id,
+                    "entity_type": template["entity_type"],
+                    "is_player": template["entity_type"] == "player",
+                    "current_stats": base_stats or {},
+                    "current_position": custom_position or {"x": 0.0, "y": 0.0},
+                    "active_effects": [],
+                    "inventory": {"items": [], "quantities": {}},
+                    "equipped_items": []
+                })
+            
+            if rows:
+                pool = await self.db.pool
+                async with pool.acquire() as conn:
+                    async with conn.transaction():
+                        await self._ensure_session(conn, session_id)
+                        await self.runtime_data.insert_entities_bulk(conn, rows)
+            
+            for index, entity_data in pending:
+                self._entity_cache.set(entity_data.entity_id, entity_data, session_id=session_id)
+                results[index] = EntityCreationResult.success(
+                    entity_id=entity_data.entity_id,
+                    entity_data=entity_data,
+                    message=f"런타임 엔티티 인스턴스 '{entity_data.name}' 생성 완료"
+                )
+            
+            return results
+            
+        except Exception as e:
+            self.logger.error(f"Bulk entity creation failed: {str(e)}")
+            error = EntityCreationResult.error(
+                message=f"런타임 엔티티 인스턴스 일괄 생성 실패: {str(e)}",
+                error_code="DATABASE_ERROR"
+            )
+            return [result if result is not None else error for result in results]
+    
+    async def _ensure_session(self, conn, session_id: str) -> None:
+        """세션 생성 (존재하지 않는 경우)"""
+        await conn.execute("""
+            INSERT INTO runtime_data.active_sessions 
+            (session_id, session_name, session_state, created_at, updated_at)
+            VALUES ($1, $2, $3, NOW(), NOW())
+            ON CONFLICT (session_id) DO NOTHING
+        """, 
+        session_id,
+        f"Session {str(session_id)[:8]}",
+        "active"
+        )
+    
+    async def _get_entity_template(self, static_entity_id: str) -> Optional[Dict[str, Any]]:
+        """정적 엔티티 템플릿 조회 (템플릿 캐시)"""
+        templates = await self._get_entity_templates([static_entity_id])
+        return templates.get(static_entity_id)
+    
+    async def _get_entity_templates(self, static_entity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """정적 엔티티 템플릿 일괄 조회 (캐시에 없는 템플릿만 한 번의 쿼리로 로드)"""
+        templates = {}
+        missing = []
+        for static_entity_id in dict.fromkeys(static_entity_ids):
+            template = self._template_cache.get(static_entity_id)
+            if template is not None:
+                templates[static_entity_id] = template
+            else:
+                missing.append(static_entity_id)
+        
+        if missing:
+            rows = await self.db.execute_query("""
+                SELECT entity_id, entity_type, entity_name, entity_description, 
+                       base_stats, default_equipment, default_abilities, 
+                       default_inventory, entity_properties
+                FROM game_data.entities 
+                WHERE entity_id = ANY($1::varchar[])
+            """, missing)
+            for row in rows or []:
+                template = dict(row)
+                self._template_cache.set(template["entity_id"], template)
+                templates[template["entity_id"]] = template
+        
+        return templates
+    
     async def get_entity(self, entity_id: str) -> EntityResult:
         """
         엔티티 조회
@@ -293,20 +434,23 @@ class EntityManager:
         """
         try:
             # 캐시에서 먼저 확인
-            async with self._cache_lock:
-                if entity_id in self._entity_cache:
-                    entity = self._entity_cache[entity_id]
+            entity = self._entity_cache.get(entity_id)
+            if entity is not None:
+                return EntityResult.success_result(entity, "캐시에서 조회")
+            
+            # 데이터베이스에서 조회 (같은 엔티티의 동시 조회는 한 번만 로드)
+            async with self._entity_cache.lock(entity_id):
+                entity = self._entity_cache.peek(entity_id)
+                if entity is not None:
                     return EntityResult.success_result(entity, "캐시에서 조회")
-            
-            # 데이터베이스에서 조회
-            entity_data = await self._load_entity_from_db(entity_id)
-            
-            if not entity_data:
-                return EntityResult.error_result(f"엔티티 '{entity_id}'를 찾을 수 없습니다.")
-            
-            # 캐시에 추가
-            async with self._cache_lock:
-                self._entity_cache[entity_id] = entity_data
+                
+                entity_data, session_id = await self._load_entity_with_session(entity_id)
+                
+                if not entity_data:
+                    return EntityResult.error_result(f"엔티티 '{entity_id}'를 찾을 수 없습니다.")
+                
+                # 캐시에 추가
+                self._entity_cache.set(entity_id, entity_data, session_id=session_id)
             
             return EntityResult.success_result(entity_data, "데이터베이스에서 조회")
             
@@ -349,6 +493,7 @@ class EntityManager:
                 status=entity.status,
                 properties=updated_properties,
                 position=entity.position,
+                game_entity_id=entity.game_entity_id,
                 created_at=entity.created_at,
                 updated_at=datetime.now()
             )
@@ -357,8 +502,7 @@ class EntityManager:
             await self._save_entity_to_db(updated_entity)
             
             # 캐시 업데이트
-            async with self._cache_lock:
-                self._entity_cache[entity_id] = updated_entity
+            self._entity_cache.set(entity_id, updated_entity)
             
             return EntityResult.success_result(
                 updated_entity,
@@ -393,9 +537,7 @@ class EntityManager:
             await self._delete_entity_from_db(entity_id)
             
             # 캐시에서 제거
-            async with self._cache_lock:
-                if entity_id in self._entity_cache:
-                    del self._entity_cache[entity_id]
+            self._entity_cache.invalidate(entity_id)
             
             # 삭제된 엔티티의 상태를 INACTIVE로 설정
             deleted_entity = EntityData(
@@ -405,6 +547,7 @@ class EntityManager:
                 status=EntityStatus.INACTIVE,
                 properties=entity.properties,
                 position=entity.position,
+                game_entity_id=entity.game_entity_id,
                 created_at=entity.created_at,
                 updated_at=entity.updated_at
             )
@@ -438,9 +581,8 @@ class EntityManager:
             entities = await self._load_entities_from_db(entity_type, status)
             
             # 캐시 업데이트
-            async with self._cache_lock:
-                for entity in entities:
-                    self._entity_cache[entity.entity_id] = entity
+            for entity in entities:
+                self._entity_cache.set(entity.entity_id, entity)
             
             return entities
             
@@ -451,6 +593,11 @@ class EntityManager:
     
     async def _load_entity_from_db(self, entity_id: str) -> Optional[EntityData]:
         """데이터베이스에서 엔티티 로드 (런타임 엔티티 인스턴스)"""
+        entity_data, _ = await self._load_entity_with_session(entity_id)
+        return entity_data
+    
+    async def _load_entity_with_session(self, entity_id: str) -> Tuple[Optional[EntityData], Optional[str]]:
+        """데이터베이스에서 엔티티와 소속 세션 ID 로드 (캐시 세션 태그용)"""
         try:
             pool = await self.db.pool
             async with pool.acquire() as conn:
@@ -472,7 +619,7 @@ class EntityManager:
                 """, entity_id)
                 
                 if not row:
-                    return None
+                    return None, None
 
                 # JSONB 데이터 처리 (통일된 처리)
                 base_stats = parse_jsonb_data(row['base_stats'])
@@ -480,19 +627,22 @@ class EntityManager:
                 
                 position = entity_properties.get('position') if entity_properties else None
                 
-                return EntityData(
+                entity_data = EntityData(
                     entity_id=row['runtime_entity_id'],
                     name=row['entity_name'],
                     entity_type=EntityType(row['entity_type']),
                     status=EntityStatus.ACTIVE,  # 기본값
                     properties=base_stats or {},
                     position=position,
+                    game_entity_id=row['game_entity_id'],
                     created_at=row['created_at'],
                     updated_at=row['updated_at']
                 )
+                session_id = str(row['session_id']) if row['session_id'] else None
+                return entity_data, session_id
         except Exception as e:
             self.logger.error(f"Failed to load entity from database: {str(e)}")
-            return None
+            return None, None
     
     async def _load_entities_from_db(self, 
                                    entity_type: Optional[EntityType] = None,
@@ -541,6 +691,7 @@ class EntityManager:
                         status=EntityStatus.ACTIVE,  # 기본값
                         properties=base_stats or {},
                 position=position,
+                        game_entity_id=row['game_entity_id'],
                         created_at=row['created_at'],
                         updated_at=row['updated_at']
                     )
@@ -619,7 +770,7 @@ class EntityManager:
             return EntityResult.error_result(f"엔티티 Effect Carrier 조회 실패: {str(e)}")
     
     async def update_entity_stats(self, entity_id: str, stats: Dict[str, Any]) -> EntityResult:
-        """엔티티 스탯 업데이트"""
+        """엔티티 스탯 업데이트 (runtime_data.entity_states.current_stats에 병합)"""
         try:
             # 기존 엔티티 조회
             get_result = await self.get_entity(entity_id)
@@ -630,22 +781,13 @@ class EntityManager:
             if not entity:
                 return EntityResult.error_result("엔티티를 찾을 수 없습니다")
             
-            # 스탯 업데이트
-            updated_properties = entity.properties.copy()
-            updated_properties.update(stats)
-            
-            # 엔티티 업데이트 (properties를 직접 업데이트)
-            update_result = await self.update_entity(
-                entity_id, 
-                updated_properties
-            )
-            
-            if not update_result.success:
-                return update_result
+            # write-through이면 즉시 UPDATE, write-behind이면 다음 flush에서 기록
+            await entity_state_store.merge_stats(entity_id, stats)
+            self._entity_cache.invalidate(entity_id)
             
             self.logger.info(f"엔티티 '{entity_id}' 스탯 업데이트 완료")
             return EntityResult.success_result(
-                update_result.entity,
+                entity,
                 f"엔티티 스탯 업데이트 완료"
             )
             
@@ -680,79 +822,68 @@ class EntityManager:
             if not entity:
                 return EntityResult.error_result("엔티티를 찾을 수 없습니다")
             
-            # 2. 현재 스탯 조회 (runtime_data.entity_states에서)
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                entity_state = await conn.fetchrow(
-                    """
-                    SELECT current_stats FROM runtime_data.entity_states
-                    WHERE runtime_entity_id = $1
-                    """,
-                    runtime_entity_id
+            # 2. 현재 스탯 조회 (write-behind 모드에서는 메모리 상태)
+            entity_state = await entity_state_store.get(runtime_entity_id)
+            if not entity_state:
+                return EntityResult.error_result("엔티티 상태를 찾을 수 없습니다")
+            
+            current_stats = entity_state.get('current_stats') or {}
+            
+            # 3. 현재 HP/MP 및 최대값 확인
+            current_hp = current_stats.get('hp', 0)
+            current_mp = current_stats.get('mp', 0)
+            max_hp = current_stats.get('max_hp', current_hp)
+            max_mp = current_stats.get('max_mp', current_mp)
+            
+            # 4. HP/MP 회복 (최대값 초과 방지)
+            new_hp = min(current_hp + hp, max_hp)
+            new_mp = min(current_mp + mp, max_mp)
+            
+            # 실제 회복량 계산
+            actual_hp_restored = new_hp - current_hp
+            actual_mp_restored = new_mp - current_mp
+            
+            # 5. 스탯 업데이트
+            updated_stats = {
+                'hp': new_hp,
+                'mp': new_mp
+            }
+            
+            await self.runtime_data.update_entity_stats(
+                runtime_entity_id,
+                updated_stats
+            )
+            
+            # 6. 캐시 무효화
+            self._entity_cache.invalidate(runtime_entity_id)
+            
+            # 7. 결과 메시지 생성
+            message_parts = []
+            if actual_hp_restored > 0:
+                message_parts.append(f"HP +{actual_hp_restored}")
+            if actual_mp_restored > 0:
+                message_parts.append(f"MP +{actual_mp_restored}")
+            
+            if not message_parts:
+                message = "회복할 수 없습니다 (이미 최대치)"
+            else:
+                message = ", ".join(message_parts) + " 회복"
+            
+            self.logger.info(f"엔티티 '{runtime_entity_id}' HP/MP 회복: {message}")
+            
+            # 8. 업데이트된 엔티티 조회하여 반환
+            updated_result = await self.get_entity(runtime_entity_id)
+            if updated_result.success and updated_result.entity:
+                return EntityResult.success_result(
+                    updated_result.entity,
+                    message
                 )
-                
-                if not entity_state:
-                    return EntityResult.error_result("엔티티 상태를 찾을 수 없습니다")
-                
-                current_stats = parse_jsonb_data(entity_state.get('current_stats', {}))
-                
-                # 3. 현재 HP/MP 및 최대값 확인
-                current_hp = current_stats.get('hp', 0)
-                current_mp = current_stats.get('mp', 0)
-                max_hp = current_stats.get('max_hp', current_hp)
-                max_mp = current_stats.get('max_mp', current_mp)
-                
-                # 4. HP/MP 회복 (최대값 초과 방지)
-                new_hp = min(current_hp + hp, max_hp)
-                new_mp = min(current_mp + mp, max_mp)
-                
-                # 실제 회복량 계산
-                actual_hp_restored = new_hp - current_hp
-                actual_mp_restored = new_mp - current_mp
-                
-                # 5. 스탯 업데이트
-                updated_stats = {
-                    'hp': new_hp,
-                    'mp': new_mp
-                }
-                
-                await self.runtime_data.update_entity_stats(
-                    runtime_entity_id,
-                    updated_stats
+            else:
+                return EntityResult.success_result(
+                    entity,
+                    message
                 )
                 
-                # 6. 캐시 무효화
-                async with self._cache_lock:
-                    if runtime_entity_id in self._entity_cache:
-                        del self._entity_cache[runtime_entity_id]
-                
-                # 7. 결과 메시지 생성
-                message_parts = []
-                if actual_hp_restored > 0:
-                    message_parts.append(f"HP +{actual_hp_restored}")
-                if actual_mp_restored > 0:
-                    message_parts.append(f"MP +{actual_mp_restored}")
-                
-                if not message_parts:
-                    message = "회복할 수 없습니다 (이미 최대치)"
-                else:
-                    message = ", ".join(message_parts) + " 회복"
-                
-                self.logger.info(f"엔티티 '{runtime_entity_id}' HP/MP 회복: {message}")
-                
-                # 8. 업데이트된 엔티티 조회하여 반환
-                updated_result = await self.get_entity(runtime_entity_id)
-                if updated_result.success and updated_result.entity:
-                    return EntityResult.success_result(
-                        updated_result.entity,
-                        message
-                    )
-                else:
-                    return EntityResult.success_result(
-                        entity,
-                        message
-                    )
-                    
         except Exception as e:
             self.logger.error(f"HP/MP 회복 실패: {str(e)}")
             return EntityResult.error_result(f"HP/MP 회복 실패: {str(e)}")
@@ -780,8 +911,15 @@ class EntityManager:
 
     async def clear_cache(self) -> None:
         """캐시 초기화"""
-        async with self._cache_lock:
-            self._entity_cache.clear()
+        self._entity_cache.clear()
+    
+    async def invalidate_session_cache(self, session_id: str) -> int:
+        """세션에 속한 엔티티 캐시 일괄 무효화"""
+        return self._entity_cache.invalidate_session(session_id)
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return self._entity_cache.snapshot()
     
     async def validate_schema(self) -> Dict[str, Any]:
         """스키마 검증"""
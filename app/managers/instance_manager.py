@@ -7,6 +7,8 @@ from database.connection import DatabaseConnection
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
+from database.cell_occupancy import cell_occupancy, cell_key
+from database.session_storage import session_storage
 
 class InstanceManager:
     """엔티티와 셀 인스턴스를 관리하는 클래스"""
@@ -115,6 +117,7 @@ class InstanceManager:
                 serialize_jsonb_data({}),
                 serialize_jsonb_data({})
                 )
+        cell_occupancy.move(runtime_entity_id, runtime_cell_id)
         
         return runtime_entity_id
 
@@ -263,21 +266,22 @@ class InstanceManager:
             async with conn.transaction():
                 try:
                     # 1. 셀에 있는 모든 엔티티들 제거
+                    #    (참조를 먼저 지워야 entity_states 서브쿼리가 대상 엔티티를 찾음)
                     await conn.execute(
                         """
-                        DELETE FROM runtime_data.entity_states
-                        WHERE runtime_cell_id = $1
+                        DELETE FROM reference_layer.entity_references
+                        WHERE runtime_entity_id IN (
+                            SELECT runtime_entity_id FROM runtime_data.entity_states
+                            WHERE current_cell_id = $1::uuid
+                        )
                         """,
                         runtime_cell_id
                     )
                     
                     await conn.execute(
                         """
-                        DELETE FROM reference_layer.entity_references
-                        WHERE runtime_entity_id IN (
-                            SELECT runtime_entity_id FROM runtime_data.entity_states
-                            WHERE runtime_cell_id = $1
-                        )
+                        DELETE FROM runtime_data.entity_states
+                        WHERE current_cell_id = $1::uuid
                         """,
                         runtime_cell_id
                     )
@@ -294,6 +298,7 @@ class InstanceManager:
                     # 3. 캐시에서 제거
                     if runtime_cell_id in self._cell_instances:
                         del self._cell_instances[runtime_cell_id]
+                    cell_occupancy.invalidate(runtime_cell_id)
                     
                     return True
                     
@@ -336,6 +341,7 @@ class InstanceManager:
                     # 3. 캐시에서 제거
                     if runtime_entity_id in self._entity_instances:
                         del self._entity_instances[runtime_entity_id]
+                    cell_occupancy.remove(runtime_entity_id)
                     
                     return True
                     
@@ -347,60 +353,34 @@ class InstanceManager:
         """
         세션의 모든 인스턴스들을 정리합니다.
         
+        엔티티 상태/참조와 셀 참조를 session_id 기준으로 한 번에 삭제합니다
+        (세션 파티셔닝 적용 시 세션 파티션 TRUNCATE). 세션 행은 유지됩니다.
+        
         Args:
             session_id: 세션 ID
             
         Returns:
             정리 성공 여부
         """
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                try:
-                    # 1. 세션의 모든 엔티티 상태 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM runtime_data.entity_states
-                        WHERE runtime_entity_id IN (
-                            SELECT runtime_entity_id FROM reference_layer.entity_references
-                            WHERE session_id = $1
-                        )
-                        """,
-                        session_id
-                    )
-
-                    # 2. 세션의 모든 엔티티 참조 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM reference_layer.entity_references
-                        WHERE session_id = $1
-                        """,
-                        session_id
-                    )
+        try:
+            await session_storage.purge(session_id, keep_session=True)
+        except Exception as e:
+            print(f"세션 인스턴스 정리 실패: {e}")
+            return False
 
-                    # 3. 세션의 모든 셀 참조 삭제
-                    await conn.execute(
-                        """
-                        DELETE FROM reference_layer.cell_references
-                        WHERE session_id = $1
-                        """,
-                        session_id
-                    ) 
-                    
-                    # 4. 캐시 정리
-                    self._cell_instances.clear()
-                    self._entity_instances.clear()
-                    
-                    return True
-                    
-                except Exception as e:
-                    print(f"세션 인스턴스 정리 실패: {e}")
-                    return False
+        # 캐시 정리 (셀 점유 맵은 purge에서 무효화)
+        self._cell_instances.clear()
+        self._entity_instances.clear()
+        return True
 
     async def get_cell_entities(self, runtime_cell_id: str) -> List[Dict[str, Any]]:
         """특정 셀에 있는 모든 엔티티들을 조회합니다."""
+        cell_uuid = cell_key(runtime_cell_id)
+        if cell_uuid is None:
+            return []
         pool = await self.db.pool
         async with pool.acquire() as conn:
+            # current_cell_id(생성 컬럼) 인덱스로 셀의 엔티티 상태부터 조회
             rows = await conn.fetch(
                 """
                 SELECT 
@@ -411,13 +391,13 @@ class InstanceManager:
                     es.current_position,
                     es.current_stats,
                     e.entity_name
-                FROM reference_layer.entity_references er
-                LEFT JOIN runtime_data.entity_states es ON er.runtime_entity_id = es.runtime_entity_id
+                FROM runtime_data.entity_states es
+                JOIN reference_layer.entity_references er ON er.runtime_entity_id = es.runtime_entity_id
                 LEFT JOIN game_data.entities e ON er.game_entity_id = e.entity_id
-                WHERE es.current_position->>'runtime_cell_id' = $1
+                WHERE es.current_cell_id = $1::uuid
                 ORDER BY er.is_player DESC, er.entity_type
                 """,
-                runtime_cell_id
+                cell_uuid
             )
             
             return [dict(row) for row in rows]
@@ -5,6 +5,8 @@
 from typing import Dict, Any, List, Optional
 import json
 from database.connection import DatabaseConnection
+from database.entity_state_store import entity_state_store
+from app.systems.session_deltas import session_deltas
 from common.utils.logger import logger
 
 
@@ -14,33 +16,120 @@ class InventoryManager:
     def __init__(self, db_connection: Optional[DatabaseConnection] = None):
         self.db = db_connection or DatabaseConnection()
     
-    async def add_item_to_inventory(
-        self,
-        runtime_entity_id: str,
-        item_id: str,
-        quantity: int = 1
-    ) -> bool:
+    @staticmethod
+    def _add_quantity(inventory: Optional[Dict[str, Any]], item_id: str, quantity: int) -> Dict[str, Any]:
+        """인벤토리에 수량 추가 (아이템 목록에 없으면 추가)"""
+        if not inventory:
+            inventory = {"items": [], "quantities": {}}
+        
+        if item_id not in inventory.get("items", []):
+            inventory.setdefault("items", []).append(item_id)
+        
+        quantities = inventory.setdefault("quantities", {})
+        quantities[item_id] = quantities.get(item_id, 0) + quantity
+        return inventory
+    
+    @staticmethod
+    def _remove_quantity(inventory: Optional[Dict[str, Any]], item_id: str, quantity: int) -> Dict[str, Any]:
+        """인벤토리에서 수량 차감 (0 이하가 되면 아이템 제거)"""
+        if not inventory:
+            raise ValueError("Inventory is empty")
+        
+        quantities = inventory.get("quantities", {})
+        current_quantity = quantities.get(item_id, 0)
+        
+        if current_quantity < quantity:
+            raise ValueError(f"Insufficient quantity: {item_id} (have {current_quantity}, need {quantity})")
+        
+        new_quantity = current_quantity - quantity
+        if new_quantity <= 0:
+            # 수량이 0 이하면 아이템 제거
+            quantities.pop(item_id, None)
+            items = inventory.get("items", [])
+            if item_id in items:
+                items.remove(item_id)
+        else:
+            quantities[item_id] = new_quantity
+        return inventory
+    
+    @staticmethod
+    def item_delta(item_ids: List[str], quantity: int = 1) -> Dict[str, int]:
+        """
+        아이템 ID 목록을 apply_delta용 변경량으로 변환 (같은 아이템은 합산)
+        
+        예: item_delta(["A", "A", "B"], -1) -> {"A": -2, "B": -1}
+        """
+        delta: Dict[str, int] = {}
+        for item_id in item_ids:
+            delta[item_id] = delta.get(item_id, 0) + quantity
+        return delta
+    
+    @classmethod
+    def _apply_changes(cls, inventory: Optional[Dict[str, Any]], changes: Dict[str, int]) -> Dict[str, Any]:
+        """
+        인벤토리 사본에 수량 변경 적용 (차감을 먼저 검증/적용하고 추가는 나중에 적용)
+        
+        Raises:
+            ValueError: 수량 부족 (원본 인벤토리는 변경되지 않음)
+        """
+        inventory = dict(inventory or {})
+        inventory["items"] = list(inventory.get("items", []))
+        inventory["quantities"] = dict(inventory.get("quantities", {}))
+        
+        for item_id, quantity in changes.items():
+            if quantity < 0:
+                cls._remove_quantity(inventory, item_id, -quantity)
+        for item_id, quantity in changes.items():
+            if quantity > 0:
+                cls._add_quantity(inventory, item_id, quantity)
+        return inventory
+    
+    async def apply_delta(self, runtime_entity_id: str, delta: Dict[str, int]) -> Dict[str, Any]:
         """
-        엔티티 인벤토리에 아이템 추가
+        여러 아이템의 수량 변경을 한 번에 적용 (전부 적용되거나 전혀 적용되지 않음)
+        
+        write-through 모드에서는 한 트랜잭션 안에서 entity_states 행을 잠근 뒤(FOR UPDATE)
+        읽기-검증-쓰기를 수행하므로 동시 변경으로 수량이 유실되지 않습니다.
+        write-behind 모드에서는 메모리 상태 조회 후 다음 대기 지점 없이 교체하므로
+        다른 코루틴의 변경과 섞이지 않습니다.
         
         Args:
             runtime_entity_id: 엔티티 런타임 ID
-            item_id: 아이템 템플릿 ID (예: "ITEM_POTION_001")
-            quantity: 추가할 수량 (기본값: 1)
+            delta: 아이템 ID -> 수량 변화 (양수: 추가, 음수: 차감, 0은 무시)
+                   예: {"ITEM_HERB_001": -2, "ITEM_POTION_001": 1}
         
         Returns:
-            성공 여부
+            변경 후 인벤토리 {"items": [...], "quantities": {...}}
+        
+        Raises:
+            ValueError: 엔티티 상태가 없거나 차감할 수량이 부족한 경우
         """
+        changes = {item_id: int(quantity) for item_id, quantity in delta.items() if quantity}
+        if not changes:
+            return await self.get_inventory(runtime_entity_id)
+        
         try:
+            if entity_state_store.write_behind:
+                # write-behind: 메모리 상태 변경 후 flusher가 배치 기록
+                entity_state = await entity_state_store.get(runtime_entity_id)
+                if not entity_state:
+                    raise ValueError(f"Entity state not found: {runtime_entity_id}")
+                inventory = self._apply_changes(entity_state['inventory'], changes)
+                await entity_state_store.set_fields(runtime_entity_id, inventory=inventory)
+                logger.info(f"Applied inventory delta {changes} to {runtime_entity_id}")
+                self._publish_delta(runtime_entity_id, changes, inventory)
+                return inventory
+            
             pool = await self.db.pool
             async with pool.acquire() as conn:
                 async with conn.transaction():
-                    # 현재 인벤토리 조회
+                    # 현재 인벤토리 조회 (행 잠금)
                     entity_state = await conn.fetchrow(
                         """
                         SELECT inventory
                         FROM runtime_data.entity_states
                         WHERE runtime_entity_id = $1
+                        FOR UPDATE
                         """,
                         runtime_entity_id
                     )
@@ -48,19 +137,9 @@ class InventoryManager:
                     if not entity_state:
                         raise ValueError(f"Entity state not found: {runtime_entity_id}")
                     
-                    # 인벤토리 파싱
+                    # 인벤토리 파싱 및 수량 변경
                     inventory = json.loads(entity_state['inventory']) if isinstance(entity_state['inventory'], str) else entity_state['inventory']
-                    if not inventory:
-                        inventory = {"items": [], "quantities": {}}
-                    
-                    # 아이템 목록에 추가 (없으면)
-                    if item_id not in inventory.get("items", []):
-                        inventory.setdefault("items", []).append(item_id)
-                    
-                    # 수량 업데이트
-                    quantities = inventory.setdefault("quantities", {})
-                    current_quantity = quantities.get(item_id, 0)
-                    quantities[item_id] = current_quantity + quantity
+                    inventory = self._apply_changes(inventory, changes)
                     
                     # 인벤토리 업데이트
                     await conn.execute(
@@ -73,14 +152,44 @@ class InventoryManager:
                         json.dumps(inventory),
                         runtime_entity_id
                     )
-                    
-                    logger.info(f"Added {quantity}x {item_id} to inventory of {runtime_entity_id}")
-                    return True
-                    
+            
+            logger.info(f"Applied inventory delta {changes} to {runtime_entity_id}")
+            self._publish_delta(runtime_entity_id, changes, inventory)
+            return inventory
+            
         except Exception as e:
-            logger.error(f"Failed to add item to inventory: {str(e)}")
+            logger.error(f"Failed to apply inventory delta: {str(e)}")
             raise
     
+    @staticmethod
+    def _publish_delta(runtime_entity_id: str, changes: Dict[str, int], inventory: Dict[str, Any]) -> None:
+        """플레이어 인벤토리 변경을 세션 델타로 발행 (변경 수량 + 변경 후 수량)"""
+        quantities = inventory.get('quantities', {})
+        session_deltas.publish_for_entity(runtime_entity_id, "inventory_delta", {
+            "changes": changes,
+            "quantities": {item_id: quantities.get(item_id, 0) for item_id in changes},
+        })
+    
+    async def add_item_to_inventory(
+        self,
+        runtime_entity_id: str,
+        item_id: str,
+        quantity: int = 1
+    ) -> bool:
+        """
+        엔티티 인벤토리에 아이템 추가 (apply_delta 단일 아이템 버전)
+        
+        Args:
+            runtime_entity_id: 엔티티 런타임 ID
+            item_id: 아이템 템플릿 ID (예: "ITEM_POTION_001")
+            quantity: 추가할 수량 (기본값: 1)
+        
+        Returns:
+            성공 여부
+        """
+        await self.apply_delta(runtime_entity_id, {item_id: quantity})
+        return True
+    
     async def remove_item_from_inventory(
         self,
         runtime_entity_id: str,
@@ -88,7 +197,7 @@ class InventoryManager:
         quantity: int = 1
     ) -> bool:
         """
-        엔티티 인벤토리에서 아이템 제거
+        엔티티 인벤토리에서 아이템 제거 (apply_delta 단일 아이템 버전)
         
         Args:
             runtime_entity_id: 엔티티 런타임 ID
@@ -98,63 +207,21 @@ class InventoryManager:
         Returns:
             성공 여부
         """
-        try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                async with conn.transaction():
-                    # 현재 인벤토리 조회
-                    entity_state = await conn.fetchrow(
-                        """
-                        SELECT inventory
-                        FROM runtime_data.entity_states
-                        WHERE runtime_entity_id = $1
-                        """,
-                        runtime_entity_id
-                    )
-                    
-                    if not entity_state:
-                        raise ValueError(f"Entity state not found: {runtime_entity_id}")
-                    
-                    # 인벤토리 파싱
-                    inventory = json.loads(entity_state['inventory']) if isinstance(entity_state['inventory'], str) else entity_state['inventory']
-                    if not inventory:
-                        raise ValueError("Inventory is empty")
-                    
-                    quantities = inventory.get("quantities", {})
-                    current_quantity = quantities.get(item_id, 0)
-                    
-                    if current_quantity < quantity:
-                        raise ValueError(f"Insufficient quantity: {item_id} (have {current_quantity}, need {quantity})")
-                    
-                    # 수량 업데이트
-                    new_quantity = current_quantity - quantity
-                    if new_quantity <= 0:
-                        # 수량이 0 이하면 아이템 제거
-                        quantities.pop(item_id, None)
-                        items = inventory.get("items", [])
-                        if item_id in items:
-                            items.remove(item_id)
-                    else:
-                        quantities[item_id] = new_quantity
-                    
-                    # 인벤토리 업데이트
-                    await conn.execute(
-                        """
-                        UPDATE runtime_data.entity_states
-                        SET inventory = $1::jsonb,
-                            updated_at = NOW()
-                        WHERE runtime_entity_id = $2
-                        """,
-                        json.dumps(inventory),
-                        runtime_entity_id
-                    )
-                    
-                    logger.info(f"Removed {quantity}x {item_id} from inventory of {runtime_entity_id}")
-                    return True
-                    
-        except Exception as e:
-            logger.error(f"Failed to remove item from inventory: {str(e)}")
-            raise
+        await self.apply_delta(runtime_entity_id, {item_id: -quantity})
+        return True
+    
+    async def check_delta(self, runtime_entity_id: str, delta: Dict[str, int]) -> None:
+        """
+        apply_delta 적용 가능 여부 검증 (인벤토리는 변경하지 않음)
+        
+        다른 상태를 먼저 바꾼 뒤 재료를 차감하는 호출자가 재료 부족을 미리 확인하는 용도입니다.
+        
+        Raises:
+            ValueError: 엔티티 상태가 없거나 차감할 수량이 부족한 경우
+        """
+        changes = {item_id: int(quantity) for item_id, quantity in delta.items() if quantity}
+        if any(quantity < 0 for quantity in changes.values()):
+            self._apply_changes(await self.get_inventory(runtime_entity_id), changes)
     
     async def get_inventory(self, runtime_entity_id: str) -> Dict[str, Any]:
         """
@@ -167,6 +234,12 @@ class InventoryManager:
             인벤토리 정보 {"items": [...], "quantities": {...}}
         """
         try:
+            if entity_state_store.write_behind:
+                entity_state = await entity_state_store.get(runtime_entity_id)
+                if not entity_state:
+                    raise ValueError(f"Entity state not found: {runtime_entity_id}")
+                return entity_state['inventory'] or {"items": [], "quantities": {}}
+            
             pool = await self.db.pool
             async with pool.acquire() as conn:
                 entity_state = await conn.fetchrow(
@@ -1,7 +1,7 @@
 """
 오브젝트 상태 관리 모듈
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import uuid
 import asyncio
 import json
@@ -15,6 +15,10 @@ from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
 from common.utils.logger import logger
+from common.utils.ttl_cache import TTLCache
+from app.config.app_config import CACHE_CONFIG
+from app.core.state_version import state_versions
+from app.systems.session_deltas import session_deltas
 
 
 class ObjectStateResult(BaseModel):
@@ -58,9 +62,8 @@ class ObjectStateManager:
         self.reference_layer = reference_layer_repo
         self.logger = logger
         
-        # 오브젝트 상태 캐시
-        self._state_cache: Dict[str, Dict[str, Any]] = {}
-        self._cache_lock = asyncio.Lock()
+        # 오브젝트 상태 캐시 (키: "{session_id}:{game_object_id}", 세션 단위 무효화)
+        self._state_cache = TTLCache("object_state", **CACHE_CONFIG["object_state"])
     
     async def get_object_state(
         self,
@@ -82,10 +85,9 @@ class ObjectStateManager:
         try:
             # 1. 캐시 확인
             cache_key = f"{session_id}:{game_object_id}"
-            async with self._cache_lock:
-                if cache_key in self._state_cache:
-                    cached_state = self._state_cache[cache_key]
-                    return ObjectStateResult.success_result(cached_state, "캐시에서 조회")
+            cached_state = self._state_cache.get(cache_key)
+            if cached_state is not None:
+                return ObjectStateResult.success_result(cached_state, "캐시에서 조회")
             
             pool = await self.db.pool
             async with pool.acquire() as conn:
@@ -171,44 +173,13 @@ class ObjectStateManager:
                     )
                 
                 # 5. 병합하여 반환
-                base_properties = parse_jsonb_data(game_object.get('properties', {}))
-                base_possible_states = parse_jsonb_data(game_object.get('possible_states', {}))
-                
-                # 런타임 상태 파싱
                 runtime_state_dict = {}
                 if runtime_state and runtime_state.get('current_state'):
                     runtime_state_dict = parse_jsonb_data(runtime_state['current_state'])
-                
-                # 기본값과 런타임 값 병합 (런타임 값이 우선)
-                merged_state = {
-                    "object_id": game_object['object_id'],
-                    "object_type": game_object['object_type'],
-                    "object_name": game_object['object_name'],
-                    "object_description": game_object.get('object_description'),
-                    "interaction_type": game_object.get('interaction_type'),
-                    "possible_states": base_possible_states,
-                    "properties": {**base_properties, **runtime_state_dict}
-                }
-                
-                # current_state는 runtime_state_dict에서 가져오거나 기본값 사용
-                if 'state' in runtime_state_dict:
-                    merged_state['current_state'] = runtime_state_dict['state']
-                elif 'default_state' in base_properties:
-                    merged_state['current_state'] = base_properties['default_state']
-                else:
-                    merged_state['current_state'] = 'default'
-                
-                # contents는 runtime_state_dict에서 가져오거나 기본값 사용
-                if 'contents' in runtime_state_dict:
-                    merged_state['contents'] = runtime_state_dict['contents']
-                elif 'contents' in base_properties:
-                    merged_state['contents'] = base_properties['contents']
-                else:
-                    merged_state['contents'] = []
+                merged_state = self._merge_object_state(game_object, runtime_state_dict)
                 
                 # 캐시에 저장
-                async with self._cache_lock:
-                    self._state_cache[cache_key] = merged_state
+                self._state_cache.set(cache_key, merged_state, session_id=str(session_id))
                 
                 return ObjectStateResult.success_result(
                     merged_state,
@@ -222,6 +193,99 @@ class ObjectStateManager:
                 error=str(e)
             )
     
+    @staticmethod
+    def _merge_object_state(game_object: Any, runtime_state_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """게임 오브젝트 기본값과 런타임 상태 병합 (런타임 값이 우선)"""
+        base_properties = parse_jsonb_data(game_object.get('properties', {}))
+        base_possible_states = parse_jsonb_data(game_object.get('possible_states', {}))
+        
+        merged_state = {
+            "object_id": game_object['object_id'],
+            "object_type": game_object['object_type'],
+            "object_name": game_object['object_name'],
+            "object_description": game_object.get('object_description'),
+            "interaction_type": game_object.get('interaction_type'),
+            "possible_states": base_possible_states,
+            "properties": {**base_properties, **runtime_state_dict}
+        }
+        
+        # current_state는 runtime_state_dict에서 가져오거나 기본값 사용
+        if 'state' in runtime_state_dict:
+            merged_state['current_state'] = runtime_state_dict['state']
+        elif 'default_state' in base_properties:
+            merged_state['current_state'] = base_properties['default_state']
+        else:
+            merged_state['current_state'] = 'default'
+        
+        # contents는 runtime_state_dict에서 가져오거나 기본값 사용
+        if 'contents' in runtime_state_dict:
+            merged_state['contents'] = runtime_state_dict['contents']
+        elif 'contents' in base_properties:
+            merged_state['contents'] = base_properties['contents']
+        else:
+            merged_state['contents'] = []
+        return merged_state
+    
+    async def get_object_states(
+        self,
+        objects: List[Tuple[str, str]],
+        session_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 오브젝트의 현재 상태 일괄 조회 (캐시 미스는 쿼리 2개로 로드)
+        
+        Args:
+            objects: (runtime_object_id, game_object_id) 목록 (runtime_object_id 필수)
+            session_id: 세션 ID
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: game_object_id -> 병합된 상태 (게임 오브젝트가 없으면 제외)
+        """
+        states: Dict[str, Dict[str, Any]] = {}
+        missing: Dict[str, str] = {}
+        for runtime_object_id, game_object_id in objects:
+            cached_state = self._state_cache.get(f"{session_id}:{game_object_id}")
+            if cached_state is not None:
+                states[game_object_id] = cached_state
+            else:
+                missing[game_object_id] = str(runtime_object_id)
+        
+        if not missing:
+            return states
+        
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            runtime_rows = await conn.fetch(
+                """
+                SELECT runtime_object_id, current_state FROM runtime_data.object_states
+                WHERE runtime_object_id = ANY($1::uuid[])
+                """,
+                list(missing.values())
+            )
+            game_objects = await conn.fetch(
+                """
+                SELECT 
+                    object_id, object_type, object_name, object_description,
+                    interaction_type, possible_states, properties
+                FROM game_data.world_objects
+                WHERE object_id = ANY($1::text[])
+                """,
+                list(missing)
+            )
+        
+        runtime_states = {
+            str(row['runtime_object_id']): parse_jsonb_data(row['current_state'])
+            for row in runtime_rows if row['current_state']
+        }
+        for game_object in game_objects:
+            game_object_id = game_object['object_id']
+            merged_state = self._merge_object_state(
+                game_object, runtime_states.get(missing[game_object_id]) or {}
+            )
+            self._state_cache.set(f"{session_id}:{game_object_id}", merged_state, session_id=str(session_id))
+            states[game_object_id] = merged_state
+        return states
+    
     async def update_object_state(
         self,
         runtime_object_id: Optional[str],
@@ -355,28 +419,37 @@ class ObjectStateManager:
                     
                     # 5. 캐시 업데이트
                     cache_key = f"{session_id}:{game_object_id}"
-                    async with self._cache_lock:
-                        if cache_key in self._state_cache:
-                            # 캐시된 상태도 업데이트
-                            self._state_cache[cache_key].update({
-                                'current_state': current_state_dict.get('state', 'default'),
-                                'contents': current_state_dict.get('contents', []),
-                                **current_state_dict
-                            })
-                    
-                    self.logger.info(f"오브젝트 상태 업데이트 완료: {game_object_id} -> {state}")
-                    
-                    return ObjectStateResult.success_result(
-                        {
-                            "runtime_object_id": runtime_object_id,
-                            "game_object_id": game_object_id,
-                            "state": current_state_dict.get('state'),
-                            "contents": current_state_dict.get('contents', []),
+                    cached_state = self._state_cache.peek(cache_key)
+                    if cached_state is not None:
+                        # 캐시된 상태도 업데이트
+                        cached_state.update({
+                            'current_state': current_state_dict.get('state', 'default'),
+                            'contents': current_state_dict.get('contents', []),
                             **current_state_dict
-                        },
-                        f"오브젝트 상태 업데이트 완료"
-                    )
+                        })
                     
+                    self.logger.info(f"오브젝트 상태 업데이트 완료: {game_object_id} -> {state}")
+            
+            # 커밋 후 상태 버전 갱신 (상태 기반 메모이즈 결과 무효화: 사용 가능한 액션 등)
+            state_versions.bump(session_id)
+            session_deltas.publish(session_id, "object_state", {
+                "runtime_object_id": str(runtime_object_id),
+                "game_object_id": game_object_id,
+                "state": current_state_dict.get('state'),
+                "contents": current_state_dict.get('contents', []),
+            })
+            
+            return ObjectStateResult.success_result(
+                {
+                    "runtime_object_id": runtime_object_id,
+                    "game_object_id": game_object_id,
+                    "state": current_state_dict.get('state'),
+                    "contents": current_state_dict.get('contents', []),
+                    **current_state_dict
+                },
+                f"오브젝트 상태 업데이트 완료"
+            )
+            
         except Exception as e:
             self.logger.error(f"오브젝트 상태 업데이트 실패: {str(e)}")
             return ObjectStateResult.error_result(
@@ -515,3 +588,15 @@ class ObjectStateManager:
                 error=str(e)
             )
 
+    
+    async def clear_cache(self) -> None:
+        """캐시 초기화"""
+        self._state_cache.clear()
+    
+    async def invalidate_session_cache(self, session_id: str) -> int:
+        """세션에 속한 오브젝트 상태 캐시 일괄 무효화"""
+        return self._state_cache.invalidate_session(str(session_id))
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        return self._state_cache.snapshot()
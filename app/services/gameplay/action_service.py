@@ -4,15 +4,72 @@
 from typing import Dict, Any, List, Optional
 import json
 import uuid
-from app.core.game_session import GameSession
+from app.core.session_registry import session_registry
 from app.services.gameplay.base_service import BaseGameplayService
 from common.utils.logger import logger
 from app.common.utils.uuid_helper import normalize_uuid, to_uuid
+from app.config.app_config import CACHE_CONFIG
+from app.core.state_version import state_versions
+from common.utils.ttl_cache import TTLCache
+from database.cell_occupancy import cell_occupancy
+from database.connection import DatabaseConnection
+
+
+# 액션 타입별 텍스트 매핑
+ACTION_TEXT_MAP = {
+    'examine': '조사하기',
+    'inspect': '상세 조사하기',
+    'search': '찾아보기',
+    'open': '열기',
+    'close': '닫기',
+    'light': '불 켜기',
+    'extinguish': '불 끄기',
+    'activate': '활성화하기',
+    'deactivate': '비활성화하기',
+    'lock': '잠그기',
+    'unlock': '잠금 해제하기',
+    'sit': '앉기',
+    'stand': '일어서기',
+    'lie': '눕기',
+    'get_up': '일어나기',
+    'climb': '오르기',
+    'descend': '내려가기',
+    'rest': '쉬기',
+    'sleep': '잠자기',
+    'meditate': '명상하기',
+    'eat': '먹기',
+    'drink': '마시기',
+    'consume': '소비하기',
+    'read': '읽기',
+    'study': '공부하기',
+    'write': '쓰기',
+    'pickup': '아이템 획득',
+    'place': '아이템 놓기',
+    'take': '가져가기',
+    'put': '넣기',
+    'combine': '조합하기',
+    'craft': '제작하기',
+    'cook': '요리하기',
+    'repair': '수리하기',
+    'destroy': '파괴하기',
+    'break': '부수기',
+    'dismantle': '분해하기',
+    'use': '사용하기',
+}
 
 
 class ActionService(BaseGameplayService):
     """액션 조회 서비스"""
     
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        super().__init__(db_connection)
+        # 세션별 game_cell_id -> runtime_cell_id 맵 (셀 참조는 세션 안에서 바뀌지 않음)
+        self._cell_ref_maps = TTLCache("cell_reference_map", **CACHE_CONFIG["cell_reference_map"])
+        # 오브젝트 템플릿별 액션 기술자 (키: game_object_id)
+        self._object_descriptors = TTLCache("object_action_descriptor", **CACHE_CONFIG["object_action_descriptor"])
+        # 액션 목록 메모이즈 (키: "{session_id}:{runtime_cell_id}", 값: (상태 버전, 셀 점유자, 액션 목록))
+        self._action_memo = TTLCache("available_actions", **CACHE_CONFIG["available_actions"])
+    
     def _can_transition_state(
         self,
         current_state: str,
@@ -148,48 +205,6 @@ class ActionService(BaseGameplayService):
         if not interaction_type or interaction_type == 'none':
             return
         
-        # 액션 타입별 텍스트 매핑
-        action_text_map = {
-            'examine': '조사하기',
-            'inspect': '상세 조사하기',
-            'search': '찾아보기',
-            'open': '열기',
-            'close': '닫기',
-            'light': '불 켜기',
-            'extinguish': '불 끄기',
-            'activate': '활성화하기',
-            'deactivate': '비활성화하기',
-            'lock': '잠그기',
-            'unlock': '잠금 해제하기',
-            'sit': '앉기',
-            'stand': '일어서기',
-            'lie': '눕기',
-            'get_up': '일어나기',
-            'climb': '오르기',
-            'descend': '내려가기',
-            'rest': '쉬기',
-            'sleep': '잠자기',
-            'meditate': '명상하기',
-            'eat': '먹기',
-            'drink': '마시기',
-            'consume': '소비하기',
-            'read': '읽기',
-            'study': '공부하기',
-            'write': '쓰기',
-            'pickup': '아이템 획득',
-            'place': '아이템 놓기',
-            'take': '가져가기',
-            'put': '넣기',
-            'combine': '조합하기',
-            'craft': '제작하기',
-            'cook': '요리하기',
-            'repair': '수리하기',
-            'destroy': '파괴하기',
-            'break': '부수기',
-            'dismantle': '분해하기',
-            'use': '사용하기',
-        }
-        
         # possible_states 기반 동적 액션 생성
         if possible_states and len(possible_states) > 0:
             # 상태 전이 기반 액션 생성
@@ -221,7 +236,7 @@ class ActionService(BaseGameplayService):
                         possible_states=possible_states
                     )
                     if can_transition:
-                        action_text = action_text_map.get(action_type, action_type)
+                        action_text = ACTION_TEXT_MAP.get(action_type, action_type)
                         object_actions.append({
                             "action_id": f"{action_type}_object_{object_id}",
                             "action_type": action_type,
@@ -249,7 +264,7 @@ class ActionService(BaseGameplayService):
             
             actions = interaction_action_map.get(interaction_type, [])
             for action_type in actions:
-                action_text = action_text_map.get(action_type, action_type)
+                action_text = ACTION_TEXT_MAP.get(action_type, action_type)
                 object_actions.append({
                     "action_id": f"{action_type}_object_{object_id}",
                     "action_type": action_type,
@@ -280,6 +295,9 @@ class ActionService(BaseGameplayService):
         """
         사용 가능한 액션 조회
         
+        결과는 (세션, 셀) 단위로 메모이즈하며, 세션 상태 버전(state_versions)이나
+        셀 점유자(cell_occupancy)가 바뀌면 다시 계산합니다.
+        
         Returns:
             List[Dict[str, Any]]: 액션 목록
         """
@@ -290,7 +308,7 @@ class ActionService(BaseGameplayService):
             except ValueError:
                 raise ValueError(f"잘못된 세션 ID 형식: {session_id}")
             
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -330,338 +348,375 @@ class ActionService(BaseGameplayService):
                 self.logger.error(f"잘못된 runtime_cell_id 형식: {current_cell_id}")
                 raise ValueError(f"현재 셀 ID 형식이 올바르지 않습니다: {current_cell_id}")
             
-            # 현재 셀 정보 조회
-            try:
-                cell_contents = await self.cell_manager.get_cell_contents(current_cell_id)
-            except Exception as e:
-                self.logger.error(f"셀 컨텐츠 조회 실패: {str(e)}, cell_id: {current_cell_id}")
-                raise ValueError(f"셀 정보를 조회할 수 없습니다: {str(e)}")
-            
-            actions = []
-            
-            # 연결된 셀로 이동 액션
-            # 현재 셀의 game_cell_id를 통해 connected_cells 정보 조회
-            try:
-                cell_data_result = await self.cell_manager.get_cell(current_cell_id)
-            except Exception as e:
-                self.logger.error(f"셀 조회 실패: {str(e)}, cell_id: {current_cell_id}")
-                cell_data_result = None
+            # 메모이즈 확인 (버전/점유자는 계산 전에 읽어 계산 중 변경이 다음 조회에서 반영되도록 함)
+            memo_key = f"{session_id}:{current_cell_id}"
+            version = state_versions.get(session_id)
+            occupants = await cell_occupancy.occupants(current_cell_id)
+            memo = self._action_memo.get(memo_key)
+            if memo is not None and memo[0] == version and memo[1] == occupants:
+                return [dict(action) for action in memo[2]]
             
-            if cell_data_result and cell_data_result.success and cell_data_result.cell:
-                cell_properties = cell_data_result.cell.properties
-                connected_cells_info = cell_properties.get('connected_cells', [])
-                
-                for connected_cell in connected_cells_info:
-                    target_game_cell_id = connected_cell['cell_id']
-                    direction = connected_cell.get('direction', '어딘가')
-                    description = connected_cell.get('description', f"{direction} 방향으로 이동")
-                    
-                    # 런타임 셀 ID 조회 또는 생성
-                    # 먼저 세션의 셀 참조에서 game_cell_id로 조회
-                    cell_refs = await self.reference_layer_repo.get_cell_references_by_session(session_id)
-                    runtime_target_cell_id = None
-                    for cell_ref in cell_refs:
-                        if cell_ref['game_cell_id'] == target_game_cell_id:
-                            runtime_target_cell_id = cell_ref['runtime_cell_id']
-                            break
-                    
-                    # 없으면 생성 (get_or_create_cell_reference는 runtime_cells를 먼저 생성하고 cell_references를 생성함)
-                    if not runtime_target_cell_id:
-                        try:
-                            cell_ref = await self.reference_layer_repo.get_or_create_cell_reference(
-                                game_cell_id=target_game_cell_id,
-                                session_id=session_id
-                            )
-                            runtime_target_cell_id = cell_ref.get('runtime_cell_id')
-                        except Exception as e:
-                            self.logger.error(f"연결된 셀 참조 생성 실패: {str(e)}, game_cell_id: {target_game_cell_id}")
-                            # 생성 실패 시 해당 셀로의 이동 액션을 건너뜀
-                            continue
-                    
-                    if runtime_target_cell_id:
-                        actions.append({
-                            "action_id": f"move_to_cell_{runtime_target_cell_id}",
-                            "action_type": "move",
-                            "text": f"{description} ({direction})",
-                            "target_id": runtime_target_cell_id,
-                            "target_name": connected_cell.get('cell_name', target_game_cell_id),
-                            "target_type": "cell",
-                            "description": description,
-                        })
+            actions = await self._build_available_actions(session_id, str(current_cell_id))
+            self._action_memo.set(memo_key, (version, occupants, actions), session_id=session_id)
+            return [dict(action) for action in actions]
             
-            # 엔티티와 대화 액션
-            for entity in cell_contents.get('entities', []):
-                if entity.get('entity_type') == 'npc' and entity.get('dialogue_id'):
-                    actions.append({
-                        "action_id": f"dialogue_{entity['runtime_entity_id']}",
-                        "action_type": "dialogue",
-                        "text": f"{entity.get('entity_name', 'NPC')}와 대화하기",
-                        "target_id": entity['runtime_entity_id'],
-                        "target_name": entity.get('entity_name', 'NPC'),
-                    })
+        except ValueError as e:
+            self.logger.error(f"액션 조회 실패 (ValueError): {str(e)}")
+            raise
+        except Exception as e:
+            self.logger.error(f"액션 조회 실패: {str(e)}", exc_info=True)
+            raise ValueError(f"액션 조회 중 오류가 발생했습니다: {str(e)}")
+    
+    async def _build_available_actions(self, session_id: str, current_cell_id: str) -> List[Dict[str, Any]]:
+        """현재 셀 기준 액션 목록 계산 (셀 참조/오브젝트 상태는 일괄 조회)"""
+        # 현재 셀 정보 조회
+        try:
+            cell_contents = await self.cell_manager.get_cell_contents(current_cell_id)
+        except Exception as e:
+            self.logger.error(f"셀 컨텐츠 조회 실패: {str(e)}, cell_id: {current_cell_id}")
+            raise ValueError(f"셀 정보를 조회할 수 없습니다: {str(e)}")
+        
+        actions = []
+        
+        # 연결된 셀로 이동 액션
+        # 현재 셀의 game_cell_id를 통해 connected_cells 정보 조회
+        try:
+            cell_data_result = await self.cell_manager.get_cell(current_cell_id)
+        except Exception as e:
+            self.logger.error(f"셀 조회 실패: {str(e)}, cell_id: {current_cell_id}")
+            cell_data_result = None
+        
+        if cell_data_result and cell_data_result.success and cell_data_result.cell:
+            cell_properties = cell_data_result.cell.properties
+            connected_cells_info = cell_properties.get('connected_cells', [])
+            actions.extend(await self._build_move_actions(session_id, connected_cells_info))
+        
+        # 엔티티와 대화 액션
+        for entity in cell_contents.get('entities', []):
+            if entity.get('entity_type') == 'npc' and entity.get('dialogue_id'):
+                actions.append({
+                    "action_id": f"dialogue_{entity['runtime_entity_id']}",
+                    "action_type": "dialogue",
+                    "text": f"{entity.get('entity_name', 'NPC')}와 대화하기",
+                    "target_id": entity['runtime_entity_id'],
+                    "target_name": entity.get('entity_name', 'NPC'),
+                })
+        
+        # 엔티티 관찰 및 상호작용 액션
+        for entity in cell_contents.get('entities', []):
+            entity_name = entity.get('entity_name', 'Entity')
+            entity_id = entity['runtime_entity_id']
+            
+            # 관찰하기 액션 (항상 가능)
+            actions.append({
+                "action_id": f"examine_entity_{entity_id}",
+                "action_type": "examine",
+                "text": f"{entity_name} 관찰하기",
+                "target_id": entity_id,
+                "target_name": entity_name,
+                "target_type": "entity",
+                "description": entity.get('description', ''),
+            })
             
-            # 엔티티 관찰 및 상호작용 액션
-            for entity in cell_contents.get('entities', []):
-                entity_name = entity.get('entity_name', 'Entity')
-                entity_id = entity['runtime_entity_id']
-                
-                # 관찰하기 액션 (항상 가능)
+            # 대화하기 액션
+            if entity.get('dialogue_id'):
                 actions.append({
-                    "action_id": f"examine_entity_{entity_id}",
-                    "action_type": "examine",
-                    "text": f"{entity_name} 관찰하기",
+                    "action_id": f"dialogue_{entity_id}",
+                    "action_type": "dialogue",
+                    "text": f"{entity_name}와 대화하기",
                     "target_id": entity_id,
                     "target_name": entity_name,
                     "target_type": "entity",
-                    "description": entity.get('description', ''),
                 })
-                
-                # 대화하기 액션
-                if entity.get('dialogue_id'):
-                    actions.append({
-                        "action_id": f"dialogue_{entity_id}",
-                        "action_type": "dialogue",
-                        "text": f"{entity_name}와 대화하기",
-                        "target_id": entity_id,
-                        "target_name": entity_name,
-                        "target_type": "entity",
-                    })
-                
-                # 상호작용하기 액션
-                if entity.get('can_interact'):
-                    actions.append({
-                        "action_id": f"interact_entity_{entity_id}",
-                        "action_type": "interact",
-                        "text": f"{entity_name}와 상호작용하기",
-                        "target_id": entity_id,
-                        "target_name": entity_name,
-                        "target_type": "entity",
-                    })
             
-            # 일반적인 액션 추가 (TRPG 스타일)
-            objects = cell_contents.get('objects', [])
-            entities = cell_contents.get('entities', [])
-            
-            # 관찰하기 액션은 항상 표시 (오브젝트나 NPC가 없어도 주변을 관찰할 수 있음)
-            discovered_items = []
-            
-            # 오브젝트 이름 수집
-            if len(objects) > 0:
-                object_names = [obj.get('object_name', 'Object') for obj in objects]
-                discovered_items.extend(object_names)
-            
-            # NPC 이름 수집 (플레이어 제외)
-            if len(entities) > 0:
-                npc_names = [
-                    entity.get('entity_name', 'Entity') 
-                    for entity in entities 
-                    if entity.get('entity_type') != 'player'
-                ]
-                discovered_items.extend(npc_names)
-            
-            # 발견된 항목이 있으면 상세 설명, 없으면 일반 설명
-            if len(discovered_items) > 0:
+            # 상호작용하기 액션
+            if entity.get('can_interact'):
                 actions.append({
-                    "action_id": "observe_room",
-                    "action_type": "observe",
-                    "text": "주변 관찰하기",
-                    "target_id": None,
-                    "target_name": None,
-                    "target_type": None,
-                    "description": f"주변을 관찰하여 {', '.join(discovered_items)} 등이 보입니다.",
-                })
-            else:
-                # 오브젝트나 NPC가 없어도 관찰 액션 제공
-                actions.append({
-                    "action_id": "observe_room",
-                    "action_type": "observe",
-                    "text": "주변 관찰하기",
-                    "target_id": None,
-                    "target_name": None,
-                    "target_type": None,
-                    "description": "주변을 자세히 관찰합니다.",
+                    "action_id": f"interact_entity_{entity_id}",
+                    "action_type": "interact",
+                    "text": f"{entity_name}와 상호작용하기",
+                    "target_id": entity_id,
+                    "target_name": entity_name,
+                    "target_type": "entity",
                 })
+        
+        # 일반적인 액션 추가 (TRPG 스타일)
+        objects = cell_contents.get('objects', [])
+        entities = cell_contents.get('entities', [])
+        
+        # 관찰하기 액션은 항상 표시 (오브젝트나 NPC가 없어도 주변을 관찰할 수 있음)
+        discovered_items = []
+        
+        # 오브젝트 이름 수집
+        if len(objects) > 0:
+            object_names = [obj.get('object_name', 'Object') for obj in objects]
+            discovered_items.extend(object_names)
+        
+        # NPC 이름 수집 (플레이어 제외)
+        if len(entities) > 0:
+            npc_names = [
+                entity.get('entity_name', 'Entity') 
+                for entity in entities 
+                if entity.get('entity_type') != 'player'
+            ]
+            discovered_items.extend(npc_names)
+        
+        # 발견된 항목이 있으면 상세 설명, 없으면 일반 설명
+        if len(discovered_items) > 0:
+            actions.append({
+                "action_id": "observe_room",
+                "action_type": "observe",
+                "text": "주변 관찰하기",
+                "target_id": None,
+                "target_name": None,
+                "target_type": None,
+                "description": f"주변을 관찰하여 {', '.join(discovered_items)} 등이 보입니다.",
+            })
+        else:
+            # 오브젝트나 NPC가 없어도 관찰 액션 제공
+            actions.append({
+                "action_id": "observe_room",
+                "action_type": "observe",
+                "text": "주변 관찰하기",
+                "target_id": None,
+                "target_name": None,
+                "target_type": None,
+                "description": "주변을 자세히 관찰합니다.",
+            })
+        
+        # 런타임 상태에서 current_state 일괄 조회
+        object_states = await self._get_object_states(objects, session_id)
+        
+        # 발견된 오브젝트별 구체적인 액션 추가
+        for obj in objects:
+            object_id = obj.get('runtime_object_id') or obj.get('object_id')
+            if not object_id:
+                continue
             
-            # 발견된 오브젝트별 구체적인 액션 추가
-            for obj in objects:
-                object_id = obj.get('runtime_object_id') or obj.get('object_id')
-                if not object_id:
-                    continue
-                    
-                object_name = obj.get('object_name', 'Object')
-                properties = obj.get('properties', {})
-                if isinstance(properties, str):
-                    properties = json.loads(properties)
-                
-                # interaction_type은 최상위 레벨 또는 properties에 있을 수 있음
-                interaction_type = obj.get('interaction_type') or properties.get('interaction_type', 'examine')
-                
-                # 런타임 상태에서 current_state 확인
-                current_state = None
-                if self.object_state_manager:
-                    try:
-                        game_object_id = obj.get('game_object_id')
-                        if game_object_id and session_id:
-                            state_result = await self.object_state_manager.get_object_state(
-                                runtime_object_id=object_id,
-                                game_object_id=game_object_id,
-                                session_id=session_id
-                            )
-                            if state_result.success and state_result.object_state:
-                                state_dict = state_result.object_state
-                                current_state = state_dict.get('state') or state_dict.get('current_state')
-                    except Exception as e:
-                        self.logger.warning(f"Failed to get object state for {object_id}: {str(e)}")
-                
-                # properties에서 current_state 확인 (fallback)
-                if not current_state:
-                    current_state = properties.get('current_state') or properties.get('state', 'closed')
-                
-                # 오브젝트의 properties.interactions를 기반으로 동적 액션 생성
-                object_actions = []
-                
-                # 기본 조사 액션 (항상 가능)
+            properties = obj.get('properties', {})
+            if isinstance(properties, str):
+                properties = json.loads(properties)
+            
+            current_state = None
+            state_dict = object_states.get(obj.get('game_object_id'))
+            if state_dict:
+                current_state = state_dict.get('state') or state_dict.get('current_state')
+            
+            # properties에서 current_state 확인 (fallback)
+            if not current_state:
+                current_state = properties.get('current_state') or properties.get('state', 'closed')
+            
+            descriptor = self._get_object_action_descriptor(obj, properties)
+            actions.extend(self._build_object_actions(obj, object_id, descriptor, current_state, properties))
+        
+        return actions
+    
+    async def _build_move_actions(
+        self,
+        session_id: str,
+        connected_cells_info: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """연결된 셀로 이동 액션 (셀 참조는 세션별 맵에서 조회, 없는 참조는 일괄 생성)"""
+        if not connected_cells_info:
+            return []
+        
+        cell_refs = await self._get_cell_reference_map(session_id)
+        missing = [
+            connected_cell['cell_id'] for connected_cell in connected_cells_info
+            if connected_cell['cell_id'] not in cell_refs
+        ]
+        if missing:
+            # 없으면 생성 (runtime_cells를 먼저 생성하고 cell_references를 생성함)
+            try:
+                cell_refs.update(
+                    await self.reference_layer_repo.get_or_create_cell_references(missing, session_id)
+                )
+            except Exception as e:
+                # 생성 실패 시 해당 셀로의 이동 액션을 건너뜀
+                self.logger.error(f"연결된 셀 참조 생성 실패: {str(e)}, game_cell_ids: {missing}")
+        
+        actions = []
+        for connected_cell in connected_cells_info:
+            target_game_cell_id = connected_cell['cell_id']
+            runtime_target_cell_id = cell_refs.get(target_game_cell_id)
+            if not runtime_target_cell_id:
+                continue
+            
+            direction = connected_cell.get('direction', '어딘가')
+            description = connected_cell.get('description', f"{direction} 방향으로 이동")
+            actions.append({
+                "action_id": f"move_to_cell_{runtime_target_cell_id}",
+                "action_type": "move",
+                "text": f"{description} ({direction})",
+                "target_id": runtime_target_cell_id,
+                "target_name": connected_cell.get('cell_name', target_game_cell_id),
+                "target_type": "cell",
+                "description": description,
+            })
+        return actions
+    
+    async def _get_cell_reference_map(self, session_id: str) -> Dict[str, str]:
+        """세션의 game_cell_id -> runtime_cell_id 맵 (세션당 한 번 조회 후 보관)"""
+        cell_refs = self._cell_ref_maps.get(session_id)
+        if cell_refs is None:
+            cell_refs = await self.reference_layer_repo.get_cell_reference_map(session_id)
+            self._cell_ref_maps.set(session_id, cell_refs, session_id=session_id)
+        return cell_refs
+    
+    async def _get_object_states(
+        self,
+        objects: List[Dict[str, Any]],
+        session_id: str
+    ) -> Dict[str, Dict[str, Any]]:
+        """셀 오브젝트들의 런타임 상태 일괄 조회 (game_object_id -> 상태)"""
+        if not self.object_state_manager:
+            return {}
+        
+        object_keys = [
+            (obj.get('runtime_object_id') or obj.get('object_id'), obj.get('game_object_id'))
+            for obj in objects
+        ]
+        object_keys = [(object_id, game_object_id) for object_id, game_object_id in object_keys
+                       if object_id and game_object_id]
+        if not object_keys:
+            return {}
+        
+        try:
+            return await self.object_state_manager.get_object_states(object_keys, session_id)
+        except Exception as e:
+            self.logger.warning(f"Failed to get object states for cell objects: {str(e)}")
+            return {}
+    
+    def _get_object_action_descriptor(self, obj: Dict[str, Any], properties: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        오브젝트 템플릿별 액션 기술자 (상태와 무관한 부분만 계산하여 game_object_id별로 보관)
+        
+        Returns:
+            Dict[str, Any]: object_name, interaction_type, possible_states,
+                            has_interactions, interaction_types, interaction_actions
+        """
+        game_object_id = obj.get('game_object_id')
+        if game_object_id:
+            descriptor = self._object_descriptors.get(game_object_id)
+            if descriptor is not None:
+                return descriptor
+        
+        object_name = obj.get('object_name', 'Object')
+        
+        # interaction_type은 최상위 레벨 또는 properties에 있을 수 있음
+        interaction_type = obj.get('interaction_type') or properties.get('interaction_type', 'examine')
+        
+        # properties.interactions 확인
+        interactions = properties.get('interactions', {})
+        if isinstance(interactions, str):
+            interactions = json.loads(interactions)
+        
+        # possible_states 확인 (상태 전이 규칙)
+        # possible_states는 최상위 레벨 또는 properties에 있을 수 있음
+        possible_states = obj.get('possible_states', [])
+        if not possible_states:
+            possible_states = properties.get('possible_states', [])
+        if isinstance(possible_states, str):
+            possible_states = json.loads(possible_states)
+        elif possible_states is None:
+            possible_states = []
+        
+        # interactions에 정의된 액션 (액션 타입, 설정, 표시 텍스트)
+        interaction_actions = []
+        for action_type, action_config in interactions.items():
+            if not isinstance(action_config, dict):
+                continue
+            action_text = action_config.get('text') or ACTION_TEXT_MAP.get(action_type, action_type)
+            interaction_actions.append((action_type, action_config, f"{object_name} {action_text}"))
+        
+        descriptor = {
+            "object_name": object_name,
+            "interaction_type": interaction_type,
+            "possible_states": possible_states,
+            "has_interactions": bool(interactions),
+            "interaction_types": frozenset(interactions),
+            "interaction_actions": interaction_actions,
+        }
+        if game_object_id:
+            self._object_descriptors.set(game_object_id, descriptor)
+        return descriptor
+    
+    def _build_object_actions(
+        self,
+        obj: Dict[str, Any],
+        object_id: str,
+        descriptor: Dict[str, Any],
+        current_state: Optional[str],
+        properties: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """오브젝트 액션 기술자와 현재 상태로 오브젝트 액션 생성"""
+        object_name = descriptor["object_name"]
+        possible_states = descriptor["possible_states"]
+        
+        # 기본 조사 액션 (항상 가능)
+        object_actions = [{
+            "action_id": f"examine_object_{object_id}",
+            "action_type": "examine",
+            "text": f"{object_name} 조사하기",
+            "target_id": object_id,
+            "target_name": object_name,
+            "target_type": "object",
+            "description": obj.get('description', ''),
+        }]
+        
+        # interactions에 정의된 모든 액션 생성
+        for action_type, action_config, action_text in descriptor["interaction_actions"]:
+            # 액션 가능 여부 확인 (강화된 검증 로직 사용)
+            can_perform = self._check_action_conditions(
+                action_config=action_config,
+                current_state=current_state or '',
+                possible_states=possible_states or []
+            )
+            
+            if not can_perform:
+                continue
+            
+            object_actions.append({
+                "action_id": f"{action_type}_object_{object_id}",
+                "action_type": action_type,
+                "text": action_text,
+                "target_id": object_id,
+                "target_name": object_name,
+                "target_type": "object",
+                "description": action_config.get('description', ''),
+            })
+        
+        # interaction_type 기반 레거시 지원 (interactions가 없는 경우)
+        # possible_states와 properties를 기반으로 동적 액션 생성
+        if not descriptor["has_interactions"]:
+            self._generate_actions_from_interaction_type(
+                object_actions=object_actions,
+                object_id=object_id,
+                object_name=object_name,
+                interaction_type=descriptor["interaction_type"],
+                current_state=current_state,
+                possible_states=possible_states,
+                properties=properties
+            )
+        
+        # contents가 있는 경우 줍기 액션 (interactions에 정의되지 않은 경우)
+        # _generate_actions_from_interaction_type에서 이미 처리되지만, 중복 방지를 위해 확인
+        contents = properties.get('contents', [])
+        if contents and len(contents) > 0:
+            # 이미 pickup 액션이 있는지 확인
+            has_pickup = any(a.get('action_type') == 'pickup' for a in object_actions)
+            if not has_pickup and 'pickup' not in descriptor["interaction_types"]:
                 object_actions.append({
-                    "action_id": f"examine_object_{object_id}",
-                    "action_type": "examine",
-                    "text": f"{object_name} 조사하기",
+                    "action_id": f"pickup_object_{object_id}",
+                    "action_type": "pickup",
+                    "text": f"{object_name}에서 아이템 획득",
                     "target_id": object_id,
                     "target_name": object_name,
                     "target_type": "object",
-                    "description": obj.get('description', ''),
+                    "description": f"{len(contents)}개의 항목이 있습니다.",
                 })
-                
-                # properties.interactions 확인
-                interactions = properties.get('interactions', {})
-                if isinstance(interactions, str):
-                    interactions = json.loads(interactions)
-                
-                # possible_states 확인 (상태 전이 규칙)
-                # possible_states는 최상위 레벨 또는 properties에 있을 수 있음
-                possible_states = obj.get('possible_states', [])
-                if not possible_states:
-                    possible_states = properties.get('possible_states', [])
-                if isinstance(possible_states, str):
-                    possible_states = json.loads(possible_states)
-                elif possible_states is None:
-                    possible_states = []
-                
-                # 액션 타입별 텍스트 매핑
-                action_text_map = {
-                    'examine': '조사하기',
-                    'inspect': '상세 조사하기',
-                    'search': '찾아보기',
-                    'open': '열기',
-                    'close': '닫기',
-                    'light': '불 켜기',
-                    'extinguish': '불 끄기',
-                    'activate': '활성화하기',
-                    'deactivate': '비활성화하기',
-                    'lock': '잠그기',
-                    'unlock': '잠금 해제하기',
-                    'sit': '앉기',
-                    'stand': '일어서기',
-                    'lie': '눕기',
-                    'get_up': '일어나기',
-                    'climb': '오르기',
-                    'descend': '내려가기',
-                    'rest': '쉬기',
-                    'sleep': '잠자기',
-                    'meditate': '명상하기',
-                    'eat': '먹기',
-                    'drink': '마시기',
-                    'consume': '소비하기',
-                    'read': '읽기',
-                    'study': '공부하기',
-                    'write': '쓰기',
-                    'pickup': '아이템 획득',
-                    'place': '아이템 놓기',
-                    'take': '가져가기',
-                    'put': '넣기',
-                    'combine': '조합하기',
-                    'craft': '제작하기',
-                    'cook': '요리하기',
-                    'repair': '수리하기',
-                    'destroy': '파괴하기',
-                    'break': '부수기',
-                    'dismantle': '분해하기',
-                    'use': '사용하기',
-                }
-                
-                # interactions에 정의된 모든 액션 생성
-                for action_type, action_config in interactions.items():
-                    if not isinstance(action_config, dict):
-                        continue
-                    
-                    # 액션 가능 여부 확인 (강화된 검증 로직 사용)
-                    can_perform = self._check_action_conditions(
-                        action_config=action_config,
-                        current_state=current_state or '',
-                        possible_states=possible_states or []
-                    )
-                    
-                    if not can_perform:
-                        continue
-                    
-                    # 액션 텍스트 생성
-                    action_text = action_config.get('text') or action_text_map.get(action_type, action_type)
-                    if not action_text.endswith('하기') and not action_text.endswith('기'):
-                        action_text = f"{object_name} {action_text}"
-                    else:
-                        action_text = f"{object_name} {action_text}"
-                    
-                    object_actions.append({
-                        "action_id": f"{action_type}_object_{object_id}",
-                        "action_type": action_type,
-                        "text": action_text,
-                        "target_id": object_id,
-                        "target_name": object_name,
-                        "target_type": "object",
-                        "description": action_config.get('description', ''),
-                    })
-                
-                # interaction_type 기반 레거시 지원 (interactions가 없는 경우)
-                # possible_states와 properties를 기반으로 동적 액션 생성
-                if not interactions:
-                    # interaction_type과 possible_states를 기반으로 동적 액션 생성
-                    self._generate_actions_from_interaction_type(
-                        object_actions=object_actions,
-                        object_id=object_id,
-                        object_name=object_name,
-                        interaction_type=interaction_type,
-                        current_state=current_state,
-                        possible_states=possible_states,
-                        properties=properties
-                    )
-                
-                # contents가 있는 경우 줍기 액션 (interactions에 정의되지 않은 경우)
-                # _generate_actions_from_interaction_type에서 이미 처리되지만, 중복 방지를 위해 확인
-                contents = properties.get('contents', [])
-                if contents and len(contents) > 0:
-                    # 이미 pickup 액션이 있는지 확인
-                    has_pickup = any(a.get('action_type') == 'pickup' for a in object_actions)
-                    if not has_pickup and 'pickup' not in interactions:
-                        object_actions.append({
-                            "action_id": f"pickup_object_{object_id}",
-                            "action_type": "pickup",
-                            "text": f"{object_name}에서 아이템 획득",
-                            "target_id": object_id,
-                            "target_name": object_name,
-                            "target_type": "object",
-                            "description": f"{len(contents)}개의 항목이 있습니다.",
-                        })
-                
-                # 오브젝트 액션들을 메인 액션 리스트에 추가
-                actions.extend(object_actions)
-            
-            return actions
-            
-        except ValueError as e:
-            self.logger.error(f"액션 조회 실패 (ValueError): {str(e)}")
-            raise
-        except Exception as e:
-            self.logger.error(f"액션 조회 실패: {str(e)}", exc_info=True)
-            raise ValueError(f"액션 조회 중 오류가 발생했습니다: {str(e)}")
+        
+        return object_actions
     
     async def get_available_actions_for_object(
         self,
@@ -765,24 +820,7 @@ class ActionService(BaseGameplayService):
                     continue
                 
                 # 액션 텍스트 생성
-                action_text_map = {
-                    'examine': '조사하기', 'inspect': '상세 조사하기', 'search': '찾아보기',
-                    'open': '열기', 'close': '닫기', 'light': '불 켜기', 'extinguish': '불 끄기',
-                    'activate': '활성화하기', 'deactivate': '비활성화하기',
-                    'lock': '잠그기', 'unlock': '잠금 해제하기',
-                    'sit': '앉기', 'stand': '일어서기', 'lie': '눕기', 'get_up': '일어나기',
-                    'climb': '오르기', 'descend': '내려가기',
-                    'rest': '쉬기', 'sleep': '잠자기', 'meditate': '명상하기',
-                    'eat': '먹기', 'drink': '마시기', 'consume': '소비하기',
-                    'read': '읽기', 'study': '공부하기', 'write': '쓰기',
-                    'pickup': '아이템 획득', 'place': '아이템 놓기',
-                    'take': '가져가기', 'put': '넣기', 'combine': '조합하기',
-                    'craft': '제작하기', 'cook': '요리하기', 'repair': '수리하기',
-                    'destroy': '파괴하기', 'break': '부수기', 'dismantle': '분해하기',
-                    'use': '사용하기',
-                }
-                
-                action_text = action_config.get('text') or action_text_map.get(action_type, action_type)
+                action_text = action_config.get('text') or ACTION_TEXT_MAP.get(action_type, action_type)
                 if not action_text.endswith('하기') and not action_text.endswith('기'):
                     action_text = f"{object_name} {action_text}"
                 else:
@@ -3,7 +3,7 @@
 """
 from typing import Dict, Any, Optional
 import uuid
-from app.core.game_session import GameSession
+from app.core.session_registry import session_registry
 from app.services.gameplay.base_service import BaseGameplayService
 from common.utils.logger import logger
 
@@ -19,7 +19,7 @@ class CellService(BaseGameplayService):
             CellInfo 딕셔너리
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -128,7 +128,7 @@ class CellService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
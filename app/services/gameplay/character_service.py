@@ -5,11 +5,12 @@ from typing import Dict, Any, List, Optional
 import json
 import uuid
 from uuid import UUID
-from app.core.game_session import GameSession
+from app.core.session_registry import session_registry
 from app.services.gameplay.base_service import BaseGameplayService
+from database.entity_state_store import entity_state_store
 from common.utils.logger import logger
 from common.utils.jsonb_handler import parse_jsonb_data
-from app.common.utils.uuid_helper import normalize_uuid, to_uuid
+from app.common.utils.uuid_helper import normalize_uuid
 
 
 class CharacterService(BaseGameplayService):
@@ -29,7 +30,7 @@ class CharacterService(BaseGameplayService):
             # UUID 형식 검증
             session_id = normalize_uuid(session_id)
             
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -54,17 +55,8 @@ class CharacterService(BaseGameplayService):
             
             entity = entity_result.entity
             
-            # 런타임 상태에서 현재 스탯 조회
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                entity_state = await conn.fetchrow(
-                    """
-                    SELECT current_stats, current_position
-                    FROM runtime_data.entity_states
-                    WHERE runtime_entity_id = $1
-                    """,
-                    to_uuid(runtime_entity_id)
-                )
+            # 런타임 상태에서 현재 스탯 조회 (write-behind 모드에서는 메모리 상태)
+            entity_state = await entity_state_store.get(runtime_entity_id)
             
             # 기본 스탯 (game_data.entities.base_stats)
             base_stats = entity.properties or {}
@@ -104,7 +96,7 @@ class CharacterService(BaseGameplayService):
             # UUID 형식 검증
             session_id = normalize_uuid(session_id)
             
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -130,17 +122,8 @@ class CharacterService(BaseGameplayService):
                 self.logger.warning(f"인벤토리 조회 실패 (기본값 사용): {str(e)}")
                 items = []
             
-            # 장착 아이템 조회 (entity_states.equipped_items)
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                entity_state = await conn.fetchrow(
-                    """
-                    SELECT equipped_items
-                    FROM runtime_data.entity_states
-                    WHERE runtime_entity_id = $1
-                    """,
-                    to_uuid(runtime_entity_id)
-                )
+            # 장착 아이템 조회 (entity_states.equipped_items, write-behind 모드에서는 메모리 상태)
+            entity_state = await entity_state_store.get(runtime_entity_id)
             
             equipped_items = []
             if entity_state and entity_state.get('equipped_items'):
@@ -197,7 +180,7 @@ class CharacterService(BaseGameplayService):
             # UUID 형식 검증
             session_id = normalize_uuid(session_id)
             
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -215,17 +198,8 @@ class CharacterService(BaseGameplayService):
             elif not isinstance(runtime_entity_id, str):
                 runtime_entity_id = str(runtime_entity_id)
             
-            # 장착 아이템 조회 (entity_states.equipped_items)
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                entity_state = await conn.fetchrow(
-                    """
-                    SELECT equipped_items
-                    FROM runtime_data.entity_states
-                    WHERE runtime_entity_id = $1
-                    """,
-                    to_uuid(runtime_entity_id)
-                )
+            # 장착 아이템 조회 (entity_states.equipped_items, write-behind 모드에서는 메모리 상태)
+            entity_state = await entity_state_store.get(runtime_entity_id)
             
             equipped_items = []
             if entity_state and entity_state.get('equipped_items'):
@@ -271,7 +245,7 @@ class CharacterService(BaseGameplayService):
             # UUID 형식 검증
             session_id = normalize_uuid(session_id)
             
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -324,7 +298,7 @@ class CharacterService(BaseGameplayService):
             # UUID 형식 검증
             session_id = normalize_uuid(session_id)
             
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -2,7 +2,7 @@
 대화 처리 서비스
 """
 from typing import Dict, Any, Optional
-from app.core.game_session import GameSession
+from app.core.session_registry import session_registry
 from app.services.gameplay.base_service import BaseGameplayService
 from common.utils.logger import logger
 
@@ -26,7 +26,7 @@ class DialogueService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -5,7 +5,10 @@ from typing import Dict, Any, Optional, List
 import json
 from datetime import datetime
 from app.core.game_manager import GameManager
-from app.core.game_session import GameSession
+from app.core.session_registry import session_registry
+from database.entity_state_store import entity_state_store
+from database.save_slot_store import save_slot_store
+from app.systems.session_clock import session_clock
 from database.factories.game_data_factory import GameDataFactory
 from database.factories.instance_factory import InstanceFactory
 from app.services.gameplay.base_service import BaseGameplayService
@@ -58,9 +61,8 @@ class GameService(BaseGameplayService):
                 start_cell_id=start_cell_id
             )
             
-            # 게임 상태 조회
-            session = GameSession(session_id)
-            await session.initialize_session()
+            # 세션 등록 및 게임 상태 조회
+            session = await session_registry.on_start(session_id)
             
             # 플레이어 엔티티 정보 조회
             player_entities = await session.get_player_entities()
@@ -105,7 +107,7 @@ class GameService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -146,7 +148,7 @@ class GameService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -256,7 +258,7 @@ class GameService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -265,19 +267,11 @@ class GameService(BaseGameplayService):
             player_id = player_entities[0]['runtime_entity_id']
             game_entity_id = player_entities[0]['game_entity_id']
             
-            # 엔티티 상태 조회
+            # 런타임 상태 (write-behind 모드에서는 메모리 상태)
+            entity_state = await entity_state_store.get(player_id)
+            
             pool = await self.db.pool
             async with pool.acquire() as conn:
-                # 런타임 상태
-                entity_state = await conn.fetchrow(
-                    """
-                    SELECT current_stats, active_effects, equipped_items
-                    FROM runtime_data.entity_states
-                    WHERE runtime_entity_id = $1
-                    """,
-                    player_id
-                )
-                
                 # 게임 데이터 (기본 템플릿)
                 game_entity = await conn.fetchrow(
                     """
@@ -378,6 +372,10 @@ class GameService(BaseGameplayService):
     async def save_game(self, session_id: str, slot_id: int, save_name: Optional[str] = None) -> Dict[str, Any]:
         """게임 저장"""
         try:
+            # write-behind 모드의 미기록 엔티티 상태와 세션 게임 시간을 먼저 기록
+            await entity_state_store.flush(session_id)
+            await session_clock.flush(session_id)
+            
             # 게임 상태 조회
             game_state = await self.get_game_state(session_id)
             
@@ -396,10 +394,6 @@ class GameService(BaseGameplayService):
                 if not session_info:
                     raise ValueError("세션을 찾을 수 없습니다.")
                 
-                # 현재 시간 조회
-                from datetime import datetime
-                save_timestamp = datetime.now()
-                
                 # 플레이어 이름 조회
                 player_name = "플레이어"
                 if session_info.get('player_runtime_entity_id'):
@@ -415,50 +409,20 @@ class GameService(BaseGameplayService):
                     if player_entity:
                         player_name = player_entity['entity_name']
                 
-                # 저장 슬롯 정보
-                save_data = {
-                    "slot_id": slot_id,
-                    "session_id": str(session_id),
-                    "save_name": save_name or f"저장 슬롯 {slot_id}",
-                    "player_name": player_name,
-                    "location": game_state.get("current_location", ""),
-                    "play_time": game_state.get("play_time", 0),
-                    "save_date": save_timestamp.isoformat(),
-                    "game_state": game_state
-                }
-                
-                # active_sessions.metadata에 저장 슬롯 정보 저장
-                metadata = await conn.fetchval(
-                    """
-                    SELECT metadata FROM runtime_data.active_sessions WHERE session_id = $1
-                    """,
-                    session_id
-                )
-                
-                if not metadata:
-                    metadata = {}
-                elif isinstance(metadata, str):
-                    metadata = json.loads(metadata)
-                
-                if "save_slots" not in metadata:
-                    metadata["save_slots"] = {}
-                
-                metadata["save_slots"][str(slot_id)] = save_data
-                
-                await conn.execute(
-                    """
-                    UPDATE runtime_data.active_sessions
-                    SET metadata = $1::jsonb, updated_at = NOW()
-                    WHERE session_id = $2
-                    """,
-                    json.dumps(metadata),
-                    session_id
-                )
+            # 저장 슬롯 스냅샷 (같은 세션을 같은 슬롯에 다시 저장하면 바뀐 행만 증분 저장)
+            saved = await save_slot_store.save(session_id, slot_id, {
+                "save_name": save_name or f"저장 슬롯 {slot_id}",
+                "player_name": player_name,
+                "location": game_state.get("current_location", ""),
+                "play_time": game_state.get("play_time", 0),
+                "game_state": game_state
+            })
             
             return {
                 "success": True,
                 "message": "게임이 저장되었습니다.",
-                "slot_id": slot_id
+                "slot_id": slot_id,
+                "save_kind": saved["kind"]
             }
         except Exception as e:
             self.logger.error(f"게임 저장 실패: {str(e)}")
@@ -467,49 +431,29 @@ class GameService(BaseGameplayService):
     async def get_save_slots(self) -> List[Dict[str, Any]]:
         """저장 슬롯 목록 조회"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                # 모든 세션의 저장 슬롯 조회
-                sessions = await conn.fetch(
-                    """
-                    SELECT session_id, metadata
-                    FROM runtime_data.active_sessions
-                    WHERE metadata IS NOT NULL AND metadata::text != '{}'
-                    """
-                )
-                
-                all_slots = {}
-                for session in sessions:
-                    metadata = session['metadata']
-                    if isinstance(metadata, str):
-                        metadata = json.loads(metadata)
-                    
-                    save_slots = metadata.get("save_slots", {})
-                    for slot_id, slot_data in save_slots.items():
-                        all_slots[slot_id] = slot_data
-                
-                # 슬롯 1-10 생성 (빈 슬롯 포함)
-                slots = []
-                for i in range(1, 11):
-                    slot_id = str(i)
-                    if slot_id in all_slots:
-                        slot_data = all_slots[slot_id]
-                        slots.append({
-                            "slot_id": i,
-                            "session_id": slot_data.get("session_id"),
-                            "player_name": slot_data.get("player_name", "플레이어"),
-                            "location": slot_data.get("location", ""),
-                            "play_time": slot_data.get("play_time", 0),
-                            "save_date": slot_data.get("save_date", ""),
-                            "is_empty": False
-                        })
-                    else:
-                        slots.append({
-                            "slot_id": i,
-                            "is_empty": True
-                        })
-                
-                return slots
+            saved_slots = {slot["slot_id"]: slot for slot in await save_slot_store.list_slots()}
+            
+            # 슬롯 1-10 생성 (빈 슬롯 포함)
+            slots = []
+            for i in range(1, 11):
+                slot_data = saved_slots.get(i)
+                if slot_data:
+                    slots.append({
+                        "slot_id": i,
+                        "session_id": slot_data["session_id"],
+                        "player_name": slot_data["player_name"],
+                        "location": slot_data["location"],
+                        "play_time": slot_data["play_time"],
+                        "save_date": slot_data["save_date"],
+                        "is_empty": False
+                    })
+                else:
+                    slots.append({
+                        "slot_id": i,
+                        "is_empty": True
+                    })
+            
+            return slots
         except Exception as e:
             self.logger.error(f"저장 슬롯 조회 실패: {str(e)}")
             raise
@@ -517,55 +461,37 @@ class GameService(BaseGameplayService):
     async def load_game(self, slot_id: int) -> Dict[str, Any]:
         """게임 불러오기"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                # 모든 세션에서 저장 슬롯 찾기
-                sessions = await conn.fetch(
-                    """
-                    SELECT session_id, metadata
-                    FROM runtime_data.active_sessions
-                    WHERE metadata IS NOT NULL AND metadata::text != '{}'
-                    """
-                )
-                
-                save_data = None
-                for session in sessions:
-                    metadata = session['metadata']
-                    if isinstance(metadata, str):
-                        metadata = json.loads(metadata)
-                    
-                    save_slots = metadata.get("save_slots", {})
-                    if str(slot_id) in save_slots:
-                        save_data = save_slots[str(slot_id)]
-                        break
-                
-                if not save_data:
-                    raise ValueError(f"저장 슬롯 {slot_id}를 찾을 수 없습니다.")
-                
-                session_id = save_data.get("session_id")
-                if not session_id:
-                    raise ValueError("저장된 세션 ID가 없습니다.")
-                
-                # 세션이 활성 상태인지 확인
-                session_exists = await conn.fetchval(
-                    """
-                    SELECT COUNT(*) FROM runtime_data.active_sessions WHERE session_id = $1
-                    """,
-                    session_id
-                )
-                
+            # 저장 시점의 런타임 행으로 세션 복원 (정리된 세션은 다시 만듦)
+            slot = await save_slot_store.restore(slot_id)
+            if not slot:
+                raise ValueError(f"저장 슬롯 {slot_id}를 찾을 수 없습니다.")
+            
+            session_id = slot["session_id"]
+            if not slot["restored"]:
+                # 스냅샷이 없는 이전 형식 슬롯: 세션이 남아 있을 때만 불러오기
+                pool = await self.db.pool
+                async with pool.acquire() as conn:
+                    session_exists = await conn.fetchval(
+                        """
+                        SELECT COUNT(*) FROM runtime_data.active_sessions WHERE session_id = $1
+                        """,
+                        session_id
+                    )
                 if session_exists == 0:
                     raise ValueError("저장된 세션이 더 이상 존재하지 않습니다.")
-                
-                # 게임 상태 반환
-                game_state = await self.get_game_state(session_id)
-                
-                return {
-                    "success": True,
-                    "message": "게임을 불러왔습니다.",
-                    "session_id": session_id,
-                    "game_state": game_state
-                }
+            
+            # 불러온 세션은 캐시를 새로 구성
+            session_registry.on_load(session_id)
+            
+            # 게임 상태 반환
+            game_state = await self.get_game_state(session_id)
+            
+            return {
+                "success": True,
+                "message": "게임을 불러왔습니다.",
+                "session_id": session_id,
+                "game_state": game_state
+            }
         except Exception as e:
             self.logger.error(f"게임 불러오기 실패: {str(e)}")
             raise
@@ -573,42 +499,12 @@ class GameService(BaseGameplayService):
     async def delete_save(self, slot_id: int) -> Dict[str, Any]:
         """저장 슬롯 삭제"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                # 모든 세션에서 저장 슬롯 찾아서 삭제
-                sessions = await conn.fetch(
-                    """
-                    SELECT session_id, metadata
-                    FROM runtime_data.active_sessions
-                    WHERE metadata IS NOT NULL AND metadata::text != '{}'
-                    """
-                )
-                
-                for session in sessions:
-                    metadata = session['metadata']
-                    if isinstance(metadata, str):
-                        metadata = json.loads(metadata)
-                    
-                    save_slots = metadata.get("save_slots", {})
-                    if str(slot_id) in save_slots:
-                        del save_slots[str(slot_id)]
-                        metadata["save_slots"] = save_slots
-                        
-                        await conn.execute(
-                            """
-                            UPDATE runtime_data.active_sessions
-                            SET metadata = $1::jsonb, updated_at = NOW()
-                            WHERE session_id = $2
-                            """,
-                            json.dumps(metadata),
-                            session['session_id']
-                        )
-                        break
-                
-                return {
-                    "success": True,
-                    "message": f"저장 슬롯 {slot_id}가 삭제되었습니다."
-                }
+            await save_slot_store.delete(slot_id)
+            
+            return {
+                "success": True,
+                "message": f"저장 슬롯 {slot_id}가 삭제되었습니다."
+            }
         except Exception as e:
             self.logger.error(f"저장 슬롯 삭제 실패: {str(e)}")
             raise
@@ -4,8 +4,9 @@
 from typing import Dict, Any, Optional, List
 import json
 import uuid
-from app.core.game_session import GameSession
+from app.core.session_registry import session_registry
 from app.services.gameplay.base_service import BaseGameplayService
+from database.entity_state_store import entity_state_store
 from common.utils.logger import logger
 from app.handlers.action_result import ActionType
 
@@ -30,7 +31,7 @@ class InteractionService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -115,14 +116,8 @@ class InteractionService(BaseGameplayService):
                         
                         # 플레이어 본인인 경우 추가 정보
                         if is_self:
-                            # 런타임 상태에서 현재 HP/MP 정보 가져오기
-                            entity_state = await conn.fetchrow(
-                                """
-                                SELECT current_stats FROM runtime_data.entity_states
-                                WHERE runtime_entity_id = $1
-                                """,
-                                player_id
-                            )
+                            # 런타임 상태에서 현재 HP/MP 정보 가져오기 (write-behind 모드에서는 메모리 상태)
+                            entity_state = await entity_state_store.get(player_id)
                             if entity_state and entity_state.get('current_stats'):
                                 stats = json.loads(entity_state['current_stats']) if isinstance(entity_state['current_stats'], str) else entity_state['current_stats']
                                 hp = stats.get('hp', entity_properties.get('hp', 100))
@@ -180,7 +175,7 @@ class InteractionService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -330,7 +325,7 @@ class InteractionService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -443,7 +438,7 @@ class InteractionService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -498,7 +493,7 @@ class InteractionService(BaseGameplayService):
             }
         """
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -545,7 +540,7 @@ class InteractionService(BaseGameplayService):
     ) -> Dict[str, Any]:
         """아이템 사용"""
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -584,7 +579,7 @@ class InteractionService(BaseGameplayService):
     ) -> Dict[str, Any]:
         """아이템 먹기"""
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -623,7 +618,7 @@ class InteractionService(BaseGameplayService):
     ) -> Dict[str, Any]:
         """아이템 장착"""
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -662,7 +657,7 @@ class InteractionService(BaseGameplayService):
     ) -> Dict[str, Any]:
         """아이템 해제"""
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
@@ -701,7 +696,7 @@ class InteractionService(BaseGameplayService):
     ) -> Dict[str, Any]:
         """아이템 버리기"""
         try:
-            session = GameSession(session_id)
+            session = session_registry.get(session_id)
             player_entities = await session.get_player_entities()
             
             if not player_entities:
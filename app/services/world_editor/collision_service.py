@@ -8,6 +8,7 @@ import math
 from enum import Enum
 
 from database.connection import DatabaseConnection
+from app.services.world_editor.spatial_index import SpatialHit, WorldSpatialIndex, world_spatial_index
 
 
 class EntitySize(str, Enum):
@@ -98,8 +99,37 @@ def check_collision(
 class CollisionService:
     """Entity 위치 충돌 검사 서비스"""
     
-    def __init__(self):
+    def __init__(self, spatial_index: Optional[WorldSpatialIndex] = None):
         self.db = DatabaseConnection()
+        # 셀별 위치/충돌 반경 격자 (셀 전체 조회/거리 계산 대신 주변 버킷만 검사)
+        self.spatial_index = spatial_index or world_spatial_index
+    
+    @staticmethod
+    def _entity_collision(hit: SpatialHit, self_radius: float) -> Dict[str, Any]:
+        entity_id, distance, other_radius, data = hit
+        return {
+            "entity_id": entity_id,
+            "entity_name": data["entity_name"],
+            "entity_size": data["entity_size"],
+            "position": data["position"],
+            "distance": distance,
+            "collision_radius_self": self_radius,
+            "collision_radius_other": other_radius,
+            "combined_radius": self_radius + other_radius
+        }
+    
+    @staticmethod
+    def _object_collision(hit: SpatialHit) -> Dict[str, Any]:
+        data = hit[3]
+        return {
+            "object_id": data["object_id"],
+            "object_name": data["object_name"],
+            "position": data["position"],
+            "object_width": data["object_width"],
+            "object_depth": data["object_depth"],
+            "object_height": data["object_height"],
+            "passable": data["passable"]
+        }
     
     async def check_position_collision(
         self,
@@ -134,63 +164,43 @@ class CollisionService:
                 ]
             }
         """
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            # 같은 cell_id를 가진 다른 Entity들의 위치와 크기 확인
-            query = """
-                SELECT 
-                    entity_id,
-                    entity_name,
-                    entity_size,
-                    default_position_3d
-                FROM game_data.entities
-                WHERE default_position_3d IS NOT NULL
-                AND default_position_3d->>'cell_id' = $1
-            """
-            
-            params = [cell_id]
-            if exclude_entity_id:
-                query += " AND entity_id != $2"
-                params.append(exclude_entity_id)
-            
-            rows = await conn.fetch(query, *params)
-            
-            colliding_entities = []
-            self_radius = get_collision_radius(entity_size)
-            
-            for row in rows:
-                other_position = row['default_position_3d']
-                other_size = row['entity_size'] or 'medium'
-                
-                # JSONB가 문자열로 반환될 수 있으므로 파싱
-                if isinstance(other_position, str):
-                    import json
-                    other_position = json.loads(other_position)
-                
-                # 위치 정보가 없으면 스킵
-                if not other_position or not isinstance(other_position, dict) or 'x' not in other_position:
-                    continue
-                
-                # 충돌 검사
-                if check_collision(position, entity_size, other_position, other_size):
-                    other_radius = get_collision_radius(other_size)
-                    distance = calculate_distance(position, other_position)
-                    
-                    colliding_entities.append({
-                        "entity_id": row['entity_id'],
-                        "entity_name": row['entity_name'],
-                        "entity_size": other_size,
-                        "position": other_position,
-                        "distance": distance,
-                        "collision_radius_self": self_radius,
-                        "collision_radius_other": other_radius,
-                        "combined_radius": self_radius + other_radius
-                    })
-            
-            return {
+        results = await self.check_collisions(cell_id, [position], entity_size, exclude_entity_id)
+        return results[0]
+    
+    async def check_collisions(
+        self,
+        cell_id: str,
+        positions: List[Dict[str, float]],
+        entity_size: str = 'medium',
+        exclude_entity_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 위치의 Entity 충돌을 한 번에 검사 (배치 배치/드래그, NPC 이동 후보 검사용)
+        
+        Args:
+            cell_id: 셀 ID
+            positions: 확인할 위치 목록
+            entity_size: 엔티티 크기
+            exclude_entity_id: 제외할 엔티티 ID
+        
+        Returns:
+            위치 순서대로 check_position_collision과 같은 형식의 결과 목록
+        """
+        grid = await self.spatial_index.entity_grid(cell_id)
+        self_radius = get_collision_radius(entity_size)
+        hits_per_position = grid.check_collisions(
+            [(position, self_radius) for position in positions],
+            [exclude_entity_id] * len(positions)
+        )
+        
+        results = []
+        for hits in hits_per_position:
+            colliding_entities = [self._entity_collision(hit, self_radius) for hit in hits]
+            results.append({
                 "collision": len(colliding_entities) > 0,
                 "colliding_entities": colliding_entities
-            }
+            })
+        return results
     
     async def check_world_object_collision(
         self,
@@ -202,6 +212,8 @@ class CollisionService:
         """
         Cell 내 특정 위치에 World Object가 있는지 확인
         
+        통과 가능한 객체는 충돌로 간주하지 않습니다 (공간 인덱스에 포함되지 않음).
+        
         Args:
             cell_id: 셀 ID
             position: 확인할 위치 {"x": 5.0, "y": 4.0, "z": 0.0}
@@ -224,73 +236,15 @@ class CollisionService:
                 ]
             }
         """
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            # 같은 cell_id를 가진 World Objects 확인
-            query = """
-                SELECT 
-                    object_id,
-                    object_name,
-                    default_position,
-                    object_width,
-                    object_depth,
-                    object_height,
-                    passable
-                FROM game_data.world_objects
-                WHERE default_cell_id = $1
-                AND default_position IS NOT NULL
-            """
-            
-            params = [cell_id]
-            if exclude_object_id:
-                query += " AND object_id != $2"
-                params.append(exclude_object_id)
-            
-            rows = await conn.fetch(query, *params)
-            
-            colliding_objects = []
-            entity_radius = get_collision_radius(entity_size)
-            
-            for row in rows:
-                obj_position = row['default_position']
-                
-                # JSONB가 문자열로 반환될 수 있으므로 파싱
-                if isinstance(obj_position, str):
-                    import json
-                    obj_position = json.loads(obj_position)
-                
-                # 위치 정보가 없으면 스킵
-                if not obj_position or not isinstance(obj_position, dict) or 'x' not in obj_position:
-                    continue
-                
-                # 통과 가능한 객체는 충돌로 간주하지 않음
-                if row['passable']:
-                    continue
-                
-                # 객체의 크기를 고려한 충돌 검사
-                obj_width = row['object_width'] or 1.0
-                obj_depth = row['object_depth'] or 1.0
-                obj_radius = max(obj_width, obj_depth) / 2.0
-                
-                # 거리 계산
-                distance = calculate_distance(position, obj_position)
-                
-                # 충돌 검사 (Entity 반경 + Object 반경)
-                if distance < (entity_radius + obj_radius):
-                    colliding_objects.append({
-                        "object_id": row['object_id'],
-                        "object_name": row['object_name'],
-                        "position": obj_position,
-                        "object_width": obj_width,
-                        "object_depth": obj_depth,
-                        "object_height": row['object_height'] or 1.0,
-                        "passable": row['passable'] or False
-                    })
-            
-            return {
-                "collision": len(colliding_objects) > 0,
-                "colliding_objects": colliding_objects
-            }
+        grid = await self.spatial_index.object_grid(cell_id)
+        # 객체 반경 = max(너비, 깊이) / 2, 충돌 조건: 거리 < Entity 반경 + 객체 반경
+        hits = grid.collisions(position, get_collision_radius(entity_size), exclude_object_id)
+        colliding_objects = [self._object_collision(hit) for hit in hits]
+        
+        return {
+            "collision": len(colliding_objects) > 0,
+            "colliding_objects": colliding_objects
+        }
     
     async def check_all_collisions(
         self,
@@ -5,6 +5,7 @@ from typing import List, Optional, Dict, Any
 from database.connection import DatabaseConnection
 from common.utils.logger import logger
 from common.utils.jsonb_handler import serialize_jsonb_data, parse_jsonb_data
+from app.managers.dialogue_catalog import dialogue_catalog
 
 
 class DialogueKnowledgeService:
@@ -141,6 +142,7 @@ class DialogueKnowledgeService:
                     serialize_jsonb_data(related_topics or {}),
                     serialize_jsonb_data(knowledge_properties or {})
                 )
+                dialogue_catalog.invalidate()
                 
                 return knowledge_id
         except Exception as e:
@@ -205,6 +207,7 @@ class DialogueKnowledgeService:
                 """
                 
                 await conn.execute(query, *values)
+                dialogue_catalog.invalidate()
                 
                 return await self.get_knowledge(knowledge_id)
         except Exception as e:
@@ -220,6 +223,7 @@ class DialogueKnowledgeService:
                     DELETE FROM game_data.dialogue_knowledge
                     WHERE knowledge_id = $1
                 """, knowledge_id)
+                dialogue_catalog.invalidate()
                 
                 return result == "DELETE 1"
         except Exception as e:
@@ -5,6 +5,7 @@ from typing import List, Optional, Dict, Any
 from database.connection import DatabaseConnection
 from common.utils.logger import logger
 from common.utils.jsonb_handler import serialize_jsonb_data, parse_jsonb_data
+from app.managers.dialogue_catalog import dialogue_catalog
 
 
 class DialogueService:
@@ -158,6 +159,7 @@ class DialogueService:
                 entity_personality,
                 serialize_jsonb_data(constraints or {})
                 )
+                dialogue_catalog.invalidate()
                 
                 return dialogue_id
         except Exception as e:
@@ -238,6 +240,7 @@ class DialogueService:
                     SET {', '.join(update_fields)}
                     WHERE dialogue_id = ${param_index}
                 """, *values)
+                dialogue_catalog.invalidate()
                 
                 return await self.get_dialogue_context(dialogue_id)
         except Exception as e:
@@ -268,6 +271,7 @@ class DialogueService:
                 content,
                 serialize_jsonb_data(conditions or {})
                 )
+                dialogue_catalog.invalidate()
                 
                 return topic_id
         except Exception as e:
@@ -329,6 +333,7 @@ class DialogueService:
                     SET {', '.join(update_fields)}
                     WHERE topic_id = ${param_index}
                 """, *values)
+                dialogue_catalog.invalidate()
                 
                 row = await conn.fetchrow("""
                     SELECT topic_id, dialogue_id, topic_type, content, conditions,
@@ -361,6 +366,7 @@ class DialogueService:
                     DELETE FROM game_data.dialogue_topics
                     WHERE topic_id = $1
                 """, topic_id)
+                dialogue_catalog.invalidate()
                 
                 return result == "DELETE 1"
         except Exception as e:
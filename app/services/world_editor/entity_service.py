@@ -8,6 +8,7 @@ from common.utils.logger import logger
 from common.utils.jsonb_handler import serialize_jsonb_data, parse_jsonb_data
 from app.common.decorators.error_handler import handle_service_errors
 from app.services.integrity_service import IntegrityService
+from app.services.world_editor.spatial_index import world_spatial_index
 
 
 class EntityService:
@@ -17,6 +18,20 @@ class EntityService:
         self.db = db_connection or DatabaseConnection()
         self.integrity_service = IntegrityService(self.db)
     
+    @staticmethod
+    def _index_entity(entity: Optional[EntityResponse]) -> None:
+        """생성/수정된 엔티티를 셀 공간 인덱스(충돌 검사/반경 조회)에 반영"""
+        if entity is None:
+            return
+        world_spatial_index.upsert_entity(
+            entity.entity_id,
+            entity.default_position_3d,
+            entity.entity_size,
+            entity_name=entity.entity_name,
+            entity_type=entity.entity_type,
+            properties=entity.entity_properties
+        )
+    
     async def get_all_entities(self) -> List[EntityResponse]:
         """모든 엔티티 조회"""
         try:
@@ -241,7 +256,9 @@ class EntityService:
                 entity_properties_json
                 )
                 
-                return await self.get_entity(entity_data.entity_id)
+                entity = await self.get_entity(entity_data.entity_id)
+                self._index_entity(entity)
+                return entity
         except Exception as e:
             logger.error(f"엔티티 생성 실패: {e}")
             raise
@@ -329,7 +346,9 @@ class EntityService:
                     
                     await conn.execute(query, *values)
                 
-                return await self.get_entity(entity_id)
+                entity = await self.get_entity(entity_id)
+                self._index_entity(entity)
+                return entity
         except Exception as e:
             logger.error(f"엔티티 업데이트 실패: {e}")
             raise
@@ -368,5 +387,6 @@ class EntityService:
                 WHERE entity_id = $1
             """, entity_id)
             
+            world_spatial_index.remove_entity(entity_id)
             return result == "DELETE 1"
 
@@ -0,0 +1,427 @@
+"""
+월드 에디터 목록 조회/일괄 처리 서비스
+
+전체 행을 응답 모델로 만드는 get_all_*() 대신 에디터 목록 API가 사용하는 공통 경로입니다.
+- fetch_page: 기본 키 순서 키셋(커서) 페이지, fields로 SELECT 컬럼 제한
+- batch_get: 여러 ID를 한 번의 쿼리로 조회 (요청 순서 유지)
+- batch_update: 여러 행을 한 트랜잭션에서 변경 (변경 필드 조합마다 UPDATE ... FROM jsonb_to_recordset 한 번)
+
+리소스별 조회 대상은 ListSpec으로 정의합니다 (ENTITY_LIST, CELL_LIST, ...).
+"""
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from database.connection import DatabaseConnection
+from app.services.world_editor.spatial_index import world_spatial_index
+from app.services.world_editor.world_object_service import WorldObjectService
+from common.utils.jsonb_handler import parse_jsonb_data
+from common.utils.logger import logger
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+MAX_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class ListSpec:
+    """목록 조회 대상 정의"""
+    table: str                                  # 대상 테이블 (별칭 t)
+    key: str                                    # 기본 키 필드 (정렬/커서/일괄 처리 기준)
+    fields: Dict[str, str]                      # 응답 필드 -> SQL 식
+    json_fields: FrozenSet[str] = frozenset()   # JSONB 필드 (응답 시 파싱)
+    updatable: Dict[str, str] = field(default_factory=dict)  # 일괄 변경 허용 필드 -> SQL 타입
+    joins: Dict[str, str] = field(default_factory=dict)      # 필드 -> 해당 필드 선택 시에만 붙는 JOIN
+    filters: FrozenSet[str] = frozenset()       # 동등 비교 필터 허용 필드
+    after_update: Optional[Callable[[Dict[str, Any]], None]] = None  # 변경된 행 후처리 (인덱스 반영 등)
+
+
+def encode_cursor(key_value: Any) -> str:
+    """키셋 커서 인코딩 (마지막 행의 기본 키)"""
+    raw = json.dumps([key_value], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Any:
+    """키셋 커서 디코딩"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        (key_value,) = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return key_value
+    except Exception:
+        raise ValueError(f"잘못된 목록 커서입니다: {cursor}")
+
+
+def parse_fields(fields: Optional[str]) -> Optional[List[str]]:
+    """fields 쿼리 파라미터 ('a,b,c') 파싱"""
+    if not fields:
+        return None
+    return [name.strip() for name in fields.split(',') if name.strip()]
+
+
+class ListQueryService:
+    """ListSpec 기반 목록 조회/일괄 처리"""
+
+    def __init__(self, spec: ListSpec, db_connection: Optional[DatabaseConnection] = None):
+        self.spec = spec
+        self.db = db_connection or DatabaseConnection()
+
+    # ------------------------------------------------------------------
+    # SQL 구성
+    # ------------------------------------------------------------------
+
+    def _select(self, fields: Optional[Sequence[str]]) -> Tuple[List[str], str]:
+        """선택 필드 확인 후 (필드 목록, SELECT ... FROM ... 절)"""
+        spec = self.spec
+        if fields:
+            unknown = [name for name in fields if name not in spec.fields]
+            if unknown:
+                raise ValueError(f"알 수 없는 필드: {', '.join(unknown)} (허용: {', '.join(spec.fields)})")
+            # 키는 커서/일괄 처리에 필요하므로 항상 포함
+            selected = [spec.key] + [name for name in dict.fromkeys(fields) if name != spec.key]
+        else:
+            selected = list(spec.fields)
+
+        columns = ", ".join(f"{spec.fields[name]} AS {name}" for name in selected)
+        joins = " ".join(dict.fromkeys(spec.joins[name] for name in selected if name in spec.joins))
+        return selected, f"SELECT {columns} FROM game_data.{spec.table} t {joins}"
+
+    def _to_item(self, row) -> Dict[str, Any]:
+        item = dict(row)
+        for name in self.spec.json_fields.intersection(item):
+            item[name] = parse_jsonb_data(item[name])
+        return item
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    async def fetch_page(self,
+                         limit: int = DEFAULT_PAGE_SIZE,
+                         cursor: Optional[str] = None,
+                         fields: Optional[Sequence[str]] = None,
+                         filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        기본 키 순서 키셋 페이지
+
+        Returns:
+            {'items': [...], 'next_cursor': 다음 페이지 커서 또는 None}
+
+        Raises:
+            ValueError: 잘못된 커서/필드/필터
+        """
+        spec = self.spec
+        limit = max(1, min(limit, MAX_PAGE_SIZE))
+        _, select_sql = self._select(fields)
+
+        conditions, values = [], []
+        if cursor:
+            values.append(decode_cursor(cursor))
+            conditions.append(f"{spec.fields[spec.key]} > ${len(values)}")
+        for name, value in (filters or {}).items():
+            if value is None:
+                continue
+            if name not in spec.filters:
+                raise ValueError(f"필터를 지원하지 않는 필드: {name}")
+            values.append(value)
+            conditions.append(f"{spec.fields[name]} = ${len(values)}")
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        values.append(limit + 1)
+        sql = f"{select_sql} {where} ORDER BY {spec.fields[spec.key]} LIMIT ${len(values)}"
+
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                rows = await conn.fetch(sql, *values)
+        except Exception as e:
+            logger.error(f"{spec.table} 목록 페이지 조회 실패: {e}")
+            raise
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][spec.key])
+        return {'items': [self._to_item(row) for row in rows], 'next_cursor': next_cursor}
+
+    async def batch_get(self,
+                        ids: Sequence[str],
+                        fields: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        여러 ID 일괄 조회 (요청 순서 유지, 중복 ID는 한 번만)
+
+        Returns:
+            {'items': [...], 'missing': [없는 ID, ...]}
+        """
+        ids = list(dict.fromkeys(ids))
+        self._check_batch_size(len(ids))
+        if not ids:
+            # 빈 요청도 필드는 검증
+            self._select(fields)
+            return {'items': [], 'missing': []}
+
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                found = await self._fetch_by_ids(conn, ids, fields)
+        except ValueError:
+            raise
+        except Exception as e:
+            logger.error(f"{self.spec.table} 일괄 조회 실패: {e}")
+            raise
+
+        return {
+            'items': [found[key] for key in ids if key in found],
+            'missing': [key for key in ids if key not in found]
+        }
+
+    async def _fetch_by_ids(self, conn, ids: List[str],
+                            fields: Optional[Sequence[str]] = None) -> Dict[str, Dict[str, Any]]:
+        spec = self.spec
+        _, select_sql = self._select(fields)
+        rows = await conn.fetch(
+            f"{select_sql} WHERE {spec.fields[spec.key]} = ANY($1::text[])",
+            ids
+        )
+        return {str(row[spec.key]): self._to_item(row) for row in rows}
+
+    # ------------------------------------------------------------------
+    # 일괄 변경
+    # ------------------------------------------------------------------
+
+    async def batch_update(self, updates: Sequence[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        여러 행 일괄 변경 (한 트랜잭션)
+
+        각 항목은 기본 키와 변경할 필드만 담습니다 (예: {"entity_id": "...", "entity_name": "..."}).
+        같은 필드 조합의 항목은 UPDATE ... FROM jsonb_to_recordset 한 번으로 처리됩니다.
+
+        Returns:
+            {'items': [변경 후 행, ...], 'missing': [없는 ID, ...]}
+
+        Raises:
+            ValueError: 키 누락, 중복 키, 변경 불가 필드
+        """
+        spec = self.spec
+        self._check_batch_size(len(updates))
+
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        ids: List[str] = []
+        seen = set()
+        for update in updates:
+            key_value = update.get(spec.key)
+            if key_value is None:
+                raise ValueError(f"일괄 변경 항목에 {spec.key}가 없습니다.")
+            key_value = str(key_value)
+            if key_value in seen:
+                raise ValueError(f"일괄 변경 항목의 {spec.key}가 중복되었습니다: {key_value}")
+
+            names = tuple(sorted(name for name in update if name != spec.key))
+            invalid = [name for name in names if name not in spec.updatable]
+            if invalid:
+                raise ValueError(f"변경할 수 없는 필드: {', '.join(invalid)} (허용: {', '.join(spec.updatable)})")
+            ids.append(key_value)
+            seen.add(key_value)
+            if names:
+                groups.setdefault(names, []).append({**update, spec.key: key_value})
+
+        if not ids:
+            return {'items': [], 'missing': []}
+
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    for names, group in groups.items():
+                        await conn.execute(self._update_sql(names), json.dumps(group, ensure_ascii=False))
+                    found = await self._fetch_by_ids(conn, ids)
+        except Exception as e:
+            logger.error(f"{spec.table} 일괄 변경 실패: {e}")
+            raise
+
+        items = [found[key] for key in ids if key in found]
+        if spec.after_update:
+            for item in items:
+                spec.after_update(item)
+        return {'items': items, 'missing': [key for key in ids if key not in found]}
+
+    def _update_sql(self, names: Tuple[str, ...]) -> str:
+        spec = self.spec
+        assignments = ", ".join(f"{name} = r.{name}" for name in names)
+        record_columns = ", ".join(
+            [f"{spec.key} text"] + [f"{name} {spec.updatable[name]}" for name in names]
+        )
+        return (
+            f"UPDATE game_data.{spec.table} t "
+            f"SET {assignments}, updated_at = CURRENT_TIMESTAMP "
+            f"FROM jsonb_to_recordset($1::jsonb) AS r({record_columns}) "
+            f"WHERE t.{spec.key} = r.{spec.key}"
+        )
+
+    @staticmethod
+    def _check_batch_size(size: int) -> None:
+        if size > MAX_BATCH_SIZE:
+            raise ValueError(f"일괄 처리는 최대 {MAX_BATCH_SIZE}개까지 가능합니다: {size}")
+
+
+# ----------------------------------------------------------------------
+# 변경 후처리 (셀 공간 인덱스 반영)
+# ----------------------------------------------------------------------
+
+def _index_entity(item: Dict[str, Any]) -> None:
+    world_spatial_index.upsert_entity(
+        item['entity_id'],
+        item.get('default_position_3d'),
+        item.get('entity_size'),
+        entity_name=item.get('entity_name'),
+        entity_type=item.get('entity_type'),
+        properties=item.get('entity_properties')
+    )
+
+
+def _index_world_object(item: Dict[str, Any]) -> None:
+    WorldObjectService._index_object(item, item.get('default_position'))
+
+
+# ----------------------------------------------------------------------
+# 리소스별 정의
+# ----------------------------------------------------------------------
+
+def _columns(*names: str) -> Dict[str, str]:
+    return {name: f"t.{name}" for name in names}
+
+
+_OWNER_JOIN = (
+    "LEFT JOIN game_data.entities owner "
+    "ON owner.entity_id = t.{properties}->'ownership'->>'owner_entity_id'"
+)
+
+ENTITY_LIST = ListSpec(
+    table="entities",
+    key="entity_id",
+    fields=_columns(
+        "entity_id", "entity_type", "entity_name", "entity_description", "entity_status",
+        "base_stats", "default_equipment", "default_abilities", "default_inventory",
+        "entity_properties", "default_position_3d", "entity_size", "dialogue_context_id",
+        "created_at", "updated_at"
+    ),
+    json_fields=frozenset({
+        "base_stats", "default_equipment", "default_abilities", "default_inventory",
+        "entity_properties", "default_position_3d"
+    }),
+    updatable={
+        "entity_type": "entity_type_enum", "entity_name": "text", "entity_description": "text",
+        "entity_status": "text", "base_stats": "jsonb", "default_equipment": "jsonb",
+        "default_abilities": "jsonb", "default_inventory": "jsonb", "entity_properties": "jsonb",
+        "default_position_3d": "jsonb", "entity_size": "text", "dialogue_context_id": "text",
+    },
+    after_update=_index_entity,
+)
+
+CELL_LIST = ListSpec(
+    table="world_cells",
+    key="cell_id",
+    fields={
+        **_columns("cell_id", "location_id", "cell_name", "matrix_width", "matrix_height",
+                   "cell_description", "cell_properties"),
+        "cell_status": "COALESCE(t.cell_status, 'active')",
+        "cell_type": "COALESCE(t.cell_type, 'indoor')",
+        **_columns("created_at", "updated_at"),
+        "owner_name": "owner.entity_name",
+    },
+    json_fields=frozenset({"cell_properties"}),
+    updatable={
+        "location_id": "text", "cell_name": "text", "matrix_width": "integer", "matrix_height": "integer",
+        "cell_description": "text", "cell_properties": "jsonb", "cell_status": "text", "cell_type": "text",
+    },
+    joins={"owner_name": _OWNER_JOIN.format(properties="cell_properties")},
+)
+
+LOCATION_LIST = ListSpec(
+    table="world_locations",
+    key="location_id",
+    fields={
+        **_columns("location_id", "region_id", "location_name", "location_description",
+                   "location_type", "location_properties", "created_at", "updated_at"),
+        "owner_name": "owner.entity_name",
+    },
+    json_fields=frozenset({"location_properties"}),
+    updatable={
+        "region_id": "text", "location_name": "text", "location_description": "text",
+        "location_type": "text", "location_properties": "jsonb",
+    },
+    joins={"owner_name": _OWNER_JOIN.format(properties="location_properties")},
+)
+
+ROAD_LIST = ListSpec(
+    table="world_roads",
+    key="road_id",
+    fields=_columns(
+        "road_id", "from_region_id", "from_location_id", "to_region_id", "to_location_id",
+        "from_pin_id", "to_pin_id", "road_type", "distance", "travel_time", "danger_level",
+        "color", "width", "dashed", "road_properties", "path_coordinates", "created_at", "updated_at"
+    ),
+    json_fields=frozenset({"road_properties", "path_coordinates"}),
+    updatable={
+        "from_region_id": "text", "from_location_id": "text", "to_region_id": "text",
+        "to_location_id": "text", "from_pin_id": "text", "to_pin_id": "text", "road_type": "text",
+        "distance": "numeric", "travel_time": "integer", "danger_level": "integer", "color": "text",
+        "width": "integer", "dashed": "boolean", "road_properties": "jsonb", "path_coordinates": "jsonb",
+    },
+)
+
+PIN_LIST = ListSpec(
+    table="pin_positions",
+    key="pin_id",
+    fields=_columns(
+        "pin_id", "pin_name", "game_data_id", "pin_type", "x", "y",
+        "icon_type", "color", "size", "created_at", "updated_at"
+    ),
+    updatable={
+        "pin_name": "text", "game_data_id": "text", "pin_type": "text", "x": "integer", "y": "integer",
+        "icon_type": "text", "color": "text", "size": "integer",
+    },
+)
+
+WORLD_OBJECT_LIST = ListSpec(
+    table="world_objects",
+    key="object_id",
+    fields=_columns(
+        "object_id", "object_type", "object_name", "object_description", "default_cell_id",
+        "default_position", "interaction_type", "possible_states", "properties",
+        "wall_mounted", "passable", "movable",
+        "object_height", "object_width", "object_depth", "object_weight",
+        "created_at", "updated_at"
+    ),
+    json_fields=frozenset({"default_position", "possible_states", "properties"}),
+    updatable={
+        "object_type": "text", "object_name": "text", "object_description": "text",
+        "default_cell_id": "text", "default_position": "jsonb", "interaction_type": "text",
+        "possible_states": "jsonb", "properties": "jsonb", "wall_mounted": "boolean",
+        "passable": "boolean", "movable": "boolean", "object_height": "float8",
+        "object_width": "float8", "object_depth": "float8", "object_weight": "float8",
+    },
+    after_update=_index_world_object,
+)
+
+ITEM_LIST = ListSpec(
+    table="items",
+    key="item_id",
+    fields={
+        **_columns("item_id", "base_property_id", "item_type", "stack_size", "consumable",
+                   "item_properties", "created_at", "updated_at"),
+        "base_property_name": "bp.name",
+        "base_property_description": "bp.description",
+    },
+    json_fields=frozenset({"item_properties"}),
+    updatable={
+        "base_property_id": "text", "item_type": "text", "stack_size": "integer",
+        "consumable": "boolean", "item_properties": "jsonb",
+    },
+    joins={
+        "base_property_name": "LEFT JOIN game_data.base_properties bp ON bp.property_id = t.base_property_id",
+        "base_property_description": "LEFT JOIN game_data.base_properties bp ON bp.property_id = t.base_property_id",
+    },
+    filters=frozenset({"item_type"}),
+)
@@ -4,16 +4,17 @@
 Cell 내 Entity들의 위치 기반 조회 및 최적화된 쿼리 제공
 """
 from typing import Dict, Any, List, Optional, Tuple
-import math
 
 from database.connection import DatabaseConnection
+from app.services.world_editor.spatial_index import WorldSpatialIndex, world_spatial_index
 
 
 class PositionService:
     """위치 기반 쿼리 서비스"""
     
-    def __init__(self):
+    def __init__(self, spatial_index: Optional[WorldSpatialIndex] = None):
         self.db = DatabaseConnection()
+        self.spatial_index = spatial_index or world_spatial_index
     
     async def get_entities_by_cell(
         self,
@@ -121,44 +122,15 @@ class PositionService:
         Returns:
             반경 내 Entity 목록 (거리 정보 포함)
         """
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            # 먼저 대략적인 영역 내 Entity 조회 (성능 최적화)
-            area_filter = {
-                'x_min': center_position.get('x', 0) - radius,
-                'x_max': center_position.get('x', 0) + radius,
-                'y_min': center_position.get('y', 0) - radius,
-                'y_max': center_position.get('y', 0) + radius,
-                'z_min': center_position.get('z', 0) - radius,
-                'z_max': center_position.get('z', 0) + radius
-            }
-            
-            entities = await self.get_entities_by_cell(
-                cell_id,
-                sort_by_position=False,
-                area_filter=area_filter
-            )
-            
-            # 정확한 거리 계산 및 필터링
-            result = []
-            for entity in entities:
-                if not entity['position'] or 'x' not in entity['position']:
-                    continue
-                
-                # 거리 계산
-                dx = entity['position'].get('x', 0) - center_position.get('x', 0)
-                dy = entity['position'].get('y', 0) - center_position.get('y', 0)
-                dz = entity['position'].get('z', 0) - center_position.get('z', 0)
-                distance = math.sqrt(dx*dx + dy*dy + dz*dz)
-                
-                if distance <= radius:
-                    entity['distance'] = distance
-                    result.append(entity)
-            
-            # 거리순 정렬
-            result.sort(key=lambda x: x.get('distance', 0))
-            
-            return result
+        # 셀 공간 인덱스의 주변 버킷 후보만 거리 계산 (거리순 정렬)
+        grid = await self.spatial_index.entity_grid(cell_id)
+        result = []
+        for _, distance, _, data in grid.query_radius(center_position, radius):
+            entity = dict(data)
+            entity['distance'] = distance
+            result.append(entity)
+        
+        return result
     
     async def get_world_objects_by_cell(
         self,
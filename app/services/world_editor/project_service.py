@@ -1,7 +1,19 @@
 """
 프로젝트 관리 서비스
+
+- export_project / import_project: 서비스 응답 모델 형태의 JSON 한 덩어리 (기존 형식)
+- stream_export / bulk_import: 테이블 행 단위 NDJSON
+  - 내보내기: REPEATABLE READ 스냅샷에서 테이블별 서버 측 커서로 row_to_json 행을 흘려보냄 (메모리 일정)
+  - 가져오기: 테이블별 임시 스테이징 테이블에 COPY 후 INSERT ... ON CONFLICT로 병합 (한 트랜잭션)
+    행마다 제공한 컬럼만 병합하며, 커밋 후 대화 카탈로그/셀 공간 인덱스를 무효화
+
+NDJSON 형식 (한 줄에 JSON 하나):
+    {"format": "ndjson", "version": "1.0.0", "tables": ["regions", ...]}
+    {"table": "regions", "row": {"region_id": "REG_...", "region_name": "...", ...}}
 """
-from typing import Dict, Any, List
+import json
+import time
+from typing import Dict, Any, List, AsyncIterable, AsyncIterator, Optional, Tuple, Union
 from database.connection import DatabaseConnection
 from app.services.world_editor.region_service import RegionService
 from app.services.world_editor.location_service import LocationService
@@ -13,6 +25,8 @@ from app.services.world_editor.item_service import ItemService
 from app.services.world_editor.pin_service import PinService
 from app.services.world_editor.road_service import RoadService
 from app.services.world_editor.map_service import MapService
+from app.services.world_editor.spatial_index import world_spatial_index
+from app.managers.dialogue_catalog import dialogue_catalog
 from app.api.schemas import (
     RegionCreate, LocationCreate, CellCreate, EntityCreate,
     WorldObjectCreate, EffectCarrierCreate, ItemCreate,
@@ -21,6 +35,127 @@ from app.api.schemas import (
 from common.utils.logger import logger
 
 
+NDJSON_FORMAT_VERSION = '1.0.0'
+
+# NDJSON 섹션 -> (테이블, 기본 키) (외래 키 순서: 가져오기 병합도 이 순서로 실행)
+PROJECT_TABLES: Dict[str, Tuple[str, str]] = {
+    'regions': ('world_regions', 'region_id'),
+    'locations': ('world_locations', 'location_id'),
+    'cells': ('world_cells', 'cell_id'),
+    'dialogue_contexts': ('dialogue_contexts', 'dialogue_id'),
+    'entities': ('entities', 'entity_id'),
+    'world_objects': ('world_objects', 'object_id'),
+    'base_properties': ('base_properties', 'property_id'),
+    'items': ('items', 'item_id'),
+    'effect_carriers': ('effect_carriers', 'effect_id'),
+    'pins': ('pin_positions', 'pin_id'),
+    'roads': ('world_roads', 'road_id'),
+    'map_metadata': ('map_metadata', 'map_id'),
+}
+
+# 스테이징 COPY 배치 크기 (행)
+IMPORT_BATCH_SIZE = 5000
+# 내보내기 커서 prefetch (행)
+EXPORT_PREFETCH = 2000
+
+
+def _to_stage_text(value: Any) -> Optional[str]:
+    """스테이징(text 컬럼) 값 변환: JSON/배열은 JSON 문자열, 나머지는 PostgreSQL 입력 문자열"""
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    return str(value)
+
+
+async def iter_ndjson_lines(chunks: AsyncIterable[Union[bytes, str]]) -> AsyncIterator[str]:
+    """
+    바이트/문자열 청크 스트림을 줄 단위로 나눔 (마지막 줄바꿈 없는 줄 포함)
+    
+    UTF-8 문자가 청크 경계에서 잘릴 수 있으므로 줄 단위로 디코딩합니다.
+    """
+    buffer = b''
+    async for chunk in chunks:
+        buffer += chunk.encode('utf-8') if isinstance(chunk, str) else chunk
+        *lines, buffer = buffer.split(b'\n')
+        for line in lines:
+            yield line.decode('utf-8')
+    if buffer:
+        yield buffer.decode('utf-8')
+
+
+class _StagedTable:
+    """가져오기 중인 테이블 하나의 스테이징 상태"""
+    
+    def __init__(self, section: str, target_types: Dict[str, Tuple[str, str]]):
+        table, key = PROJECT_TABLES[section]
+        self.section = section
+        self.table = table
+        self.key = key
+        self.stage = f"_import_{table}"
+        # 대상 테이블의 모든 컬럼을 스테이징 (행마다 있는 키가 다를 수 있음)
+        self.columns = list(target_types)
+        self.target_types = target_types
+        # 행 형태 (행이 제공한 대상 컬럼 조합) -> 형태 번호
+        self.shapes: Dict[Tuple[str, ...], int] = {}
+        self.pending: List[Tuple[Any, ...]] = []
+        self.rows = 0
+        self.elapsed = 0.0
+    
+    def create_sql(self) -> str:
+        columns = ", ".join(f'"{column}" text' for column in self.columns)
+        return f'CREATE TEMP TABLE "{self.stage}" (_line bigint, _shape int, {columns}) ON COMMIT DROP'
+    
+    def add(self, line_no: int, row: Dict[str, Any]) -> None:
+        """
+        행 스테이징 (대상 테이블에 없는 키는 무시)
+        
+        Raises:
+            ValueError: 기본 키가 없는 행
+        """
+        shape = tuple(column for column in self.columns if column in row)
+        if self.key not in shape:
+            raise ValueError(f"{line_no}번째 줄: {self.section} 행에 기본 키 {self.key}가 없습니다.")
+        shape_id = self.shapes.setdefault(shape, len(self.shapes))
+        self.pending.append((line_no, shape_id, *(_to_stage_text(row.get(column)) for column in self.columns)))
+    
+    def _select(self, column: str) -> str:
+        column_type, category = self.target_types[column]
+        if category == 'A':
+            # 배열은 JSON 배열로 내보내지므로 원소를 풀어 다시 배열로
+            return (
+                f'CASE WHEN s."{column}" IS NULL THEN NULL '
+                f'ELSE ARRAY(SELECT jsonb_array_elements_text(s."{column}"::jsonb))::{column_type} END'
+            )
+        return f's."{column}"::{column_type}'
+    
+    def merge_sql(self) -> List[str]:
+        """
+        행 형태별 병합 SQL
+        
+        같은 키가 여러 번 나오면 마지막 줄만 병합하고, 각 행은 자신이 제공한 컬럼만
+        INSERT/UPDATE합니다. (없는 컬럼은 새 행이면 대상 기본값, 기존 행이면 기존 값 유지)
+        """
+        latest = (
+            f'(SELECT DISTINCT ON ("{self.key}") * FROM "{self.stage}" '
+            f'ORDER BY "{self.key}", _line DESC) s'
+        )
+        statements = []
+        for shape, shape_id in self.shapes.items():
+            columns = ", ".join(f'"{column}"' for column in shape)
+            updates = ", ".join(f'"{column}" = EXCLUDED."{column}"' for column in shape if column != self.key)
+            statements.append(
+                f'INSERT INTO game_data.{self.table} ({columns}) '
+                f'SELECT {", ".join(self._select(column) for column in shape)} '
+                f'FROM {latest} WHERE s._shape = {shape_id} '
+                f'ON CONFLICT ("{self.key}") DO '
+                + (f'UPDATE SET {updates}' if updates else 'NOTHING')
+            )
+        return statements
+
+
 class ProjectService:
     """프로젝트 저장/로드 서비스"""
     
@@ -53,21 +188,15 @@ class ProjectService:
             if not map_metadata:
                 map_metadata = None
             
-            # 엔티티는 셀별로 가져오기
-            entities = []
-            for cell in cells:
-                try:
-                    cell_id = cell.cell_id if hasattr(cell, 'cell_id') else cell['cell_id']
-                    cell_entities = await self.entity_service.get_entities_by_cell(cell_id)
-                    for e in cell_entities:
-                        if hasattr(e, 'dict'):
-                            entities.append(e.dict())
-                        elif hasattr(e, 'model_dump'):
-                            entities.append(e.model_dump())
-                        else:
-                            entities.append(e)
-                except Exception as e:
-                    logger.warning(f"셀 {cell_id if 'cell_id' in locals() else 'unknown'}의 엔티티 조회 실패: {e}")
+            # 엔티티는 셀별로 묶기 (셀마다 조회하지 않고 한 번에 조회, 셀 순서 -> 이름 순서 유지)
+            entities_by_cell: Dict[str, List[Dict[str, Any]]] = {
+                (cell.cell_id if hasattr(cell, 'cell_id') else cell['cell_id']): [] for cell in cells
+            }
+            for e in await self.entity_service.get_all_entities():
+                cell_entities = entities_by_cell.get((e.entity_properties or {}).get('cell_id'))
+                if cell_entities is not None and e.entity_type == 'npc':
+                    cell_entities.append(e.model_dump() if hasattr(e, 'model_dump') else e.dict())
+            entities = [e for cell_entities in entities_by_cell.values() for e in cell_entities]
             
             # Pydantic 모델을 dict로 변환하는 헬퍼 함수
             def to_dict(obj):
@@ -243,4 +372,146 @@ class ProjectService:
         except Exception as e:
             logger.error(f"프로젝트 가져오기 실패: {e}")
             raise
-
+    
+    async def stream_export(self) -> AsyncIterator[str]:
+        """
+        전체 프로젝트를 NDJSON으로 스트리밍 내보내기
+        
+        한 REPEATABLE READ 읽기 전용 트랜잭션(일관된 스냅샷)에서 테이블마다
+        서버 측 커서로 EXPORT_PREFETCH행씩 가져오므로 메모리 사용량이 테이블 크기와 무관합니다.
+        행 직렬화는 PostgreSQL(row_to_json)이 담당합니다.
+        """
+        yield json.dumps({
+            'format': 'ndjson',
+            'version': NDJSON_FORMAT_VERSION,
+            'tables': list(PROJECT_TABLES)
+        }) + '\n'
+        
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            async with conn.transaction(isolation='repeatable_read', readonly=True):
+                for section, (table, key) in PROJECT_TABLES.items():
+                    prefix = f'{{"table":"{section}","row":'
+                    rows = 0
+                    async for record in conn.cursor(
+                        f'SELECT row_to_json(t)::text AS row FROM game_data.{table} t ORDER BY t.{key}',
+                        prefetch=EXPORT_PREFETCH
+                    ):
+                        yield prefix + record['row'] + '}\n'
+                        rows += 1
+                    logger.debug(f"프로젝트 내보내기: {section} {rows}행")
+    
+    async def bulk_import(self,
+                          lines: AsyncIterable[str],
+                          batch_size: int = IMPORT_BATCH_SIZE) -> Dict[str, Dict[str, Any]]:
+        """
+        NDJSON 프로젝트 가져오기 (스테이징 COPY + INSERT ... ON CONFLICT 병합, 한 트랜잭션)
+        
+        행은 batch_size 단위로 임시 스테이징 테이블에 COPY되고, 입력이 끝나면
+        PROJECT_TABLES 순서(외래 키 순서)로 대상 테이블에 병합됩니다.
+        하나라도 실패하면 전체가 롤백됩니다.
+        
+        Returns:
+            {'stats': {섹션: 행 수}, 'timings_ms': {섹션: 스테이징+병합 시간}}
+        
+        Raises:
+            ValueError: 잘못된 JSON 줄 또는 알 수 없는 섹션
+        """
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                target_types = await self._load_target_types(conn)
+                staged: Dict[str, _StagedTable] = {}
+                
+                line_no = 0
+                async for line in lines:
+                    line_no += 1
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"{line_no}번째 줄: 유효하지 않은 JSON: {e}")
+                    if not isinstance(entry, dict) or 'table' not in entry:
+                        continue  # 헤더 등
+                    
+                    section = entry['table']
+                    if section not in PROJECT_TABLES:
+                        raise ValueError(f"{line_no}번째 줄: 알 수 없는 섹션: {section}")
+                    row = entry.get('row') or {}
+                    
+                    table = staged.get(section)
+                    if table is None:
+                        table = _StagedTable(section, target_types[PROJECT_TABLES[section][0]])
+                        await conn.execute(table.create_sql())
+                        staged[section] = table
+                    
+                    table.add(line_no, row)
+                    if len(table.pending) >= batch_size:
+                        await self._copy_to_stage(conn, table)
+                
+                stats: Dict[str, int] = {}
+                timings_ms: Dict[str, float] = {}
+                for section in PROJECT_TABLES:
+                    table = staged.get(section)
+                    if table is None:
+                        continue
+                    await self._copy_to_stage(conn, table)
+                    
+                    started = time.perf_counter()
+                    for statement in table.merge_sql():
+                        await conn.execute(statement)
+                    table.elapsed += time.perf_counter() - started
+                    
+                    stats[section] = table.rows
+                    timings_ms[section] = round(table.elapsed * 1000, 2)
+                    logger.info(f"프로젝트 가져오기: {section} {table.rows}행 ({timings_ms[section]}ms)")
+        
+        # 커밋 후 가져온 데이터를 읽는 메모리 인덱스 무효화 (대화 카탈로그, 셀 공간 인덱스)
+        if stats:
+            dialogue_catalog.invalidate()
+            world_spatial_index.invalidate()
+        
+        return {'stats': stats, 'timings_ms': timings_ms}
+    
+    @staticmethod
+    async def _load_target_types(conn) -> Dict[str, Dict[str, Tuple[str, str]]]:
+        """
+        대상 테이블별 {컬럼: (타입, 타입 분류)}
+        
+        타입은 typmod 없이 조회합니다. varchar(n)으로 명시 캐스트하면 길이 초과 값이
+        잘려 들어가므로, 길이 검사는 대상 컬럼에 대입할 때 하도록 둡니다.
+        """
+        rows = await conn.fetch(
+            """
+            SELECT c.relname AS table_name, a.attname AS column_name,
+                   format_type(a.atttypid, NULL) AS column_type,
+                   t.typcategory::text AS category
+            FROM pg_attribute a
+            JOIN pg_class c ON c.oid = a.attrelid
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_type t ON t.oid = a.atttypid
+            WHERE n.nspname = 'game_data'
+              AND c.relname = ANY($1::text[])
+              AND a.attnum > 0 AND NOT a.attisdropped
+            """,
+            [table for table, _ in PROJECT_TABLES.values()]
+        )
+        target_types: Dict[str, Dict[str, Tuple[str, str]]] = {table: {} for table, _ in PROJECT_TABLES.values()}
+        for row in rows:
+            target_types[row['table_name']][row['column_name']] = (row['column_type'], row['category'])
+        return target_types
+    
+    @staticmethod
+    async def _copy_to_stage(conn, table: _StagedTable) -> None:
+        if not table.pending:
+            return
+        started = time.perf_counter()
+        await conn.copy_records_to_table(
+            table.stage,
+            records=table.pending,
+            columns=['_line', '_shape', *table.columns]
+        )
+        table.rows += len(table.pending)
+        table.pending = []
+        table.elapsed += time.perf_counter() - started
@@ -1,163 +1,224 @@
 """
 통합 검색 서비스
+
+타입별 테이블을 UNION ALL 한 번의 쿼리로 검색하고 점수순으로 정렬합니다.
+- 후보: 이름/설명 부분 일치(ILIKE) + 이름 유사 단어(pg_trgm <%, 오타 허용)
+- 점수: 이름 완전 일치 > 접두 일치 > 부분 일치 + word_similarity + 설명 일치 가산점
+- 페이지: (점수, 타입, ID) 키셋 커서 (OFFSET 없이 다음 페이지 조회)
+
+트라이그램 인덱스는 database/migrations/add_search_trgm_indexes.sql 참고
 """
-from typing import List, Dict, Any
+import base64
+import json
+from typing import List, Dict, Any, Optional, Tuple
 from database.connection import DatabaseConnection
 from app.api.schemas import SearchResultItem, SearchResponse
 from common.utils.logger import logger
-from common.utils.jsonb_handler import parse_jsonb_data
+
+
+# 타입별 검색 대상 (검색 타입 필터 순서 = 기존 검색 결과 순서)
+_SEARCH_SOURCES: Dict[str, Dict[str, str]] = {
+    'region': {
+        'source': "game_data.world_regions",
+        'id': "region_id",
+        'name': "region_name",
+        'description': "region_description",
+        'extra': "NULL::text",
+    },
+    'location': {
+        'source': "game_data.world_locations",
+        'id': "location_id",
+        'name': "location_name",
+        'description': "location_description",
+        'extra': "NULL::text",
+    },
+    'cell': {
+        'source': "game_data.world_cells",
+        'id': "cell_id",
+        'name': "cell_name",
+        'description': "cell_description",
+        'extra': "NULL::text",
+    },
+    'entity': {
+        'source': "game_data.entities",
+        'id': "entity_id",
+        'name': "entity_name",
+        'description': "entity_description",
+        'extra': "NULL::text",
+    },
+    'world_object': {
+        'source': "game_data.world_objects",
+        'id': "object_id",
+        'name': "object_name",
+        'description': "object_description",
+        'extra': "NULL::text",
+    },
+    'effect_carrier': {
+        'source': "game_data.effect_carriers",
+        'id': "effect_id::text",
+        'name': "name",
+        'description': "NULL::text",
+        'extra': "carrier_type::text",
+    },
+    'item': {
+        'source': "game_data.items i JOIN game_data.base_properties bp ON i.base_property_id = bp.property_id",
+        'id': "i.item_id",
+        'name': "bp.name",
+        'description': "bp.description",
+        'extra': "i.item_type",
+    },
+}
+
+# 결과 metadata에 추가 컬럼을 싣는 타입
+_EXTRA_METADATA_KEYS = {
+    'effect_carrier': 'carrier_type',
+    'item': 'item_type',
+}
+
+# 파라미터: $1 부분 일치 패턴, $2 접두 패턴, $3 검색어, $4 LIMIT, $5~$7 커서 (점수, 타입, ID)
+_BRANCH_SQL = """
+    (SELECT * FROM (
+        SELECT '{entity_type}'::text AS entity_type,
+               {id} AS entity_id,
+               {name} AS name,
+               {description} AS description,
+               {extra} AS extra,
+               (CASE WHEN lower({name}) = lower($3) THEN 3.0
+                     WHEN {name} ILIKE $2 THEN 2.0
+                     WHEN {name} ILIKE $1 THEN 1.0
+                     ELSE 0.0 END
+                + COALESCE(word_similarity($3, {name}), 0)
+                + CASE WHEN {description} ILIKE $1 THEN 0.25 ELSE 0.0 END)::float8 AS score
+        FROM {source}
+        WHERE {name} ILIKE $1 OR {description} ILIKE $1 OR $3 <% {name}
+    ) matched
+    WHERE $5::float8 IS NULL
+       OR matched.score < $5
+       OR (matched.score = $5 AND (matched.entity_type, matched.entity_id) > ($6::text, $7::text))
+    ORDER BY matched.score DESC, matched.entity_type, matched.entity_id
+    LIMIT $4)
+"""
+
+DEFAULT_SEARCH_LIMIT = 50
+
+
+def _escape_like(text: str) -> str:
+    """ILIKE 패턴 특수문자 이스케이프"""
+    return text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+
+
+def encode_cursor(score: float, entity_type: str, entity_id: str) -> str:
+    """키셋 커서 인코딩 (URL에 그대로 쓸 수 있는 문자열)"""
+    raw = json.dumps([score, entity_type, entity_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[float, str, str]:
+    """키셋 커서 디코딩"""
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        score, entity_type, entity_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return float(score), str(entity_type), str(entity_id)
+    except Exception:
+        raise ValueError(f"잘못된 검색 커서입니다: {cursor}")
 
 
 class SearchService:
     """통합 검색 서비스"""
-    
+
     def __init__(self, db_connection=None):
         self.db = db_connection or DatabaseConnection()
-    
-    async def search(self, query: str, entity_types: List[str] = None) -> SearchResponse:
-        """모든 엔티티 타입에서 검색"""
+        # 타입 조합별 SQL (같은 문자열을 재사용해 asyncpg prepared statement 캐시 적중)
+        self._sql_cache: Dict[Tuple[str, ...], str] = {}
+
+    def _build_sql(self, entity_types: Tuple[str, ...]) -> str:
+        sql = self._sql_cache.get(entity_types)
+        if sql is None:
+            branches = [
+                _BRANCH_SQL.format(entity_type=entity_type, **_SEARCH_SOURCES[entity_type])
+                for entity_type in entity_types
+            ]
+            # 브랜치가 하나여도 ORDER BY가 겹치지 않도록 UNION을 서브쿼리로 감쌈
+            sql = "SELECT * FROM (\n" + "\n    UNION ALL\n".join(branches) + """
+) u
+ORDER BY score DESC, entity_type, entity_id
+LIMIT $4
+"""
+            self._sql_cache[entity_types] = sql
+        return sql
+
+    async def search(self,
+                     query: str,
+                     entity_types: List[str] = None,
+                     limit: int = DEFAULT_SEARCH_LIMIT,
+                     cursor: Optional[str] = None) -> SearchResponse:
+        """
+        모든 엔티티 타입에서 검색 (점수순, 커서 페이지)
+
+        Args:
+            query: 검색어
+            entity_types: 타입 필터 (없으면 전체)
+            limit: 페이지 크기
+            cursor: 이전 응답의 next_cursor
+
+        Raises:
+            ValueError: 잘못된 커서
+        """
+        types = tuple(
+            entity_type for entity_type in _SEARCH_SOURCES
+            if not entity_types or entity_type in entity_types
+        )
+        cursor_score, cursor_type, cursor_id = decode_cursor(cursor) if cursor else (None, None, None)
+
+        if not types:
+            return SearchResponse(query=query, results=[], total=0, entity_type_counts={})
+
+        escaped = _escape_like(query)
         try:
             pool = await self.db.pool
             async with pool.acquire() as conn:
-                results: List[SearchResultItem] = []
-                entity_type_counts: Dict[str, int] = {}
-                
-                search_pattern = f"%{query}%"
-                
-                # Regions 검색
-                if not entity_types or 'region' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT region_id, region_name, region_description
-                        FROM game_data.world_regions
-                        WHERE region_name ILIKE $1 OR region_description ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='region',
-                            entity_id=row['region_id'],
-                            name=row['region_name'],
-                            description=row['region_description'],
-                            metadata={'type': 'region'}
-                        ))
-                    entity_type_counts['region'] = len(rows)
-                
-                # Locations 검색
-                if not entity_types or 'location' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT location_id, location_name, location_description
-                        FROM game_data.world_locations
-                        WHERE location_name ILIKE $1 OR location_description ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='location',
-                            entity_id=row['location_id'],
-                            name=row['location_name'],
-                            description=row['location_description'],
-                            metadata={'type': 'location'}
-                        ))
-                    entity_type_counts['location'] = len(rows)
-                
-                # Cells 검색
-                if not entity_types or 'cell' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT cell_id, cell_name, cell_description
-                        FROM game_data.world_cells
-                        WHERE cell_name ILIKE $1 OR cell_description ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='cell',
-                            entity_id=row['cell_id'],
-                            name=row['cell_name'] or row['cell_id'],
-                            description=row['cell_description'],
-                            metadata={'type': 'cell'}
-                        ))
-                    entity_type_counts['cell'] = len(rows)
-                
-                # Entities 검색
-                if not entity_types or 'entity' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT entity_id, entity_name, entity_description
-                        FROM game_data.entities
-                        WHERE entity_name ILIKE $1 OR entity_description ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='entity',
-                            entity_id=row['entity_id'],
-                            name=row['entity_name'],
-                            description=row['entity_description'],
-                            metadata={'type': 'entity'}
-                        ))
-                    entity_type_counts['entity'] = len(rows)
-                
-                # World Objects 검색
-                if not entity_types or 'world_object' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT object_id, object_name, object_description
-                        FROM game_data.world_objects
-                        WHERE object_name ILIKE $1 OR object_description ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='world_object',
-                            entity_id=row['object_id'],
-                            name=row['object_name'],
-                            description=row['object_description'],
-                            metadata={'type': 'world_object'}
-                        ))
-                    entity_type_counts['world_object'] = len(rows)
-                
-                # Effect Carriers 검색
-                if not entity_types or 'effect_carrier' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT effect_id, name, carrier_type
-                        FROM game_data.effect_carriers
-                        WHERE name ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='effect_carrier',
-                            entity_id=str(row['effect_id']),
-                            name=row['name'],
-                            description=None,
-                            metadata={'type': 'effect_carrier', 'carrier_type': row['carrier_type']}
-                        ))
-                    entity_type_counts['effect_carrier'] = len(rows)
-                
-                # Items 검색
-                if not entity_types or 'item' in entity_types:
-                    rows = await conn.fetch("""
-                        SELECT i.item_id, bp.name, bp.description, i.item_type
-                        FROM game_data.items i
-                        LEFT JOIN game_data.base_properties bp ON i.base_property_id = bp.property_id
-                        WHERE bp.name ILIKE $1 OR bp.description ILIKE $1
-                        LIMIT 100
-                    """, search_pattern)
-                    for row in rows:
-                        results.append(SearchResultItem(
-                            entity_type='item',
-                            entity_id=row['item_id'],
-                            name=row['name'] or row['item_id'],
-                            description=row['description'],
-                            metadata={'type': 'item', 'item_type': row['item_type']}
-                        ))
-                    entity_type_counts['item'] = len(rows)
-                
-                return SearchResponse(
-                    query=query,
-                    results=results,
-                    total=len(results),
-                    entity_type_counts=entity_type_counts
+                # 다음 페이지 여부 확인을 위해 limit + 1개 조회
+                rows = await conn.fetch(
+                    self._build_sql(types),
+                    f"%{escaped}%",
+                    f"{escaped}%",
+                    query,
+                    limit + 1,
+                    cursor_score,
+                    cursor_type,
+                    cursor_id
                 )
         except Exception as e:
             logger.error(f"검색 실패: {e}")
             raise
 
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last['score'], last['entity_type'], last['entity_id'])
+
+        results: List[SearchResultItem] = []
+        entity_type_counts: Dict[str, int] = {}
+        for row in rows:
+            entity_type = row['entity_type']
+            metadata: Dict[str, Any] = {'type': entity_type, 'score': row['score']}
+            extra_key = _EXTRA_METADATA_KEYS.get(entity_type)
+            if extra_key:
+                metadata[extra_key] = row['extra']
+            results.append(SearchResultItem(
+                entity_type=entity_type,
+                entity_id=row['entity_id'],
+                name=row['name'] or row['entity_id'],
+                description=row['description'],
+                metadata=metadata
+            ))
+            entity_type_counts[entity_type] = entity_type_counts.get(entity_type, 0) + 1
+
+        return SearchResponse(
+            query=query,
+            results=results,
+            total=len(results),
+            entity_type_counts=entity_type_counts,
+            next_cursor=next_cursor
+        )
@@ -0,0 +1,445 @@
+"""
+셀 공간 인덱스 (균일 격자)
+
+충돌 검사/반경 조회마다 셀의 모든 Entity/World Object를 조회해 거리를 계산하지 않도록
+셀별 위치와 충돌 반경을 x/y 평면 격자 버킷으로 메모리에 유지합니다.
+
+- 셀 격자는 처음 조회할 때 한 번 로드 (Entity: default_position_3d->>'cell_id',
+  World Object: default_cell_id, 통과 불가 객체만)
+- 조회는 질의 위치 주변 버킷의 후보만 검사하며, 거리는 3D로 계산
+- 일괄 조회(check_collisions)는 같은 버킷의 질의를 모아 NumPy로 거리 행렬을 한 번에 계산
+  (NumPy가 없으면 순수 Python으로 계산)
+- EntityService/WorldObjectService 쓰기 경로에서 upsert/remove로 즉시 갱신
+- 셀 격자는 TTLCache(CACHE_CONFIG["spatial_index_cell"])에 보관되므로
+  갱신 경로를 거치지 않은 변경(팩토리/마이그레이션 등)도 TTL 이내에 반영
+
+사용 예:
+    from app.services.world_editor.spatial_index import world_spatial_index
+
+    grid = await world_spatial_index.entity_grid(cell_id)
+    hits = grid.query_radius({"x": 5.0, "y": 4.0}, 3.0)
+    world_spatial_index.upsert_entity(entity_id, position_3d, "medium", entity_name)
+"""
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.config.app_config import CACHE_CONFIG
+from database.connection import DatabaseConnection
+from common.utils.jsonb_handler import parse_jsonb_data
+from common.utils.ttl_cache import TTLCache
+
+try:
+    import numpy as np
+except ImportError:  # 선택 의존성
+    np = None
+
+# 격자 버킷 한 변의 길이 (미터, 가장 큰 충돌 반경 2.0m의 두 배)
+DEFAULT_BUCKET_SIZE = 4.0
+
+# 한 번에 계산할 거리 행렬 최대 원소 수 (질의 수 x 후보 수)
+_MAX_MATRIX_SIZE = 1_000_000
+
+# (item_id, 거리, 항목 충돌 반경, 항목 데이터)
+SpatialHit = Tuple[str, float, float, Any]
+
+
+def _coords(position: Dict[str, Any]) -> Tuple[float, float, float]:
+    return (
+        float(position.get('x', 0.0) or 0.0),
+        float(position.get('y', 0.0) or 0.0),
+        float(position.get('z', 0.0) or 0.0),
+    )
+
+
+class SpatialGrid:
+    """셀 하나의 균일 격자 공간 인덱스"""
+
+    def __init__(self, bucket_size: float = DEFAULT_BUCKET_SIZE):
+        """
+        Args:
+            bucket_size: 격자 버킷 한 변의 길이 (미터)
+        """
+        self.bucket_size = bucket_size
+        self.max_radius = 0.0
+        self._items: Dict[str, Tuple[float, float, float, float, Any]] = {}
+        self._bucket_of: Dict[str, Tuple[int, int]] = {}
+        self._buckets: Dict[Tuple[int, int], Dict[str, None]] = {}
+        # 버킷별 (ID 목록, [x, y, z, radius] 배열) - 버킷 변경 시 무효화
+        self._packed: Dict[Tuple[int, int], Tuple[List[str], Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: str) -> bool:
+        return item_id in self._items
+
+    def _bucket_key(self, x: float, y: float) -> Tuple[int, int]:
+        return (math.floor(x / self.bucket_size), math.floor(y / self.bucket_size))
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def upsert(self, item_id: str, position: Dict[str, Any], radius: float, data: Any = None) -> None:
+        """항목 추가 또는 위치/반경 갱신"""
+        self.remove(item_id)
+        x, y, z = _coords(position)
+        key = self._bucket_key(x, y)
+        self._items[item_id] = (x, y, z, radius, data)
+        self._bucket_of[item_id] = key
+        self._buckets.setdefault(key, {})[item_id] = None
+        self._packed.pop(key, None)
+        # 제거 시 줄이지 않음 (후보 탐색 범위가 넓어질 뿐 결과는 정확함)
+        self.max_radius = max(self.max_radius, radius)
+
+    def remove(self, item_id: str) -> bool:
+        """항목 제거"""
+        if self._items.pop(item_id, None) is None:
+            return False
+        key = self._bucket_of.pop(item_id)
+        bucket = self._buckets[key]
+        del bucket[item_id]
+        if not bucket:
+            del self._buckets[key]
+        self._packed.pop(key, None)
+        return True
+
+    def get(self, item_id: str) -> Optional[Any]:
+        """항목 데이터 조회"""
+        item = self._items.get(item_id)
+        return item[4] if item is not None else None
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def query_radius(self, center: Dict[str, Any], radius: float) -> List[SpatialHit]:
+        """중심에서 radius 이내(경계 포함) 항목을 거리순으로 조회"""
+        hits = self._query([_coords(center)], [radius], include_item_radius=False)[0]
+        hits.sort(key=lambda hit: hit[1])
+        return hits
+
+    def collisions(self,
+                   position: Dict[str, Any],
+                   radius: float,
+                   exclude_id: Optional[str] = None) -> List[SpatialHit]:
+        """position에 반경 radius로 놓았을 때 겹치는 항목 (거리 < 두 반경의 합)"""
+        return self.check_collisions([(position, radius)], [exclude_id])[0]
+
+    def check_collisions(self,
+                         queries: Sequence[Tuple[Dict[str, Any], float]],
+                         exclude_ids: Optional[Sequence[Optional[str]]] = None) -> List[List[SpatialHit]]:
+        """
+        여러 위치의 충돌을 한 번에 검사
+
+        Args:
+            queries: (위치, 충돌 반경) 목록
+            exclude_ids: 질의별 제외할 항목 ID (예: 이동 중인 자기 자신)
+
+        Returns:
+            질의 순서대로 충돌 항목 목록
+        """
+        results = self._query([_coords(position) for position, _ in queries],
+                              [radius for _, radius in queries],
+                              include_item_radius=True)
+        if exclude_ids:
+            for hits, exclude_id in zip(results, exclude_ids):
+                if exclude_id is not None:
+                    hits[:] = [hit for hit in hits if hit[0] != exclude_id]
+        return results
+
+    def _query(self,
+               points: List[Tuple[float, float, float]],
+               radii: List[float],
+               include_item_radius: bool) -> List[List[SpatialHit]]:
+        """질의 위치를 버킷별로 묶어 주변 버킷 후보와 거리 비교"""
+        results: List[List[SpatialHit]] = [[] for _ in points]
+        if not self._items or not points:
+            return results
+
+        groups: Dict[Tuple[int, int], List[int]] = {}
+        for index, (x, y, _) in enumerate(points):
+            groups.setdefault(self._bucket_key(x, y), []).append(index)
+
+        for (gx, gy), indexes in groups.items():
+            reach = max(radii[i] for i in indexes)
+            if include_item_radius:
+                reach += self.max_radius
+            keys = self._neighbor_keys(gx, gy, reach)
+            if np is not None:
+                self._match_numpy(points, radii, indexes, keys, include_item_radius, results)
+            else:
+                self._match_python(points, radii, indexes, keys, include_item_radius, results)
+        return results
+
+    def _neighbor_keys(self, gx: int, gy: int, reach: float) -> List[Tuple[int, int]]:
+        # 버킷 안 어느 위치에서든 reach 이내 항목은 ceil(reach / bucket_size) 버킷 안에 있음
+        span = math.ceil(reach / self.bucket_size)
+        if (2 * span + 1) ** 2 >= len(self._buckets):
+            return list(self._buckets)
+        buckets = self._buckets
+        return [
+            (bx, by)
+            for bx in range(gx - span, gx + span + 1)
+            for by in range(gy - span, gy + span + 1)
+            if (bx, by) in buckets
+        ]
+
+    def _match_python(self, points, radii, indexes, keys, include_item_radius, results) -> None:
+        items = self._items
+        candidates = [item_id for key in keys for item_id in self._buckets[key]]
+        for i in indexes:
+            px, py, pz = points[i]
+            radius = radii[i]
+            hits = results[i]
+            for item_id in candidates:
+                x, y, z, item_radius, data = items[item_id]
+                distance = math.sqrt((x - px) ** 2 + (y - py) ** 2 + (z - pz) ** 2)
+                if include_item_radius:
+                    if distance < radius + item_radius:
+                        hits.append((item_id, distance, item_radius, data))
+                elif distance <= radius:
+                    hits.append((item_id, distance, item_radius, data))
+
+    def _pack(self, key: Tuple[int, int]) -> Tuple[List[str], Any]:
+        packed = self._packed.get(key)
+        if packed is None:
+            ids = list(self._buckets[key])
+            array = np.array([self._items[item_id][:4] for item_id in ids], dtype=np.float64).reshape(-1, 4)
+            packed = self._packed[key] = (ids, array)
+        return packed
+
+    def _match_numpy(self, points, radii, indexes, keys, include_item_radius, results) -> None:
+        if not keys:
+            return
+        packed = [self._pack(key) for key in keys]
+        ids = [item_id for bucket_ids, _ in packed for item_id in bucket_ids]
+        candidates = np.concatenate([array for _, array in packed])
+        items = self._items
+
+        # 거리 행렬이 너무 커지지 않도록 질의를 나눠 계산
+        chunk = max(1, _MAX_MATRIX_SIZE // len(ids))
+        for start in range(0, len(indexes), chunk):
+            chunk_indexes = indexes[start:start + chunk]
+            query = np.array([points[i] for i in chunk_indexes], dtype=np.float64)
+            limit = np.array([radii[i] for i in chunk_indexes], dtype=np.float64)[:, None]
+
+            diff = query[:, None, :] - candidates[None, :, :3]
+            distances = np.sqrt(np.einsum('qcd,qcd->qc', diff, diff))
+            if include_item_radius:
+                mask = distances < limit + candidates[None, :, 3]
+            else:
+                mask = distances <= limit
+
+            for row, column in zip(*np.nonzero(mask)):
+                item_id = ids[column]
+                item = items[item_id]
+                results[chunk_indexes[row]].append((item_id, float(distances[row, column]), item[3], item[4]))
+
+
+class WorldSpatialIndex:
+    """셀별 Entity/World Object 공간 인덱스"""
+
+    def __init__(self,
+                 db_connection: Optional[DatabaseConnection] = None,
+                 max_cells: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None,
+                 bucket_size: float = DEFAULT_BUCKET_SIZE):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+            max_cells: 종류별 보관할 최대 셀 수 (기본: CACHE_CONFIG["spatial_index_cell"]["max_size"])
+            ttl_seconds: 셀 격자 유효 시간 (기본: CACHE_CONFIG["spatial_index_cell"]["ttl_seconds"])
+            bucket_size: 격자 버킷 한 변의 길이 (미터)
+        """
+        config = CACHE_CONFIG["spatial_index_cell"]
+        self._db = db_connection
+        max_cells = max_cells or config["max_size"]
+        ttl_seconds = ttl_seconds or config["ttl_seconds"]
+        self.bucket_size = bucket_size
+        self._entity_grids = TTLCache("spatial_entity_grid", max_size=max_cells, ttl_seconds=ttl_seconds)
+        self._object_grids = TTLCache("spatial_object_grid", max_size=max_cells, ttl_seconds=ttl_seconds)
+        # 항목 ID -> 셀 ID (셀 간 이동 시 이전 격자에서 제거)
+        self._entity_cells: Dict[str, str] = {}
+        self._object_cells: Dict[str, str] = {}
+        self.loads = 0
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    # ------------------------------------------------------------------
+    # 셀 격자 조회
+    # ------------------------------------------------------------------
+
+    async def entity_grid(self, cell_id: str) -> SpatialGrid:
+        """셀의 Entity 격자 (없으면 로드)"""
+        return await self._entity_grids.get_or_load(cell_id, lambda: self._load_entities(cell_id))
+
+    async def object_grid(self, cell_id: str) -> SpatialGrid:
+        """셀의 통과 불가 World Object 격자 (없으면 로드)"""
+        return await self._object_grids.get_or_load(cell_id, lambda: self._load_objects(cell_id))
+
+    async def _load_entities(self, cell_id: str) -> SpatialGrid:
+        from app.services.world_editor.collision_service import get_collision_radius
+
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT entity_id, entity_name, entity_type, entity_size,
+                       default_position_3d, entity_properties
+                FROM game_data.entities
+                WHERE default_position_3d IS NOT NULL
+                AND default_position_3d->>'cell_id' = $1
+                """,
+                cell_id
+            )
+
+        grid = SpatialGrid(self.bucket_size)
+        for row in rows:
+            position = parse_jsonb_data(row['default_position_3d'])
+            if not isinstance(position, dict) or 'x' not in position:
+                continue
+            entity_size = row['entity_size'] or 'medium'
+            properties = parse_jsonb_data(row['entity_properties'])
+            grid.upsert(row['entity_id'], position, get_collision_radius(entity_size), {
+                "entity_id": row['entity_id'],
+                "entity_name": row['entity_name'],
+                "entity_type": row['entity_type'],
+                "entity_size": entity_size,
+                "position": position,
+                "properties": properties if isinstance(properties, dict) else {}
+            })
+            self._entity_cells[row['entity_id']] = cell_id
+        self.loads += 1
+        return grid
+
+    async def _load_objects(self, cell_id: str) -> SpatialGrid:
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT object_id, object_name, default_position,
+                       object_width, object_depth, object_height
+                FROM game_data.world_objects
+                WHERE default_cell_id = $1
+                AND default_position IS NOT NULL
+                AND NOT COALESCE(passable, false)
+                """,
+                cell_id
+            )
+
+        grid = SpatialGrid(self.bucket_size)
+        for row in rows:
+            self._add_object(grid, row['object_id'], row['object_name'], parse_jsonb_data(row['default_position']),
+                             row['object_width'], row['object_depth'], row['object_height'])
+            self._object_cells[row['object_id']] = cell_id
+        self.loads += 1
+        return grid
+
+    @staticmethod
+    def _add_object(grid: SpatialGrid, object_id: str, object_name: Optional[str], position: Any,
+                    width: Optional[float], depth: Optional[float], height: Optional[float]) -> None:
+        if not isinstance(position, dict) or 'x' not in position:
+            return
+        width = width or 1.0
+        depth = depth or 1.0
+        grid.upsert(object_id, position, max(width, depth) / 2.0, {
+            "object_id": object_id,
+            "object_name": object_name,
+            "position": position,
+            "object_width": width,
+            "object_depth": depth,
+            "object_height": height or 1.0,
+            "passable": False
+        })
+
+    # ------------------------------------------------------------------
+    # 쓰기 경로 갱신
+    # ------------------------------------------------------------------
+
+    def upsert_entity(self,
+                      entity_id: str,
+                      position_3d: Optional[Dict[str, Any]],
+                      entity_size: Optional[str],
+                      entity_name: Optional[str] = None,
+                      entity_type: Optional[str] = None,
+                      properties: Optional[Dict[str, Any]] = None) -> None:
+        """Entity 생성/수정 반영 (로드되지 않은 셀은 다음 로드 시 DB에서 읽음)"""
+        from app.services.world_editor.collision_service import get_collision_radius
+
+        self.remove_entity(entity_id)
+        if not isinstance(position_3d, dict) or 'x' not in position_3d or not position_3d.get('cell_id'):
+            return
+        cell_id = position_3d['cell_id']
+        self._entity_cells[entity_id] = cell_id
+        grid = self._entity_grids.peek(cell_id)
+        if grid is None:
+            return
+        entity_size = entity_size or 'medium'
+        grid.upsert(entity_id, position_3d, get_collision_radius(entity_size), {
+            "entity_id": entity_id,
+            "entity_name": entity_name,
+            "entity_type": entity_type,
+            "entity_size": entity_size,
+            "position": position_3d,
+            "properties": properties if isinstance(properties, dict) else {}
+        })
+
+    def remove_entity(self, entity_id: str) -> None:
+        """Entity 삭제/이동 반영"""
+        cell_id = self._entity_cells.pop(entity_id, None)
+        grid = self._entity_grids.peek(cell_id) if cell_id is not None else None
+        if grid is not None:
+            grid.remove(entity_id)
+
+    def upsert_object(self,
+                      object_id: str,
+                      cell_id: Optional[str],
+                      position: Optional[Dict[str, Any]],
+                      width: Optional[float] = None,
+                      depth: Optional[float] = None,
+                      height: Optional[float] = None,
+                      passable: bool = False,
+                      object_name: Optional[str] = None) -> None:
+        """World Object 생성/수정 반영 (통과 가능 객체는 인덱스에서 제외)"""
+        self.remove_object(object_id)
+        if not cell_id or passable:
+            return
+        self._object_cells[object_id] = cell_id
+        grid = self._object_grids.peek(cell_id)
+        if grid is not None:
+            self._add_object(grid, object_id, object_name, position, width, depth, height)
+
+    def remove_object(self, object_id: str) -> None:
+        """World Object 삭제/이동 반영"""
+        cell_id = self._object_cells.pop(object_id, None)
+        grid = self._object_grids.peek(cell_id) if cell_id is not None else None
+        if grid is not None:
+            grid.remove(object_id)
+
+    def invalidate(self, cell_ids: Optional[Iterable[str]] = None) -> None:
+        """셀 격자 무효화 (None이면 전체)"""
+        if cell_ids is None:
+            self._entity_grids.clear()
+            self._object_grids.clear()
+            return
+        for cell_id in cell_ids:
+            self._entity_grids.invalidate(cell_id)
+            self._object_grids.invalidate(cell_id)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태"""
+        return {
+            "backend": "numpy" if np is not None else "python",
+            "loads": self.loads,
+            "entity_grids": self._entity_grids.snapshot(),
+            "object_grids": self._object_grids.snapshot(),
+        }
+
+
+# 전역 셀 공간 인덱스
+world_spatial_index = WorldSpatialIndex()
@@ -8,6 +8,7 @@ from app.api.schemas import (
 )
 from common.utils.logger import logger
 from common.utils.jsonb_handler import serialize_jsonb_data, parse_jsonb_data
+from app.services.world_editor.spatial_index import world_spatial_index
 
 
 class WorldObjectService:
@@ -16,6 +17,20 @@ class WorldObjectService:
     def __init__(self, db_connection: Optional[DatabaseConnection] = None):
         self.db = db_connection or DatabaseConnection()
     
+    @staticmethod
+    def _index_object(row, default_position) -> None:
+        """생성/수정된 World Object를 셀 공간 인덱스(충돌 검사)에 반영"""
+        world_spatial_index.upsert_object(
+            row['object_id'],
+            row['default_cell_id'],
+            default_position,
+            width=row['object_width'],
+            depth=row['object_depth'],
+            height=row['object_height'],
+            passable=row['passable'] or False,
+            object_name=row['object_name']
+        )
+    
     async def get_all_world_objects(self) -> List[WorldObjectResponse]:
         """모든 World Object 조회"""
         try:
@@ -176,7 +191,8 @@ class WorldObjectService:
                     RETURNING 
                         object_id, object_type, object_name, object_description,
                         default_cell_id, default_position, interaction_type,
-                        possible_states, properties, created_at, updated_at
+                        possible_states, properties, created_at, updated_at,
+                        object_width, object_depth, object_height, passable
                 """,
                     world_object_data.object_id,
                     world_object_data.object_type,
@@ -192,6 +208,7 @@ class WorldObjectService:
                 default_position = parse_jsonb_data(row['default_position'])
                 possible_states = parse_jsonb_data(row['possible_states'])
                 properties = parse_jsonb_data(row['properties'])
+                self._index_object(row, default_position)
                 
                 # possible_states가 dict가 아닌 경우 빈 dict로 변환
                 if not isinstance(possible_states, dict):
@@ -296,7 +313,8 @@ class WorldObjectService:
                     RETURNING 
                         object_id, object_type, object_name, object_description,
                         default_cell_id, default_position, interaction_type,
-                        possible_states, properties, created_at, updated_at
+                        possible_states, properties, created_at, updated_at,
+                        object_width, object_depth, object_height, passable
                 """
                 
                 row = await conn.fetchrow(query, *update_values)
@@ -304,6 +322,7 @@ class WorldObjectService:
                 default_position = parse_jsonb_data(row['default_position'])
                 possible_states = parse_jsonb_data(row['possible_states'])
                 properties = parse_jsonb_data(row['properties'])
+                self._index_object(row, default_position)
                 
                 # possible_states가 dict가 아닌 경우 빈 dict로 변환
                 if not isinstance(possible_states, dict):
@@ -336,6 +355,7 @@ class WorldObjectService:
                     WHERE object_id = $1
                 """, object_id)
                 
+                world_spatial_index.remove_object(object_id)
                 return result == "DELETE 1"
         except Exception as e:
             logger.error(f"World Object 삭제 실패: {e}")
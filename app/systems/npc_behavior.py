@@ -6,9 +6,8 @@ NPC 자동 행동 시스템
 """
 import asyncio
 import logging
-import random
 import uuid
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 
 from app.managers.entity_manager import EntityManager, EntityType, EntityStatus
@@ -16,6 +15,7 @@ from app.managers.cell_manager import CellManager, CellType, CellStatus
 from app.managers.dialogue_manager import DialogueManager
 from app.handlers.action_handler import ActionHandler
 from app.systems.time_system import TimeSystem, TimePeriod
+from app.config.app_config import GAME_CONFIG
 from database.connection import DatabaseConnection
 
 logger = logging.getLogger(__name__)
@@ -52,11 +52,15 @@ class NPCBehavior:
         # NPC 정보는 DB에서 동적으로 로드
         self.npc_routines = {}
         self.cell_mapping = {}
+        self.session_id: Optional[str] = None
+        # 시간대 -> 해당 시간대에 스케줄이 있는 NPC 목록 (틱마다 할 일이 있는 NPC만 실행)
+        self._period_index: Dict[str, List[str]] = {}
         
         logger.info("NPCBehavior system initialized")
     
     async def load_npc_behavior_schedules(self, session_id: str):
         """DB에서 NPC 행동 스케줄 로드"""
+        self.session_id = session_id
         try:
             # 게임 데이터에서 엔티티 행동 스케줄 조회
             # 테스트 환경에서는 모든 NPC 스케줄을 로드
@@ -110,6 +114,7 @@ class NPCBehavior:
                     "action_data": action_data
                 })
             
+            self._index_routines()
             logger.info(f"Loaded behavior schedules for {len(self.npc_routines)} NPCs")
             return True
             
@@ -117,6 +122,29 @@ class NPCBehavior:
             logger.error(f"Failed to load NPC behavior schedules: {str(e)}")
             return False
     
+    def set_npc_routines(self, npc_routines: Dict[str, Dict[str, Any]], session_id: Optional[str] = None):
+        """
+        NPC 루틴 직접 설정 (DB 로드 대신 사용)
+        
+        Args:
+            npc_routines: {npc_id: {"name": str, "type": str, "schedules": {time_period: [schedule, ...]}}}
+            session_id: 행동 로그를 기록할 세션 ID
+        """
+        self.npc_routines = npc_routines
+        if session_id:
+            self.session_id = session_id
+        self._index_routines()
+    
+    def _index_routines(self):
+        """스케줄을 우선순위 순으로 한 번 정렬하고 시간대별 NPC 인덱스 구성"""
+        period_index: Dict[str, List[str]] = {}
+        for npc_id, routine in self.npc_routines.items():
+            for time_period, schedules in routine["schedules"].items():
+                schedules.sort(key=lambda x: x["priority"])
+                if schedules:
+                    period_index.setdefault(time_period, []).append(npc_id)
+        self._period_index = period_index
+    
     def set_cell_mapping(self, cell_mapping: Dict[str, str]):
         """셀 ID 매핑 설정"""
         self.cell_mapping = cell_mapping
@@ -156,22 +184,75 @@ class NPCBehavior:
             logger.error(f"Error executing routine for {npc_id}: {str(e)}")
             return False
     
-    async def _execute_scheduled_actions(self, npc_id: str, time_period: TimePeriod) -> bool:
+    async def execute_all_routines(self,
+                                   time_period: Optional[Union[TimePeriod, str]] = None,
+                                   max_concurrency: Optional[int] = None) -> Dict[str, bool]:
+        """
+        현재 시간대에 스케줄이 있는 모든 NPC 루틴을 동시 실행 (틱 단위)
+        
+        NPC 간에는 동시에 실행하되, 한 NPC의 행동은 우선순위 순서대로 실행합니다.
+        동시 실행 수는 연결 풀 크기를 넘지 않도록 세마포어로 제한합니다.
+        확률 판정은 NPC별 난수(TimeSystem.rng_for)를 사용하므로 실행 순서와 관계없이 재현됩니다.
+        
+        Args:
+            time_period: 시간대 (None이면 TimeSystem의 현재 시간대)
+            max_concurrency: 최대 동시 실행 NPC 수 (None이면 설정값 또는 연결 풀 크기 기준)
+            
+        Returns:
+            NPC ID별 실행 성공 여부
+        """
+        if time_period is None:
+            time_period = self.time_system.get_time_period()
+        period_value = time_period.value if isinstance(time_period, TimePeriod) else str(time_period)
+        
+        npc_ids = self._period_index.get(period_value, [])
+        if not npc_ids:
+            return {}
+        
+        semaphore = asyncio.Semaphore(max_concurrency or await self._default_concurrency())
+        
+        async def run(npc_id: str) -> bool:
+            async with semaphore:
+                return await self._execute_scheduled_actions(npc_id, period_value)
+        
+        results = await asyncio.gather(*(run(npc_id) for npc_id in npc_ids), return_exceptions=True)
+        
+        outcome = {}
+        for npc_id, result in zip(npc_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error executing routine for {npc_id}: {str(result)}")
+                result = False
+            outcome[npc_id] = result
+        
+        logger.info(f"Executed {period_value} routines for {len(npc_ids)} NPCs "
+                    f"({sum(outcome.values())} succeeded)")
+        return outcome
+    
+    async def _default_concurrency(self) -> int:
+        """기본 동시 실행 수 (연결 풀 최대 크기에서 여유분 제외)"""
+        configured = GAME_CONFIG["npc_routine_concurrency"]
+        if configured:
+            return configured
+        try:
+            pool = await self.db.pool
+            return max(1, pool.get_max_size() - 2)
+        except Exception:
+            return 4
+    
+    async def _execute_scheduled_actions(self, npc_id: str, time_period: Union[TimePeriod, str]) -> bool:
         """DB 스케줄에 따른 행동 실행"""
         try:
             npc_info = self.npc_routines[npc_id]
-            time_period_str = time_period.value
+            time_period_str = time_period.value if isinstance(time_period, TimePeriod) else time_period
             
             # 해당 시간대의 스케줄이 있는지 확인
             if time_period_str not in npc_info["schedules"]:
                 logger.info(f"No scheduled actions for {npc_id} during {time_period_str}")
                 return True
             
+            # 로드 시 우선순위 순으로 정렬됨
             schedules = npc_info["schedules"][time_period_str]
             
-            # 우선순위 순으로 정렬
-            schedules.sort(key=lambda x: x["priority"])
-            
             for schedule in schedules:
                 action_type = schedule["action_type"]
                 conditions = schedule["conditions"]
@@ -216,7 +297,12 @@ class NPCBehavior:
                     await self.move_to_cell(npc_id, target_cell_id)
             
             # 액션 핸들러를 통한 행동 실행
-            result = await self.action_handler.execute_action(action_type, npc_id, target_cell_id if target_cell_id else "current_cell")
+            result = await self.action_handler.execute_action(
+                action_type, npc_id, target_cell_id if target_cell_id else "current_cell",
+                session_id=self.session_id,
+                # NPC 행동은 플레이어 세션 시계를 진행하지 않음
+                advance_clock=False
+            )
             
             if result.success:
                 logger.info(f"Successfully executed {action_type} for {npc_id}")
@@ -270,12 +356,10 @@ class NPCBehavior:
             상호작용 성공 여부
         """
         try:
-            # 같은 셀에 있는 다른 NPC들 찾기
-            cell_content = await self.cell_manager.load_cell_content(current_cell_id)
-            if not cell_content.success:
-                return False
-            
-            other_entities = [e for e in cell_content.content.entities if e != npc_id]
+            # 같은 셀에 있는 다른 엔티티들 찾기 (셀 점유 맵, 셀 컨텐츠 전체 로드 없음)
+            occupants = await self.cell_manager.get_cell_occupants(current_cell_id)
+            # 정렬하여 시드 지정 시 선택 결과 재현 가능
+            other_entities = sorted(entity_id for entity_id in occupants if entity_id != str(npc_id))
             
             if not other_entities:
                 logger.info(f"No other entities in {current_cell_id} for {npc_id} to interact with")
@@ -285,12 +369,14 @@ class NPCBehavior:
             time_period = self.time_system.get_time_period()
             interaction_prob = self.time_system.get_interaction_probability(time_period)
             
-            if random.random() > interaction_prob:
+            # NPC별 난수 사용 (루틴은 동시 실행되므로 공유 난수 대신 시드/틱/NPC ID로 초기화, 시드 지정 시 재현 가능)
+            rng = self.time_system.rng_for(str(npc_id))
+            if rng.random() > interaction_prob:
                 logger.info(f"{npc_id} chose not to interact (probability: {interaction_prob})")
                 return True
             
             # 랜덤하게 다른 NPC 선택
-            target_npc = random.choice(other_entities)
+            target_npc = rng.choice(other_entities)
             
             # 대화 시작
             dialogue_result = await self.dialogue_manager.start_dialogue(
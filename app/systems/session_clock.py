@@ -0,0 +1,403 @@
+"""
+세션 게임 시계 (액션 시간 소모용)
+
+액션 핸들러가 시간 소모를 적용할 때마다 TimeSystem()을 새로 만들지 않도록
+세션별 현재 게임 시간을 메모리에 보관합니다.
+
+- 세션 시간은 처음 사용할 때 runtime_data.session_states에서 한 번만 로드
+- advance(): 메모리의 절대 게임 분을 더하고 (O(1)) 기한이 된 세션 예약 이벤트 실행
+- 변경된 세션은 dirty로 표시하고 백그라운드 flusher가 주기마다
+  UPDATE ... FROM unnest(...) 한 번으로 기록 (같은 세션의 연속 변경은 마지막 값 하나로 합쳐짐)
+- 저장 시 flush(session_id)로 동기 기록, 세션 시작/불러오기/종료 시 discard(session_id)
+- 변경/예약 이벤트가 없는 시계는 session_timeout_minutes 동안 쓰이지 않으면 flusher가 메모리에서 제거
+- frozen_clock() 안에서 실행한 액션(NPC 루틴 등 플레이어가 아닌 행위자)은 시간을 소모하지 않음
+
+TimeSystem(틱 루프/헤드리스 시뮬레이션)과 별개로 동작하며,
+TimeSystem을 실행 중인 세션에는 핸들러에 time_system을 직접 주입해야 합니다.
+
+사용 예:
+    from app.systems.session_clock import session_clock
+
+    now = await session_clock.advance(session_id, 30)
+    await session_clock.schedule(session_id, "shop_open", "shop", GameTime(day=2, hour=9))
+    await session_clock.flush(session_id)
+"""
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from app.config.app_config import GAME_CONFIG
+from app.systems.session_deltas import session_deltas
+from app.systems.time_system import GameTime, ScheduledEvent
+from database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+_FLUSH_SQL = """
+    UPDATE runtime_data.session_states ss
+    SET current_day = u.current_day,
+        current_hour = u.current_hour,
+        current_minute = u.current_minute,
+        last_tick = NOW(),
+        updated_at = NOW()
+    FROM unnest($1::uuid[], $2::int[], $3::int[], $4::int[])
+        AS u(session_id, current_day, current_hour, current_minute)
+    WHERE ss.session_id = u.session_id
+"""
+
+# 현재 실행 중인 액션이 세션 시계를 진행하지 않아야 하는지 (태스크별)
+_clock_frozen: contextvars.ContextVar[bool] = contextvars.ContextVar("session_clock_frozen", default=False)
+
+
+@contextmanager
+def frozen_clock() -> Iterator[None]:
+    """블록 안에서 실행되는 액션의 시간 소모를 적용하지 않음 (NPC 루틴 액션)"""
+    token = _clock_frozen.set(True)
+    try:
+        yield
+    finally:
+        _clock_frozen.reset(token)
+
+
+def clock_frozen() -> bool:
+    """frozen_clock() 블록 안인지 여부"""
+    return _clock_frozen.get()
+
+
+@dataclass
+class SessionClockMetrics:
+    """세션 시계 통계"""
+    loads: int = 0
+    advances: int = 0
+    fired_events: int = 0
+    flushes: int = 0
+    flushed_sessions: int = 0
+    failed_flushes: int = 0
+    evicted: int = 0
+    last_flush_ms: float = 0.0
+
+
+class _SessionClock:
+    __slots__ = ("minutes", "events", "heap", "last_used")
+
+    def __init__(self, minutes: int):
+        self.minutes = minutes
+        self.events: Dict[str, ScheduledEvent] = {}
+        self.heap: List[tuple] = []
+        self.last_used = time.monotonic()
+
+
+class SessionClockService:
+    """세션별 게임 시계"""
+
+    def __init__(self,
+                 db_connection: Optional[DatabaseConnection] = None,
+                 flush_interval: Optional[float] = None,
+                 idle_timeout_minutes: Optional[float] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+            flush_interval: session_states 기록 주기 (초, 기본: GAME_CONFIG["session_clock_flush_interval_seconds"])
+            idle_timeout_minutes: 쓰이지 않는 시계 제거 시간 (기본: GAME_CONFIG["session_timeout_minutes"])
+        """
+        self._db = db_connection
+        self.flush_interval = flush_interval or GAME_CONFIG["session_clock_flush_interval_seconds"]
+        self.idle_timeout_seconds = (idle_timeout_minutes or GAME_CONFIG["session_timeout_minutes"]) * 60
+        self.metrics = SessionClockMetrics()
+
+        self._clocks: Dict[str, _SessionClock] = {}
+        self._dirty_ids: Set[str] = set()
+        self._event_seq = itertools.count()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._closed = False
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    # ------------------------------------------------------------------
+    # 시간 조회/진행
+    # ------------------------------------------------------------------
+
+    async def now(self, session_id: str) -> GameTime:
+        """세션의 현재 게임 시간"""
+        clock = await self._get_clock(str(session_id))
+        return GameTime.from_minutes(clock.minutes)
+
+    async def advance(self, session_id: str, minutes: int) -> GameTime:
+        """
+        세션 게임 시간을 minutes분 진행하고 기한이 된 예약 이벤트 실행
+
+        Returns:
+            진행 후 게임 시간
+        """
+        session_id = str(session_id)
+        clock = await self._get_clock(session_id)
+        if minutes > 0:
+            clock.minutes += minutes
+            self.metrics.advances += 1
+            self._mark_dirty(session_id)
+            await self._fire_due_events(session_id, clock)
+            now = GameTime.from_minutes(clock.minutes)
+            session_deltas.publish(session_id, "time_advanced", {
+                "day": now.day, "hour": now.hour, "minute": now.minute, "minutes": minutes
+            })
+            return now
+        return GameTime.from_minutes(clock.minutes)
+
+    async def _get_clock(self, session_id: str) -> _SessionClock:
+        clock = self._clocks.get(session_id)
+        if clock is None:
+            minutes = await self._load_minutes(session_id)
+            # 로드 중 다른 코루틴이 먼저 등록했으면 그 시계를 사용
+            clock = self._clocks.setdefault(session_id, _SessionClock(minutes))
+            # 쓰이지 않는 시계 제거도 flusher가 담당
+            self._ensure_started()
+        clock.last_used = time.monotonic()
+        return clock
+
+    async def _load_minutes(self, session_id: str) -> int:
+        """session_states에서 세션 시간 로드 (행이 없으면 기본 시각으로 생성)"""
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                """
+                SELECT current_day, current_hour, current_minute
+                FROM runtime_data.session_states
+                WHERE session_id = $1::uuid
+                """,
+                session_id
+            )
+            if row:
+                # 자정(0시)/정각(0분)이 기본값으로 바뀌지 않도록 NULL만 기본값 처리
+                current_time = GameTime(
+                    day=row['current_day'] if row['current_day'] is not None else 1,
+                    hour=row['current_hour'] if row['current_hour'] is not None else 6,
+                    minute=row['current_minute'] if row['current_minute'] is not None else 0
+                )
+            else:
+                current_time = GameTime()
+                await conn.execute(
+                    """
+                    INSERT INTO runtime_data.session_states
+                    (session_id, current_day, current_hour, current_minute)
+                    VALUES ($1::uuid, $2, $3, $4)
+                    ON CONFLICT (session_id) DO NOTHING
+                    """,
+                    session_id, current_time.day, current_time.hour, current_time.minute
+                )
+        self.metrics.loads += 1
+        return current_time.to_minutes()
+
+    # ------------------------------------------------------------------
+    # 예약 이벤트
+    # ------------------------------------------------------------------
+
+    async def schedule(self,
+                       session_id: str,
+                       event_name: str,
+                       event_type: str,
+                       trigger_time: GameTime,
+                       event_data: Optional[Dict[str, Any]] = None,
+                       handler: Optional[Callable] = None,
+                       repeat_interval: Optional[int] = None) -> str:
+        """
+        세션 예약 이벤트 등록 (O(log n))
+
+        handler는 advance()로 trigger_time에 도달했을 때 event_data를 인자로 호출됩니다.
+        현재 시각 이전의 trigger_time은 다음 advance()에서 바로 실행됩니다.
+        """
+        session_id = str(session_id)
+        clock = await self._get_clock(session_id)
+        event = ScheduledEvent(
+            event_id=str(uuid.uuid4()),
+            event_name=event_name,
+            event_type=event_type,
+            trigger_time=trigger_time,
+            event_data={"session_id": session_id, **(event_data or {})},
+            handler=handler,
+            repeat_interval=repeat_interval
+        )
+        clock.events[event.event_id] = event
+        heapq.heappush(clock.heap, (trigger_time.to_minutes(), next(self._event_seq), event.event_id))
+        return event.event_id
+
+    def cancel(self, session_id: str, event_id: str) -> bool:
+        """예약 이벤트 취소 (힙 항목은 실행 시점에 제거)"""
+        clock = self._clocks.get(str(session_id))
+        event = clock.events.pop(event_id, None) if clock is not None else None
+        if event is None:
+            return False
+        event.is_active = False
+        return True
+
+    async def _fire_due_events(self, session_id: str, clock: _SessionClock) -> int:
+        """현재 시각 이하의 예약 이벤트를 시각 순서대로 실행"""
+        heap = clock.heap
+        fired = 0
+        while heap and heap[0][0] <= clock.minutes:
+            due, _, event_id = heapq.heappop(heap)
+            event = clock.events.get(event_id)
+            if event is None:
+                continue
+
+            event.trigger_time = GameTime.from_minutes(due)
+            try:
+                if event.handler:
+                    await event.handler(event.event_data)
+                fired += 1
+            except Exception as e:
+                logger.error(f"Session clock: event failed: {event.event_name} - {e}")
+
+            if not event.is_active:
+                continue
+            if event.repeat_interval and event.repeat_interval > 0:
+                next_due = due + event.repeat_interval
+                heapq.heappush(heap, (next_due, next(self._event_seq), event_id))
+            else:
+                clock.events.pop(event_id, None)
+
+        self.metrics.fired_events += fired
+        return fired
+
+    # ------------------------------------------------------------------
+    # flush
+    # ------------------------------------------------------------------
+
+    def _mark_dirty(self, session_id: str) -> None:
+        self._dirty_ids.add(session_id)
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        """현재 이벤트 루프에 flusher 태스크 준비 (지연 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._flush_lock = asyncio.Lock()
+            self._flusher_task = None
+
+        if self._closed:
+            return
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = loop.create_task(self._flusher_loop())
+
+    async def _flusher_loop(self) -> None:
+        """주기마다 변경된 세션 시간 기록"""
+        while not self._closed:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Session clock: flush failed: {e}")
+            self.evict_idle()
+
+    def evict_idle(self) -> int:
+        """기록할 변경과 예약 이벤트가 없고 유휴 시간이 지난 시계 제거 (제거된 수 반환)"""
+        deadline = time.monotonic() - self.idle_timeout_seconds
+        idle = [
+            session_id for session_id, clock in self._clocks.items()
+            if clock.last_used < deadline and not clock.events and session_id not in self._dirty_ids
+        ]
+        for session_id in idle:
+            del self._clocks[session_id]
+        self.metrics.evicted += len(idle)
+        return len(idle)
+
+    async def flush(self, session_id: Optional[str] = None) -> int:
+        """
+        변경된 세션 시간을 한 번의 배치 UPDATE로 기록
+
+        Args:
+            session_id: 지정 시 해당 세션만 기록 (저장 시)
+
+        Returns:
+            기록된 세션 수
+        """
+        if not self._dirty_ids:
+            return 0
+        self._ensure_started()
+
+        async with self._flush_lock:
+            session_id = str(session_id) if session_id else None
+            ids = [sid for sid in self._dirty_ids if session_id is None or sid == session_id]
+            ids = [sid for sid in ids if sid in self._clocks]
+            if not ids:
+                return 0
+
+            # await 전에 값을 고정하고 dirty를 비워 flush 중 변경은 다음 flush로 넘김
+            times = [GameTime.from_minutes(self._clocks[sid].minutes) for sid in ids]
+            self._dirty_ids.difference_update(ids)
+
+            started = time.perf_counter()
+            try:
+                pool = await self.db.pool
+                async with pool.acquire() as conn:
+                    await conn.execute(
+                        _FLUSH_SQL,
+                        ids,
+                        [t.day for t in times],
+                        [t.hour for t in times],
+                        [t.minute for t in times]
+                    )
+            except Exception:
+                # 기록 실패 시 dirty 복원 (다음 flush에서 재시도)
+                self._dirty_ids.update(sid for sid in ids if sid in self._clocks)
+                self.metrics.failed_flushes += 1
+                raise
+
+            self.metrics.flushes += 1
+            self.metrics.flushed_sessions += len(ids)
+            self.metrics.last_flush_ms = (time.perf_counter() - started) * 1000
+            return len(ids)
+
+    def discard(self, session_id: str) -> None:
+        """세션 시계를 메모리에서 제거 (미기록 변경은 버림, 다음 사용 시 다시 로드)"""
+        session_id = str(session_id)
+        self._clocks.pop(session_id, None)
+        self._dirty_ids.discard(session_id)
+
+    async def close(self) -> None:
+        """남은 변경을 기록하고 flusher 종료 (애플리케이션 종료 시)"""
+        self._closed = True
+        task, self._flusher_task = self._flusher_task, None
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            task.cancel()
+            try:
+                await task
+            except (asyncio.CancelledError, Exception):
+                pass
+        if self._dirty_ids:
+            await self.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "resident": len(self._clocks),
+            "dirty": len(self._dirty_ids),
+            "scheduled_events": sum(len(clock.events) for clock in self._clocks.values()),
+            "loads": metrics.loads,
+            "advances": metrics.advances,
+            "fired_events": metrics.fired_events,
+            "flushes": metrics.flushes,
+            "flushed_sessions": metrics.flushed_sessions,
+            "failed_flushes": metrics.failed_flushes,
+            "evicted": metrics.evicted,
+            "last_flush_ms": metrics.last_flush_ms,
+        }
+
+
+# 전역 세션 시계
+session_clock = SessionClockService()
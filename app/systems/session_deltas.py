@@ -0,0 +1,376 @@
+"""
+세션 게임플레이 델타 스트림 (WebSocket 서버 푸시)
+
+게임 화면이 액션마다 state/actions/cell/character를 다시 조회하지 않도록
+매니저가 상태를 바꾸는 시점에 세션별 델타를 만들어 연결된 클라이언트에 보냅니다.
+
+- 델타 종류: entity_entered / entity_left (플레이어가 있는 셀), player_moved,
+  object_state, inventory_delta, time_advanced, actions (사용 가능한 액션 목록이 바뀐 경우)
+- 세션 채널마다 stream ID와 1부터 증가하는 seq를 붙이고 최근 델타를 링 버퍼에 보관
+- 클라이언트가 seq 누락을 감지하면 resume(stream, last_seq)으로 버퍼에서 재전송,
+  버퍼에 없거나 stream이 다르면 스냅샷으로 재동기화
+- 연결된 클라이언트가 없는 세션은 채널이 없으므로 publish()는 바로 반환
+
+델타 생산 위치:
+    cell_occupancy.move()                  -> entity_entered / entity_left / player_moved
+    ObjectStateManager.update_object_state -> object_state
+    InventoryManager.apply_delta           -> inventory_delta
+    session_clock.advance                  -> time_advanced
+    상태 변경 델타 이후 actions_provider로 다시 계산 (디바운스, 바뀐 경우만 전송)
+
+사용 예:
+    from app.systems.session_deltas import session_deltas
+
+    token = session_deltas.attach(session_id, send)   # send(message: dict)
+    session_deltas.watch(session_id, player_id, runtime_cell_id)
+    session_deltas.publish(session_id, "time_advanced", {"day": 1, "hour": 9, "minute": 0})
+    session_deltas.detach(session_id, token)
+"""
+import asyncio
+import itertools
+import json
+import logging
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from app.config.app_config import GAME_CONFIG
+from database.cell_occupancy import cell_key, cell_occupancy
+
+logger = logging.getLogger(__name__)
+
+# 사용 가능한 액션 목록을 다시 계산하게 하는 델타
+ACTION_AFFECTING_KINDS = frozenset({
+    "entity_entered", "entity_left", "player_moved", "object_state", "inventory_delta",
+})
+
+Sink = Callable[[Dict[str, Any]], Any]
+ActionsProvider = Callable[[str], Awaitable[List[Dict[str, Any]]]]
+
+
+@dataclass
+class SessionDeltaMetrics:
+    """델타 스트림 통계"""
+    published: int = 0
+    dropped_no_channel: int = 0
+    replays: int = 0
+    resyncs: int = 0
+    action_refreshes: int = 0
+    action_pushes: int = 0
+    sink_errors: int = 0
+
+
+class _DeltaChannel:
+    __slots__ = ("stream_id", "seq", "buffer", "sinks", "player_id", "cell_id",
+                 "actions_digest", "actions_task", "actions_dirty")
+
+    def __init__(self, buffer_size: int):
+        self.stream_id = uuid.uuid4().hex
+        self.seq = 0
+        self.buffer: Deque[Dict[str, Any]] = deque(maxlen=buffer_size)
+        self.sinks: Dict[int, Sink] = {}
+        self.player_id: Optional[str] = None
+        self.cell_id: Optional[str] = None
+        self.actions_digest: Optional[str] = None
+        self.actions_task: Optional[asyncio.Task] = None
+        # 재계산 중 들어온 상태 변경 (끝난 뒤 한 번 더 재계산)
+        self.actions_dirty = False
+
+
+class SessionDeltaStream:
+    """세션별 델타 채널"""
+
+    def __init__(self,
+                 buffer_size: Optional[int] = None,
+                 actions_debounce: Optional[float] = None):
+        """
+        Args:
+            buffer_size: 세션별 재전송 버퍼 크기 (기본: GAME_CONFIG["session_delta_buffer_size"])
+            actions_debounce: 상태 변경 후 액션 목록 재계산까지 대기 시간
+                (초, 기본: GAME_CONFIG["session_delta_actions_debounce_seconds"])
+        """
+        self.buffer_size = buffer_size or GAME_CONFIG["session_delta_buffer_size"]
+        self.actions_debounce = actions_debounce or GAME_CONFIG["session_delta_actions_debounce_seconds"]
+        # 세션 ID -> 액션 목록 (gameplay 라우트에서 ActionService로 설정)
+        self.actions_provider: Optional[ActionsProvider] = None
+        self.metrics = SessionDeltaMetrics()
+
+        self._channels: Dict[str, _DeltaChannel] = {}
+        self._tokens = itertools.count(1)
+        # 플레이어 런타임 엔티티 ID -> 세션 / 셀 키 -> 그 셀을 보는 세션
+        self._players: Dict[str, str] = {}
+        self._cell_watchers: Dict[str, Set[str]] = {}
+
+    # ------------------------------------------------------------------
+    # 채널
+    # ------------------------------------------------------------------
+
+    def attach(self, session_id: str, sink: Sink) -> int:
+        """
+        세션 채널에 전송 함수 등록 (채널이 없으면 생성)
+
+        Args:
+            sink: 메시지 dict를 받아 클라이언트 송신 큐에 넣는 함수 (대기하지 않아야 함)
+
+        Returns:
+            detach()에 쓸 토큰
+        """
+        session_id = str(session_id)
+        channel = self._channels.get(session_id)
+        if channel is None:
+            channel = self._channels[session_id] = _DeltaChannel(self.buffer_size)
+        token = next(self._tokens)
+        channel.sinks[token] = sink
+        return token
+
+    def detach(self, session_id: str, token: int) -> None:
+        """전송 함수 해제 (마지막 연결이면 채널 제거)"""
+        session_id = str(session_id)
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return
+        channel.sinks.pop(token, None)
+        if not channel.sinks:
+            self._drop_channel(session_id, channel)
+
+    def _drop_channel(self, session_id: str, channel: _DeltaChannel) -> None:
+        self._channels.pop(session_id, None)
+        self._unwatch(session_id, channel)
+        if channel.actions_task is not None and not channel.actions_task.done():
+            channel.actions_task.cancel()
+
+    def position(self, session_id: str) -> Optional[Tuple[str, int]]:
+        """채널의 (stream ID, 마지막 seq) - 스냅샷을 만들기 전에 읽어 둠"""
+        channel = self._channels.get(str(session_id))
+        return (channel.stream_id, channel.seq) if channel is not None else None
+
+    def connected_sessions(self) -> List[str]:
+        """게임 화면이 연결된 세션 ID 목록"""
+        return list(self._channels)
+
+    def watch(self, session_id: str, player_id: Optional[str], cell_id: Optional[str]) -> None:
+        """세션 플레이어와 현재 셀 지정 (셀 입출입 델타 대상)"""
+        session_id = str(session_id)
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return
+        self._unwatch(session_id, channel)
+        channel.player_id = str(player_id) if player_id else None
+        channel.cell_id = cell_key(cell_id)
+        if channel.player_id:
+            self._players[channel.player_id] = session_id
+        if channel.cell_id:
+            self._cell_watchers.setdefault(channel.cell_id, set()).add(session_id)
+
+    def _unwatch(self, session_id: str, channel: _DeltaChannel) -> None:
+        if channel.player_id and self._players.get(channel.player_id) == session_id:
+            del self._players[channel.player_id]
+        if channel.cell_id:
+            watchers = self._cell_watchers.get(channel.cell_id)
+            if watchers is not None:
+                watchers.discard(session_id)
+                if not watchers:
+                    del self._cell_watchers[channel.cell_id]
+
+    def remember_actions(self, session_id: str, actions: List[Dict[str, Any]]) -> None:
+        """스냅샷으로 보낸 액션 목록 기록 (같은 목록은 다시 푸시하지 않음)"""
+        channel = self._channels.get(str(session_id))
+        if channel is not None:
+            channel.actions_digest = _digest(actions)
+
+    def resync(self, session_id: str) -> None:
+        """
+        클라이언트에 스냅샷 재동기화 요청 (불러오기/새 게임처럼 상태 전체가 바뀐 경우)
+
+        stream ID를 새로 발급하므로 이전 seq로는 resume할 수 없습니다.
+        """
+        session_id = str(session_id)
+        channel = self._channels.get(session_id)
+        if channel is None:
+            return
+        self._unwatch(session_id, channel)
+        channel.stream_id = uuid.uuid4().hex
+        channel.seq = 0
+        channel.buffer.clear()
+        channel.player_id = channel.cell_id = channel.actions_digest = None
+        self.metrics.resyncs += 1
+        self._send(channel, {"type": "resync", "stream": channel.stream_id})
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+
+    def publish(self, session_id: Optional[str], kind: str, data: Dict[str, Any]) -> Optional[int]:
+        """
+        세션 델타 발행
+
+        Returns:
+            델타 seq (연결된 클라이언트가 없으면 None)
+        """
+        if not session_id:
+            return None
+        channel = self._channels.get(str(session_id))
+        if channel is None:
+            self.metrics.dropped_no_channel += 1
+            return None
+
+        channel.seq += 1
+        message = {"type": "delta", "stream": channel.stream_id, "seq": channel.seq, "kind": kind, "data": data}
+        channel.buffer.append(message)
+        self.metrics.published += 1
+        self._send(channel, message)
+
+        if kind in ACTION_AFFECTING_KINDS:
+            self._schedule_actions(str(session_id), channel)
+        return channel.seq
+
+    def publish_for_entity(self, runtime_entity_id: str, kind: str, data: Dict[str, Any]) -> Optional[int]:
+        """플레이어 엔티티 기준 발행 (연결된 세션의 플레이어가 아니면 무시)"""
+        return self.publish(self._players.get(str(runtime_entity_id)), kind, data)
+
+    def _send(self, channel: _DeltaChannel, message: Dict[str, Any]) -> None:
+        for sink in list(channel.sinks.values()):
+            try:
+                sink(message)
+            except Exception as e:
+                self.metrics.sink_errors += 1
+                logger.error(f"Session deltas: send failed: {e}")
+
+    def replay(self, session_id: str, stream_id: Optional[str], last_seq: Optional[int]) -> Optional[List[Dict[str, Any]]]:
+        """
+        last_seq 이후 델타 재전송 목록
+
+        Returns:
+            재전송할 델타 (누락 없음이면 빈 목록), 버퍼로 메울 수 없으면 None (스냅샷 필요)
+        """
+        channel = self._channels.get(str(session_id))
+        if channel is None or stream_id != channel.stream_id or last_seq is None:
+            return None
+        try:
+            last_seq = int(last_seq)
+        except (TypeError, ValueError):
+            return None
+        if last_seq > channel.seq:
+            return None
+        if last_seq == channel.seq:
+            return []
+        oldest = channel.buffer[0]["seq"] if channel.buffer else channel.seq + 1
+        if last_seq + 1 < oldest:
+            return None
+        self.metrics.replays += 1
+        return [message for message in channel.buffer if message["seq"] > last_seq]
+
+    # ------------------------------------------------------------------
+    # 셀 입출입
+    # ------------------------------------------------------------------
+
+    def on_entity_moved(self, entity_id: str, previous_cell: Optional[str], cell: Optional[str]) -> None:
+        """cell_occupancy 이동 리스너 (셀 키는 정규화된 UUID 문자열)"""
+        if not self._channels:
+            return
+        session_id = self._players.get(entity_id)
+        if session_id is not None:
+            channel = self._channels.get(session_id)
+            if channel is not None and cell is not None:
+                self.watch(session_id, entity_id, cell)
+                self.publish(session_id, "player_moved", {"cell_id": cell, "previous_cell_id": previous_cell})
+            return
+
+        if previous_cell is not None:
+            for watcher in list(self._cell_watchers.get(previous_cell, ())):
+                self.publish(watcher, "entity_left", {"entity_id": entity_id, "cell_id": previous_cell})
+        if cell is not None:
+            for watcher in list(self._cell_watchers.get(cell, ())):
+                self.publish(watcher, "entity_entered", {"entity_id": entity_id, "cell_id": cell})
+
+    # ------------------------------------------------------------------
+    # 액션 목록
+    # ------------------------------------------------------------------
+
+    def _schedule_actions(self, session_id: str, channel: _DeltaChannel) -> None:
+        """상태 변경 후 액션 목록 재계산 예약 (디바운스 동안 변경은 한 번으로 합침)"""
+        if self.actions_provider is None:
+            return
+        if channel.actions_task is not None and not channel.actions_task.done():
+            channel.actions_dirty = True
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        channel.actions_task = loop.create_task(self._refresh_actions(session_id, channel))
+
+    async def _refresh_actions(self, session_id: str, channel: _DeltaChannel) -> None:
+        while True:
+            await asyncio.sleep(self.actions_debounce)
+            # 대기 중 채널이 바뀌었으면(재연결/재동기화) 무시
+            if self._channels.get(session_id) is not channel:
+                return
+            # 이 시점 이전 변경은 이번 재계산에 반영됨
+            channel.actions_dirty = False
+            stream_id = channel.stream_id
+            try:
+                actions = await self.actions_provider(session_id)
+            except Exception as e:
+                logger.error(f"Session deltas: actions refresh failed: {e}")
+                return
+            self.metrics.action_refreshes += 1
+            if self._channels.get(session_id) is not channel or channel.stream_id != stream_id:
+                return
+            digest = _digest(actions)
+            if digest != channel.actions_digest:
+                channel.actions_digest = digest
+                self.metrics.action_pushes += 1
+                self.publish(session_id, "actions", {"actions": actions})
+            # 재계산 중 상태가 바뀌었으면 다시 계산 (바뀐 목록을 놓치지 않도록)
+            if not channel.actions_dirty:
+                return
+
+    # ------------------------------------------------------------------
+    # 종료/통계
+    # ------------------------------------------------------------------
+
+    def discard(self, session_id: str) -> None:
+        """세션 채널 제거 (세션 종료 시)"""
+        session_id = str(session_id)
+        channel = self._channels.get(session_id)
+        if channel is not None:
+            self._drop_channel(session_id, channel)
+
+    async def close(self) -> None:
+        """모든 채널과 액션 재계산 태스크 종료 (애플리케이션 종료 시)"""
+        tasks = [channel.actions_task for channel in self._channels.values()
+                 if channel.actions_task is not None and not channel.actions_task.done()]
+        self._channels.clear()
+        self._players.clear()
+        self._cell_watchers.clear()
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "channels": len(self._channels),
+            "connections": sum(len(channel.sinks) for channel in self._channels.values()),
+            "watched_cells": len(self._cell_watchers),
+            "published": metrics.published,
+            "dropped_no_channel": metrics.dropped_no_channel,
+            "replays": metrics.replays,
+            "resyncs": metrics.resyncs,
+            "action_refreshes": metrics.action_refreshes,
+            "action_pushes": metrics.action_pushes,
+            "sink_errors": metrics.sink_errors,
+        }
+
+
+def _digest(actions: List[Dict[str, Any]]) -> str:
+    return json.dumps(actions, sort_keys=True, default=str)
+
+
+# 전역 세션 델타 스트림
+session_deltas = SessionDeltaStream()
+cell_occupancy.add_listener(session_deltas.on_entity_moved)
@@ -3,6 +3,9 @@ TimeSystem 모듈 - 시간 기반 시뮬레이션 엔진
 게임 내 시간 진행, 이벤트 스케줄링, NPC 행동 패턴 관리
 """
 import asyncio
+import heapq
+import itertools
+import random
 import sys
 import os
 from typing import Dict, Any, List, Optional, Callable, Union
@@ -16,6 +19,9 @@ import json
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
 
 from database.connection import DatabaseConnection
+from database.log_sink import BatchedLogSink
+from app.config.app_config import GAME_CONFIG
+from common.utils.jsonb_handler import encode_jsonb, parse_jsonb_data
 from common.utils.logger import logger
 from common.error_handling.error_types import (
     ErrorContext, BusinessLogicError, SystemError
@@ -35,6 +41,19 @@ class TimePeriod(str, Enum):
     EVENING = "evening"
     NIGHT = "night"
 
+MINUTES_PER_DAY = 24 * 60
+
+# UUID가 아닌 사용자 지정 event_id를 time_events에 저장할 때 event_data에 보관하는 키
+_CUSTOM_EVENT_ID_KEY = "_event_id"
+
+
+def _as_uuid(value: Any) -> Optional[uuid.UUID]:
+    """UUID 문자열이면 UUID로, 아니면 None (::uuid 캐스트 오류 방지)"""
+    try:
+        return uuid.UUID(str(value))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
 @dataclass
 class GameTime:
     """게임 내 시간"""
@@ -61,6 +80,17 @@ class GameTime:
             minute=data.get("minute", 0),
             second=data.get("second", 0)
         )
+    
+    def to_minutes(self) -> int:
+        """절대 게임 분 (Day 1 00:00 = 0)"""
+        return (self.day - 1) * MINUTES_PER_DAY + self.hour * 60 + self.minute
+    
+    @classmethod
+    def from_minutes(cls, total_minutes: int) -> "GameTime":
+        """절대 게임 분으로부터 생성"""
+        days, rest = divmod(total_minutes, MINUTES_PER_DAY)
+        hour, minute = divmod(rest, 60)
+        return cls(day=days + 1, hour=hour, minute=minute)
 
 @dataclass
 class ScheduledEvent:
@@ -77,17 +107,57 @@ class ScheduledEvent:
 class TimeSystem:
     """시간 기반 시뮬레이션 엔진"""
     
-    def __init__(self):
+    # 취소된 힙 항목이 이 비율을 넘으면 힙 재구성
+    _COMPACT_RATIO = 0.5
+    _COMPACT_MIN_SIZE = 64
+    
+    # 시간대별 NPC 상호작용 확률
+    INTERACTION_PROBABILITIES = {
+        TimePeriod.MORNING: 0.3,
+        TimePeriod.AFTERNOON: 0.5,
+        TimePeriod.EVENING: 0.7,
+        TimePeriod.NIGHT: 0.1
+    }
+    
+    def __init__(self, seed: Optional[int] = None):
+        """
+        Args:
+            seed: 시뮬레이션 난수 시드 (None이면 비결정적)
+        """
         self.db = DatabaseConnection()
         self.current_time = GameTime()
         self.time_scale = TimeScale.REAL_TIME
         self.is_running = False
-        self.scheduled_events: List[ScheduledEvent] = []
+        self.is_headless = False
+        # 시뮬레이션 난수 (NPC 행동 등 시간 기반 확률 판정은 이 인스턴스를 사용)
+        self.rng = random.Random(seed)
+        self._seed = seed
+        # session_states 저장 주기 (게임 분 단위, 틱마다 저장하지 않음)
+        self.checkpoint_interval_minutes = GAME_CONFIG["time_checkpoint_interval_minutes"]
+        self._last_checkpoint_minute: Optional[int] = None
+        # 이벤트 스케줄러: 절대 게임 분 기준 최소 힙 + event_id 인덱스 (취소는 지연 삭제)
+        self._event_heap: List[tuple] = []
+        self._events: Dict[str, ScheduledEvent] = {}
+        self._event_seq = itertools.count()
+        self._cancelled_count = 0
+        self.persist_events = GAME_CONFIG["time_event_persistence"]
         self.tick_handlers: List[Callable] = []
         self.tick_interval = 1.0  # 초 단위
         self._tick_task: Optional[asyncio.Task] = None
         self._session_id: Optional[str] = None  # 현재 세션 ID 저장
         
+        # 트리거 이벤트 로그 배치 기록 (event_data는 JSONB 코덱 사용 → executemany)
+        self.event_log_sink = BatchedLogSink(
+            self.db,
+            "triggered_events",
+            columns=("session_id", "event_type", "event_data", "triggered_at"),
+            max_queue_size=GAME_CONFIG["log_sink_queue_size"],
+            batch_size=GAME_CONFIG["log_sink_batch_size"],
+            flush_interval=GAME_CONFIG["log_sink_flush_interval_seconds"],
+            policy=GAME_CONFIG["log_sink_backpressure"],
+            use_copy=False
+        )
+        
         # 시간 가속 배율 매핑
         self.scale_multipliers = {
             TimeScale.REAL_TIME: 1.0,
@@ -109,6 +179,7 @@ class TimeSystem:
         """TimeSystem 정리"""
         try:
             await self.stop()
+            await self.event_log_sink.close()
             await self.db.close()
             logger.info("TimeSystem 정리 완료")
         except Exception as e:
@@ -127,6 +198,12 @@ class TimeSystem:
             # 세션 상태 로드
             await self._load_session_state(session_id)
             
+            # 대기 이벤트 복원
+            if self.persist_events:
+                await self.load_scheduled_events(session_id)
+            
+            self._last_checkpoint_minute = self.current_time.to_minutes()
+            
             # 시간 시스템 시작
             self.is_running = True
             self._tick_task = asyncio.create_task(self._tick_loop())
@@ -141,8 +218,35 @@ class TimeSystem:
                 context=ErrorContext(session_id=session_id)
             )
     
+    async def start_headless(self, session_id: str):
+        """
+        헤드리스 시뮬레이션 시작 (틱 루프 없음)
+        
+        step/run_until로 시간을 명시적으로 진행합니다. 대기(sleep) 없이 가능한 한
+        빠르게 진행하며, session_states는 체크포인트 주기마다만 저장합니다.
+        """
+        if self.is_running:
+            raise BusinessLogicError(
+                message="틱 루프 실행 중에는 헤드리스 모드를 시작할 수 없습니다",
+                error_code="TIMESYSTEM_ALREADY_RUNNING",
+                context=ErrorContext(session_id=session_id)
+            )
+        
+        self._session_id = session_id
+        await self._load_session_state(session_id)
+        if self.persist_events:
+            await self.load_scheduled_events(session_id)
+        
+        self.is_headless = True
+        self._last_checkpoint_minute = self.current_time.to_minutes()
+        logger.info(f"TimeSystem 헤드리스 시작: {self.current_time} (Session: {session_id})")
+    
     async def stop(self):
         """시간 시스템 중지"""
+        if self.is_headless:
+            await self._stop_headless()
+            return
+        
         if not self.is_running:
             return
         
@@ -150,6 +254,8 @@ class TimeSystem:
             # 마지막 시간 상태 저장
             if self._session_id:
                 await self._save_time_state()
+                if self.persist_events:
+                    await self.save_scheduled_events(self._session_id)
             
             self.is_running = False
             
@@ -160,12 +266,30 @@ class TimeSystem:
                 except asyncio.CancelledError:
                     pass
             
+            # 대기 중인 이벤트 로그 기록
+            await self.event_log_sink.flush()
+            
             logger.info(f"TimeSystem 중지 (Session: {self._session_id})")
             self._session_id = None
             
         except Exception as e:
             logger.error(f"TimeSystem 중지 실패: {e}")
     
+    async def _stop_headless(self):
+        """헤드리스 시뮬레이션 종료 (최종 체크포인트 저장)"""
+        try:
+            if self._session_id:
+                await self._save_time_state()
+                if self.persist_events:
+                    await self.save_scheduled_events(self._session_id)
+            await self.event_log_sink.flush()
+            logger.info(f"TimeSystem 헤드리스 종료: {self.current_time} (Session: {self._session_id})")
+        except Exception as e:
+            logger.error(f"TimeSystem 헤드리스 종료 실패: {e}")
+        finally:
+            self.is_headless = False
+            self._session_id = None
+    
     async def _tick_loop(self):
         """시간 틱 루프"""
         while self.is_running:
@@ -179,8 +303,8 @@ class TimeSystem:
                 # 틱 핸들러 실행
                 await self._execute_tick_handlers()
                 
-                # DB에 시간 상태 저장
-                await self._save_time_state()
+                # DB에 시간 상태 저장 (체크포인트 주기마다)
+                await self._maybe_checkpoint()
                 
                 # 다음 틱까지 대기
                 await asyncio.sleep(self.tick_interval)
@@ -221,29 +345,145 @@ class TimeSystem:
             self.current_time.day += 1
     
     async def _check_scheduled_events(self):
-        """스케줄된 이벤트 확인"""
-        current_time = self.current_time
+        """
+        기한이 지난 스케줄 이벤트 실행
+        
+        현재 절대 게임 분 이하의 이벤트를 모두 꺼내 실행하므로, 한 틱에 여러 분이
+        진행되는 가속 모드에서도 건너뛴 분의 이벤트가 순서대로 실행됩니다.
+        """
+        now = self.current_time.to_minutes()
+        heap = self._event_heap
+        fired = 0
         
-        for event in self.scheduled_events:
+        while heap and heap[0][0] <= now:
+            due, _, event_id = heapq.heappop(heap)
+            event = self._events.get(event_id)
+            if event is None:
+                continue
             if not event.is_active:
+                # 취소된 이벤트 (지연 삭제)
+                del self._events[event_id]
+                self._cancelled_count -= 1
                 continue
             
-            # 이벤트 트리거 시간 확인
-            if (event.trigger_time.day == current_time.day and
-                event.trigger_time.hour == current_time.hour and
-                event.trigger_time.minute == current_time.minute):
-                
-                try:
-                    # 이벤트 실행
-                    await self._execute_event(event)
-                    
-                    # 반복 이벤트 처리
-                    if event.repeat_interval:
-                        event.trigger_time.minute += event.repeat_interval
-                        self._normalize_time()
-                    
-                except Exception as e:
-                    logger.error(f"이벤트 실행 실패: {event.event_name} - {e}")
+            # 실행 시각 고정 (반복 이벤트의 다음 시각 계산 기준)
+            event.trigger_time = GameTime.from_minutes(due)
+            try:
+                await self._execute_event(event)
+                fired += 1
+            except Exception as e:
+                logger.error(f"이벤트 실행 실패: {event.event_name} - {e}")
+            
+            # 핸들러에서 취소했을 수 있음
+            if not event.is_active:
+                if self._events.pop(event_id, None) is not None:
+                    self._cancelled_count -= 1
+                continue
+            
+            # 반복 이벤트 처리 (밀린 반복도 순서대로 따라잡음)
+            if event.repeat_interval and event.repeat_interval > 0:
+                next_due = due + event.repeat_interval
+                event.trigger_time = GameTime.from_minutes(next_due)
+                heapq.heappush(heap, (next_due, next(self._event_seq), event_id))
+            else:
+                del self._events[event_id]
+        
+        return fired
+    
+    def _compact_event_heap(self):
+        """취소된 항목이 많으면 힙 재구성"""
+        if (len(self._event_heap) < self._COMPACT_MIN_SIZE or
+                self._cancelled_count <= len(self._event_heap) * self._COMPACT_RATIO):
+            return
+        
+        self._events = {
+            event_id: event for event_id, event in self._events.items() if event.is_active
+        }
+        # 틱 처리 중에도 안전하도록 리스트를 제자리에서 교체
+        self._event_heap[:] = [entry for entry in self._event_heap if entry[2] in self._events]
+        heapq.heapify(self._event_heap)
+        self._cancelled_count = 0
+    
+    async def step(self, minutes: int = 1, tick_minutes: int = 1) -> int:
+        """
+        게임 시간을 minutes분 진행 (헤드리스 시뮬레이션)
+        
+        Returns:
+            실행된 이벤트 수
+        """
+        target = GameTime.from_minutes(self.current_time.to_minutes() + minutes)
+        return await self.run_until(target, tick_minutes=tick_minutes)
+    
+    async def run_until(self,
+                        target_time: GameTime,
+                        tick_minutes: int = 1,
+                        checkpoint_interval_minutes: Optional[int] = None) -> int:
+        """
+        target_time까지 대기 없이 게임 시간 진행 (헤드리스 시뮬레이션)
+        
+        틱 핸들러가 있으면 tick_minutes 단위로 진행하며 매 틱 핸들러를 실행합니다.
+        틱 핸들러가 없으면 다음 스케줄 이벤트 시각으로 바로 이동합니다.
+        session_states는 checkpoint_interval_minutes마다, 그리고 종료 시각에 저장합니다.
+        
+        Args:
+            target_time: 목표 게임 시간
+            tick_minutes: 틱 간격 (분)
+            checkpoint_interval_minutes: 체크포인트 주기 (None이면 checkpoint_interval_minutes 속성)
+            
+        Returns:
+            실행된 이벤트 수
+        """
+        if self.is_running:
+            raise BusinessLogicError(
+                message="틱 루프 실행 중에는 시간을 직접 진행할 수 없습니다",
+                error_code="TIMESYSTEM_ALREADY_RUNNING",
+                context=ErrorContext(session_id=self._session_id)
+            )
+        
+        tick_minutes = max(1, tick_minutes)
+        interval = checkpoint_interval_minutes or self.checkpoint_interval_minutes
+        now = self.current_time.to_minutes()
+        end = target_time.to_minutes()
+        fired = 0
+        
+        while now < end:
+            next_now = min(now + tick_minutes, end)
+            if not self.tick_handlers:
+                # 매 틱 실행할 핸들러가 없으면 다음 이벤트 시각으로 점프
+                next_due = self._next_due_minute()
+                next_now = end if next_due is None else max(next_now, min(next_due, end))
+            
+            self.current_time = GameTime.from_minutes(next_now)
+            fired += await self._check_scheduled_events()
+            if self.tick_handlers:
+                await self._execute_tick_handlers()
+            await self._maybe_checkpoint(interval)
+            now = next_now
+        
+        await self._maybe_checkpoint(interval, force=True)
+        return fired
+    
+    def _next_due_minute(self) -> Optional[int]:
+        next_time = self.next_event_time()
+        return next_time.to_minutes() if next_time is not None else None
+    
+    async def _maybe_checkpoint(self, interval: Optional[int] = None, force: bool = False):
+        """체크포인트 주기가 지났으면 시간 상태 저장 (틱마다 저장하지 않음)"""
+        if not self._session_id:
+            return
+        
+        now = self.current_time.to_minutes()
+        if self._last_checkpoint_minute is None:
+            self._last_checkpoint_minute = now
+        
+        interval = interval or self.checkpoint_interval_minutes
+        if not force and now - self._last_checkpoint_minute < interval:
+            return
+        if force and now == self._last_checkpoint_minute:
+            return
+        
+        await self._save_time_state()
+        self._last_checkpoint_minute = now
     
     async def _execute_event(self, event: ScheduledEvent):
         """이벤트 실행"""
@@ -259,18 +499,16 @@ class TimeSystem:
     async def _log_event(self, event: ScheduledEvent):
         """이벤트 로깅"""
         try:
-            pool = await self.db.pool
-            async with pool.acquire() as conn:
-                await conn.execute("""
-                    INSERT INTO runtime_data.triggered_events 
-                    (session_id, event_type, event_data, triggered_at)
-                    VALUES ($1, $2, $3, $4)
-                """, 
-                event.event_data.get("session_id"),
+            session_id = event.event_data.get("session_id")
+            if not session_id:
+                raise ValueError(f"session_id가 없는 이벤트는 기록할 수 없습니다: {event.event_name}")
+            
+            await self.event_log_sink.enqueue((
+                session_id,
                 event.event_type,
                 json.dumps(event.event_data),
                 datetime.now()
-                )
+            ))
         except Exception as e:
             logger.error(f"이벤트 로깅 실패: {e}")
     
@@ -368,10 +606,18 @@ class TimeSystem:
         trigger_time: GameTime,
         event_data: Dict[str, Any],
         handler: Optional[Callable] = None,
-        repeat_interval: Optional[int] = None
+        repeat_interval: Optional[int] = None,
+        event_id: Optional[str] = None
     ) -> str:
-        """이벤트 스케줄링"""
-        event_id = str(uuid.uuid4())
+        """
+        이벤트 스케줄링 (O(log n))
+        
+        현재 시각 이전의 trigger_time은 다음 틱에 바로 실행됩니다.
+        """
+        event_id = event_id or str(uuid.uuid4())
+        if event_id in self._events:
+            await self.cancel_event(event_id)
+            self._purge_event(event_id)
         
         event = ScheduledEvent(
             event_id=event_id,
@@ -383,19 +629,149 @@ class TimeSystem:
             repeat_interval=repeat_interval
         )
         
-        self.scheduled_events.append(event)
-        logger.info(f"📅 이벤트 스케줄링: {event_name} at {trigger_time}")
+        self._events[event_id] = event
+        heapq.heappush(self._event_heap, (trigger_time.to_minutes(), next(self._event_seq), event_id))
+        logger.debug(f"📅 이벤트 스케줄링: {event_name} at {trigger_time}")
         
         return event_id
     
     async def cancel_event(self, event_id: str) -> bool:
-        """이벤트 취소"""
-        for event in self.scheduled_events:
-            if event.event_id == event_id:
-                event.is_active = False
-                logger.info(f"이벤트 취소: {event.event_name}")
-                return True
-        return False
+        """이벤트 취소 (힙 항목은 실행 시점 또는 재구성 시 제거)"""
+        event = self._events.get(event_id)
+        if event is None or not event.is_active:
+            return False
+        
+        event.is_active = False
+        self._cancelled_count += 1
+        logger.info(f"이벤트 취소: {event.event_name}")
+        self._compact_event_heap()
+        return True
+    
+    def _purge_event(self, event_id: str):
+        """취소된 이벤트를 인덱스와 힙에서 즉시 제거 (같은 event_id 재스케줄용)"""
+        if self._events.pop(event_id, None) is None:
+            return
+        self._event_heap[:] = [entry for entry in self._event_heap if entry[2] != event_id]
+        heapq.heapify(self._event_heap)
+        self._cancelled_count -= 1
+    
+    @property
+    def scheduled_events(self) -> List[ScheduledEvent]:
+        """대기 중인 이벤트 (실행 전 취소된 이벤트 포함)"""
+        return list(self._events.values())
+    
+    def next_event_time(self) -> Optional[GameTime]:
+        """가장 빠른 대기 이벤트 시각"""
+        while self._event_heap:
+            due, _, event_id = self._event_heap[0]
+            event = self._events.get(event_id)
+            if event is not None and event.is_active:
+                return GameTime.from_minutes(due)
+            heapq.heappop(self._event_heap)
+            if event is not None:
+                del self._events[event_id]
+                self._cancelled_count -= 1
+        return None
+    
+    async def save_scheduled_events(self, session_id: str) -> int:
+        """
+        세션의 대기 이벤트를 game_data.time_events에 저장
+        
+        핸들러는 저장되지 않으며, 복원된 이벤트는 핸들러 없이 실행(기록)됩니다.
+        
+        Returns:
+            저장된 이벤트 수
+        """
+        if _as_uuid(session_id) is None:
+            logger.warning(f"대기 이벤트 저장 생략: UUID가 아닌 세션 ID ({session_id})")
+            return 0
+        
+        rows = []
+        for event in self._events.values():
+            if not event.is_active:
+                continue
+            if event.event_data.get("session_id", session_id) != session_id:
+                continue
+            event_uuid = _as_uuid(event.event_id)
+            event_data = event.event_data
+            if event_uuid is None:
+                # 사용자 지정 ID는 event_data에 보관하고 행 ID는 새로 발급 (복원 시 원래 ID 사용)
+                event_uuid = uuid.uuid4()
+                event_data = {**event_data, _CUSTOM_EVENT_ID_KEY: event.event_id}
+            rows.append((
+                str(event_uuid),
+                event.event_name,
+                event.event_type,
+                event.trigger_time.day,
+                event.trigger_time.hour,
+                event.trigger_time.minute,
+                encode_jsonb(event_data),
+                session_id,
+                event.repeat_interval
+            ))
+        
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    await conn.execute(
+                        "DELETE FROM game_data.time_events WHERE session_id = $1::uuid",
+                        session_id
+                    )
+                    if rows:
+                        await conn.executemany("""
+                            INSERT INTO game_data.time_events
+                            (event_id, event_name, event_type, trigger_day, trigger_hour, trigger_minute,
+                             event_data, is_active, session_id, repeat_interval)
+                            VALUES ($1::uuid, $2, $3, $4, $5, $6, $7::jsonb, true, $8::uuid, $9)
+                        """, rows)
+            logger.info(f"📅 대기 이벤트 저장: {len(rows)}개 (Session: {session_id})")
+            return len(rows)
+        except Exception as e:
+            logger.error(f"대기 이벤트 저장 실패: {e}")
+            return 0
+    
+    async def load_scheduled_events(self, session_id: str) -> int:
+        """
+        game_data.time_events에서 세션의 대기 이벤트 복원
+        
+        Returns:
+            복원된 이벤트 수
+        """
+        if _as_uuid(session_id) is None:
+            return 0
+        
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                rows = await conn.fetch("""
+                    SELECT event_id, event_name, event_type, trigger_day, trigger_hour,
+                           trigger_minute, event_data, repeat_interval
+                    FROM game_data.time_events
+                    WHERE session_id = $1::uuid AND is_active = true
+                """, session_id)
+        except Exception as e:
+            logger.error(f"대기 이벤트 복원 실패: {e}")
+            return 0
+        
+        for row in rows:
+            event_data = parse_jsonb_data(row['event_data']) or {}
+            event_id = event_data.pop(_CUSTOM_EVENT_ID_KEY, None) or str(row['event_id'])
+            await self.schedule_event(
+                event_name=row['event_name'],
+                event_type=row['event_type'],
+                trigger_time=GameTime(
+                    day=row['trigger_day'] or 1,
+                    hour=row['trigger_hour'] or 0,
+                    minute=row['trigger_minute'] or 0
+                ),
+                event_data=event_data,
+                repeat_interval=row['repeat_interval'],
+                event_id=event_id
+            )
+        
+        logger.info(f"📅 대기 이벤트 복원: {len(rows)}개 (Session: {session_id})")
+        return len(rows)
     
     def add_tick_handler(self, handler: Callable):
         """틱 핸들러 추가"""
@@ -417,6 +793,37 @@ class TimeSystem:
         """현재 시간 조회"""
         return self.current_time
     
+    def get_time_period(self) -> TimePeriod:
+        """현재 시간대 조회"""
+        hour = self.current_time.hour
+        if 6 <= hour < 12:
+            return TimePeriod.MORNING
+        if 12 <= hour < 18:
+            return TimePeriod.AFTERNOON
+        if 18 <= hour < 22:
+            return TimePeriod.EVENING
+        return TimePeriod.NIGHT
+    
+    def get_interaction_probability(self, time_period: Optional[TimePeriod] = None) -> float:
+        """시간대별 NPC 상호작용 확률"""
+        return self.INTERACTION_PROBABILITIES[time_period or self.get_time_period()]
+    
+    def seed(self, seed: Optional[int]):
+        """시뮬레이션 난수 시드 재설정 (재현 가능한 실행용)"""
+        self.rng.seed(seed)
+        self._seed = seed
+    
+    def rng_for(self, key: str) -> random.Random:
+        """
+        키(NPC ID 등)별 난수 (시드, 현재 게임 분, 키로 초기화)
+        
+        동시에 실행되는 루틴이 공유 난수를 쓰면 뽑는 순서가 I/O 타이밍에 따라 달라지므로,
+        키마다 독립된 난수를 사용해 시드 지정 시 실행 순서와 관계없이 재현 가능
+        """
+        if self._seed is None:
+            return random.Random()
+        return random.Random(f"{self._seed}:{self.current_time.to_minutes()}:{key}")
+    
     def set_time(self, time: GameTime):
         """시간 설정"""
         self.current_time = time
@@ -431,7 +838,7 @@ class TimeSystem:
     
     def get_scheduled_events(self) -> List[ScheduledEvent]:
         """스케줄된 이벤트 조회"""
-        return [event for event in self.scheduled_events if event.is_active]
+        return [event for event in self._events.values() if event.is_active]
     
     async def get_time_statistics(self) -> Dict[str, Any]:
         """시간 시스템 통계"""
@@ -3,8 +3,8 @@
 """
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Set
-import json
+from contextlib import asynccontextmanager
+from typing import Optional
 
 from app.api.routes import (
     regions, locations, cells, roads, pins, map_metadata, pin_connections,
@@ -12,47 +12,50 @@ from app.api.routes import (
     search, relationships, map_hierarchy, project
 )
 from app.api.routes import dialogue, dialogue_knowledge
+from database.connection import close_all_pools, get_pool_metrics
+from database.log_sink import close_all_log_sinks, get_log_sink_metrics
+from database.entity_state_store import entity_state_store
+from app.systems.session_clock import session_clock
+from app.systems.session_deltas import session_deltas
+from app.services.world_editor.spatial_index import world_spatial_index
+from database.cell_occupancy import cell_occupancy
+from database.save_slot_store import save_slot_store
+from common.utils.tracing import TracingMiddleware, tracer
+from app.core.session_registry import session_registry
+from app.core.session_reaper import session_reaper
+from app.ui.backend.websocket_hub import WebSocketHub, message_topics
 from common.utils.logger import logger
 
 
-# WebSocket 연결 관리자
-class ConnectionManager:
-    """WebSocket 연결 관리"""
-    
-    def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
-    
-    async def connect(self, websocket: WebSocket):
-        """연결 수락"""
-        await websocket.accept()
-        self.active_connections.add(websocket)
-        logger.info(f"WebSocket 연결: {len(self.active_connections)}개 활성 연결")
-    
-    def disconnect(self, websocket: WebSocket):
-        """연결 해제"""
-        self.active_connections.discard(websocket)
-        logger.info(f"WebSocket 연결 해제: {len(self.active_connections)}개 활성 연결")
-    
-    async def broadcast(self, message: dict):
-        """모든 연결에 메시지 브로드캐스트"""
-        disconnected = set()
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"브로드캐스트 실패: {e}")
-                disconnected.add(connection)
-        
-        # 연결 해제된 소켓 제거
-        for connection in disconnected:
-            self.disconnect(connection)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 수명 주기 (시작/종료 훅)"""
+    logger.info("World Editor API 서버 시작")
+    # 유휴 세션 회수 (GAME_CONFIG["session_reaper_enabled"]일 때만 실행)
+    session_reaper.start()
+    try:
+        yield
+    finally:
+        await session_reaper.close()
+        # 대기 중인 행동/이벤트 로그 기록 후 프로세스 공유 DB 연결 풀 정리
+        await close_all_log_sinks()
+        await entity_state_store.close()
+        await session_clock.close()
+        await manager.close()
+        await gameplay.gameplay_hub.close()
+        await session_deltas.close()
+        session_registry.clear()
+        await close_all_pools()
+        tracer.shutdown()
+        logger.info("World Editor API 서버 종료")
 
 
 # FastAPI 앱 생성
 app = FastAPI(
     title="World Editor API",
     version="1.0.0",
-    description="D&D 타운 스타일 월드 에디터 API"
+    description="D&D 타운 스타일 월드 에디터 API",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -64,6 +67,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 요청 트레이싱 (TRACING_ENABLED=false이면 그대로 통과)
+app.add_middleware(TracingMiddleware)
+
 # 라우터 등록
 app.include_router(regions.router, prefix="/api/regions", tags=["regions"])
 app.include_router(locations.router, prefix="/api/locations", tags=["locations"])
@@ -95,8 +101,15 @@ app.include_router(behavior_schedules.router, prefix="/api/behavior-schedules",
 from app.ui.backend.routes import gameplay
 app.include_router(gameplay.router)
 
-# WebSocket 연결 관리자
-manager = ConnectionManager()
+# WebSocket 연결 관리자 (연결별 송신 큐, 토픽 구독, 연속 업데이트 합치기)
+manager = WebSocketHub()
+
+# 동기화 메시지 타입 -> 합치기 기준 오브젝트 ID 키
+_SYNC_OBJECT_KEYS = {
+    "pin_update": "pin_id",
+    "road_update": "road_id",
+    "map_update": "map_id",
+}
 
 
 @app.websocket("/ws")
@@ -112,10 +125,24 @@ async def websocket_endpoint(websocket: WebSocket):
             
             if message_type == "ping":
                 # 핑 메시지 응답
-                await websocket.send_json({"type": "pong"})
-            elif message_type in ["pin_update", "road_update", "map_update"]:
-                # 변경사항을 다른 클라이언트에 브로드캐스트
-                await manager.broadcast(data)
+                manager.send(websocket, {"type": "pong"})
+            elif message_type in ("subscribe", "unsubscribe"):
+                # 지도 범위 구독 ("region:ID", "location:ID", "cell:ID")
+                topics = data.get("topics")
+                if message_type == "subscribe":
+                    current = manager.subscribe(websocket, topics or [])
+                else:
+                    current = manager.unsubscribe(websocket, topics)
+                manager.send(websocket, {"type": "subscribed", "topics": sorted(current)})
+            elif message_type in _SYNC_OBJECT_KEYS:
+                # 변경사항을 구독 중인 클라이언트에 브로드캐스트
+                payload = data.get("data")
+                object_id = payload.get(_SYNC_OBJECT_KEYS[message_type]) if isinstance(payload, dict) else None
+                manager.publish(
+                    data,
+                    topics=message_topics(payload) or None,
+                    coalesce_key=f"{message_type}:{object_id}" if object_id else None
+                )
             else:
                 logger.warning(f"알 수 없는 메시지 타입: {message_type}")
                 
@@ -150,14 +177,30 @@ async def health_check():
     return {"status": "healthy", "service": "World Editor API"}
 
 
-@app.on_event("startup")
-async def startup_event():
-    """애플리케이션 시작 시 실행"""
-    logger.info("World Editor API 서버 시작")
-
+@app.get("/health/db")
+async def database_health_check():
+    """DB 연결 풀 상태 (in_use, idle, 대기 시간, acquire 타임아웃), 로그 싱크, 엔티티 상태 저장소, 셀 점유 맵, 세션 게임 시계, 셀 공간 인덱스, WebSocket 팬아웃, 게임플레이 델타 채널, 저장 슬롯, 유휴 세션 회수 및 상주 세션 통계"""
+    return {
+        "status": "healthy",
+        "pools": get_pool_metrics(),
+        "log_sinks": get_log_sink_metrics(),
+        "entity_states": entity_state_store.snapshot(),
+        "cell_occupancy": cell_occupancy.snapshot(),
+        "session_clocks": session_clock.snapshot(),
+        "spatial_index": world_spatial_index.snapshot(),
+        "websocket": manager.snapshot(),
+        "gameplay_websocket": gameplay.gameplay_hub.snapshot(),
+        "session_deltas": session_deltas.snapshot(),
+        "save_slots": save_slot_store.snapshot(),
+        "session_reaper": session_reaper.snapshot(),
+        "sessions": session_registry.stats()
+    }
 
-@app.on_event("shutdown")
-async def shutdown_event():
-    """애플리케이션 종료 시 실행"""
-    logger.info("World Editor API 서버 종료")
 
+@app.get("/api/debug/traces")
+async def get_debug_traces(limit: int = 100, path_prefix: Optional[str] = None, min_duration_ms: float = 0.0):
+    """최근 요청 트레이스 (라우트, 서비스 호출 구간, DB 시간, 조회 행 수)"""
+    return {
+        "enabled": tracer.enabled,
+        "traces": tracer.get_traces(limit=limit, path_prefix=path_prefix, min_duration_ms=min_duration_ms)
+    }
@@ -1,8 +1,9 @@
 """
 게임플레이 API 라우트 (리팩토링 버전)
 """
+import uuid
 from typing import Optional, List, Dict, Any
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field, validator
 from app.services.gameplay import (
     GameService,
@@ -16,7 +17,10 @@ from app.services.gameplay import (
     MapService,
     ExplorationService
 )
+from app.systems.session_deltas import session_deltas
+from app.ui.backend.websocket_hub import WebSocketHub
 from common.utils.logger import logger
+from common.utils.tracing import trace_span
 
 router = APIRouter(prefix="/api/gameplay", tags=["gameplay"])
 
@@ -103,6 +107,13 @@ def get_exploration_service() -> ExplorationService:
     return _exploration_service
 
 
+# 게임플레이 델타 WebSocket 연결 (연결별 송신 큐, 느린 소비자 퇴출)
+gameplay_hub = WebSocketHub()
+
+# 상태 변경 델타 이후 사용 가능한 액션 목록 재계산 (ActionService 메모이즈 사용)
+session_deltas.actions_provider = lambda session_id: get_action_service().get_available_actions(session_id)
+
+
 # 요청/응답 스키마
 class StartGameRequest(BaseModel):
     player_template_id: str
@@ -185,6 +196,7 @@ class SaveGameResponse(BaseModel):
     success: bool
     message: str
     slot_id: int
+    save_kind: Optional[str] = None  # full | incremental
 
 class LoadGameRequest(BaseModel):
     slot_id: int
@@ -315,51 +327,20 @@ async def get_current_cell(session_id: str):
 @router.post("/move", response_model=MovePlayerResponse)
 async def move_player(request: MovePlayerRequest):
     """플레이어 이동"""
-    # #region agent log
-    import json as json_module
-    import traceback
-    try:
-        with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-            f.write(json_module.dumps({"location":"gameplay.py:271","message":"move_player API 진입","data":{"session_id":request.session_id,"target_cell_id":request.target_cell_id},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"B"}) + "\n")
-    except: pass
-    # #endregion
     try:
         service = get_cell_service()
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:277","message":"CellService.move_player 호출 전","data":{"session_id":request.session_id,"target_cell_id":request.target_cell_id},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"B"}) + "\n")
-        except: pass
-        # #endregion
-        result = await service.move_player(
-            session_id=request.session_id,
-            target_cell_id=request.target_cell_id
-        )
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:285","message":"CellService.move_player 성공","data":{"session_id":request.session_id,"has_result":bool(result)},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"B"}) + "\n")
-        except: pass
-        # #endregion
+        with trace_span("CellService.move_player", session_id=request.session_id):
+            result = await service.move_player(
+                session_id=request.session_id,
+                target_cell_id=request.target_cell_id
+            )
         return MovePlayerResponse(**result)
     except ValueError as e:
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:291","message":"move_player ValueError","data":{"session_id":request.session_id,"error":str(e)},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"B"}) + "\n")
-        except: pass
-        # #endregion
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:299","message":"move_player 예외 발생","data":{"session_id":request.session_id,"error":str(e),"error_type":type(e).__name__,"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"B"}) + "\n")
-        except: pass
-        # #endregion
         logger.error(f"이동 실패: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -399,41 +380,16 @@ async def start_dialogue(request: StartDialogueRequest):
 @router.post("/dialogue/choice")
 async def process_dialogue_choice(request: ProcessDialogueChoiceRequest):
     """대화 선택지 처리"""
-    # #region agent log
-    import json as json_module
-    import traceback
-    try:
-        with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-            f.write(json_module.dumps({"location":"gameplay.py:354","message":"process_dialogue_choice API 진입","data":{"session_id":request.session_id,"dialogue_id":request.dialogue_id,"choice_id":request.choice_id},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"C"}) + "\n")
-    except: pass
-    # #endregion
     try:
         service = get_dialogue_service()
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:361","message":"DialogueService.process_dialogue_choice 호출 전","data":{"session_id":request.session_id,"dialogue_id":request.dialogue_id,"choice_id":request.choice_id},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"C"}) + "\n")
-        except: pass
-        # #endregion
-        result = await service.process_dialogue_choice(
-            session_id=request.session_id,
-            dialogue_id=request.dialogue_id,
-            choice_id=request.choice_id
-        )
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:368","message":"DialogueService.process_dialogue_choice 성공","data":{"session_id":request.session_id,"has_result":bool(result),"result_keys":list(result.keys()) if isinstance(result,dict) else None},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"C"}) + "\n")
-        except: pass
-        # #endregion
+        with trace_span("DialogueService.process_dialogue_choice", session_id=request.session_id):
+            result = await service.process_dialogue_choice(
+                session_id=request.session_id,
+                dialogue_id=request.dialogue_id,
+                choice_id=request.choice_id
+            )
         return result
     except Exception as e:
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:373","message":"process_dialogue_choice 예외 발생","data":{"session_id":request.session_id,"dialogue_id":request.dialogue_id,"choice_id":request.choice_id,"error":str(e),"error_type":type(e).__name__,"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"C"}) + "\n")
-        except: pass
-        # #endregion
         logger.error(f"대화 선택지 처리 실패: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -466,14 +422,6 @@ async def interact_with_entity(request: InteractRequest):
 @router.post("/interact/object", response_model=InteractResponse)
 async def interact_with_object(request: InteractObjectRequest):
     """오브젝트와 상호작용"""
-    # #region agent log
-    import json as json_module
-    import traceback
-    try:
-        with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-            f.write(json_module.dumps({"location":"gameplay.py:421","message":"interact_with_object API 진입","data":{"session_id":request.session_id,"object_id":request.object_id,"action_type":request.action_type},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"F"}) + "\n")
-    except: pass
-    # #endregion
     try:
         # 입력 검증
         if not request.session_id:
@@ -489,47 +437,25 @@ async def interact_with_object(request: InteractObjectRequest):
         
         logger.info(f"오브젝트 상호작용 요청: session_id={request.session_id}, object_id={request.object_id} (type={type(request.object_id).__name__}), action_type={request.action_type}")
         service = get_interaction_service()
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:442","message":"InteractionService.interact_with_object 호출 전","data":{"session_id":request.session_id,"object_id":request.object_id},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"F"}) + "\n")
-        except: pass
-        # #endregion
-        result = await service.interact_with_object(
-            session_id=request.session_id,
-            object_id=request.object_id,
-            action_type=request.action_type
-        )
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:450","message":"InteractionService.interact_with_object 성공","data":{"success":result.get('success'),"message":result.get('message')},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"F"}) + "\n")
-        except: pass
-        # #endregion
+        with trace_span("InteractionService.interact_with_object", session_id=request.session_id,
+                        action_type=request.action_type):
+            result = await service.interact_with_object(
+                session_id=request.session_id,
+                object_id=request.object_id,
+                action_type=request.action_type
+            )
         logger.info(f"오브젝트 상호작용 성공: {result.get('message', '')}")
         return InteractResponse(**result)
     except HTTPException:
         raise
     except ValueError as e:
         logger.warning(f"오브젝트 상호작용 실패 (ValueError): {str(e)}")
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:461","message":"interact_with_object ValueError","data":{"error":str(e)},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"F"}) + "\n")
-        except: pass
-        # #endregion
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e)
         )
     except Exception as e:
         logger.error(f"오브젝트 상호작용 실패: {str(e)}", exc_info=True)
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:470","message":"interact_with_object 예외 발생","data":{"error":str(e),"error_type":type(e).__name__,"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"F"}) + "\n")
-        except: pass
-        # #endregion
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"오브젝트 상호작용 실패: {str(e)}"
@@ -715,25 +641,11 @@ async def drop_item(request: ItemActionRequest):
 @router.get("/actions/{session_id}")
 async def get_available_actions(session_id: str):
     """사용 가능한 액션 조회"""
-    # #region agent log
-    import json as json_module
-    import traceback
-    try:
-        with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-            f.write(json_module.dumps({"location":"gameplay.py:638","message":"get_available_actions API 진입","data":{"session_id":session_id,"session_id_length":len(session_id) if session_id else 0},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"G"}) + "\n")
-    except: pass
-    # #endregion
     # UUID 형식 검증
     try:
         import uuid
         uuid.UUID(session_id)
     except ValueError as e:
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:645","message":"get_available_actions UUID 검증 실패","data":{"session_id":session_id,"error":str(e)},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"G"}) + "\n")
-        except: pass
-        # #endregion
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"잘못된 세션 ID 형식: {session_id}"
@@ -741,40 +653,19 @@ async def get_available_actions(session_id: str):
     
     try:
         service = get_action_service()
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:653","message":"ActionService.get_available_actions 호출 전","data":{"session_id":session_id},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"G"}) + "\n")
-        except: pass
-        # #endregion
-        result = await service.get_available_actions(session_id)
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:656","message":"ActionService.get_available_actions 성공","data":{"actions_count":len(result) if isinstance(result, list) else 0},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"G"}) + "\n")
-        except: pass
-        # #endregion
+        with trace_span("ActionService.get_available_actions", session_id=session_id) as span:
+            result = await service.get_available_actions(session_id)
+            if isinstance(result, list):
+                span.set(actions=len(result))
         return result
     except ValueError as e:
         logger.error(f"액션 조회 실패 (ValueError): {str(e)}")
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:662","message":"get_available_actions ValueError","data":{"error":str(e)},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"G"}) + "\n")
-        except: pass
-        # #endregion
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
     except Exception as e:
         logger.error(f"액션 조회 실패: {str(e)}", exc_info=True)
-        # #region agent log
-        try:
-            with open('c:\\hobby\\rpg_engine\\.cursor\\debug.log', 'a', encoding='utf-8') as f:
-                f.write(json_module.dumps({"location":"gameplay.py:670","message":"get_available_actions 예외 발생","data":{"error":str(e),"error_type":type(e).__name__,"traceback":traceback.format_exc()},"timestamp":int(__import__('time').time()*1000),"sessionId":"debug-session","runId":"run1","hypothesisId":"G"}) + "\n")
-        except: pass
-        # #endregion
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"액션 조회 실패: {str(e)}"
@@ -1389,3 +1280,85 @@ async def get_exploration_progress(
             detail=f"탐험 진행도 조회 실패: {str(e)}"
         )
 
+
+# 게임플레이 델타 채널
+
+async def _send_snapshot(websocket: WebSocket, session_id: str) -> None:
+    """
+    재동기화 스냅샷 전송 (게임 상태 + 현재 셀 + 사용 가능한 액션)
+
+    seq는 스냅샷을 만들기 전에 읽으므로, 만드는 동안 발행된 델타는 클라이언트가 이어서 적용합니다.
+    """
+    position = session_deltas.position(session_id)
+    if position is None:
+        return
+    stream_id, seq = position
+
+    state = await get_game_service().get_game_state(session_id)
+    session_deltas.watch(session_id, state.get("player_id"), state.get("current_cell_id"))
+    cell = await get_cell_service().get_current_cell(session_id)
+    actions = await get_action_service().get_available_actions(session_id)
+    session_deltas.remember_actions(session_id, actions)
+
+    gameplay_hub.send(websocket, {
+        "type": "snapshot",
+        "stream": stream_id,
+        "seq": seq,
+        "data": {"state": state, "cell": cell, "actions": actions}
+    })
+
+
+@router.websocket("/ws/{session_id}")
+async def gameplay_delta_channel(websocket: WebSocket, session_id: str):
+    """
+    게임플레이 델타 채널
+
+    서버 -> 클라이언트:
+        {"type": "snapshot", "stream", "seq", "data": {"state", "cell", "actions"}}
+        {"type": "delta", "stream", "seq", "kind", "data"}
+        {"type": "resync", "stream"}  (불러오기 등으로 상태 전체가 바뀜 -> snapshot 요청)
+    클라이언트 -> 서버:
+        {"type": "resume", "stream", "last_seq"}  (seq 누락 시, 버퍼에 없으면 스냅샷으로 응답)
+        {"type": "snapshot"}, {"type": "ping"}
+    """
+    try:
+        uuid.UUID(session_id)
+    except ValueError:
+        await websocket.close(code=1008)
+        return
+
+    await gameplay_hub.connect(websocket)
+    token = session_deltas.attach(session_id, lambda message: gameplay_hub.send(websocket, message))
+    try:
+        await _send_snapshot(websocket, session_id)
+        while True:
+            data = await websocket.receive_json()
+            message_type = data.get("type")
+
+            if message_type == "ping":
+                gameplay_hub.send(websocket, {"type": "pong"})
+            elif message_type == "resume":
+                missed = session_deltas.replay(session_id, data.get("stream"), data.get("last_seq"))
+                if missed is None:
+                    await _send_snapshot(websocket, session_id)
+                else:
+                    for message in missed:
+                        gameplay_hub.send(websocket, message)
+            elif message_type == "snapshot":
+                await _send_snapshot(websocket, session_id)
+            else:
+                logger.warning(f"알 수 없는 게임플레이 메시지 타입: {message_type}")
+
+    except WebSocketDisconnect:
+        pass
+    except ValueError as e:
+        # 세션/플레이어를 찾을 수 없음 (close reason은 123바이트 제한)
+        try:
+            await websocket.close(code=1008, reason=str(e).encode("utf-8")[:120].decode("utf-8", "ignore"))
+        except Exception:
+            pass
+    except Exception as e:
+        logger.error(f"게임플레이 WebSocket 오류: {str(e)}")
+    finally:
+        session_deltas.detach(session_id, token)
+        gameplay_hub.disconnect(websocket)
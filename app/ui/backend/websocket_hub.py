@@ -0,0 +1,402 @@
+"""
+WebSocket 팬아웃 허브 (월드 에디터 실시간 동기화)
+
+연결마다 크기가 제한된 송신 큐와 writer 태스크를 두어
+느린 클라이언트 하나가 다른 클라이언트의 브로드캐스트를 막지 않도록 합니다.
+
+- publish(): 메시지를 한 번만 직렬화해 대상 연결 큐에 넣음 (await 없음)
+- 큐가 가득 찬 연결(느린 소비자)은 퇴출하고 소켓을 1013(Try Again Later)으로 닫음
+- 토픽 구독: "region:ID", "location:ID", "cell:ID" (구독이 없는 연결은 모든 메시지 수신)
+- coalesce_key가 같은 메시지(드래그 중 연속 pin_update 등)는 flush 주기마다 마지막 상태 하나만 전송
+
+사용 예:
+    hub = WebSocketHub()
+    await hub.connect(websocket)
+    hub.subscribe(websocket, ["region:REG_001"])
+    hub.publish({"type": "pin_update", "data": {...}}, topics=["region:REG_001"],
+                coalesce_key="pin_update:PIN_001")
+"""
+import asyncio
+import json
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from app.config.app_config import WEBSOCKET_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 토픽 범위 (메시지 data의 키 -> 토픽 접두사)
+TOPIC_SCOPES: Tuple[Tuple[str, str], ...] = (
+    ("region_id", "region"),
+    ("location_id", "location"),
+    ("cell_id", "cell"),
+)
+
+# 느린 소비자 퇴출 시 close 코드 (1013: Try Again Later)
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+def message_topics(data: Optional[Dict[str, Any]]) -> List[str]:
+    """
+    메시지 data의 범위 키로 토픽 목록 생성
+
+    예: {"region_id": "REG_1", "cell_id": "CELL_1"} -> ["region:REG_1", "cell:CELL_1"]
+    """
+    if not isinstance(data, dict):
+        return []
+    return [f"{scope}:{data[key]}" for key, scope in TOPIC_SCOPES if data.get(key)]
+
+
+@dataclass
+class WebSocketHubMetrics:
+    """팬아웃 통계"""
+    published: int = 0
+    coalesced: int = 0
+    enqueued: int = 0
+    sent: int = 0
+    send_failures: int = 0
+    evicted: int = 0
+    flushes: int = 0
+    last_flush_ms: float = 0.0
+
+
+class _Subscriber:
+    __slots__ = ("websocket", "topics", "queue", "task")
+
+    def __init__(self, websocket: Any, queue_size: int):
+        self.websocket = websocket
+        self.topics: Set[str] = set()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+
+
+class WebSocketHub:
+    """토픽 기반 WebSocket 팬아웃"""
+
+    def __init__(self,
+                 queue_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None,
+                 send_timeout: Optional[float] = None):
+        """
+        Args:
+            queue_size: 연결별 송신 큐 크기 (가득 차면 퇴출, 기본: WEBSOCKET_CONFIG["send_queue_size"])
+            flush_interval: 합쳐진 메시지 전송 주기 (초, 기본: WEBSOCKET_CONFIG["coalesce_interval_seconds"])
+            send_timeout: 메시지 하나의 전송 제한 시간 (초, 기본: WEBSOCKET_CONFIG["send_timeout_seconds"])
+        """
+        self.queue_size = queue_size or WEBSOCKET_CONFIG["send_queue_size"]
+        self.flush_interval = flush_interval or WEBSOCKET_CONFIG["coalesce_interval_seconds"]
+        self.send_timeout = send_timeout or WEBSOCKET_CONFIG["send_timeout_seconds"]
+        self.metrics = WebSocketHubMetrics()
+
+        self._subscribers: Dict[Any, _Subscriber] = {}
+        # 구독이 없는 연결 (모든 메시지 수신) / 토픽별 구독 연결
+        self._wildcard: Set[_Subscriber] = set()
+        self._by_topic: Dict[str, Set[_Subscriber]] = {}
+        # coalesce_key -> (메시지, 토픽, 제외 연결)
+        self._pending: Dict[str, Tuple[Dict[str, Any], Optional[Tuple[str, ...]], Any]] = {}
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+
+    @property
+    def active_connections(self) -> Set[Any]:
+        """현재 연결된 WebSocket 집합"""
+        return set(self._subscribers)
+
+    # ------------------------------------------------------------------
+    # 연결/구독
+    # ------------------------------------------------------------------
+
+    async def connect(self, websocket: Any, topics: Optional[Iterable[str]] = None) -> None:
+        """연결 수락 후 writer 태스크 시작"""
+        await websocket.accept()
+        subscriber = _Subscriber(websocket, self.queue_size)
+        self._subscribers[websocket] = subscriber
+        self._wildcard.add(subscriber)
+        if topics:
+            self.subscribe(websocket, topics)
+        subscriber.task = asyncio.get_running_loop().create_task(self._writer(subscriber))
+        logger.info(f"WebSocket 연결: {len(self._subscribers)}개 활성 연결")
+
+    def disconnect(self, websocket: Any) -> None:
+        """연결 해제 (이미 해제된 연결은 무시)"""
+        subscriber = self._remove(websocket)
+        if subscriber is None:
+            return
+        if subscriber.task is not None and subscriber.task is not _current_task():
+            subscriber.task.cancel()
+        logger.info(f"WebSocket 연결 해제: {len(self._subscribers)}개 활성 연결")
+
+    def subscribe(self, websocket: Any, topics: Iterable[str]) -> Set[str]:
+        """
+        토픽 구독 추가
+
+        Returns:
+            연결의 현재 구독 토픽
+        """
+        subscriber = self._subscribers.get(websocket)
+        if subscriber is None:
+            return set()
+        if isinstance(topics, str):
+            topics = [topics]
+        for topic in topics:
+            topic = str(topic)
+            if topic in subscriber.topics:
+                continue
+            subscriber.topics.add(topic)
+            self._by_topic.setdefault(topic, set()).add(subscriber)
+        if subscriber.topics:
+            self._wildcard.discard(subscriber)
+        return set(subscriber.topics)
+
+    def unsubscribe(self, websocket: Any, topics: Optional[Iterable[str]] = None) -> Set[str]:
+        """
+        토픽 구독 해제 (topics가 없으면 전체 해제 -> 모든 메시지 수신으로 복귀)
+
+        Returns:
+            연결의 현재 구독 토픽
+        """
+        subscriber = self._subscribers.get(websocket)
+        if subscriber is None:
+            return set()
+        if isinstance(topics, str):
+            topics = [topics]
+        for topic in list(subscriber.topics if topics is None else map(str, topics)):
+            if topic not in subscriber.topics:
+                continue
+            subscriber.topics.discard(topic)
+            self._drop_topic_member(topic, subscriber)
+        if not subscriber.topics:
+            self._wildcard.add(subscriber)
+        return set(subscriber.topics)
+
+    def _drop_topic_member(self, topic: str, subscriber: _Subscriber) -> None:
+        members = self._by_topic.get(topic)
+        if members is not None:
+            members.discard(subscriber)
+            if not members:
+                del self._by_topic[topic]
+
+    def _remove(self, websocket: Any) -> Optional[_Subscriber]:
+        subscriber = self._subscribers.pop(websocket, None)
+        if subscriber is None:
+            return None
+        self._wildcard.discard(subscriber)
+        for topic in subscriber.topics:
+            self._drop_topic_member(topic, subscriber)
+        return subscriber
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+
+    def publish(self,
+                message: Dict[str, Any],
+                topics: Optional[Iterable[str]] = None,
+                coalesce_key: Optional[str] = None,
+                exclude: Any = None) -> int:
+        """
+        메시지 발행 (송신 큐에 넣기만 하고 전송을 기다리지 않음)
+
+        Args:
+            message: JSON 직렬화 가능한 메시지
+            topics: 메시지 토픽 (없으면 모든 연결에 전송)
+            coalesce_key: 같은 키의 메시지는 flush 주기 동안 마지막 하나만 전송
+            exclude: 전송에서 제외할 연결 (보낸 클라이언트 등)
+
+        Returns:
+            큐에 넣은 연결 수 (합쳐지는 메시지는 0)
+        """
+        self.metrics.published += 1
+        topic_tuple = tuple(topics) if topics else None
+        if coalesce_key is not None:
+            if coalesce_key in self._pending:
+                self.metrics.coalesced += 1
+            self._pending[coalesce_key] = (message, topic_tuple, exclude)
+            self._ensure_flusher()
+            return 0
+        return self._fanout(json.dumps(message, ensure_ascii=False), topic_tuple, exclude)
+
+    def send(self, websocket: Any, message: Dict[str, Any]) -> bool:
+        """
+        한 연결에만 메시지 전송 (pong 등 응답도 writer 태스크를 거쳐 전송 순서 유지)
+
+        Returns:
+            큐에 넣었으면 True (연결이 없거나 퇴출되면 False)
+        """
+        subscriber = self._subscribers.get(websocket)
+        if subscriber is None:
+            return False
+        try:
+            subscriber.queue.put_nowait(json.dumps(message, ensure_ascii=False))
+        except asyncio.QueueFull:
+            self._evict(subscriber)
+            return False
+        self.metrics.enqueued += 1
+        return True
+
+    def _recipients(self, topics: Optional[Tuple[str, ...]]) -> Set[_Subscriber]:
+        if topics is None:
+            return set(self._subscribers.values())
+        recipients = set(self._wildcard)
+        for topic in topics:
+            members = self._by_topic.get(topic)
+            if members:
+                recipients |= members
+        return recipients
+
+    def _fanout(self, text: str, topics: Optional[Tuple[str, ...]], exclude: Any) -> int:
+        """직렬화된 메시지를 대상 연결 큐에 넣고, 큐가 가득 찬 연결은 퇴출"""
+        delivered = 0
+        slow: List[_Subscriber] = []
+        for subscriber in self._recipients(topics):
+            if subscriber.websocket is exclude:
+                continue
+            try:
+                subscriber.queue.put_nowait(text)
+                delivered += 1
+            except asyncio.QueueFull:
+                slow.append(subscriber)
+
+        for subscriber in slow:
+            self._evict(subscriber)
+        self.metrics.enqueued += delivered
+        return delivered
+
+    def _evict(self, subscriber: _Subscriber) -> None:
+        """느린 소비자 퇴출 (큐를 비우고 소켓 종료)"""
+        if self._remove(subscriber.websocket) is None:
+            return
+        self.metrics.evicted += 1
+        logger.warning(
+            f"WebSocket 느린 소비자 퇴출: 송신 큐 {subscriber.queue.qsize()}/{self.queue_size}, "
+            f"{len(self._subscribers)}개 활성 연결"
+        )
+        if subscriber.task is not None:
+            subscriber.task.cancel()
+        asyncio.get_running_loop().create_task(
+            _close_quietly(subscriber.websocket, SLOW_CONSUMER_CLOSE_CODE)
+        )
+
+    async def _writer(self, subscriber: _Subscriber) -> None:
+        """연결별 송신 루프 (전송 실패/제한 시간 초과 시 연결 해제)"""
+        websocket = subscriber.websocket
+        try:
+            while True:
+                text = await subscriber.queue.get()
+                await self._send_with_timeout(websocket, text)
+                self.metrics.sent += 1
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            self.metrics.send_failures += 1
+            logger.error(f"브로드캐스트 실패: {e}")
+            if self._remove(websocket) is not None:
+                await _close_quietly(websocket, SLOW_CONSUMER_CLOSE_CODE)
+
+    async def _send_with_timeout(self, websocket: Any, text: str) -> None:
+        """
+        제한 시간 내 전송 (초과 시 asyncio.TimeoutError)
+
+        asyncio.wait_for는 전송 완료와 취소가 겹치면 취소를 삼킬 수 있어(Python 3.11 이하)
+        종료 시 writer가 멈추지 않도록 asyncio.wait로 직접 처리합니다.
+        """
+        send = asyncio.ensure_future(websocket.send_text(text))
+        try:
+            done, _ = await asyncio.wait((send,), timeout=self.send_timeout)
+        finally:
+            if not send.done():
+                send.cancel()
+        if not done:
+            raise asyncio.TimeoutError(f"전송 제한 시간 초과 ({self.send_timeout}초)")
+        send.result()
+
+    # ------------------------------------------------------------------
+    # 합쳐진 메시지 flush
+    # ------------------------------------------------------------------
+
+    def _ensure_flusher(self) -> None:
+        """현재 이벤트 루프에 flusher 태스크 준비 (지연 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._flusher_task = None
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = loop.create_task(self._flusher_loop())
+
+    async def _flusher_loop(self) -> None:
+        """주기마다 합쳐진 메시지 전송 (대기 메시지가 없으면 종료)"""
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        합쳐진 메시지를 키별 마지막 상태로 전송
+
+        Returns:
+            전송한 메시지 수
+        """
+        if not self._pending:
+            return 0
+        started = time.perf_counter()
+        pending, self._pending = self._pending, {}
+        for message, topics, exclude in pending.values():
+            self._fanout(json.dumps(message, ensure_ascii=False), topics, exclude)
+        self.metrics.flushes += 1
+        self.metrics.last_flush_ms = (time.perf_counter() - started) * 1000
+        return len(pending)
+
+    async def close(self) -> None:
+        """대기 메시지를 버리고 모든 writer/flusher 종료 (애플리케이션 종료 시)"""
+        self._pending.clear()
+        tasks = [self._flusher_task] if self._flusher_task is not None else []
+        self._flusher_task = None
+        for websocket in list(self._subscribers):
+            subscriber = self._remove(websocket)
+            if subscriber.task is not None:
+                tasks.append(subscriber.task)
+
+        current_loop = asyncio.get_running_loop()
+        tasks = [task for task in tasks if not task.done() and task.get_loop() is current_loop]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        subscribers = self._subscribers.values()
+        return {
+            "connections": len(self._subscribers),
+            "topics": len(self._by_topic),
+            "pending_coalesced": len(self._pending),
+            "queued": sum(subscriber.queue.qsize() for subscriber in subscribers),
+            "max_queued": max((subscriber.queue.qsize() for subscriber in subscribers), default=0),
+            "published": metrics.published,
+            "coalesced": metrics.coalesced,
+            "enqueued": metrics.enqueued,
+            "sent": metrics.sent,
+            "send_failures": metrics.send_failures,
+            "evicted": metrics.evicted,
+            "flushes": metrics.flushes,
+            "last_flush_ms": metrics.last_flush_ms,
+        }
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return None
+
+
+async def _close_quietly(websocket: Any, code: int) -> None:
+    try:
+        await websocket.close(code=code)
+    except Exception:
+        # 이미 닫혔거나 핸드셰이크 전 연결
+        pass
@@ -22,6 +22,7 @@ import type { GameScreenType } from '../../hooks/game/useGameNavigation';
 import { useObjectInteraction } from '../../hooks/game/useObjectInteraction';
 import { useEntityInteraction } from '../../hooks/game/useEntityInteraction';
 import { useContextMenuActions } from '../../hooks/game/useContextMenuActions';
+import { useGameDeltas } from '../../hooks/game/useGameDeltas';
 
 interface GameViewProps {
   onNavigate?: (screen: GameScreenType) => void;
@@ -42,6 +43,8 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
     isSkipMode,
     setSkipMode,
     addHistory,
+    deltaConnected,
+    availableActions: pushedActions,
   } = useGameStore();
   
   const [availableActions, setAvailableActions] = useState<GameAction[]>([]);
@@ -58,6 +61,22 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
   const [pickupObjectName, setPickupObjectName] = useState<string>('');
   const autoTimerRef = useRef<number | null>(null);
 
+  // 델타 채널 연결 (연결된 동안 액션 목록은 서버가 변경 시 푸시)
+  useGameDeltas();
+
+  useEffect(() => {
+    if (pushedActions) {
+      setAvailableActions(pushedActions);
+    }
+  }, [pushedActions]);
+
+  // 델타 채널이 끊긴 경우에만 HTTP로 액션 목록 재조회
+  const refreshActions = useCallback(async (sessionId: string) => {
+    if (deltaConnected) return;
+    const actions = await gameApi.getAvailableActions(sessionId);
+    setAvailableActions(actions);
+  }, [deltaConnected]);
+
   // Hooks for interaction handling
   const { handleObjectAction } = useObjectInteraction({
     onPickupRequest: (objectId, objectName) => {
@@ -70,8 +89,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
         // 발견된 오브젝트 초기화
         setDiscoveredObjects(new Set());
         // 새로운 액션 조회
-        const actions = await gameApi.getAvailableActions(gameState.session_id);
-        setAvailableActions(actions);
+        await refreshActions(gameState.session_id);
       }
     },
   });
@@ -222,8 +240,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
             });
             
             // 새로운 액션 조회
-            const actions = await gameApi.getAvailableActions(gameState.session_id);
-            setAvailableActions(actions);
+            await refreshActions(gameState.session_id);
             
             // 발견된 오브젝트 초기화 (새 셀에서는 아직 발견하지 않음)
             setDiscoveredObjects(new Set());
@@ -290,8 +307,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
               
               // 새로운 액션 조회 (개별 오브젝트 및 NPC 액션 포함)
               try {
-                const actions = await gameApi.getAvailableActions(gameState.session_id);
-                setAvailableActions(actions);
+                await refreshActions(gameState.session_id);
               } catch (error) {
                 console.error('액션 조회 실패:', error);
                 setError('액션을 불러오는데 실패했습니다. 페이지를 새로고침해주세요.');
@@ -330,8 +346,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
                 });
                 
                 // 엔티티 조사 후 액션 목록 업데이트
-                const actions = await gameApi.getAvailableActions(gameState.session_id);
-                setAvailableActions(actions);
+                await refreshActions(gameState.session_id);
               } catch (error) {
                 setCurrentMessage({
                   text: action.description || `${action.target_name}를 살펴봅니다.`,
@@ -355,8 +370,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
                 });
                 
                 // 오브젝트 조사 후 액션 목록 업데이트 (해당 오브젝트에 대한 액션들이 나타남)
-                const actions = await gameApi.getAvailableActions(gameState.session_id);
-                setAvailableActions(actions);
+                await refreshActions(gameState.session_id);
               } catch (error) {
                 setCurrentMessage({
                   text: action.description || `${action.target_name}를 살펴봅니다.`,
@@ -399,8 +413,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
               if (['open', 'close', 'light', 'extinguish'].includes(action.action_type)) {
                 const cell = await gameApi.getCurrentCell(gameState.session_id);
                 setCurrentCell(cell);
-                const actions = await gameApi.getAvailableActions(gameState.session_id);
-                setAvailableActions(actions);
+                await refreshActions(gameState.session_id);
               }
             } catch (error) {
               setError(error instanceof Error ? error.message : '상호작용 실패');
@@ -744,8 +757,7 @@ export const GameView: React.FC<GameViewProps> = ({ onNavigate }) => {
               if (response.success) {
                 const cell = await gameApi.getCurrentCell(gameState.session_id);
                 setCurrentCell(cell);
-                const actions = await gameApi.getAvailableActions(gameState.session_id);
-                setAvailableActions(actions);
+                await refreshActions(gameState.session_id);
               }
             } catch (error) {
               console.error('아이템 획득 실패:', error);
@@ -0,0 +1,46 @@
+/**
+ * 게임플레이 델타 채널 Hook
+ * 세션 WebSocket으로 스냅샷/델타를 받아 스토어에 반영
+ */
+import { useEffect } from 'react';
+import { useGameStore } from '../../store/gameStore';
+import { gameApi } from '../../services/gameApi';
+
+export const useGameDeltas = () => {
+  const {
+    gameState,
+    cellStale,
+    applySnapshot,
+    applyDelta,
+    setDeltaConnected,
+    setCellStale,
+    setCurrentCell,
+  } = useGameStore();
+
+  const sessionId = gameState?.session_id;
+
+  useEffect(() => {
+    if (!sessionId) return;
+
+    const channel = gameApi.connectDeltas(sessionId, {
+      onSnapshot: applySnapshot,
+      onDelta: applyDelta,
+      onConnectionChange: setDeltaConnected,
+    });
+
+    return () => {
+      channel.close();
+      setDeltaConnected(false);
+    };
+  }, [sessionId, applySnapshot, applyDelta, setDeltaConnected]);
+
+  // 엔티티 진입/플레이어 이동 델타는 ID만 담고 있으므로 셀 정보를 한 번 다시 조회
+  useEffect(() => {
+    if (!sessionId || !cellStale) return;
+
+    setCellStale(false);
+    gameApi.getCurrentCell(sessionId)
+      .then(setCurrentCell)
+      .catch((error) => console.error('셀 정보 갱신 실패:', error));
+  }, [sessionId, cellStale, setCellStale, setCurrentCell]);
+};
@@ -21,6 +21,8 @@ export const useWebSocket = (onMessage?: (message: WebSocketMessage) => void) =>
   const wsRef = useRef<WebSocket | null>(null);
   const onMessageRef = useRef(onMessage);
   const reconnectTimeoutRef = useRef<number | null>(null);
+  // 구독 토픽 ("region:ID", "location:ID", "cell:ID") - 재연결 시 다시 구독
+  const topicsRef = useRef<string[]>([]);
 
   // onMessage 콜백을 ref로 저장하여 의존성 문제 해결
   useEffect(() => {
@@ -51,6 +53,9 @@ export const useWebSocket = (onMessage?: (message: WebSocketMessage) => void) =>
           clearTimeout(reconnectTimeoutRef.current);
           reconnectTimeoutRef.current = null;
         }
+        if (topicsRef.current.length > 0) {
+          ws.send(JSON.stringify({ type: 'subscribe', topics: topicsRef.current }));
+        }
       };
 
       ws.onmessage = (event) => {
@@ -121,9 +126,20 @@ export const useWebSocket = (onMessage?: (message: WebSocketMessage) => void) =>
     }
   };
 
+  // 보고 있는 지도 범위만 구독 (빈 배열이면 모든 업데이트 수신)
+  const setTopics = useCallback((topics: string[]) => {
+    topicsRef.current = topics;
+    if (wsRef.current && wsRef.current.readyState === WebSocket.OPEN) {
+      wsRef.current.send(JSON.stringify(
+        topics.length > 0 ? { type: 'subscribe', topics } : { type: 'unsubscribe' }
+      ));
+    }
+  }, []);
+
   return { 
     isConnected, 
     sendMessage,
+    setTopics,
     connected: isConnected,
   };
 };
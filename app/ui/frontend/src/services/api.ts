@@ -47,6 +47,42 @@ api.interceptors.response.use(
   }
 );
 
+// 목록 페이지/일괄 처리 (ID 순서 키셋 커서, fields로 응답 필드 제한)
+export interface ListPageParams {
+  limit?: number;
+  cursor?: string | null;
+  fields?: string[];
+}
+
+const listApi = (basePath: string) => ({
+  getPage: (params: ListPageParams = {}, filters: Record<string, string> = {}) =>
+    api.get(basePath, {
+      params: {
+        limit: params.limit ?? 100,
+        cursor: params.cursor || undefined,
+        fields: params.fields?.join(','),
+        ...filters,
+      },
+    }),
+  batchGet: (ids: string[], fields?: string[]) => api.post(`${basePath}/batch-get`, { ids, fields }),
+  batchUpdate: (updates: Record<string, any>[]) => api.patch(`${basePath}/batch`, { updates }),
+});
+
+// 모든 페이지를 커서로 이어 조회
+export const fetchAllPages = async (
+  getPage: (params: ListPageParams) => Promise<{ data: { items: any[]; next_cursor: string | null } }>,
+  params: ListPageParams = {}
+): Promise<any[]> => {
+  const items: any[] = [];
+  let cursor: string | null = null;
+  do {
+    const response = await getPage({ ...params, cursor });
+    items.push(...response.data.items);
+    cursor = response.data.next_cursor;
+  } while (cursor);
+  return items;
+};
+
 // Regions API
 export const regionsApi = {
   getAll: () => api.get('/api/regions'),
@@ -59,6 +95,7 @@ export const regionsApi = {
 // Locations API
 export const locationsApi = {
   getAll: () => api.get('/api/locations'),
+  ...listApi('/api/locations'),
   getById: (id: string) => api.get(`/api/locations/${id}`),
   getByRegion: (regionId: string) => api.get(`/api/locations/region/${regionId}`),
   create: (data: any) => api.post('/api/locations', data),
@@ -69,6 +106,7 @@ export const locationsApi = {
 // Cells API
 export const cellsApi = {
   getAll: () => api.get('/api/cells'),
+  ...listApi('/api/cells'),
   getById: (id: string) => api.get(`/api/cells/${id}`),
   getByLocation: (locationId: string) => api.get(`/api/cells/location/${locationId}`),
   create: (data: any) => api.post('/api/cells', data),
@@ -83,6 +121,7 @@ export const cellsApi = {
 // Roads API
 export const roadsApi = {
   getAll: () => api.get('/api/roads'),
+  ...listApi('/api/roads'),
   getById: (id: string) => api.get(`/api/roads/${id}`),
   create: (data: any) => api.post('/api/roads', data),
   update: (id: string, data: any) => api.put(`/api/roads/${id}`, data),
@@ -92,6 +131,7 @@ export const roadsApi = {
 // Pins API
 export const pinsApi = {
   getAll: () => api.get('/api/pins'),
+  ...listApi('/api/pins'),
   getById: (id: string) => api.get(`/api/pins/${id}`),
   getByGameData: (gameDataId: string, pinType: string) => 
     api.get(`/api/pins/game-data/${gameDataId}/${pinType}`),
@@ -117,6 +157,7 @@ export const mapApi = {
 // Entities (NPCs) API
 export const entitiesApi = {
   getAll: () => api.get('/api/entities'),
+  ...listApi('/api/entities'),
   getByCell: (cellId: string) => api.get(`/api/entities/cell/${cellId}`),
   getByLocation: (locationId: string) => api.get(`/api/entities/location/${locationId}`),
   getById: (id: string) => api.get(`/api/entities/${id}`),
@@ -168,6 +209,7 @@ export const managementApi = {
 // World Objects API
 export const worldObjectsApi = {
   getAll: () => api.get('/api/world-objects'),
+  ...listApi('/api/world-objects'),
   getById: (id: string) => api.get(`/api/world-objects/${id}`),
   getByCell: (cellId: string) => api.get(`/api/world-objects/cell/${cellId}`),
   create: (data: any) => api.post('/api/world-objects', data),
@@ -199,6 +241,7 @@ export const itemsApi = {
     const query = itemType ? `?item_type=${itemType}` : '';
     return api.get(`/api/items${query}`);
   },
+  ...listApi('/api/items'),
   getById: (id: string) => api.get(`/api/items/${id}`),
   create: (data: any) => api.post('/api/items', data),
   update: (id: string, data: any) => api.put(`/api/items/${id}`, data),
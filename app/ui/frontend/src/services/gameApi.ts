@@ -4,9 +4,117 @@
  */
 
 import axios, { AxiosInstance } from 'axios';
-import { GameState, CellInfo, DialogueInfo, GameAction } from '../types/game';
+import { GameState, CellInfo, DialogueInfo, GameAction, GameDelta, GameSnapshot } from '../types/game';
 
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8001';
+const WS_BASE_URL = API_BASE_URL.replace(/^http/, 'ws');
+
+export interface GameDeltaHandlers {
+  onSnapshot: (snapshot: GameSnapshot) => void;
+  onDelta: (delta: GameDelta) => void;
+  onConnectionChange?: (connected: boolean) => void;
+}
+
+/**
+ * 게임플레이 델타 채널
+ * 스냅샷 이후 seq 순서대로 델타를 적용하고, 누락을 감지하면 resume으로 재요청
+ */
+export class GameDeltaChannel {
+  private ws: WebSocket | null = null;
+  private stream: string | null = null;
+  private lastSeq = 0;
+  // 스냅샷 대기 중에는 델타를 버리고, resume 요청 후에는 이어지는 seq만 적용
+  private awaitingSnapshot = true;
+  private resumePending = false;
+  private closed = false;
+  private reconnectTimer: number | null = null;
+
+  constructor(private sessionId: string, private handlers: GameDeltaHandlers) {
+    this.connect();
+  }
+
+  private connect() {
+    const ws = new WebSocket(`${WS_BASE_URL}/api/gameplay/ws/${this.sessionId}`);
+    this.ws = ws;
+
+    ws.onopen = () => {
+      this.handlers.onConnectionChange?.(true);
+      // 재연결이면 마지막 seq부터 이어받기 (서버가 버퍼에 없으면 스냅샷으로 응답)
+      if (this.stream) {
+        this.resumePending = true;
+        ws.send(JSON.stringify({ type: 'resume', stream: this.stream, last_seq: this.lastSeq }));
+      }
+    };
+
+    ws.onmessage = (event) => {
+      try {
+        this.handleMessage(JSON.parse(event.data));
+      } catch (error) {
+        console.error('델타 메시지 처리 오류:', error);
+      }
+    };
+
+    ws.onclose = (event) => {
+      this.handlers.onConnectionChange?.(false);
+      // 세션 없음(1008)이나 직접 종료가 아니면 재연결
+      if (!this.closed && event.code !== 1008 && this.reconnectTimer === null) {
+        this.reconnectTimer = window.setTimeout(() => {
+          this.reconnectTimer = null;
+          if (!this.closed) this.connect();
+        }, 2000);
+      }
+    };
+  }
+
+  private handleMessage(message: any) {
+    switch (message.type) {
+      case 'snapshot':
+        this.stream = message.stream;
+        this.lastSeq = message.seq;
+        this.awaitingSnapshot = false;
+        this.resumePending = false;
+        this.handlers.onSnapshot(message as GameSnapshot);
+        break;
+      case 'delta':
+        if (this.awaitingSnapshot || message.stream !== this.stream || message.seq <= this.lastSeq) {
+          // 스냅샷 대기 중이거나 이미 반영된 델타
+          return;
+        }
+        if (message.seq !== this.lastSeq + 1) {
+          // 누락 감지 -> 마지막으로 적용한 seq 이후 재요청 (응답 전까지 순서가 맞지 않는 델타는 버림)
+          if (!this.resumePending) {
+            this.resumePending = true;
+            this.send({ type: 'resume', stream: this.stream, last_seq: this.lastSeq });
+          }
+          return;
+        }
+        this.lastSeq = message.seq;
+        this.resumePending = false;
+        this.handlers.onDelta(message as GameDelta);
+        break;
+      case 'resync':
+        this.awaitingSnapshot = true;
+        this.send({ type: 'snapshot' });
+        break;
+    }
+  }
+
+  private send(message: Record<string, unknown>) {
+    if (this.ws && this.ws.readyState === WebSocket.OPEN) {
+      this.ws.send(JSON.stringify(message));
+    }
+  }
+
+  close() {
+    this.closed = true;
+    if (this.reconnectTimer !== null) {
+      clearTimeout(this.reconnectTimer);
+      this.reconnectTimer = null;
+    }
+    this.ws?.close(1000);
+    this.ws = null;
+  }
+}
 
 export class GameApiClient {
   private client: AxiosInstance;
@@ -224,6 +332,11 @@ export class GameApiClient {
     return response.data;
   }
 
+  // 게임플레이 델타 채널 연결 (상태/액션/셀 변경을 서버가 푸시)
+  connectDeltas(sessionId: string, handlers: GameDeltaHandlers): GameDeltaChannel {
+    return new GameDeltaChannel(sessionId, handlers);
+  }
+
   // 헬스 체크
   async healthCheck() {
     const response = await this.client.get('/health');
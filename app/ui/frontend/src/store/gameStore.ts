@@ -3,7 +3,7 @@
  */
 
 import { create } from 'zustand';
-import { GameState, CellInfo, GameMessage, DialogueInfo } from '../types/game';
+import { GameState, CellInfo, GameMessage, DialogueInfo, GameAction, GameDelta, GameSnapshot, GameTime } from '../types/game';
 
 export interface HistoryEntry {
   cellId: string;
@@ -25,6 +25,13 @@ interface GameStore {
   history: HistoryEntry[]; // 대화/액션 기록
   isInfoPanelOpen: boolean; // 정보 패널 (인벤토리, 시간, 저널)
   discoveredObjects: Set<string>; // 발견된 오브젝트 ID 목록
+  // 델타 채널로 받은 상태 (연결되어 있으면 액션/셀을 다시 조회하지 않음)
+  deltaConnected: boolean;
+  availableActions: GameAction[] | null;
+  gameTime: GameTime | null;
+  inventoryQuantities: Record<string, number>; // 변경된 아이템의 현재 수량
+  inventoryVersion: number; // 인벤토리 델타마다 증가 (인벤토리 화면 갱신 트리거)
+  cellStale: boolean; // 셀에 새 엔티티가 들어오거나 플레이어가 이동함 -> 셀 정보 한 번 다시 조회
   
   setGameState: (state: GameState) => void;
   setCurrentCell: (cell: CellInfo) => void;
@@ -39,6 +46,10 @@ interface GameStore {
   clearHistory: () => void;
   toggleInfoPanel: () => void;
   setDiscoveredObjects: (objects: Set<string>) => void;
+  setDeltaConnected: (connected: boolean) => void;
+  setCellStale: (stale: boolean) => void;
+  applySnapshot: (snapshot: GameSnapshot) => void;
+  applyDelta: (delta: GameDelta) => void;
   reset: () => void;
 }
 
@@ -55,6 +66,12 @@ export const useGameStore = create<GameStore>((set) => ({
   history: [],
   isInfoPanelOpen: false,
   discoveredObjects: new Set<string>(),
+  deltaConnected: false,
+  availableActions: null,
+  gameTime: null,
+  inventoryQuantities: {},
+  inventoryVersion: 0,
+  cellStale: false,
 
   setGameState: (state) => set({ gameState: state }),
   setCurrentCell: (cell) => set({ currentCell: cell }),
@@ -71,6 +88,55 @@ export const useGameStore = create<GameStore>((set) => ({
   clearHistory: () => set({ history: [] }),
   toggleInfoPanel: () => set((state) => ({ isInfoPanelOpen: !state.isInfoPanelOpen })),
   setDiscoveredObjects: (objects) => set({ discoveredObjects: objects }),
+  setDeltaConnected: (connected) => set({ deltaConnected: connected }),
+  setCellStale: (stale) => set({ cellStale: stale }),
+  applySnapshot: (snapshot) => set({
+    gameState: snapshot.data.state,
+    currentCell: snapshot.data.cell,
+    availableActions: snapshot.data.actions,
+    cellStale: false,
+  }),
+  applyDelta: (delta) => set((state) => {
+    switch (delta.kind) {
+      case 'actions':
+        return { availableActions: delta.data.actions };
+      case 'time_advanced':
+        return { gameTime: { day: delta.data.day, hour: delta.data.hour, minute: delta.data.minute } };
+      case 'inventory_delta':
+        return {
+          inventoryQuantities: { ...state.inventoryQuantities, ...delta.data.quantities },
+          inventoryVersion: state.inventoryVersion + 1,
+        };
+      case 'entity_left':
+        if (!state.currentCell) return {};
+        return {
+          currentCell: {
+            ...state.currentCell,
+            entities: state.currentCell.entities.filter(
+              (entity) => (entity.runtime_entity_id || entity.entity_id) !== delta.data.entity_id
+            ),
+          },
+        };
+      case 'object_state':
+        if (!state.currentCell) return {};
+        return {
+          currentCell: {
+            ...state.currentCell,
+            objects: state.currentCell.objects.map((obj) =>
+              obj.object_id === delta.data.game_object_id || obj.object_id === delta.data.runtime_object_id
+                ? { ...obj, properties: { ...obj.properties, state: delta.data.state, contents: delta.data.contents } }
+                : obj
+            ),
+          },
+        };
+      case 'entity_entered':
+      case 'player_moved':
+        // 델타에는 ID만 있으므로 셀 정보를 한 번 다시 조회
+        return { cellStale: true };
+      default:
+        return {};
+    }
+  }),
   reset: () => set({
     gameState: null,
     currentCell: null,
@@ -84,6 +150,12 @@ export const useGameStore = create<GameStore>((set) => ({
     history: [],
     isInfoPanelOpen: false,
     discoveredObjects: new Set<string>(),
+    deltaConnected: false,
+    availableActions: null,
+    gameTime: null,
+    inventoryQuantities: {},
+    inventoryVersion: 0,
+    cellStale: false,
   }),
 }));
 
@@ -107,3 +107,38 @@ export interface Condition {
   value: unknown;
 }
 
+
+// 게임플레이 델타 채널 (서버 푸시)
+export type GameDeltaKind =
+  | 'entity_entered'
+  | 'entity_left'
+  | 'player_moved'
+  | 'object_state'
+  | 'inventory_delta'
+  | 'time_advanced'
+  | 'actions';
+
+export interface GameDelta {
+  type: 'delta';
+  stream: string;
+  seq: number;
+  kind: GameDeltaKind;
+  data: any;
+}
+
+export interface GameSnapshot {
+  type: 'snapshot';
+  stream: string;
+  seq: number;
+  data: {
+    state: GameState;
+    cell: CellInfo;
+    actions: GameAction[];
+  };
+}
+
+export interface GameTime {
+  day: number;
+  hour: number;
+  minute: number;
+}
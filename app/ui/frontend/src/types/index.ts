@@ -149,8 +149,9 @@ export type EditorTool = 'select' | 'pin' | 'road' | 'pan' | 'zoom';
 
 // WebSocket 메시지 타입
 export interface WebSocketMessage {
-  type: 'ping' | 'pong' | 'pin_update' | 'road_update' | 'map_update';
+  type: 'ping' | 'pong' | 'pin_update' | 'road_update' | 'map_update' | 'subscribe' | 'unsubscribe' | 'subscribed';
   data?: any;
+  topics?: string[];
   timestamp?: string;
 }
 
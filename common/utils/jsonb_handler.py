@@ -1,14 +1,84 @@
 """
 JSONB 데이터 처리 유틸리티
+
+JSON 백엔드는 orjson이 설치되어 있으면 orjson, 없으면 표준 json을 사용합니다.
+DB 연결 풀은 encode_jsonb / decode_jsonb를 json/jsonb 타입 코덱으로 등록하므로
+조회 결과는 이미 디코딩된 Python 객체로 전달됩니다.
 """
 import json
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _stdlib_dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False)
+
+
+if orjson is not None:
+    def _orjson_dumps(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    
+    _json_dumps: Callable[[Any], str] = _orjson_dumps
+    _json_loads: Callable[[Union[str, bytes]], Any] = orjson.loads
+    _json_backend = "orjson"
+else:
+    _json_dumps = _stdlib_dumps
+    _json_loads = json.loads
+    _json_backend = "json"
+
+
+def configure_json_backend(dumps: Optional[Callable[[Any], str]] = None,
+                           loads: Optional[Callable[[Union[str, bytes]], Any]] = None,
+                           name: str = "custom") -> None:
+    """
+    JSON 인코더/디코더 교체
+    
+    Args:
+        dumps: Python 객체 -> JSON 문자열 함수 (None이면 기존 유지)
+        loads: JSON 문자열 -> Python 객체 함수 (None이면 기존 유지)
+        name: 백엔드 이름 (get_json_backend 표시용)
+    """
+    global _json_dumps, _json_loads, _json_backend
+    if dumps is not None:
+        _json_dumps = dumps
+    if loads is not None:
+        _json_loads = loads
+    _json_backend = name
+
+
+def get_json_backend() -> str:
+    """현재 JSON 백엔드 이름 ("orjson", "json" 또는 사용자 지정)"""
+    return _json_backend
+
+
+def encode_jsonb(value: Any) -> str:
+    """
+    json/jsonb 파라미터 인코더 (asyncpg 타입 코덱)
+    
+    호환성: 문자열은 이미 직렬화된 JSON으로 간주하여 그대로 전달합니다.
+    (기존 json.dumps(...) / serialize_jsonb_data(...) 호출부 유지)
+    """
+    if isinstance(value, str):
+        return value
+    return _json_dumps(value)
+
+
+def decode_jsonb(text: str) -> Any:
+    """json/jsonb 결과 디코더 (asyncpg 타입 코덱)"""
+    return _json_loads(text)
 
 
 def parse_jsonb_data(data: Any) -> Union[Dict[str, Any], List[Any], None]:
     """
     JSONB 데이터를 파싱하여 Python 객체로 변환
     
+    DB 조회 결과는 연결 풀의 JSONB 코덱이 이미 디코딩하므로 그대로 반환됩니다.
+    문자열은 레거시 경로(코덱 미등록 연결, 외부 입력)에서만 파싱합니다.
+    
     Args:
         data: JSONB 데이터 (문자열 또는 이미 파싱된 객체)
         
@@ -23,10 +93,14 @@ def parse_jsonb_data(data: Any) -> Union[Dict[str, Any], List[Any], None]:
     
     if isinstance(data, str):
         try:
-            return json.loads(data)
-        except (json.JSONDecodeError, TypeError):
+            return _json_loads(data)
+        except (ValueError, TypeError):
             return None
     
+    if isinstance(data, (int, float)):
+        # 코덱이 디코딩한 JSON 스칼라 값
+        return data
+    
     return None
 
 
@@ -47,7 +121,7 @@ def serialize_jsonb_data(data: Any) -> str:
         return data
     
     try:
-        return json.dumps(data, ensure_ascii=False)
+        return _json_dumps(data)
     except (TypeError, ValueError):
         return '{}'
 
@@ -184,6 +184,7 @@ class TemplateManager:
                     VALUES ($1, $2, $3, $4, $5, $6, TRUE)
                 """, template_id, f"{category} Template", content, personality, priority, 
                 json.dumps(topics or {}))
+                self._invalidate_dialogue_catalog()
                 
                 # 캐시 업데이트
                 if category not in self._template_cache:
@@ -235,12 +236,19 @@ class TemplateManager:
                         SET {', '.join(update_fields)}
                         WHERE dialogue_id = ${param_count}
                     """, *params)
+                    self._invalidate_dialogue_catalog()
                     
                     logger.info(f"Updated template: {template_id}")
                 
         except Exception as e:
             logger.error(f"Failed to update template {template_id}: {str(e)}")
     
+    @staticmethod
+    def _invalidate_dialogue_catalog() -> None:
+        """대화 카탈로그 무효화 (템플릿은 dialogue_contexts에 저장됨)"""
+        from app.managers.dialogue_catalog import dialogue_catalog
+        dialogue_catalog.invalidate()
+    
     def get_cached_template(self, category: str, personality: str = None) -> Optional[str]:
         """캐시된 템플릿 조회 (동기)"""
         templates = self._template_cache.get(category, [])
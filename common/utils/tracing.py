@@ -0,0 +1,278 @@
+"""
+요청 트레이싱
+
+요청 단위로 라우트/서비스 호출(span)/DB 시간/조회 행 수를 기록합니다.
+- 완료된 트레이스는 메모리 링 버퍼에 보관 (/api/debug/traces 로 조회)
+- 선택적으로 QueueHandler 기반 JSONL 파일 기록 (파일 I/O는 별도 스레드에서 수행)
+- 비활성화 시 미들웨어는 그대로 통과하고 span()은 공유 no-op 객체를 반환
+
+사용 예:
+    from common.utils.tracing import trace_span
+
+    with trace_span("CellService.move_player", session_id=session_id):
+        result = await service.move_player(...)
+"""
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from app.config.app_config import TRACING_CONFIG
+
+
+class Span:
+    """트레이스 내 개별 구간"""
+    __slots__ = ("name", "attrs", "started", "duration_ms", "error", "_trace")
+
+    def __init__(self, trace: "Trace", name: str, attrs: Dict[str, Any]):
+        self._trace = trace
+        self.name = name
+        self.attrs = attrs
+        self.started = 0.0
+        self.duration_ms = 0.0
+        self.error: Optional[str] = None
+
+    def set(self, **attrs: Any) -> None:
+        """구간 속성 추가 (행 수 등)"""
+        self.attrs.update(attrs)
+
+    def __enter__(self) -> "Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.duration_ms = (time.perf_counter() - self.started) * 1000
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        self._trace.spans.append(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "name": self.name,
+            "offset_ms": round((self.started - self._trace.started) * 1000, 3),
+            "duration_ms": round(self.duration_ms, 3),
+        }
+        if self.attrs:
+            data["attrs"] = self.attrs
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+class _NoopSpan:
+    """트레이싱 비활성/트레이스 밖에서 사용하는 no-op 구간"""
+    __slots__ = ()
+
+    def set(self, **attrs: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Trace:
+    """요청 단위 트레이스"""
+    __slots__ = ("trace_id", "method", "path", "route", "status_code", "timestamp",
+                 "started", "duration_ms", "spans", "db_time_ms", "db_calls", "db_rows")
+
+    def __init__(self, method: str, path: str):
+        self.trace_id = uuid.uuid4().hex
+        self.method = method
+        self.path = path
+        self.route: Optional[str] = None
+        self.status_code: Optional[int] = None
+        self.timestamp = datetime.now().isoformat()
+        self.started = time.perf_counter()
+        self.duration_ms = 0.0
+        self.spans: List[Span] = []
+        self.db_time_ms = 0.0
+        self.db_calls = 0
+        self.db_rows = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "timestamp": self.timestamp,
+            "method": self.method,
+            "path": self.path,
+            "route": self.route,
+            "status_code": self.status_code,
+            "duration_ms": round(self.duration_ms, 3),
+            "db_time_ms": round(self.db_time_ms, 3),
+            "db_calls": self.db_calls,
+            "db_rows": self.db_rows,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+
+_current_trace: contextvars.ContextVar[Optional[Trace]] = contextvars.ContextVar("current_trace", default=None)
+
+
+class Tracer:
+    """트레이스 수집기 (링 버퍼 + 선택적 JSONL 파일)"""
+
+    def __init__(self, enabled: bool = False, buffer_size: int = 500, jsonl_path: Optional[str] = None):
+        self.enabled = False
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._jsonl_logger: Optional[logging.Logger] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
+        self.configure(enabled=enabled, buffer_size=buffer_size, jsonl_path=jsonl_path)
+
+    def configure(self,
+                  enabled: Optional[bool] = None,
+                  buffer_size: Optional[int] = None,
+                  jsonl_path: Optional[str] = None) -> None:
+        """트레이싱 설정 변경 (jsonl_path를 주면 JSONL 파일 기록 시작)"""
+        if buffer_size is not None and buffer_size != self._buffer.maxlen:
+            self._buffer = deque(self._buffer, maxlen=buffer_size)
+        if jsonl_path:
+            self._start_jsonl(jsonl_path)
+        if enabled is not None:
+            self.enabled = enabled
+
+    def _start_jsonl(self, path: str) -> None:
+        self._stop_jsonl()
+        file_handler = logging.FileHandler(path, mode="a", encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        jsonl_logger = logging.getLogger("common.utils.tracing.jsonl")
+        jsonl_logger.handlers.clear()
+        jsonl_logger.addHandler(logging.handlers.QueueHandler(record_queue))
+        jsonl_logger.setLevel(logging.INFO)
+        jsonl_logger.propagate = False
+
+        self._listener = logging.handlers.QueueListener(record_queue, file_handler)
+        self._listener.start()
+        self._jsonl_logger = jsonl_logger
+
+    def _stop_jsonl(self) -> None:
+        if self._listener is not None:
+            self._listener.stop()
+            for handler in self._listener.handlers:
+                handler.close()
+            self._listener = None
+        if self._jsonl_logger is not None:
+            self._jsonl_logger.handlers.clear()
+            self._jsonl_logger = None
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    def start_trace(self, method: str, path: str) -> Trace:
+        return Trace(method, path)
+
+    def finish_trace(self, trace: Trace) -> None:
+        trace.duration_ms = (time.perf_counter() - trace.started) * 1000
+        self._buffer.append(trace)
+        if self._jsonl_logger is not None:
+            self._jsonl_logger.info(json.dumps(trace.to_dict(), ensure_ascii=False, default=str))
+
+    def span(self, name: str, **attrs: Any):
+        """현재 요청 트레이스에 구간 추가 (트레이스 밖이면 no-op)"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        trace = _current_trace.get()
+        if trace is None:
+            return _NOOP_SPAN
+        return Span(trace, name, attrs)
+
+    def record_db(self, elapsed_seconds: float) -> None:
+        """DB 연결 사용 시간 누적"""
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.db_time_ms += elapsed_seconds * 1000
+            trace.db_calls += 1
+
+    def record_rows(self, rows: int) -> None:
+        """조회 행 수 누적"""
+        trace = _current_trace.get()
+        if trace is not None:
+            trace.db_rows += rows
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    def get_traces(self,
+                   limit: int = 100,
+                   path_prefix: Optional[str] = None,
+                   min_duration_ms: float = 0.0) -> List[Dict[str, Any]]:
+        """최근 트레이스 조회 (최신순)"""
+        result = []
+        for trace in reversed(self._buffer):
+            if path_prefix and not trace.path.startswith(path_prefix):
+                continue
+            if trace.duration_ms < min_duration_ms:
+                continue
+            result.append(trace.to_dict())
+            if len(result) >= limit:
+                break
+        return result
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+    def shutdown(self) -> None:
+        """JSONL 기록 스레드 종료 (애플리케이션 종료 시)"""
+        self._stop_jsonl()
+
+
+class TracingMiddleware:
+    """
+    요청 트레이싱 ASGI 미들웨어
+
+    트레이싱이 비활성화되어 있으면 추가 작업 없이 다음 앱을 호출합니다.
+    """
+
+    def __init__(self, app, tracer: Optional[Tracer] = None):
+        self.app = app
+        self.tracer = tracer
+
+    async def __call__(self, scope, receive, send):
+        tracer = self.tracer or globals()["tracer"]
+        if scope["type"] != "http" or not tracer.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        trace = tracer.start_trace(scope.get("method", ""), scope.get("path", ""))
+        token = _current_trace.set(trace)
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                trace.status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception:
+            trace.status_code = trace.status_code or 500
+            raise
+        finally:
+            route = scope.get("route")
+            trace.route = getattr(route, "path", None)
+            _current_trace.reset(token)
+            tracer.finish_trace(trace)
+
+
+# 전역 트레이서
+tracer = Tracer(**TRACING_CONFIG)
+
+
+def trace_span(name: str, **attrs: Any):
+    """현재 요청 트레이스에 구간 추가 (with 문으로 사용)"""
+    return tracer.span(name, **attrs)
@@ -0,0 +1,255 @@
+"""
+크기 제한 + TTL + LRU 캐시
+
+매니저 캐시(엔티티/셀/오브젝트 상태/Effect Carrier)에서 공통으로 사용합니다.
+- max_size 초과 시 가장 오래 사용되지 않은 항목부터 제거 (LRU)
+- ttl_seconds 경과 항목은 조회 시 만료 처리
+- 세션 태그별 일괄 무효화 (invalidate_session_caches: 생성된 모든 캐시에서 한 번에)
+- on_evict: LRU 제거 시 (키, 값) 알림 (다른 자료구조와 함께 유지하는 역색인용)
+- 키 해시 기반 스트라이프 락 (로드 중복 방지용, 전역 락 없음)
+
+asyncio 단일 스레드에서 get/set은 원자적으로 수행되므로 조회/저장에는 락이
+필요하지 않습니다. 락은 get_or_load에서 같은 키의 동시 로드를 합치는 데만 사용합니다.
+"""
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Iterator, List, Optional, Set
+
+
+@dataclass
+class CacheStats:
+    """캐시 통계"""
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _CacheEntry:
+    __slots__ = ("value", "expires_at", "session_id")
+
+    def __init__(self, value: Any, expires_at: Optional[float], session_id: Optional[str]):
+        self.value = value
+        self.expires_at = expires_at
+        self.session_id = session_id
+
+
+_MISSING = object()
+
+# 생성된 모든 캐시 (세션 단위 일괄 무효화용, 매니저와 함께 수거되도록 약한 참조)
+_instances: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+
+def invalidate_session_caches(session_id: str) -> int:
+    """
+    모든 TTLCache에서 세션 태그 항목 일괄 무효화 (저장된 게임 불러오기 등)
+
+    매니저는 서비스마다 따로 만들어지므로 인스턴스를 모르는 곳에서도
+    세션 캐시를 한 번에 비울 수 있도록 합니다.
+
+    Returns:
+        제거된 항목 수
+    """
+    session_id = str(session_id)
+    return sum(cache.invalidate_session(session_id) for cache in list(_instances))
+
+
+class TTLCache:
+    """크기 제한 TTL LRU 캐시"""
+
+    def __init__(self,
+                 name: str,
+                 max_size: int = 10000,
+                 ttl_seconds: Optional[float] = None,
+                 lock_stripes: int = 64,
+                 on_evict: Optional[Callable[[Hashable, Any], None]] = None):
+        """
+        Args:
+            name: 캐시 이름 (통계 표시용)
+            max_size: 최대 항목 수
+            ttl_seconds: 항목 유효 시간 (None이면 만료 없음)
+            lock_stripes: 스트라이프 락 개수
+            on_evict: max_size 초과로 항목이 제거될 때 (키, 값)으로 호출 (만료/무효화는 제외)
+        """
+        self.name = name
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.on_evict = on_evict
+        self.stats = CacheStats()
+        self._entries: "OrderedDict[Hashable, _CacheEntry]" = OrderedDict()
+        self._session_keys: Dict[str, Set[Hashable]] = {}
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(lock_stripes)]
+        _instances.add(self)
+
+    # ------------------------------------------------------------------
+    # 조회/저장
+    # ------------------------------------------------------------------
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """캐시 조회 (만료 항목은 제거 후 miss 처리)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return default
+
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
+            return default
+
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def set(self, key: Hashable, value: Any, session_id: Optional[str] = None) -> None:
+        """
+        캐시 저장
+
+        Args:
+            key: 캐시 키
+            value: 값
+            session_id: 세션 태그 (invalidate_session 대상). None이면 기존 태그 유지
+        """
+        existing = self._entries.get(key)
+        if existing is not None:
+            if session_id is None:
+                session_id = existing.session_id
+            elif existing.session_id != session_id:
+                self._untag(key, existing.session_id)
+
+        expires_at = time.monotonic() + self.ttl_seconds if self.ttl_seconds else None
+        self._entries[key] = _CacheEntry(value, expires_at, session_id)
+        self._entries.move_to_end(key)
+        if session_id is not None:
+            self._session_keys.setdefault(session_id, set()).add(key)
+
+        while len(self._entries) > self.max_size:
+            oldest_key = next(iter(self._entries))
+            evicted = self._remove(oldest_key)
+            self.stats.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(oldest_key, evicted.value)
+
+    def peek(self, key: Hashable, default: Any = None) -> Any:
+        """통계/LRU 순서에 영향 없이 유효한 항목 조회"""
+        entry = self._entries.get(key)
+        if entry is None or (entry.expires_at is not None and entry.expires_at <= time.monotonic()):
+            return default
+        return entry.value
+
+    def session_of(self, key: Hashable) -> Optional[str]:
+        """항목의 세션 태그 (통계에 영향 없음)"""
+        entry = self._entries.get(key)
+        return entry.session_id if entry is not None else None
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """항목 제거 후 값 반환"""
+        entry = self._remove(key)
+        if entry is None:
+            return default
+        self.stats.invalidations += 1
+        return entry.value
+
+    def invalidate(self, key: Hashable) -> bool:
+        """항목 무효화"""
+        return self.pop(key, _MISSING) is not _MISSING
+
+    def invalidate_session(self, session_id: str) -> int:
+        """세션 태그가 붙은 항목 일괄 무효화 후 제거된 항목 수 반환"""
+        keys = self._session_keys.pop(session_id, None)
+        if not keys:
+            return 0
+        removed = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                removed += 1
+        self.stats.invalidations += removed
+        return removed
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        self._entries.clear()
+        self._session_keys.clear()
+
+    async def get_or_load(self,
+                          key: Hashable,
+                          loader: Callable[[], Awaitable[Any]],
+                          session_id: Optional[str] = None) -> Any:
+        """
+        캐시 조회 후 없으면 로드 (같은 키의 동시 로드는 한 번만 수행)
+
+        loader가 None을 반환하면 캐시에 저장하지 않습니다.
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        async with self.lock(key):
+            # 대기 중 다른 태스크가 로드했을 수 있음
+            value = self.peek(key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            value = await loader()
+            if value is not None:
+                self.set(key, value, session_id)
+            return value
+
+    def lock(self, key: Hashable) -> asyncio.Lock:
+        """키에 해당하는 스트라이프 락"""
+        return self._locks[hash(key) % len(self._locks)]
+
+    # ------------------------------------------------------------------
+    # 내부/상태
+    # ------------------------------------------------------------------
+
+    def _remove(self, key: Hashable) -> Optional[_CacheEntry]:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._untag(key, entry.session_id)
+        return entry
+
+    def _untag(self, key: Hashable, session_id: Optional[str]) -> None:
+        if session_id is None:
+            return
+        keys = self._session_keys.get(session_id)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._session_keys[session_id]
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.peek(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(list(self._entries))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        stats = self.stats
+        return {
+            "name": self.name,
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "sessions": len(self._session_keys),
+            "hits": stats.hits,
+            "misses": stats.misses,
+            "hit_rate": stats.hit_rate,
+            "evictions": stats.evictions,
+            "expirations": stats.expirations,
+            "invalidations": stats.invalidations,
+        }
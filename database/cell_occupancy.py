@@ -0,0 +1,216 @@
+"""
+셀 점유 맵 (셀 → 엔티티 ID 집합)
+
+"이 셀에 누가 있는가"를 요청마다 entity_states에서 다시 조회하지 않도록
+자주 조회되는 셀의 점유자 집합을 메모리에 유지합니다.
+
+- 캐시에 없는 셀은 entity_states.current_cell_id 인덱스로 한 번 조회 후 보관
+- 위치 변경 경로(entity_state_store.set_fields, CellManager 셀 입출입, 엔티티 생성)에서
+  move()/track_position()으로 즉시 갱신
+- 셀 집합은 TTLCache(CACHE_CONFIG["cell_occupancy"])에 보관되므로
+  갱신 경로를 거치지 않은 변경(일괄 삭제 등)도 TTL 이내에 반영
+- write-behind 모드에서 아직 기록되지 않은 위치 변경은 조회 시 덮어씀
+- 역색인(엔티티 → 셀)에서 LRU로 밀려난 엔티티의 셀 집합은 무효화
+  (이전 셀을 모르면 이동 시 이전 셀 집합에서 뺄 수 없으므로 다음 조회에서 다시 로드)
+- add_listener()로 등록한 함수에 셀 변경 (엔티티 ID, 이전 셀, 새 셀)을 알림 (세션 델타 스트림)
+
+사용 예:
+    from database.cell_occupancy import cell_occupancy
+
+    entity_ids = await cell_occupancy.occupants(runtime_cell_id)
+    cell_occupancy.move(runtime_entity_id, new_runtime_cell_id)
+"""
+import logging
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Union
+from uuid import UUID
+
+from app.config.app_config import CACHE_CONFIG
+from database.connection import DatabaseConnection
+from common.utils.jsonb_handler import parse_jsonb_data
+from common.utils.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+def cell_key(cell_id: Union[str, UUID, None]) -> Optional[str]:
+    """셀 ID를 정규화된 UUID 문자열로 변환 (UUID가 아니면 None)"""
+    if cell_id is None:
+        return None
+    if isinstance(cell_id, UUID):
+        return str(cell_id)
+    try:
+        return str(UUID(str(cell_id)))
+    except (ValueError, TypeError):
+        return None
+
+
+class CellOccupancyMap:
+    """셀 점유 맵"""
+
+    def __init__(self,
+                 db_connection: Optional[DatabaseConnection] = None,
+                 max_cells: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+            max_cells: 보관할 최대 셀 수 (기본: CACHE_CONFIG["cell_occupancy"]["max_size"])
+            ttl_seconds: 셀 집합 유효 시간 (기본: CACHE_CONFIG["cell_occupancy"]["ttl_seconds"])
+        """
+        config = CACHE_CONFIG["cell_occupancy"]
+        self._db = db_connection
+        max_cells = max_cells or config["max_size"]
+        ttl_seconds = ttl_seconds or config["ttl_seconds"]
+        self._cells = TTLCache("cell_occupancy", max_size=max_cells, ttl_seconds=ttl_seconds)
+        # 엔티티 → 셀 (이동 시 이전 셀 집합에서 빼기 위한 역색인)
+        self._entity_cells = TTLCache("cell_occupancy_entity", max_size=max_cells * 50, ttl_seconds=ttl_seconds,
+                                      on_evict=self._on_entity_evicted)
+        # 로드 중 발생한 이동 감지용
+        self._generation = 0
+        # 셀 변경 리스너 (entity_id, previous_cell_key, cell_key) - 이전 셀을 모르면 None
+        self._listeners: List[Callable[[str, Optional[str], Optional[str]], None]] = []
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    async def occupants(self, cell_id: Union[str, UUID]) -> FrozenSet[str]:
+        """셀에 있는 엔티티 ID 집합 (runtime_entity_id 문자열)"""
+        key = cell_key(cell_id)
+        if key is None:
+            return frozenset()
+
+        entity_ids = self._cells.get(key)
+        if entity_ids is not None:
+            return frozenset(entity_ids)
+
+        async with self._cells.lock(key):
+            entity_ids = self._cells.peek(key)
+            if entity_ids is None:
+                entity_ids = await self._load(key)
+        return frozenset(entity_ids)
+
+    def peek(self, cell_id: Union[str, UUID]) -> Optional[FrozenSet[str]]:
+        """메모리에 있는 셀 점유자 조회 (없으면 None, DB 조회 없음)"""
+        entity_ids = self._cells.peek(cell_key(cell_id))
+        return frozenset(entity_ids) if entity_ids is not None else None
+
+    async def _load(self, key: str) -> Set[str]:
+        generation = self._generation
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT runtime_entity_id, session_id
+                FROM runtime_data.entity_states
+                WHERE current_cell_id = $1::uuid
+                """,
+                key
+            )
+        entity_ids = {str(row["runtime_entity_id"]) for row in rows}
+
+        # write-behind 모드에서 아직 기록되지 않은 위치 변경 반영
+        from database.entity_state_store import entity_state_store
+        for entity_id, position in entity_state_store.pending_positions().items():
+            if cell_key((position or {}).get("runtime_cell_id")) == key:
+                entity_ids.add(entity_id)
+            else:
+                entity_ids.discard(entity_id)
+
+        if generation != self._generation:
+            # 조회 중 이동이 있었으면 결과를 보관하지 않음 (다음 조회에서 다시 로드)
+            return entity_ids
+
+        session_id = str(rows[0]["session_id"]) if rows and rows[0]["session_id"] else None
+        self._cells.set(key, entity_ids, session_id=session_id)
+        for entity_id in entity_ids:
+            self._entity_cells.set(entity_id, key)
+        return entity_ids
+
+    # ------------------------------------------------------------------
+    # 갱신
+    # ------------------------------------------------------------------
+
+    def _on_entity_evicted(self, entity_id: str, key: str) -> None:
+        """역색인에서 밀려난 엔티티가 있는 셀 집합 무효화 (유령 점유자 방지)"""
+        entity_ids = self._cells.peek(key)
+        if entity_ids is not None and entity_id in entity_ids:
+            self._generation += 1
+            self._cells.invalidate(key)
+
+    def move(self, runtime_entity_id: Union[str, UUID], cell_id: Union[str, UUID, None]) -> None:
+        """엔티티의 셀 변경 반영 (cell_id가 None이면 셀에서 나감)"""
+        entity_id = str(runtime_entity_id)
+        key = cell_key(cell_id)
+        self._generation += 1
+
+        previous = self._entity_cells.pop(entity_id)
+        if previous is not None and previous != key:
+            entity_ids = self._cells.peek(previous)
+            if entity_ids is not None:
+                entity_ids.discard(entity_id)
+
+        if key is not None:
+            entity_ids = self._cells.peek(key)
+            if entity_ids is not None:
+                if previous is None and entity_id in entity_ids:
+                    # 역색인만 만료된 경우 (같은 셀 안의 위치 변경)
+                    previous = key
+                entity_ids.add(entity_id)
+            self._entity_cells.set(entity_id, key)
+
+        if previous != key:
+            self._notify(entity_id, previous, key)
+
+    def add_listener(self, listener: Callable[[str, Optional[str], Optional[str]], None]) -> None:
+        """셀 변경 리스너 등록 (move() 안에서 동기 호출되므로 대기하지 않아야 함)"""
+        self._listeners.append(listener)
+
+    def _notify(self, entity_id: str, previous: Optional[str], key: Optional[str]) -> None:
+        for listener in self._listeners:
+            try:
+                listener(entity_id, previous, key)
+            except Exception as e:
+                logger.error(f"Cell occupancy: listener failed: {e}")
+
+    def track_position(self, runtime_entity_id: Union[str, UUID], position: Any) -> None:
+        """current_position 값(dict 또는 JSON 문자열)의 runtime_cell_id로 move() 수행"""
+        position = parse_jsonb_data(position) if isinstance(position, str) else position
+        self.move(runtime_entity_id, (position or {}).get("runtime_cell_id"))
+
+    def remove(self, runtime_entity_id: Union[str, UUID]) -> None:
+        """엔티티를 점유 맵에서 제거 (엔티티 삭제 시)"""
+        self.move(runtime_entity_id, None)
+
+    def invalidate(self, cell_id: Union[str, UUID]) -> None:
+        """셀 집합 무효화 (다음 조회 시 DB에서 다시 로드)"""
+        self._generation += 1
+        self._cells.invalidate(cell_key(cell_id))
+
+    def invalidate_session(self, session_id: str) -> int:
+        """세션의 셀 집합 일괄 무효화"""
+        self._generation += 1
+        return self._cells.invalidate_session(str(session_id))
+
+    def clear(self) -> None:
+        """전체 초기화"""
+        self._generation += 1
+        self._cells.clear()
+        self._entity_cells.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        return {
+            "cells": self._cells.snapshot(),
+            "tracked_entities": len(self._entity_cells),
+        }
+
+
+# 전역 셀 점유 맵
+cell_occupancy = CellOccupancyMap()
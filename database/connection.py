@@ -1,84 +1,335 @@
 import asyncpg
-from typing import Optional
+import asyncio
+from typing import Optional, Dict, Any, Tuple
+from dataclasses import dataclass
 import logging
 import os
 import sys
+import time
 from dotenv import load_dotenv
 from app.config.app_config import get_db_settings
+from common.utils.jsonb_handler import encode_jsonb, decode_jsonb, get_json_backend
+from common.utils.tracing import tracer
 
 load_dotenv()
 
-class DatabaseConnection:
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    """연결 풀 acquire 통계"""
+    acquire_count: int = 0
+    acquire_timeouts: int = 0
+    waiting: int = 0
+    total_wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+
+class _MeteredAcquireContext:
+    """대기 시간/타임아웃을 기록하는 acquire 컨텍스트 (async with / await 모두 지원)"""
+    
+    __slots__ = ("_pool", "_timeout", "_conn", "_held_at")
+    
+    def __init__(self, pool: "MeteredPool", timeout: Optional[float]):
+        self._pool = pool
+        self._timeout = timeout
+        self._conn = None
+        self._held_at = None
+    
+    async def _acquire(self):
+        metrics = self._pool.metrics
+        metrics.waiting += 1
+        started = time.perf_counter()
+        try:
+            return await self._pool.raw_pool.acquire(timeout=self._timeout)
+        except asyncio.TimeoutError:
+            metrics.acquire_timeouts += 1
+            raise
+        finally:
+            waited = time.perf_counter() - started
+            metrics.waiting -= 1
+            metrics.acquire_count += 1
+            metrics.total_wait_time += waited
+            if waited > metrics.max_wait_time:
+                metrics.max_wait_time = waited
+    
+    async def __aenter__(self):
+        self._conn = await self._acquire()
+        if tracer.enabled:
+            self._held_at = time.perf_counter()
+        return self._conn
+    
+    async def __aexit__(self, *exc):
+        conn, self._conn = self._conn, None
+        if self._held_at is not None:
+            # 요청 트레이스에 연결 점유 시간(DB 시간) 기록
+            tracer.record_db(time.perf_counter() - self._held_at)
+            self._held_at = None
+        await self._pool.raw_pool.release(conn)
+    
+    def __await__(self):
+        return self._acquire().__await__()
+
+
+class MeteredPool:
+    """
+    asyncpg.Pool 래퍼
+    
+    acquire()만 계측하고 나머지 속성은 원본 풀로 위임합니다.
+    """
+    
+    def __init__(self, key: Tuple[str, str], raw_pool: asyncpg.Pool, acquire_timeout: Optional[float]):
+        self.key = key
+        self.raw_pool = raw_pool
+        self.acquire_timeout = acquire_timeout
+        self.metrics = PoolMetrics()
+        self.loop = asyncio.get_running_loop()
+        self.ref_count = 0
+    
+    def acquire(self, *, timeout: Optional[float] = None) -> _MeteredAcquireContext:
+        return _MeteredAcquireContext(self, timeout if timeout is not None else self.acquire_timeout)
+    
+    async def release(self, connection, *, timeout: Optional[float] = None) -> None:
+        await self.raw_pool.release(connection, timeout=timeout)
+    
+    def is_stale(self) -> bool:
+        """닫혔거나 다른 이벤트 루프에서 생성된 풀인지 확인"""
+        if self.raw_pool.is_closing():
+            return True
+        try:
+            return asyncio.get_running_loop() is not self.loop
+        except RuntimeError:
+            return False
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 풀 상태 및 통계"""
+        size = self.raw_pool.get_size()
+        idle = self.raw_pool.get_idle_size()
+        metrics = self.metrics
+        return {
+            "dsn": self.key[0],
+            "role": self.key[1],
+            "min_size": self.raw_pool.get_min_size(),
+            "max_size": self.raw_pool.get_max_size(),
+            "size": size,
+            "in_use": size - idle,
+            "idle": idle,
+            "waiting": metrics.waiting,
+            "acquire_count": metrics.acquire_count,
+            "acquire_timeouts": metrics.acquire_timeouts,
+            "avg_wait_ms": (metrics.total_wait_time / metrics.acquire_count * 1000) if metrics.acquire_count else 0.0,
+            "max_wait_ms": metrics.max_wait_time * 1000,
+            "handles": self.ref_count,
+        }
+    
+    def __getattr__(self, name: str):
+        return getattr(self.raw_pool, name)
+
+
+class PoolRegistry:
+    """
+    프로세스 단위 연결 풀 레지스트리
+    
+    (DSN, role) 당 하나의 풀을 생성하여 모든 DatabaseConnection 인스턴스가 공유합니다.
+    풀은 이벤트 루프에 묶이므로 루프가 바뀌면 (테스트 등) 새 풀을 생성합니다.
+    """
+    
     def __init__(self):
+        self._pools: Dict[Tuple[str, str], MeteredPool] = {}
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    @staticmethod
+    def make_key(db_settings, role: str) -> Tuple[str, str]:
+        dsn = f"postgresql://{db_settings.user}@{db_settings.host}:{db_settings.port}/{db_settings.database}"
+        return dsn, role
+    
+    def _get_lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    async def acquire_pool(self, db_settings, role: str = "default") -> MeteredPool:
+        """공유 풀 참조 획득 (없으면 생성)"""
+        key = self.make_key(db_settings, role)
+        async with self._get_lock():
+            pool = self._pools.get(key)
+            if pool is not None and pool.is_stale():
+                self._discard(pool)
+                pool = None
+            
+            if pool is None:
+                pool = await self._create_pool(key, db_settings)
+                self._pools[key] = pool
+            
+            pool.ref_count += 1
+            return pool
+    
+    async def release_pool(self, pool: MeteredPool) -> None:
+        """공유 풀 참조 반환 (마지막 참조이면 풀 종료)"""
+        async with self._get_lock():
+            pool.ref_count = max(pool.ref_count - 1, 0)
+            if pool.ref_count > 0:
+                return
+            if self._pools.get(pool.key) is pool:
+                del self._pools[pool.key]
+        
+        if pool.is_stale():
+            self._discard(pool)
+        else:
+            await pool.raw_pool.close()
+            logger.info(f"Database connection pool closed (role={pool.key[1]})")
+    
+    async def close_all(self) -> None:
+        """모든 공유 풀 종료 (애플리케이션 종료 시)"""
+        async with self._get_lock():
+            pools = list(self._pools.values())
+            self._pools.clear()
+        
+        for pool in pools:
+            pool.ref_count = 0
+            try:
+                if pool.is_stale():
+                    self._discard(pool)
+                else:
+                    await pool.raw_pool.close()
+            except Exception as e:
+                logger.error(f"Failed to close database connection pool (role={pool.key[1]}): {str(e)}")
+        
+        if pools:
+            logger.info(f"Database connection pools closed: {len(pools)}")
+    
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """풀별 통계 (in_use, idle, 대기 시간, acquire 타임아웃 등)"""
+        return {
+            f"{dsn}#{role}": pool.snapshot()
+            for (dsn, role), pool in self._pools.items()
+        }
+    
+    async def _create_pool(self, key: Tuple[str, str], db_settings) -> MeteredPool:
+        # 테스트 환경 고려: 연결 풀 크기 증가
+        # 테스트 실행 시 여러 테스트가 동시에 실행될 수 있으므로
+        # max_size를 증가시켜 연결 풀 고갈 방지
+        is_test = (
+            "pytest" in sys.modules or 
+            any("pytest" in arg for arg in sys.argv) or
+            "PYTEST_CURRENT_TEST" in os.environ
+        )
+        
+        min_size = db_settings.pool_min_size
+        max_size = max(db_settings.pool_max_size, 15) if is_test else db_settings.pool_max_size
+        
+        raw_pool = await asyncpg.create_pool(
+            host=db_settings.host,
+            port=db_settings.port,
+            user=db_settings.user,
+            password=db_settings.password,
+            database=db_settings.database,
+            min_size=min_size,
+            max_size=max_size,
+            max_inactive_connection_lifetime=db_settings.pool_max_inactive_lifetime,
+            command_timeout=db_settings.command_timeout,
+            init=_register_json_codecs if db_settings.json_codecs else None
+        )
+        json_codec = get_json_backend() if db_settings.json_codecs else "disabled"
+        logger.info(f"Database connection pool initialized successfully (role={key[1]}, min={min_size}, max={max_size}, test={is_test}, json_codec={json_codec})")
+        return MeteredPool(key, raw_pool, db_settings.pool_acquire_timeout)
+    
+    @staticmethod
+    def _discard(pool: MeteredPool) -> None:
+        """다른 루프에 묶인 풀은 await 없이 정리"""
+        try:
+            pool.raw_pool.terminate()
+        except Exception as e:
+            logger.debug(f"Stale pool terminate warning (role={pool.key[1]}): {str(e)}")
+
+
+async def _register_json_codecs(conn: asyncpg.Connection) -> None:
+    """
+    json/jsonb 타입 코덱 등록 (연결 생성 시 1회)
+    
+    조회 결과는 dict/list로 디코딩되어 전달되고, 파라미터는 Python 객체 또는
+    직렬화된 JSON 문자열 모두 허용합니다 (common.utils.jsonb_handler.encode_jsonb).
+    """
+    for type_name in ("json", "jsonb"):
+        await conn.set_type_codec(
+            type_name,
+            encoder=encode_jsonb,
+            decoder=decode_jsonb,
+            schema="pg_catalog",
+            format="text"
+        )
+
+
+# 전역 풀 레지스트리 인스턴스
+pool_registry = PoolRegistry()
+
+
+async def close_all_pools() -> None:
+    """애플리케이션 종료 훅: 모든 공유 풀 종료"""
+    await pool_registry.close_all()
+
+
+def get_pool_metrics() -> Dict[str, Dict[str, Any]]:
+    """공유 풀 통계 조회"""
+    return pool_registry.get_metrics()
+
+
+class DatabaseConnection:
+    def __init__(self, role: str = "default"):
         # 설정 통합: app/config/app_config.py 사용
         db_settings = get_db_settings()
+        self._settings = db_settings
         self.host = db_settings.host
         self.port = db_settings.port
         self.user = db_settings.user
         self.password = db_settings.password
         self.database = db_settings.database
+        self.role = role
         
         # 로깅 설정
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
         
-        # 연결 상태 관리
-        self._pool = None
+        # 연결 상태 관리 (풀은 pool_registry가 소유, 인스턴스는 참조만 보유)
+        self._pool: Optional[MeteredPool] = None
         self._is_initialized = False
         self._is_closed = False
         
     async def initialize(self) -> None:
-        """연결 초기화"""
+        """연결 초기화 (프로세스 공유 풀 참조 획득)"""
         if self._is_initialized or self._is_closed:
             return
             
         try:
-            # 테스트 환경 고려: 연결 풀 크기 증가
-            # 테스트 실행 시 여러 테스트가 동시에 실행될 수 있으므로
-            # max_size를 증가시켜 연결 풀 고갈 방지
-            is_test = (
-                "pytest" in sys.modules or 
-                any("pytest" in arg for arg in sys.argv) or
-                "PYTEST_CURRENT_TEST" in os.environ
-            )
-            
-            # 연결 풀 크기: 성능과 안정성의 균형
-            # 테스트 환경: session 스코프로 연결 풀 공유하므로 적절한 크기 유지
-            # 프로덕션: 실제 부하에 맞게 조정
-            min_size = 2
-            max_size = 15 if is_test else 10  # 테스트: 15 (session 공유로 효율적), 프로덕션: 10
-            
-            self._pool = await asyncpg.create_pool(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                min_size=min_size,
-                max_size=max_size,
-                command_timeout=60  # 테스트 환경에서 타임아웃 증가
-            )
+            self._pool = await pool_registry.acquire_pool(self._settings, self.role)
             self._is_initialized = True
-            self.logger.info(f"Database connection pool initialized successfully (min={min_size}, max={max_size}, test={is_test})")
         except Exception as e:
             self.logger.error(f"Failed to initialize database connection pool: {str(e)}")
             raise
     
     @property
-    async def pool(self) -> asyncpg.Pool:
+    async def pool(self) -> MeteredPool:
         """데이터베이스 커넥션 풀을 반환합니다"""
+        if self._is_initialized and self._pool.is_stale():
+            # 다른 이벤트 루프에서 생성된 풀이면 현재 루프의 공유 풀로 교체
+            self._is_initialized = False
         if not self._is_initialized:
             await self.initialize()
         return self._pool
     
     async def close(self):
-        """데이터베이스 연결을 종료합니다"""
+        """데이터베이스 연결을 종료합니다 (공유 풀 참조 반환)"""
         if self._pool and not self._is_closed:
             try:
-                await self._pool.close()
+                if self._is_initialized:
+                    await pool_registry.release_pool(self._pool)
                 self._is_closed = True
                 self._is_initialized = False
-                self.logger.info("Database connection pool closed successfully")
+                self.logger.info("Database connection released successfully")
             except Exception as e:
                 self.logger.error(f"Failed to close database connection pool: {str(e)}")
                 raise
@@ -98,6 +349,8 @@ class DatabaseConnection:
             pool = await self.pool
             async with pool.acquire() as conn:
                 result = await conn.fetch(query, *args)
+                if tracer.enabled:
+                    tracer.record_rows(len(result))
                 return result
         except Exception as e:
             self.logger.error(f"Query execution failed: {str(e)}")
@@ -145,7 +398,8 @@ class DatabaseConnection:
 
     async def release_connection(self, connection):
         """데이터베이스 연결을 해제합니다"""
-        await connection.release()
+        pool = await self.pool
+        await pool.release(connection)
 
     async def execute_single_query(self, query: str, *args) -> Optional[asyncpg.Record]:
         """
@@ -0,0 +1,430 @@
+"""
+엔티티 상태 저장소 (write-through / write-behind)
+
+runtime_data.entity_states의 스탯/위치/인벤토리 등 JSONB 상태 변경을 한 곳으로 모읍니다.
+
+- write-through (기본): 변경마다 즉시 UPDATE (기존 동작과 동일)
+- write-behind: 상태를 메모리에 보관하고 변경된 필드만 dirty로 표시한 뒤,
+  백그라운드 flusher가 주기마다 모든 변경을 UPDATE ... FROM unnest(...) 한 번으로 기록
+  - 같은 엔티티의 연속 변경은 마지막 값 하나로 합쳐짐
+  - 저장/세션 종료 시 flush(session_id)로 동기 기록
+  - max_dirty_age_seconds: 가장 오래된 미기록 변경이 이 시간을 넘으면 즉시 flush (크래시 시 유실 범위 제한)
+  - max_dirty_entities: dirty 엔티티 수가 이 값을 넘으면 즉시 flush
+
+write-behind 모드에서는 flush 전까지 DB의 entity_states가 최신이 아니므로
+상태 조회는 get()을 사용해야 합니다.
+
+사용 예:
+    from database.entity_state_store import entity_state_store
+
+    await entity_state_store.merge_stats(runtime_entity_id, {"hp": 90})
+    await entity_state_store.set_fields(runtime_entity_id, current_position=position)
+    await entity_state_store.flush(session_id)
+"""
+import asyncio
+import copy
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
+
+from app.config.app_config import GAME_CONFIG
+from database.connection import DatabaseConnection
+from database.cell_occupancy import cell_occupancy
+from common.utils.jsonb_handler import encode_jsonb, parse_jsonb_data
+
+logger = logging.getLogger(__name__)
+
+# 저장소가 관리하는 entity_states JSONB 컬럼 (unnest 인자 순서)
+STATE_FIELDS = ("current_stats", "current_position", "active_effects", "inventory", "equipped_items")
+
+_FLUSH_SQL = """
+    UPDATE runtime_data.entity_states es
+    SET current_stats = COALESCE(u.current_stats::jsonb, es.current_stats),
+        current_position = COALESCE(u.current_position::jsonb, es.current_position),
+        active_effects = COALESCE(u.active_effects::jsonb, es.active_effects),
+        inventory = COALESCE(u.inventory::jsonb, es.inventory),
+        equipped_items = COALESCE(u.equipped_items::jsonb, es.equipped_items),
+        updated_at = NOW()
+    FROM unnest($1::uuid[], $2::text[], $3::text[], $4::text[], $5::text[], $6::text[])
+        AS u(runtime_entity_id, current_stats, current_position, active_effects, inventory, equipped_items)
+    WHERE es.runtime_entity_id = u.runtime_entity_id
+"""
+
+
+@dataclass
+class EntityStateStoreMetrics:
+    """엔티티 상태 저장소 통계"""
+    mutations: int = 0
+    writes: int = 0            # write-through UPDATE 수
+    flushes: int = 0           # write-behind 배치 수
+    flushed_entities: int = 0
+    failed_flushes: int = 0
+    last_flush_ms: float = 0.0
+
+
+class _EntityState:
+    __slots__ = ("session_id", "values", "loaded", "dirty")
+
+    def __init__(self, session_id: Optional[str]):
+        self.session_id = session_id
+        self.values: Dict[str, Any] = {}
+        self.loaded = False
+        self.dirty: Set[str] = set()
+
+
+class EntityStateStore:
+    """엔티티 상태 저장소"""
+
+    def __init__(self,
+                 db_connection: Optional[DatabaseConnection] = None,
+                 write_behind: Optional[bool] = None,
+                 flush_interval: Optional[float] = None,
+                 max_dirty_age_seconds: Optional[float] = None,
+                 max_dirty_entities: Optional[int] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+            write_behind: write-behind 사용 여부 (기본: GAME_CONFIG["entity_state_write_behind"])
+            flush_interval: write-behind flush 주기 (초)
+            max_dirty_age_seconds: 미기록 변경 최대 유지 시간 (초)
+            max_dirty_entities: 즉시 flush를 유발하는 dirty 엔티티 수
+        """
+        self._db = db_connection
+        self.write_behind = GAME_CONFIG["entity_state_write_behind"] if write_behind is None else write_behind
+        self.flush_interval = flush_interval or GAME_CONFIG["entity_state_flush_interval_seconds"]
+        self.max_dirty_age_seconds = max_dirty_age_seconds or GAME_CONFIG["entity_state_max_dirty_age_seconds"]
+        self.max_dirty_entities = max_dirty_entities or GAME_CONFIG["entity_state_max_dirty_entities"]
+        self.metrics = EntityStateStoreMetrics()
+
+        self._states: Dict[str, _EntityState] = {}
+        self._dirty_ids: Set[str] = set()
+        self._dirty_since: Optional[float] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._flush_requested: Optional[asyncio.Event] = None
+        self._closed = False
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    def configure(self, write_behind: bool) -> None:
+        """모드 변경 (write-behind 해제 전에는 flush() 필요)"""
+        if not write_behind and self._dirty_ids:
+            raise RuntimeError("write-behind 해제 전에 flush()가 필요합니다.")
+        self.write_behind = write_behind
+        self._closed = False
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+
+    async def get(self, runtime_entity_id: str) -> Optional[Dict[str, Any]]:
+        """엔티티 상태 조회 (write-behind에서는 메모리 상태 우선)"""
+        runtime_entity_id = str(runtime_entity_id)
+        if not self.write_behind:
+            row = await self._fetch_row(runtime_entity_id)
+            return self._row_values(row) if row else None
+
+        state = await self._load(runtime_entity_id)
+        if state is None:
+            return None
+        return copy.deepcopy(state.values)
+
+    def overlay(self, runtime_entity_id: str, row: Dict[str, Any]) -> Dict[str, Any]:
+        """DB에서 읽은 entity_states 행에 아직 기록되지 않은 변경을 덮어씀"""
+        state = self._states.get(str(runtime_entity_id))
+        if state is not None and state.dirty:
+            for field in state.dirty:
+                row[field] = copy.deepcopy(state.values[field])
+        return row
+
+    def pending_positions(self) -> Dict[str, Any]:
+        """아직 기록되지 않은 current_position 변경 (엔티티 ID → 위치)"""
+        return {
+            entity_id: self._states[entity_id].values.get("current_position")
+            for entity_id in self._dirty_ids
+            if "current_position" in self._states[entity_id].dirty
+        }
+
+    async def _fetch_row(self, runtime_entity_id: str):
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            return await conn.fetchrow(
+                f"""
+                SELECT COALESCE(es.session_id, re.session_id) AS session_id,
+                       {", ".join(f"es.{field}" for field in STATE_FIELDS)}
+                FROM runtime_data.entity_states es
+                LEFT JOIN runtime_data.runtime_entities re ON re.runtime_entity_id = es.runtime_entity_id
+                WHERE es.runtime_entity_id = $1
+                """,
+                runtime_entity_id
+            )
+
+    @staticmethod
+    def _row_values(row) -> Dict[str, Any]:
+        return {field: parse_jsonb_data(row[field]) for field in STATE_FIELDS}
+
+    async def _load(self, runtime_entity_id: str) -> Optional[_EntityState]:
+        state = self._states.get(runtime_entity_id)
+        if state is not None and state.loaded:
+            return state
+
+        row = await self._fetch_row(runtime_entity_id)
+        if not row:
+            return state
+
+        # 조회 중 다른 변경이 먼저 들어왔을 수 있으므로 다시 확인
+        state = self._states.get(runtime_entity_id)
+        if state is None:
+            session_id = str(row["session_id"]) if row["session_id"] else None
+            state = self._states.setdefault(runtime_entity_id, _EntityState(session_id))
+        if not state.loaded:
+            values = self._row_values(row)
+            for field in STATE_FIELDS:
+                # 메모리에서 변경된 필드가 DB 값보다 최신
+                state.values.setdefault(field, values[field])
+            if state.session_id is None and row["session_id"]:
+                state.session_id = str(row["session_id"])
+            state.loaded = True
+        return state
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+
+    async def set_fields(self,
+                         runtime_entity_id: str,
+                         session_id: Optional[str] = None,
+                         **fields: Any) -> None:
+        """
+        상태 필드 교체
+
+        Args:
+            runtime_entity_id: 런타임 엔티티 ID
+            session_id: 세션 ID (세션 단위 flush용, 없으면 최초 변경 시 DB 행에서 조회)
+            **fields: STATE_FIELDS 중 교체할 필드와 값 (전달한 객체는 저장소가 소유하므로 이후 변경 금지)
+        """
+        unknown = set(fields) - set(STATE_FIELDS)
+        if unknown:
+            raise ValueError(f"지원하지 않는 상태 필드: {sorted(unknown)}")
+
+        runtime_entity_id = str(runtime_entity_id)
+        self.metrics.mutations += 1
+
+        if not self.write_behind:
+            await self._write_through(runtime_entity_id, fields)
+            if "current_position" in fields:
+                cell_occupancy.track_position(runtime_entity_id, fields["current_position"])
+            return
+
+        state = self._states.get(runtime_entity_id)
+        if not session_id and (state is None or (state.session_id is None and not state.loaded)):
+            # 세션을 모르면 flush(session_id)/discard_session에서 빠지므로 DB 행에서 소유 세션 확인
+            state = await self._load(runtime_entity_id)
+        if state is None:
+            state = self._states[runtime_entity_id] = _EntityState(str(session_id) if session_id else None)
+        elif session_id and state.session_id is None:
+            state.session_id = str(session_id)
+        for field, value in fields.items():
+            # 직렬화된 JSON 문자열(json.dumps 호출부)은 객체로 보관
+            state.values[field] = parse_jsonb_data(value) if isinstance(value, str) else value
+        self._mark_dirty(runtime_entity_id, state, fields.keys())
+        if "current_position" in fields:
+            cell_occupancy.track_position(runtime_entity_id, state.values["current_position"])
+
+    async def merge_stats(self,
+                          runtime_entity_id: str,
+                          stats: Dict[str, Any],
+                          session_id: Optional[str] = None) -> None:
+        """current_stats에 값 병합 (current_stats || stats)"""
+        runtime_entity_id = str(runtime_entity_id)
+        if not self.write_behind:
+            self.metrics.mutations += 1
+            self.metrics.writes += 1
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    """
+                    UPDATE runtime_data.entity_states
+                    SET current_stats = COALESCE(current_stats, '{}'::jsonb) || $1::jsonb,
+                        updated_at = NOW()
+                    WHERE runtime_entity_id = $2
+                    """,
+                    encode_jsonb(stats), runtime_entity_id
+                )
+            return
+
+        state = await self._load(runtime_entity_id)
+        if state is None:
+            raise ValueError(f"Entity state not found: {runtime_entity_id}")
+        merged = dict(state.values.get("current_stats") or {})
+        merged.update(stats)
+        await self.set_fields(runtime_entity_id, session_id=session_id, current_stats=merged)
+
+    async def _write_through(self, runtime_entity_id: str, fields: Dict[str, Any]) -> None:
+        columns = list(fields)
+        assignments = ", ".join(f"{column} = ${i + 1}::jsonb" for i, column in enumerate(columns))
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            await conn.execute(
+                f"""
+                UPDATE runtime_data.entity_states
+                SET {assignments}, updated_at = NOW()
+                WHERE runtime_entity_id = ${len(columns) + 1}
+                """,
+                *[encode_jsonb(fields[column]) for column in columns],
+                runtime_entity_id
+            )
+        self.metrics.writes += 1
+
+    def _mark_dirty(self, runtime_entity_id: str, state: _EntityState, fields) -> None:
+        state.dirty.update(fields)
+        self._dirty_ids.add(runtime_entity_id)
+
+        now = time.monotonic()
+        if self._dirty_since is None:
+            self._dirty_since = now
+
+        self._ensure_started()
+        if (len(self._dirty_ids) >= self.max_dirty_entities
+                or now - self._dirty_since >= self.max_dirty_age_seconds):
+            self._flush_requested.set()
+
+    # ------------------------------------------------------------------
+    # flush
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        """현재 이벤트 루프에 flusher 태스크 준비 (지연 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 메모리 상태는 루프와 무관하므로 flusher만 새 루프에서 다시 시작
+            self._loop = loop
+            self._flush_lock = asyncio.Lock()
+            self._flush_requested = asyncio.Event()
+            self._flusher_task = None
+
+        if self._closed:
+            return
+        if self._flusher_task is None or self._flusher_task.done():
+            self._flusher_task = loop.create_task(self._flusher_loop())
+
+    async def _flusher_loop(self) -> None:
+        """주기 또는 임계값 도달 시 dirty 상태 flush"""
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._flush_requested.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Entity state store: flush failed: {e}")
+
+    async def flush(self, session_id: Optional[str] = None) -> int:
+        """
+        dirty 상태를 한 번의 배치 UPDATE로 기록
+
+        Args:
+            session_id: 지정 시 해당 세션 엔티티만 기록 (저장/세션 종료 시)
+
+        Returns:
+            기록된 엔티티 수
+        """
+        if not self._dirty_ids:
+            return 0
+        self._ensure_started()
+
+        async with self._flush_lock:
+            session_id = str(session_id) if session_id else None
+            ids = [
+                entity_id for entity_id in self._dirty_ids
+                if session_id is None or self._states[entity_id].session_id == session_id
+            ]
+            if not ids:
+                return 0
+
+            # await 전에 값을 직렬화하고 dirty를 비워 flush 중 변경은 다음 flush로 넘김
+            columns: List[List[Optional[str]]] = [[] for _ in STATE_FIELDS]
+            snapshot = {}
+            for entity_id in ids:
+                state = self._states[entity_id]
+                snapshot[entity_id] = state.dirty
+                for column, field in zip(columns, STATE_FIELDS):
+                    column.append(encode_jsonb(state.values[field]) if field in state.dirty else None)
+                state.dirty = set()
+                self._dirty_ids.discard(entity_id)
+            self._dirty_since = time.monotonic() if self._dirty_ids else None
+
+            started = time.perf_counter()
+            try:
+                pool = await self.db.pool
+                async with pool.acquire() as conn:
+                    await conn.execute(_FLUSH_SQL, ids, *columns)
+            except Exception:
+                # 기록 실패 시 dirty 복원 (다음 flush에서 재시도)
+                for entity_id, fields in snapshot.items():
+                    state = self._states.get(entity_id)
+                    if state is not None:
+                        state.dirty |= fields
+                        self._dirty_ids.add(entity_id)
+                if self._dirty_ids and self._dirty_since is None:
+                    self._dirty_since = time.monotonic()
+                self.metrics.failed_flushes += 1
+                raise
+
+            self.metrics.flushes += 1
+            self.metrics.flushed_entities += len(ids)
+            self.metrics.last_flush_ms = (time.perf_counter() - started) * 1000
+            return len(ids)
+
+    async def discard_session(self, session_id: str, flush: bool = False) -> None:
+        """세션 엔티티 상태를 메모리에서 제거 (flush=True이면 먼저 기록)"""
+        if flush:
+            await self.flush(session_id)
+        session_id = str(session_id)
+        for entity_id in [eid for eid, state in self._states.items() if state.session_id == session_id]:
+            del self._states[entity_id]
+            self._dirty_ids.discard(entity_id)
+        if not self._dirty_ids:
+            self._dirty_since = None
+
+    async def close(self) -> None:
+        """남은 변경을 기록하고 flusher 종료 (애플리케이션 종료 시)"""
+        self._closed = True
+        task, self._flusher_task = self._flusher_task, None
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            self._flush_requested.set()
+            try:
+                await task
+            except Exception:
+                pass
+        if self._dirty_ids:
+            await self.flush()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "write_behind": self.write_behind,
+            "resident": len(self._states),
+            "dirty": len(self._dirty_ids),
+            "mutations": metrics.mutations,
+            "writes": metrics.writes,
+            "flushes": metrics.flushes,
+            "flushed_entities": metrics.flushed_entities,
+            "failed_flushes": metrics.failed_flushes,
+            "last_flush_ms": metrics.last_flush_ms,
+        }
+
+
+# 전역 엔티티 상태 저장소
+entity_state_store = EntityStateStore()
@@ -313,7 +313,10 @@ class GameDataFactory:
                     json.dumps(conditions or {})
                 )
 
-                return context_id
+        # 대화 카탈로그 무효화 (순환 import 방지를 위해 지연 import)
+        from app.managers.dialogue_catalog import dialogue_catalog
+        dialogue_catalog.invalidate()
+        return context_id
 
     async def create_world_region(
         self,
@@ -8,6 +8,8 @@ from ..connection import DatabaseConnection
 from ..repositories.game_data import GameDataRepository
 from ..repositories.reference_layer import ReferenceLayerRepository
 from ..repositories.runtime_data import RuntimeDataRepository
+from ..cell_occupancy import cell_occupancy
+from common.utils.jsonb_handler import parse_jsonb_data
 
 class InstanceFactory:
     def __init__(self, db_connection: Optional[DatabaseConnection] = None):
@@ -34,63 +36,78 @@ class InstanceFactory:
             position: 초기 위치 {"x": float, "y": float, "z": float}
             customization: 커스터마이징 속성 (선택사항)
         """
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            async with conn.transaction():
-                # 1. 게임 데이터에서 템플릿 로드
-                template = await self.game_data.get_entity(game_entity_id)
-                if not template:
-                    raise ValueError(f"Template not found: {game_entity_id}")
+        runtime_entity_ids = await self.create_npc_instances(
+            [{
+                "game_entity_id": game_entity_id,
+                "runtime_cell_id": runtime_cell_id,
+                "position": position,
+                "customization": customization
+            }],
+            session_id
+        )
+        return runtime_entity_ids[0]
 
-                # 2. 속성 복사 및 커스터마이징
-                properties = copy.deepcopy(json.loads(template['entity_properties']))
-                if customization:
-                    self._deep_update(properties, customization)
+    async def create_npc_instances(
+        self,
+        npc_specs: List[Dict[str, Any]],
+        session_id: str
+    ) -> List[uuid.UUID]:
+        """
+        여러 NPC 템플릿으로부터 런타임 인스턴스를 일괄 생성합니다.
+        
+        템플릿은 한 번에 조회하고, 모든 인스턴스를 하나의 트랜잭션에서 저장합니다.
+        
+        Args:
+            npc_specs: [{"game_entity_id": str, "runtime_cell_id": str,
+                         "position": {"x", "y", "z"}, "customization": dict(선택)}]
+            session_id: 세션 ID
+            
+        Returns:
+            입력 순서와 같은 순서의 runtime_entity_id 목록
+        """
+        if not npc_specs:
+            return []
 
-                # 3. runtime_entity_id 생성
-                runtime_entity_id = uuid.uuid4()  # UUID 객체로 생성 (asyncpg가 자동 변환)
-                
-                # 4. runtime_entities 먼저 생성 (외래키 제약조건을 위해 필수)
-                await conn.execute(
-                    """
-                    INSERT INTO runtime_data.runtime_entities 
-                    (runtime_entity_id, game_entity_id, session_id, created_at)
-                    VALUES ($1, $2, $3, NOW())
-                    """,
-                    runtime_entity_id, game_entity_id, session_id
-                )
+        # 1. 게임 데이터에서 템플릿 일괄 로드
+        templates = await self.game_data.get_entities_by_ids(
+            [spec['game_entity_id'] for spec in npc_specs]
+        )
 
-                # 5. 참조 레이어에 등록
-                await conn.execute(
-                    """
-                    INSERT INTO reference_layer.entity_references 
-                    (runtime_entity_id, game_entity_id, session_id, entity_type, is_player)
-                    VALUES ($1, $2, $3, 'npc', FALSE)
-                    """,
-                    runtime_entity_id, game_entity_id, session_id
-                )
+        entities = []
+        for spec in npc_specs:
+            template = templates.get(spec['game_entity_id'])
+            if not template:
+                raise ValueError(f"Template not found: {spec['game_entity_id']}")
 
-                # 4. 런타임 상태 초기화
-                base_stats = json.loads(template['base_stats'])
-                # current_position에 셀 정보 포함
-                position_with_cell = position.copy()
-                position_with_cell['runtime_cell_id'] = runtime_cell_id
-                await conn.execute(
-                    """
-                    INSERT INTO runtime_data.entity_states 
-                    (runtime_entity_id, current_stats, 
-                     current_position, active_effects, inventory, equipped_items)
-                    VALUES ($1, $2, $3, $4, $5, $6)
-                    """,
-                    runtime_entity_id,
-                    json.dumps(base_stats),
-                    json.dumps(position_with_cell),
-                    json.dumps([]),  # 초기에는 활성 효과 없음
-                    json.dumps(properties.get('initial_inventory', {"items": []})),
-                    json.dumps(properties.get('initial_equipment', {"equipped": []}))
-                )
+            # 2. 속성 복사 및 커스터마이징
+            properties = copy.deepcopy(parse_jsonb_data(template['entity_properties']) or {})
+            if spec.get('customization'):
+                self._deep_update(properties, spec['customization'])
 
-                return runtime_entity_id
+            # 3. current_position에 셀 정보 포함
+            position_with_cell = dict(spec['position'])
+            position_with_cell['runtime_cell_id'] = spec['runtime_cell_id']
+
+            entities.append({
+                "runtime_entity_id": uuid.uuid4(),  # UUID 객체로 생성 (asyncpg가 자동 변환)
+                "game_entity_id": spec['game_entity_id'],
+                "session_id": session_id,
+                "entity_type": "npc",
+                "is_player": False,
+                "current_stats": parse_jsonb_data(template['base_stats']),
+                "current_position": position_with_cell,
+                "active_effects": [],  # 초기에는 활성 효과 없음
+                "inventory": properties.get('initial_inventory', {"items": []}),
+                "equipped_items": properties.get('initial_equipment', {"equipped": []})
+            })
+
+        # 4. runtime_entities / 참조 레이어 / 런타임 상태를 하나의 트랜잭션에서 저장
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await self.runtime_data.insert_entities_bulk(conn, entities)
+
+        return [entity['runtime_entity_id'] for entity in entities]
 
     async def create_player_instance(
         self,
@@ -119,7 +136,7 @@ class InstanceFactory:
                     raise ValueError(f"Template not found: {game_entity_id}")
 
                 # 2. 속성 복사 및 커스터마이징
-                properties = copy.deepcopy(json.loads(template['entity_properties']))
+                properties = copy.deepcopy(parse_jsonb_data(template['entity_properties']))
                 if customization:
                     self._deep_update(properties, customization)
 
@@ -147,24 +164,26 @@ class InstanceFactory:
                 )
 
                 # 4. 런타임 상태 초기화
-                base_stats = json.loads(template['base_stats'])
+                base_stats = parse_jsonb_data(template['base_stats'])
                 # current_position에 셀 정보 포함
                 position_with_cell = position.copy()
                 position_with_cell['runtime_cell_id'] = runtime_cell_id
                 await conn.execute(
                     """
                     INSERT INTO runtime_data.entity_states 
-                    (runtime_entity_id, current_stats, 
+                    (runtime_entity_id, session_id, current_stats, 
                      current_position, active_effects, inventory, equipped_items)
-                    VALUES ($1, $2, $3, $4, $5, $6)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
                     """,
                     runtime_entity_id,
+                    session_id,
                     json.dumps(base_stats),
                     json.dumps(position_with_cell),
                     json.dumps([]),  # 초기에는 활성 효과 없음
                     json.dumps(properties.get('initial_inventory', {"items": []})),
                     json.dumps(properties.get('initial_equipment', {"equipped": []}))
                 )
+                cell_occupancy.move(runtime_entity_id, runtime_cell_id)
 
                 return runtime_entity_id
 
@@ -193,7 +212,7 @@ class InstanceFactory:
                     raise ValueError(f"Template not found: {game_item_id}")
 
                 # 2. 속성 복사 및 커스터마이징
-                properties = copy.deepcopy(json.loads(template['item_properties']))
+                properties = copy.deepcopy(parse_jsonb_data(template['item_properties']))
                 if customization:
                     self._deep_update(properties, customization)
 
@@ -251,7 +270,7 @@ class InstanceFactory:
                     raise ValueError(f"Template not found: {game_effect_id}")
 
                 # 2. 속성 복사 및 커스터마이징
-                properties = copy.deepcopy(json.loads(template['effect_properties']))
+                properties = copy.deepcopy(parse_jsonb_data(template['effect_properties']))
                 if customization:
                     self._deep_update(properties, customization)
 
@@ -296,7 +315,7 @@ class InstanceFactory:
                     raise ValueError(f"Cell template not found: {game_cell_id}")
 
                 # 2. 속성 복사 및 커스터마이징
-                properties = copy.deepcopy(json.loads(template['cell_properties']) if template['cell_properties'] else {})
+                properties = copy.deepcopy(parse_jsonb_data(template['cell_properties']) if template['cell_properties'] else {})
                 if customization:
                     self._deep_update(properties, customization)
 
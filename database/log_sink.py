@@ -0,0 +1,331 @@
+"""
+비동기 배치 로그 싱크
+
+행동 로그/이벤트 로그처럼 게임 진행에 영향을 주지 않는 감사(audit) 쓰기를
+요청 경로에서 분리합니다. 레코드는 제한된 메모리 큐에 적재되고, 백그라운드
+writer 태스크가 크기/시간 임계값에 따라 배치 단위로 기록합니다.
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+import weakref
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from database.connection import DatabaseConnection
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(str, Enum):
+    """큐가 가득 찼을 때의 처리 정책"""
+    BLOCK = "block"                  # 공간이 생길 때까지 대기
+    DROP_OLDEST = "drop_oldest"      # 가장 오래된 레코드 폐기
+    SPILL_TO_FILE = "spill_to_file"  # 초과분을 JSONL 파일로 기록
+
+
+@dataclass
+class LogSinkMetrics:
+    """로그 싱크 통계"""
+    queued: int = 0
+    flushed: int = 0
+    dropped: int = 0
+    spilled: int = 0
+    failed: int = 0
+    batches: int = 0
+    last_flush_ms: float = 0.0
+
+
+Record = Tuple[Any, ...]
+BeforeFlushHook = Callable[[Any, List[Record]], Awaitable[None]]
+
+# 종료 시 일괄 flush를 위한 활성 싱크 목록
+_active_sinks: "weakref.WeakSet[BatchedLogSink]" = weakref.WeakSet()
+
+
+class BatchedLogSink:
+    """
+    제한된 큐 + 배치 writer
+
+    기본 쓰기 경로는 copy_records_to_table(binary COPY)입니다. JSONB처럼 연결에
+    텍스트 코덱이 등록된 컬럼이 있는 테이블은 use_copy=False로 executemany를 사용합니다.
+    배치 쓰기가 실패하면 레코드 단위로 재시도하여 잘못된 레코드만 실패 처리합니다.
+    """
+
+    def __init__(self,
+                 db_connection: DatabaseConnection,
+                 table_name: str,
+                 columns: Sequence[str],
+                 schema_name: str = "runtime_data",
+                 max_queue_size: int = 10000,
+                 batch_size: int = 500,
+                 flush_interval: float = 1.0,
+                 policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 spill_path: Optional[str] = None,
+                 before_flush: Optional[BeforeFlushHook] = None,
+                 use_copy: bool = True):
+        """
+        Args:
+            db_connection: 데이터베이스 연결
+            table_name: 대상 테이블
+            columns: 레코드 튜플 순서와 일치하는 컬럼 목록
+            schema_name: 대상 스키마
+            max_queue_size: 큐 최대 크기
+            batch_size: 배치당 최대 레코드 수 (도달 시 즉시 flush)
+            flush_interval: 최대 flush 주기 (초)
+            policy: 백프레셔 정책
+            spill_path: SPILL_TO_FILE 정책의 JSONL 파일 경로
+            before_flush: 배치 기록 직전 같은 트랜잭션에서 호출되는 훅 (FK 선행 데이터 보장 등)
+            use_copy: COPY 사용 여부
+        """
+        self.db = db_connection
+        self.table_name = table_name
+        self.schema_name = schema_name
+        self.columns = list(columns)
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.policy = BackpressurePolicy(policy)
+        self.spill_path = spill_path or os.path.join("logs", f"{table_name}_spill.jsonl")
+        self.before_flush = before_flush
+        self.use_copy = use_copy
+        self.metrics = LogSinkMetrics()
+
+        placeholders = ", ".join(f"${i + 1}" for i in range(len(self.columns)))
+        self._insert_sql = (
+            f"INSERT INTO {schema_name}.{table_name} ({', '.join(self.columns)}) "
+            f"VALUES ({placeholders})"
+        )
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._batch_ready: Optional[asyncio.Event] = None
+        self._closed = False
+
+        _active_sinks.add(self)
+
+    # ------------------------------------------------------------------
+    # 적재
+    # ------------------------------------------------------------------
+
+    def _ensure_started(self) -> None:
+        """현재 이벤트 루프에 큐/writer 태스크 준비 (지연 시작)"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # 이전 루프의 큐는 사용할 수 없으므로 새로 구성 (테스트마다 루프가 바뀌는 경우)
+            if self._queue is not None and self._queue.qsize():
+                logger.warning(f"Log sink {self.table_name}: discarding {self._queue.qsize()} records from closed loop")
+                self.metrics.dropped += self._queue.qsize()
+            self._loop = loop
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+            self._flush_lock = asyncio.Lock()
+            self._batch_ready = asyncio.Event()
+            self._writer_task = None
+
+        if self._writer_task is None or self._writer_task.done():
+            self._writer_task = loop.create_task(self._writer_loop())
+
+    async def enqueue(self, record: Record) -> bool:
+        """
+        레코드 적재
+
+        Returns:
+            큐에 적재되었는지 여부 (폐기/파일 기록 시 False)
+        """
+        if self._closed:
+            self.metrics.dropped += 1
+            return False
+
+        self._ensure_started()
+        queue = self._queue
+
+        if queue.full():
+            if self.policy == BackpressurePolicy.DROP_OLDEST:
+                queue.get_nowait()
+                self.metrics.dropped += 1
+            elif self.policy == BackpressurePolicy.SPILL_TO_FILE:
+                self._spill([record])
+                return False
+            else:
+                self._batch_ready.set()
+                await queue.put(record)
+                self._after_put(queue)
+                return True
+
+        queue.put_nowait(record)
+        self._after_put(queue)
+        return True
+
+    def _after_put(self, queue: asyncio.Queue) -> None:
+        self.metrics.queued += 1
+        if queue.qsize() >= self.batch_size:
+            self._batch_ready.set()
+
+    def _spill(self, records: List[Record]) -> None:
+        """초과 레코드를 JSONL 파일로 기록"""
+        try:
+            directory = os.path.dirname(self.spill_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for record in records:
+                    f.write(json.dumps(dict(zip(self.columns, record)), ensure_ascii=False, default=str))
+                    f.write("\n")
+            self.metrics.spilled += len(records)
+        except OSError as e:
+            logger.error(f"Log sink {self.table_name}: spill failed: {e}")
+            self.metrics.dropped += len(records)
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+
+    async def _writer_loop(self) -> None:
+        """크기 또는 시간 임계값에 따라 배치 flush"""
+        while True:
+            try:
+                await asyncio.wait_for(self._batch_ready.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._batch_ready.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Log sink {self.table_name}: writer error: {e}")
+
+            if self._closed:
+                return
+
+    def _drain(self) -> List[Record]:
+        batch = []
+        while len(batch) < self.batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    async def flush(self) -> int:
+        """큐에 쌓인 레코드를 모두 기록하고 기록된 레코드 수 반환"""
+        if self._queue is None or self._loop is not asyncio.get_running_loop():
+            return 0
+
+        written = 0
+        async with self._flush_lock:
+            while not self._queue.empty():
+                batch = self._drain()
+                written += await self._write_batch(batch)
+        return written
+
+    async def _write_batch(self, batch: List[Record]) -> int:
+        started = time.perf_counter()
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                async with conn.transaction():
+                    if self.before_flush:
+                        await self.before_flush(conn, batch)
+                    if self.use_copy:
+                        await conn.copy_records_to_table(
+                            self.table_name,
+                            records=batch,
+                            columns=self.columns,
+                            schema_name=self.schema_name
+                        )
+                    else:
+                        await conn.executemany(self._insert_sql, batch)
+            written = len(batch)
+        except Exception as e:
+            logger.warning(f"Log sink {self.table_name}: batch write failed ({len(batch)} records), retrying per record: {e}")
+            written = await self._write_records_individually(batch)
+
+        self.metrics.batches += 1
+        self.metrics.flushed += written
+        self.metrics.last_flush_ms = (time.perf_counter() - started) * 1000
+        return written
+
+    async def _write_records_individually(self, batch: List[Record]) -> int:
+        written = 0
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                for record in batch:
+                    try:
+                        async with conn.transaction():
+                            if self.before_flush:
+                                await self.before_flush(conn, [record])
+                            await conn.execute(self._insert_sql, *record)
+                        written += 1
+                    except Exception as e:
+                        self.metrics.failed += 1
+                        logger.error(f"Log sink {self.table_name}: failed to write record: {e}")
+        except Exception as e:
+            self.metrics.failed += len(batch) - written
+            logger.error(f"Log sink {self.table_name}: connection error: {e}")
+        return written
+
+    # ------------------------------------------------------------------
+    # 종료/상태
+    # ------------------------------------------------------------------
+
+    async def close(self) -> None:
+        """남은 레코드를 모두 기록하고 writer 태스크 종료"""
+        if self._closed:
+            return
+        self._closed = True
+
+        # 진행 중인 배치가 유실되지 않도록 취소 대신 종료 신호 후 대기
+        task, self._writer_task = self._writer_task, None
+        if task is not None and not task.done() and self._loop is asyncio.get_running_loop():
+            self._batch_ready.set()
+            try:
+                await task
+            except Exception:
+                pass
+
+        try:
+            await self.flush()
+        finally:
+            _active_sinks.discard(self)
+            if self._queue is not None and self._queue.qsize():
+                # 다른 루프에서 닫히는 경우 기록할 수 없는 레코드는 파일로 보존
+                self._spill(self._drain_all())
+
+    def _drain_all(self) -> List[Record]:
+        records = []
+        while not self._queue.empty():
+            records.append(self._queue.get_nowait())
+        return records
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 큐 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "table": f"{self.schema_name}.{self.table_name}",
+            "policy": self.policy.value,
+            "pending": self._queue.qsize() if self._queue is not None else 0,
+            "queued": metrics.queued,
+            "flushed": metrics.flushed,
+            "dropped": metrics.dropped,
+            "spilled": metrics.spilled,
+            "failed": metrics.failed,
+            "batches": metrics.batches,
+            "last_flush_ms": metrics.last_flush_ms,
+        }
+
+
+async def close_all_log_sinks() -> None:
+    """활성 로그 싱크 전체 flush 및 종료 (애플리케이션 종료 시)"""
+    for sink in list(_active_sinks):
+        try:
+            await sink.close()
+        except Exception as e:
+            logger.error(f"Log sink {sink.table_name}: close failed: {e}")
+
+
+def get_log_sink_metrics() -> List[Dict[str, Any]]:
+    """활성 로그 싱크 통계"""
+    return [sink.snapshot() for sink in list(_active_sinks)]
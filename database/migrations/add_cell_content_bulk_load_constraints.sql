@@ -0,0 +1,91 @@
+-- =====================================================
+-- 셀 컨텐츠 일괄 로딩을 위한 제약조건/인덱스 추가
+-- =====================================================
+-- 목적: CellManager._load_cell_content_from_db가 오브젝트 수와 무관하게
+--       고정된 쿼리 수로 runtime_objects / object_references / object_states를
+--       INSERT ... SELECT ... ON CONFLICT 로 일괄 생성할 수 있도록 함
+--
+-- 추가 항목:
+-- - object_references (session_id, game_object_id) 유니크 제약
+-- - object_states (runtime_object_id) 유니크 제약
+-- - world_objects.default_cell_id 인덱스 (셀 단위 오브젝트 조회)
+--
+-- 실행 전 주의사항:
+-- 1. 백업 필수
+-- 2. 중복 레퍼런스/상태는 가장 오래된 레퍼런스, 가장 최근 상태만 남기고 정리
+-- =====================================================
+
+-- 1. 세션 내 동일 게임 오브젝트에 대한 중복 런타임 오브젝트 정리
+--    (runtime_objects 삭제 시 object_references / object_states는 CASCADE)
+WITH ranked AS (
+    SELECT runtime_object_id,
+           ROW_NUMBER() OVER (
+               PARTITION BY session_id, game_object_id
+               ORDER BY created_at, runtime_object_id
+           ) AS rn
+    FROM reference_layer.object_references
+)
+DELETE FROM runtime_data.runtime_objects ro
+USING ranked r
+WHERE ro.runtime_object_id = r.runtime_object_id
+  AND r.rn > 1;
+
+WITH ranked AS (
+    SELECT runtime_object_id,
+           ROW_NUMBER() OVER (
+               PARTITION BY session_id, game_object_id
+               ORDER BY created_at, runtime_object_id
+           ) AS rn
+    FROM reference_layer.object_references
+)
+DELETE FROM reference_layer.object_references orf
+USING ranked r
+WHERE orf.runtime_object_id = r.runtime_object_id
+  AND r.rn > 1;
+
+-- 2. 런타임 오브젝트당 중복 상태 정리 (가장 최근 상태 유지)
+WITH ranked AS (
+    SELECT state_id,
+           ROW_NUMBER() OVER (
+               PARTITION BY runtime_object_id
+               ORDER BY updated_at DESC NULLS LAST, created_at DESC NULLS LAST
+           ) AS rn
+    FROM runtime_data.object_states
+)
+DELETE FROM runtime_data.object_states os
+USING ranked r
+WHERE os.state_id = r.state_id
+  AND r.rn > 1;
+
+-- 3. 유니크 제약 추가 (ON CONFLICT 대상)
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'uq_object_references_session_object'
+    ) THEN
+        ALTER TABLE reference_layer.object_references
+        ADD CONSTRAINT uq_object_references_session_object UNIQUE (session_id, game_object_id);
+    END IF;
+
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'uq_object_states_runtime_object'
+    ) THEN
+        ALTER TABLE runtime_data.object_states
+        ADD CONSTRAINT uq_object_states_runtime_object UNIQUE (runtime_object_id);
+    END IF;
+END $$;
+
+-- 4. 셀 단위 오브젝트 조회 인덱스
+CREATE INDEX IF NOT EXISTS idx_world_objects_default_cell ON game_data.world_objects(default_cell_id);
+
+-- =====================================================
+-- 통계 정보 업데이트 (쿼리 플래너 최적화)
+-- =====================================================
+
+ANALYZE game_data.world_objects;
+ANALYZE reference_layer.object_references;
+ANALYZE runtime_data.object_states;
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
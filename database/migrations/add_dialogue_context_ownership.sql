@@ -0,0 +1,21 @@
+-- =====================================================
+-- 대화 기록용 컨텍스트에 NPC 소유 키(entity_id) 채우기
+-- =====================================================
+-- 목적: DialogueManager는 dialogue_id LIKE '%npc_id%' 대신
+--       dialogue_contexts.entity_id(소유 키)로 NPC 컨텍스트를 찾음 (대화 카탈로그 인덱스)
+--       기존 대화 기록 저장 시 entity_id 없이 생성된 'ctx_{NPC 런타임 ID}_{주제}'
+--       컨텍스트에 소유 키를 채워 전역 컨텍스트로 취급되지 않도록 함
+--
+-- 변경 항목:
+-- - dialogue_contexts.entity_id: 'ctx_<uuid>_' 형식 컨텍스트의 NPC 런타임 ID
+-- =====================================================
+
+UPDATE game_data.dialogue_contexts
+SET entity_id = substring(dialogue_id FROM 5 FOR 36),
+    updated_at = CURRENT_TIMESTAMP
+WHERE (entity_id IS NULL OR entity_id = '')
+  AND dialogue_id ~* '^ctx_[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}_';
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
@@ -0,0 +1,24 @@
+-- =====================================================
+-- 셀 점유 조회용 current_cell_id 인덱스 추가
+-- =====================================================
+-- 목적: "셀에 누가 있는가" 조회(셀 컨텐츠 로드, 셀 엔티티 조회, NPC 상호작용)가
+--       current_position->>'runtime_cell_id' 문자열 비교로 entity_states 전체를
+--       순차 스캔하지 않도록 생성 컬럼 current_cell_id에 인덱스 추가
+--
+-- 추가 인덱스:
+-- - idx_entity_states_current_cell_id: current_cell_id 기반 조회
+--   (셀에 없는 엔티티(NULL)는 제외한 부분 인덱스)
+--   runtime_cells 삭제 시 FK(ON DELETE SET NULL) 처리에도 사용됨
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_entity_states_current_cell_id
+ON runtime_data.entity_states (current_cell_id)
+WHERE current_cell_id IS NOT NULL;
+
+COMMENT ON INDEX runtime_data.idx_entity_states_current_cell_id IS '셀 점유 조회 최적화 (current_cell_id = $1)';
+
+ANALYZE runtime_data.entity_states;
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
@@ -0,0 +1,29 @@
+-- =====================================================
+-- 위치 동기화 트리거에 변경 조건 추가
+-- =====================================================
+-- 목적: entity_states 배치 UPDATE(엔티티 상태 write-behind flush)는 모든 JSONB 컬럼을
+--       SET 목록에 포함하므로, current_position이 실제로 바뀐 행에서만
+--       cell_occupants 동기화 트리거가 실행되도록 함
+--
+-- 변경 항목:
+-- - trg_sync_cell_occupants_from_position: UPDATE는 위치가 바뀐 경우에만 실행
+--   (INSERT 트리거는 기존과 동일)
+-- =====================================================
+
+DROP TRIGGER IF EXISTS trg_sync_cell_occupants_from_position ON runtime_data.entity_states;
+DROP TRIGGER IF EXISTS trg_sync_cell_occupants_from_position_insert ON runtime_data.entity_states;
+
+CREATE TRIGGER trg_sync_cell_occupants_from_position_insert
+AFTER INSERT ON runtime_data.entity_states
+FOR EACH ROW
+EXECUTE FUNCTION runtime_data.sync_cell_occupants_from_position();
+
+CREATE TRIGGER trg_sync_cell_occupants_from_position
+AFTER UPDATE OF current_position ON runtime_data.entity_states
+FOR EACH ROW
+WHEN (OLD.current_position IS DISTINCT FROM NEW.current_position)
+EXECUTE FUNCTION runtime_data.sync_cell_occupants_from_position();
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
@@ -0,0 +1,74 @@
+-- =====================================================
+-- 저장 슬롯 전용 테이블 추가
+-- =====================================================
+-- 목적: 저장 슬롯을 active_sessions.metadata JSONB에 넣고 모든 세션 행을
+--       읽어 Python에서 찾던 방식을 (owner, slot_id) 기본 키 조회로 교체하고,
+--       엔티티/오브젝트 상태까지 담은 스냅샷으로 실제 복원이 가능하도록 함
+--
+-- 추가 테이블:
+-- - runtime_data.save_slots: 슬롯 요약 (목록 표시용) + 마지막 저장 시점의 행 다이제스트
+--   세션 FK 없음 (세션이 종료/정리되어도 저장은 유지되고 불러오기 시 세션을 다시 만듦)
+-- - runtime_data.save_slot_snapshots: 압축 스냅샷 체인
+--   seq 1은 전체 스냅샷(full), 이후는 직전 저장 이후 바뀐 행만 담은 증분(incremental)
+--
+-- 기존 active_sessions.metadata의 save_slots는 요약만 옮김 (스냅샷 없음 -> 세션이 남아 있을 때만 불러오기)
+-- =====================================================
+
+CREATE TABLE IF NOT EXISTS runtime_data.save_slots (
+    owner VARCHAR(100) NOT NULL DEFAULT 'local',
+    slot_id INTEGER NOT NULL,
+    session_id UUID NOT NULL,
+    save_name VARCHAR(200),
+    player_name VARCHAR(100),
+    location VARCHAR(200),
+    play_time INTEGER DEFAULT 0,
+    game_state JSONB,
+    codec VARCHAR(10) NOT NULL DEFAULT 'zlib',
+    chain_length INTEGER NOT NULL DEFAULT 0,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    row_digests BYTEA,
+    saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (owner, slot_id)
+);
+
+CREATE TABLE IF NOT EXISTS runtime_data.save_slot_snapshots (
+    owner VARCHAR(100) NOT NULL,
+    slot_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    kind VARCHAR(20) NOT NULL,
+    codec VARCHAR(10) NOT NULL DEFAULT 'zlib',
+    payload BYTEA NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (owner, slot_id, seq),
+    FOREIGN KEY (owner, slot_id) REFERENCES runtime_data.save_slots(owner, slot_id) ON DELETE CASCADE,
+    CONSTRAINT chk_save_snapshot_kind CHECK (kind IN ('full', 'incremental'))
+);
+
+COMMENT ON TABLE runtime_data.save_slots IS '저장 슬롯 요약 (owner, slot_id 기본 키 조회)';
+COMMENT ON COLUMN runtime_data.save_slots.row_digests IS '마지막 저장 시점의 행별 다이제스트 (압축, 증분 저장 비교용)';
+COMMENT ON TABLE runtime_data.save_slot_snapshots IS '저장 슬롯 스냅샷 체인 (full 1개 + incremental, 압축 bytea)';
+
+-- 기존 metadata 저장 슬롯 이전 (슬롯 번호별 가장 최근 저장만)
+INSERT INTO runtime_data.save_slots
+    (owner, slot_id, session_id, save_name, player_name, location, play_time, game_state, saved_at)
+SELECT DISTINCT ON (s.key::int)
+       'local', s.key::int, a.session_id,
+       s.value->>'save_name', s.value->>'player_name', s.value->>'location',
+       COALESCE((s.value->>'play_time')::int, 0), s.value->'game_state',
+       COALESCE((s.value->>'save_date')::timestamp, a.updated_at)
+FROM runtime_data.active_sessions a
+CROSS JOIN LATERAL jsonb_each(a.metadata->'save_slots') AS s
+WHERE jsonb_typeof(a.metadata->'save_slots') = 'object'
+  AND s.key ~ '^[0-9]+$'
+ORDER BY s.key::int, COALESCE((s.value->>'save_date')::timestamp, a.updated_at) DESC
+ON CONFLICT (owner, slot_id) DO NOTHING;
+
+UPDATE runtime_data.active_sessions
+SET metadata = metadata - 'save_slots'
+WHERE metadata ? 'save_slots';
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
@@ -0,0 +1,62 @@
+-- =====================================================
+-- 통합 검색용 트라이그램(pg_trgm) 인덱스 추가
+-- =====================================================
+-- 목적: SearchService는 타입별 ILIKE '%검색어%' 순차 스캔 대신
+--       UNION ALL 한 번의 쿼리로 이름/설명을 검색하고 유사도로 정렬함
+--       (ILIKE 부분 일치와 오타 허용 유사 단어 검색(<%)이 GIN 트라이그램 인덱스를 사용)
+--
+-- 추가 인덱스:
+-- - 지역/장소/셀/엔티티/오브젝트/기본 속성(아이템)/Effect Carrier 이름
+-- - 지역/장소/셀/엔티티/오브젝트/기본 속성(아이템) 설명
+-- =====================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- 1. 이름 인덱스 (부분 일치 + 유사 단어 검색)
+CREATE INDEX IF NOT EXISTS idx_world_regions_name_trgm ON game_data.world_regions
+USING GIN (region_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_world_locations_name_trgm ON game_data.world_locations
+USING GIN (location_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_world_cells_name_trgm ON game_data.world_cells
+USING GIN (cell_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_entities_name_trgm ON game_data.entities
+USING GIN (entity_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_world_objects_name_trgm ON game_data.world_objects
+USING GIN (object_name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_base_properties_name_trgm ON game_data.base_properties
+USING GIN (name gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_effect_carriers_name_trgm ON game_data.effect_carriers
+USING GIN (name gin_trgm_ops);
+
+-- 2. 설명 인덱스 (부분 일치)
+CREATE INDEX IF NOT EXISTS idx_world_regions_description_trgm ON game_data.world_regions
+USING GIN (region_description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_world_locations_description_trgm ON game_data.world_locations
+USING GIN (location_description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_world_cells_description_trgm ON game_data.world_cells
+USING GIN (cell_description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_entities_description_trgm ON game_data.entities
+USING GIN (entity_description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_world_objects_description_trgm ON game_data.world_objects
+USING GIN (object_description gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS idx_base_properties_description_trgm ON game_data.base_properties
+USING GIN (description gin_trgm_ops);
+
+-- =====================================================
+-- 인덱스 추가 완료
+-- =====================================================
+
+COMMENT ON INDEX game_data.idx_entities_name_trgm IS '통합 검색: 엔티티 이름 부분 일치/유사 단어 검색';
+COMMENT ON INDEX game_data.idx_world_objects_name_trgm IS '통합 검색: 오브젝트 이름 부분 일치/유사 단어 검색';
+COMMENT ON INDEX game_data.idx_base_properties_name_trgm IS '통합 검색: 아이템(기본 속성) 이름 부분 일치/유사 단어 검색';
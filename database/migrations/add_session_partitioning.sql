@@ -0,0 +1,207 @@
+-- =====================================================
+-- 세션 단위 파티셔닝 (선택 적용)
+-- =====================================================
+-- 목적: 세션 종료/유휴 세션 회수 시 entity_states, cell_references의 세션 행을
+--       행 단위 DELETE 대신 세션 파티션 분리 + DROP(또는 TRUNCATE)으로 정리
+--
+-- 대상 테이블 (PARTITION BY LIST (session_id), 세션마다 파티션 1개):
+-- - runtime_data.entity_states
+-- - reference_layer.cell_references
+-- 파티션 이름: <테이블>_s_<세션 UUID 32자리 hex> (runtime_data.session_partition_name)
+--
+-- 변경 사항:
+-- - 기본 키/유니크 제약에 session_id 추가 (파티션 키 조건), entity_states.session_id NOT NULL
+--   (session_id가 비어 있던 entity_states 행은 runtime_entities에서 채움)
+-- - DEFAULT 파티션 없음: 세션 행은 항상 세션 파티션에 들어가고 분리(DETACH ... CONCURRENTLY) 가능
+--   세션이 없는 행(고아 행)은 옮기지 않음
+-- - active_sessions INSERT 트리거가 세션 파티션 생성 (CREATE TABLE + ATTACH, 상위 테이블은
+--   SHARE UPDATE EXCLUSIVE만 잡으므로 다른 세션의 조회/갱신을 막지 않음)
+-- - 인덱스/FK/트리거/주석은 기존 정의를 그대로 다시 만듦
+--
+-- 제외: reference_layer.entity_references (triggered_events가 FK로 참조하여 분할 불가)
+--
+-- 세션 파티션 정리는 database.session_storage가 담당 (분할 여부는 카탈로그로 감지)
+-- PostgreSQL 13 이상 필요 (14 이상에서 CONCURRENTLY 분리)
+-- mvp_schema.sql에는 포함하지 않음 (세션이 많이 쌓이는 배포에서 선택 적용)
+-- =====================================================
+
+-- 1. 파티션 이름 / 생성 함수
+CREATE OR REPLACE FUNCTION runtime_data.session_partition_name(p_table TEXT, p_session_id UUID)
+RETURNS TEXT AS $$
+    SELECT p_table || '_s_' || replace(p_session_id::text, '-', '')
+$$ LANGUAGE sql IMMUTABLE;
+
+CREATE OR REPLACE FUNCTION runtime_data.create_session_partitions(p_session_id UUID)
+RETURNS VOID AS $$
+DECLARE
+    v_parent RECORD;
+    v_name TEXT;
+BEGIN
+    FOR v_parent IN
+        SELECT n.nspname AS schema_name, c.relname AS table_name
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE c.relkind = 'p'
+          AND n.nspname || '.' || c.relname IN ('runtime_data.entity_states', 'reference_layer.cell_references')
+    LOOP
+        v_name := runtime_data.session_partition_name(v_parent.table_name, p_session_id);
+        IF to_regclass(format('%I.%I', v_parent.schema_name, v_name)) IS NOT NULL THEN
+            CONTINUE;
+        END IF;
+
+        -- CREATE TABLE ... PARTITION OF는 상위 테이블에 ACCESS EXCLUSIVE를 잡으므로 만든 뒤 ATTACH
+        EXECUTE format(
+            'CREATE TABLE %I.%I (LIKE %I.%I INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS)',
+            v_parent.schema_name, v_name, v_parent.schema_name, v_parent.table_name
+        );
+        EXECUTE format(
+            'ALTER TABLE %I.%I ATTACH PARTITION %I.%I FOR VALUES IN (%L)',
+            v_parent.schema_name, v_parent.table_name, v_parent.schema_name, v_name, p_session_id
+        );
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION runtime_data.create_session_partitions_on_insert()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM runtime_data.create_session_partitions(NEW.session_id);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 2. 기존 테이블을 세션 분할 테이블로 교체하는 함수 (마이그레이션 후 삭제)
+CREATE OR REPLACE FUNCTION runtime_data.partition_table_by_session(p_schema TEXT, p_table TEXT)
+RETURNS VOID AS $$
+DECLARE
+    v_source REGCLASS := format('%I.%I', p_schema, p_table)::regclass;
+    v_legacy TEXT := p_table || '_unpartitioned';
+    v_keys TEXT[];
+    v_indexes TEXT[];
+    v_foreign_keys TEXT[];
+    v_triggers TEXT[];
+    v_comments TEXT[];
+    v_columns TEXT;
+    v_statement TEXT;
+    r RECORD;
+BEGIN
+    IF (SELECT relkind FROM pg_class WHERE oid = v_source) = 'p' THEN
+        RAISE NOTICE '%.% 는 이미 분할되어 있습니다.', p_schema, p_table;
+        RETURN;
+    END IF;
+
+    -- 2-1. 기존 정의 수집 (이름 변경 전이므로 정의가 원래 테이블 이름을 가리킴)
+    SELECT array_agg(format(
+               'ALTER TABLE %I.%I ADD CONSTRAINT %I %s (%s)',
+               p_schema, p_table, c.conname,
+               CASE c.contype WHEN 'p' THEN 'PRIMARY KEY' ELSE 'UNIQUE' END,
+               (SELECT string_agg(quote_ident(a.attname), ', ' ORDER BY k.ord)
+                FROM unnest(c.conkey) WITH ORDINALITY AS k(attnum, ord)
+                JOIN pg_attribute a ON a.attrelid = c.conrelid AND a.attnum = k.attnum)
+               || CASE WHEN 'session_id' = ANY(
+                      SELECT a.attname FROM pg_attribute a
+                      WHERE a.attrelid = c.conrelid AND a.attnum = ANY(c.conkey)
+                  ) THEN '' ELSE ', session_id' END
+           ))
+    INTO v_keys
+    FROM pg_constraint c
+    WHERE c.conrelid = v_source AND c.contype IN ('p', 'u');
+
+    SELECT array_agg(format('ALTER TABLE %I.%I ADD CONSTRAINT %I %s',
+                            p_schema, p_table, c.conname, pg_get_constraintdef(c.oid)))
+    INTO v_foreign_keys
+    FROM pg_constraint c
+    WHERE c.conrelid = v_source AND c.contype = 'f';
+
+    SELECT array_agg(pg_get_indexdef(i.indexrelid))
+    INTO v_indexes
+    FROM pg_index i
+    WHERE i.indrelid = v_source
+      AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid AND c.conrelid = v_source);
+
+    SELECT array_agg(pg_get_triggerdef(t.oid))
+    INTO v_triggers
+    FROM pg_trigger t
+    WHERE t.tgrelid = v_source AND NOT t.tgisinternal;
+
+    SELECT array_agg(format('COMMENT ON TABLE %I.%I IS %L', p_schema, p_table, d.description))
+    INTO v_comments
+    FROM pg_description d
+    WHERE d.objoid = v_source AND d.classoid = 'pg_class'::regclass AND d.objsubid = 0;
+
+    SELECT v_comments || array_agg(format('COMMENT ON INDEX %I.%I IS %L', p_schema, ic.relname, d.description))
+    INTO v_comments
+    FROM pg_index i
+    JOIN pg_class ic ON ic.oid = i.indexrelid
+    JOIN pg_description d ON d.objoid = i.indexrelid AND d.classoid = 'pg_class'::regclass
+    WHERE i.indrelid = v_source;
+
+    SELECT string_agg(quote_ident(a.attname), ', ' ORDER BY a.attnum)
+    INTO v_columns
+    FROM pg_attribute a
+    WHERE a.attrelid = v_source AND a.attnum > 0 AND NOT a.attisdropped AND a.attgenerated = '';
+
+    -- 2-2. 기존 테이블과 인덱스 이름 비우기
+    EXECUTE format('ALTER TABLE %I.%I RENAME TO %I', p_schema, p_table, v_legacy);
+    FOR r IN
+        SELECT ic.relname FROM pg_index i JOIN pg_class ic ON ic.oid = i.indexrelid WHERE i.indrelid = v_source
+    LOOP
+        EXECUTE format('ALTER INDEX %I.%I RENAME TO %I', p_schema, r.relname, left(r.relname, 49) || '_unpartitioned');
+    END LOOP;
+
+    -- 2-3. 분할 테이블 생성 (CHECK/NOT NULL/기본값/생성 컬럼/컬럼 주석은 LIKE로 복사)
+    EXECUTE format(
+        'CREATE TABLE %I.%I (LIKE %I.%I INCLUDING DEFAULTS INCLUDING GENERATED INCLUDING CONSTRAINTS '
+        'INCLUDING COMMENTS INCLUDING STORAGE) PARTITION BY LIST (session_id)',
+        p_schema, p_table, p_schema, v_legacy
+    );
+    EXECUTE format('ALTER TABLE %I.%I ALTER COLUMN session_id SET NOT NULL', p_schema, p_table);
+    FOREACH v_statement IN ARRAY COALESCE(v_keys, '{}') LOOP
+        EXECUTE v_statement;
+    END LOOP;
+
+    -- 2-4. 기존 세션 파티션 생성 후 행 이동 (트리거/FK를 다시 만들기 전이라 행 단위 동기화 없음)
+    FOR r IN SELECT session_id FROM runtime_data.active_sessions LOOP
+        PERFORM runtime_data.create_session_partitions(r.session_id);
+    END LOOP;
+    EXECUTE format(
+        'INSERT INTO %I.%I (%s) SELECT %s FROM %I.%I '
+        'WHERE session_id IN (SELECT session_id FROM runtime_data.active_sessions)',
+        p_schema, p_table, v_columns, v_columns, p_schema, v_legacy
+    );
+
+    -- 2-5. 기존 테이블 삭제 후 인덱스/FK/트리거/주석 복원
+    EXECUTE format('DROP TABLE %I.%I', p_schema, v_legacy);
+    FOREACH v_statement IN ARRAY COALESCE(v_indexes, '{}') || COALESCE(v_foreign_keys, '{}')
+                              || COALESCE(v_triggers, '{}') || COALESCE(v_comments, '{}') LOOP
+        EXECUTE v_statement;
+    END LOOP;
+
+    EXECUTE format('ANALYZE %I.%I', p_schema, p_table);
+END;
+$$ LANGUAGE plpgsql;
+
+-- 3. entity_states.session_id 채우기 (NOT NULL 전환 전)
+UPDATE runtime_data.entity_states es
+SET session_id = re.session_id
+FROM runtime_data.runtime_entities re
+WHERE es.session_id IS NULL
+  AND re.runtime_entity_id = es.runtime_entity_id;
+
+-- 4. 테이블 교체
+SELECT runtime_data.partition_table_by_session('runtime_data', 'entity_states');
+SELECT runtime_data.partition_table_by_session('reference_layer', 'cell_references');
+
+DROP FUNCTION runtime_data.partition_table_by_session(TEXT, TEXT);
+
+-- 5. 새 세션 파티션 생성 트리거
+DROP TRIGGER IF EXISTS trg_create_session_partitions ON runtime_data.active_sessions;
+CREATE TRIGGER trg_create_session_partitions
+AFTER INSERT ON runtime_data.active_sessions
+FOR EACH ROW EXECUTE FUNCTION runtime_data.create_session_partitions_on_insert();
+
+COMMENT ON FUNCTION runtime_data.create_session_partitions(UUID) IS '세션 파티션 생성 (entity_states, cell_references 중 분할된 테이블)';
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
@@ -0,0 +1,30 @@
+-- =====================================================
+-- TimeSystem 이벤트 스케줄러 영속화 컬럼 추가
+-- =====================================================
+-- 목적: TimeSystem의 대기 중 스케줄 이벤트를 game_data.time_events에 저장하고
+--       세션 재시작 시 복원할 수 있도록 함
+--
+-- 추가 항목:
+-- - session_id: 이벤트를 스케줄한 세션 (NULL이면 템플릿 이벤트)
+-- - repeat_interval: 반복 간격 (분 단위, NULL이면 1회성)
+-- - (session_id, is_active) 인덱스 (세션 단위 복원)
+-- =====================================================
+
+ALTER TABLE game_data.time_events
+    ADD COLUMN IF NOT EXISTS session_id UUID,
+    ADD COLUMN IF NOT EXISTS repeat_interval INTEGER;
+
+COMMENT ON COLUMN game_data.time_events.session_id IS '이벤트를 스케줄한 세션 (NULL이면 템플릿 이벤트)';
+COMMENT ON COLUMN game_data.time_events.repeat_interval IS '반복 간격 (분 단위, NULL이면 1회성)';
+
+CREATE INDEX IF NOT EXISTS idx_time_events_session_active ON game_data.time_events(session_id, is_active);
+
+-- =====================================================
+-- 통계 정보 업데이트 (쿼리 플래너 최적화)
+-- =====================================================
+
+ANALYZE game_data.time_events;
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
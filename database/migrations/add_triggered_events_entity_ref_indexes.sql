@@ -0,0 +1,29 @@
+-- =====================================================
+-- triggered_events 엔티티 참조 FK 인덱스 추가
+-- =====================================================
+-- 목적: 세션 정리(database.session_storage)에서 entity_references를 집합 DELETE할 때
+--       삭제되는 행마다 source_entity_ref/target_entity_ref FK 확인이
+--       triggered_events 전체를 순차 스캔하지 않도록 참조 컬럼에 인덱스 추가
+--       (이벤트 로그가 쌓인 상태에서 엔티티 10만 세션 정리가 명령 제한 시간을 넘던 문제)
+--
+-- 추가 인덱스:
+-- - idx_triggered_events_source_entity_ref: source_entity_ref (NULL 제외 부분 인덱스)
+-- - idx_triggered_events_target_entity_ref: target_entity_ref (NULL 제외 부분 인덱스)
+-- =====================================================
+
+CREATE INDEX IF NOT EXISTS idx_triggered_events_source_entity_ref
+ON runtime_data.triggered_events (source_entity_ref)
+WHERE source_entity_ref IS NOT NULL;
+
+CREATE INDEX IF NOT EXISTS idx_triggered_events_target_entity_ref
+ON runtime_data.triggered_events (target_entity_ref)
+WHERE target_entity_ref IS NOT NULL;
+
+COMMENT ON INDEX runtime_data.idx_triggered_events_source_entity_ref IS 'entity_references 삭제 시 FK 확인';
+COMMENT ON INDEX runtime_data.idx_triggered_events_target_entity_ref IS 'entity_references 삭제 시 FK 확인';
+
+ANALYZE runtime_data.triggered_events;
+
+-- =====================================================
+-- 마이그레이션 완료
+-- =====================================================
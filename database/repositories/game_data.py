@@ -20,6 +20,19 @@ class GameDataRepository:
             )
             return dict(row) if row else None
 
+    async def get_entities_by_ids(self, entity_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """여러 엔티티 정보를 한 번에 조회합니다. (entity_id -> 엔티티)"""
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT * FROM game_data.entities 
+                WHERE entity_id = ANY($1::varchar[])
+                """, 
+                list(set(entity_ids))
+            )
+            return {row['entity_id']: dict(row) for row in rows}
+
     async def get_entities_by_type(self, entity_type: str) -> List[Dict[str, Any]]:
         """특정 타입의 모든 엔티티를 조회합니다."""
         pool = await self.db.pool
@@ -248,6 +248,112 @@ class ReferenceLayerRepository:
             )
             return [dict(row) for row in rows]
 
+    async def get_cell_reference_map(self, session_id: str) -> Dict[str, str]:
+        """세션의 game_cell_id -> runtime_cell_id 맵을 조회합니다."""
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                """
+                SELECT game_cell_id, runtime_cell_id FROM reference_layer.cell_references 
+                WHERE session_id = $1
+                """, 
+                session_id
+            )
+            return {row['game_cell_id']: str(row['runtime_cell_id']) for row in rows}
+
+    async def get_or_create_cell_references(self, game_cell_ids: List[str], session_id: str) -> Dict[str, str]:
+        """
+        여러 게임 셀의 셀 참조를 한 번에 조회하거나 생성합니다.
+        
+        get_or_create_cell_reference의 일괄 버전 (runtime_cells → cell_references 순서로 생성).
+        동시에 생성된 참조는 uq_cell_references_session_cell 제약조건으로 걸러내고 기존 참조를 사용합니다.
+        
+        Returns:
+            Dict[str, str]: game_cell_id -> runtime_cell_id (존재하지 않는 게임 셀은 제외)
+        """
+        import uuid
+        game_cell_ids = list(dict.fromkeys(game_cell_ids))
+        if not game_cell_ids:
+            return {}
+        
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                rows = await conn.fetch(
+                    """
+                    SELECT game_cell_id, runtime_cell_id FROM reference_layer.cell_references
+                    WHERE session_id = $1 AND game_cell_id = ANY($2::text[])
+                    """,
+                    session_id, game_cell_ids
+                )
+                references = {row['game_cell_id']: str(row['runtime_cell_id']) for row in rows}
+                missing = [cell_id for cell_id in game_cell_ids if cell_id not in references]
+                if not missing:
+                    return references
+                
+                # 게임 데이터에서 cell_type 조회 (cell_properties.cell_type, 기본값 indoor)
+                cells = await conn.fetch(
+                    """
+                    SELECT cell_id, COALESCE(cell_properties->>'cell_type', 'indoor') AS cell_type
+                    FROM game_data.world_cells
+                    WHERE cell_id = ANY($1::text[])
+                    """,
+                    missing
+                )
+                if not cells:
+                    return references
+                
+                new_ids = [uuid.uuid4() for _ in cells]
+                new_cell_ids = [row['cell_id'] for row in cells]
+                cell_types = [row['cell_type'] for row in cells]
+                
+                # 1. runtime_cells에 먼저 생성 (FK 제약조건을 위해 필수)
+                await conn.execute(
+                    """
+                    INSERT INTO runtime_data.runtime_cells (
+                        runtime_cell_id, game_cell_id, session_id, status, cell_type, created_at
+                    )
+                    SELECT t.runtime_cell_id, t.game_cell_id, $4::uuid, 'active', t.cell_type, NOW()
+                    FROM unnest($1::uuid[], $2::text[], $3::text[])
+                        AS t(runtime_cell_id, game_cell_id, cell_type)
+                    """,
+                    new_ids, new_cell_ids, cell_types, session_id
+                )
+                
+                # 2. 참조 레이어에 등록 (동시에 생성된 참조와 충돌하면 건너뜀)
+                inserted = await conn.fetch(
+                    """
+                    INSERT INTO reference_layer.cell_references
+                    (runtime_cell_id, game_cell_id, session_id, cell_type)
+                    SELECT t.runtime_cell_id, t.game_cell_id, $4::uuid, t.cell_type
+                    FROM unnest($1::uuid[], $2::text[], $3::text[])
+                        AS t(runtime_cell_id, game_cell_id, cell_type)
+                    ON CONFLICT (session_id, game_cell_id) DO NOTHING
+                    RETURNING game_cell_id, runtime_cell_id
+                    """,
+                    new_ids, new_cell_ids, cell_types, session_id
+                )
+                references.update({row['game_cell_id']: str(row['runtime_cell_id']) for row in inserted})
+                
+                # 3. 충돌한 셀은 먼저 생성된 참조 사용, 사용되지 않은 runtime_cells 행 제거
+                conflicted = [cell_id for cell_id in new_cell_ids if cell_id not in references]
+                if conflicted:
+                    unused = [runtime_id for runtime_id, cell_id in zip(new_ids, new_cell_ids) if cell_id in conflicted]
+                    await conn.execute(
+                        "DELETE FROM runtime_data.runtime_cells WHERE runtime_cell_id = ANY($1::uuid[])",
+                        unused
+                    )
+                    rows = await conn.fetch(
+                        """
+                        SELECT game_cell_id, runtime_cell_id FROM reference_layer.cell_references
+                        WHERE session_id = $1 AND game_cell_id = ANY($2::text[])
+                        """,
+                        session_id, conflicted
+                    )
+                    references.update({row['game_cell_id']: str(row['runtime_cell_id']) for row in rows})
+        
+        return references
+
     async def delete_entity_reference(self, runtime_entity_id: str) -> bool:
         """엔티티 참조를 삭제합니다."""
         pool = await self.db.pool
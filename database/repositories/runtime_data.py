@@ -2,6 +2,9 @@ from typing import Optional, List, Dict, Any
 import asyncpg
 import json
 from ..connection import DatabaseConnection
+from ..entity_state_store import entity_state_store
+from ..cell_occupancy import cell_occupancy
+from common.utils.jsonb_handler import encode_jsonb
 
 class RuntimeDataRepository:
     def __init__(self, db_connection=None):
@@ -45,7 +48,61 @@ class RuntimeDataRepository:
                 entity_state_data.get('inventory', []),
                 entity_state_data.get('equipped_items', [])
             )
-            return entity_state_data['runtime_entity_id']
+        cell_occupancy.track_position(entity_state_data['runtime_entity_id'], entity_state_data['current_position'])
+        return entity_state_data['runtime_entity_id']
+
+    async def insert_entities_bulk(self, conn: asyncpg.Connection, entities: List[Dict[str, Any]]) -> None:
+        """
+        런타임 엔티티를 일괄 생성합니다. (runtime_entities, entity_references, entity_states)
+        
+        호출자의 커넥션/트랜잭션에서 실행되며, 테이블당 한 번의 왕복으로 처리합니다.
+        JSONB 값은 Python 객체 또는 직렬화된 JSON 문자열 모두 허용합니다.
+        """
+        if not entities:
+            return
+        
+        await conn.copy_records_to_table(
+            'runtime_entities',
+            schema_name='runtime_data',
+            columns=['runtime_entity_id', 'game_entity_id', 'session_id'],
+            records=[(e['runtime_entity_id'], e['game_entity_id'], e['session_id']) for e in entities]
+        )
+        
+        await conn.execute(
+            """
+            INSERT INTO reference_layer.entity_references
+            (runtime_entity_id, game_entity_id, session_id, entity_type, is_player)
+            SELECT r.runtime_entity_id, r.game_entity_id, r.session_id,
+                   r.entity_type::entity_type_enum, r.is_player
+            FROM unnest($1::uuid[], $2::varchar[], $3::uuid[], $4::text[], $5::boolean[])
+                AS r(runtime_entity_id, game_entity_id, session_id, entity_type, is_player)
+            """,
+            [e['runtime_entity_id'] for e in entities],
+            [e['game_entity_id'] for e in entities],
+            [e['session_id'] for e in entities],
+            [e['entity_type'] for e in entities],
+            [e.get('is_player', False) for e in entities]
+        )
+        
+        await conn.execute(
+            """
+            INSERT INTO runtime_data.entity_states
+            (runtime_entity_id, session_id, current_stats, current_position, active_effects, inventory, equipped_items)
+            SELECT s.runtime_entity_id, s.session_id, s.current_stats::jsonb, s.current_position::jsonb,
+                   s.active_effects::jsonb, s.inventory::jsonb, s.equipped_items::jsonb
+            FROM unnest($1::uuid[], $2::uuid[], $3::text[], $4::text[], $5::text[], $6::text[], $7::text[])
+                AS s(runtime_entity_id, session_id, current_stats, current_position, active_effects, inventory, equipped_items)
+            """,
+            [e['runtime_entity_id'] for e in entities],
+            [e['session_id'] for e in entities],
+            [encode_jsonb(e.get('current_stats') or {}) for e in entities],
+            [encode_jsonb(e.get('current_position') or {}) for e in entities],
+            [encode_jsonb(e.get('active_effects', [])) for e in entities],
+            [encode_jsonb(e.get('inventory') or {"items": [], "quantities": {}}) for e in entities],
+            [encode_jsonb(e.get('equipped_items', [])) for e in entities]
+        )
+        for e in entities:
+            cell_occupancy.track_position(e['runtime_entity_id'], e.get('current_position'))
 
     async def create_cell(self, cell_data: Dict[str, Any]) -> str:
         """셀을 생성합니다."""
@@ -67,7 +124,7 @@ class RuntimeDataRepository:
         """셀의 엔티티와 오브젝트 정보를 로드합니다."""
         pool = await self.db.pool
         async with pool.acquire() as conn:
-            # 엔티티 정보 조회 (current_position JSONB에서 runtime_cell_id 확인)
+            # 엔티티 정보 조회 (current_cell_id 생성 컬럼 인덱스 사용)
             entities = await conn.fetch(
                 """
                 SELECT 
@@ -78,7 +135,7 @@ class RuntimeDataRepository:
                 FROM runtime_data.entity_states es
                 JOIN reference_layer.entity_references er 
                     ON es.runtime_entity_id = er.runtime_entity_id
-                WHERE es.current_position->>'runtime_cell_id' = $1
+                WHERE es.current_cell_id = $1::uuid
                 """,
                 runtime_cell_id
             )
@@ -109,19 +166,10 @@ class RuntimeDataRepository:
 
     async def update_entity_cell(self, runtime_entity_id: str, runtime_cell_id: str, position: Dict[str, float]):
         """엔티티의 셀과 위치를 업데이트합니다."""
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            # current_position JSONB에 runtime_cell_id 포함
-            position_with_cell = position.copy()
-            position_with_cell['runtime_cell_id'] = runtime_cell_id
-            await conn.execute(
-                """
-                UPDATE runtime_data.entity_states
-                SET current_position = $1
-                WHERE runtime_entity_id = $2
-                """,
-                json.dumps(position_with_cell), runtime_entity_id
-            )
+        # current_position JSONB에 runtime_cell_id 포함
+        position_with_cell = position.copy()
+        position_with_cell['runtime_cell_id'] = runtime_cell_id
+        await entity_state_store.set_fields(runtime_entity_id, current_position=position_with_cell)
 
     async def update_entity_state(self, runtime_entity_id: str, properties: Dict[str, Any]):
         """엔티티의 상태를 업데이트합니다."""
@@ -138,17 +186,8 @@ class RuntimeDataRepository:
             )
 
     async def update_entity_stats(self, runtime_entity_id: str, stats: Dict[str, Any]):
-        """엔티티의 스탯을 업데이트합니다."""
-        pool = await self.db.pool
-        async with pool.acquire() as conn:
-            await conn.execute(
-                """
-                UPDATE runtime_data.entity_states
-                SET current_stats = current_stats || $1::jsonb
-                WHERE runtime_entity_id = $2
-                """,
-                json.dumps(stats), runtime_entity_id
-            )
+        """엔티티의 스탯을 업데이트합니다. (current_stats || stats)"""
+        await entity_state_store.merge_stats(runtime_entity_id, stats)
 
     async def get_active_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """세션 정보를 조회합니다."""
@@ -188,7 +227,8 @@ class RuntimeDataRepository:
                 """, 
                 runtime_entity_id
             )
-            return dict(row) if row else None
+            # write-behind 모드의 미기록 변경 반영
+            return entity_state_store.overlay(runtime_entity_id, dict(row)) if row else None
 
     async def get_entity_states_by_cell(self, runtime_cell_id: str) -> List[Dict[str, Any]]:
         """특정 셀에 있는 모든 엔티티의 상태를 조회합니다."""
@@ -204,11 +244,11 @@ class RuntimeDataRepository:
                 FROM runtime_data.entity_states es
                 JOIN reference_layer.entity_references er 
                     ON es.runtime_entity_id = er.runtime_entity_id
-                WHERE es.current_position->>'runtime_cell_id' = $1
+                WHERE es.current_cell_id = $1::uuid
                 """, 
                 runtime_cell_id
             )
-            return [dict(row) for row in rows]
+            return [entity_state_store.overlay(row['runtime_entity_id'], dict(row)) for row in rows]
 
     async def get_object_state(self, runtime_object_id: str) -> Optional[Dict[str, Any]]:
         """오브젝트의 현재 상태를 조회합니다."""
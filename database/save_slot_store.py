@@ -0,0 +1,610 @@
+"""
+저장 슬롯 스냅샷 저장소
+
+게임 저장을 runtime_data.save_slots ((owner, slot_id) 기본 키)에 두고, 세션의 런타임 행을
+압축 스냅샷으로 보관해 불러오기 시 저장 시점의 상태로 복원합니다.
+
+- 스냅샷 대상: 세션 행, 런타임 셀/엔티티/오브젝트와 참조 계층, 셀-오브젝트 배치,
+  entity_states, object_states, session_states (SNAPSHOT_TABLES, 복원도 이 순서)
+- 형식: 첫 줄 헤더 JSON, 이후 한 줄에 "테이블\\t키\\t행 JSON" (행 JSON은 row_to_json 결과 그대로,
+  빈 행은 삭제 표시)을 zstd(zstandard 설치 시) 또는 zlib으로 압축한 bytea 하나
+- 증분 저장: 같은 세션을 같은 슬롯에 다시 저장하면 직전 저장의 행 다이제스트와 비교해
+  바뀐/삭제된 행만 저장 (체인이 save_max_incremental_chain을 넘거나 바뀐 비율이
+  save_incremental_max_ratio를 넘으면 전체 스냅샷으로 다시 시작)
+- 복원: 체인을 순서대로 적용한 행을 테이블별 임시 테이블에 COPY(copy_records_to_table)한 뒤
+  스냅샷에 없는 세션 행 삭제 + INSERT ... ON CONFLICT 병합 (한 트랜잭션, 같은 행은 건너뜀)
+  세션이 이미 정리되었으면 세션 행부터 다시 만듦
+- 스냅샷이 없는 슬롯(기존 metadata 저장에서 이전)은 restore()가 restored=False로 반환
+
+사용 예:
+    from database.save_slot_store import save_slot_store
+
+    await save_slot_store.save(session_id, 1, {"save_name": "저장 1", "player_name": "...", ...})
+    slots = await save_slot_store.list_slots()
+    slot = await save_slot_store.restore(1)
+"""
+import hashlib
+import json
+import logging
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.config.app_config import GAME_CONFIG
+from database.connection import DatabaseConnection
+from database.cell_occupancy import cell_occupancy
+from database.entity_state_store import entity_state_store
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FORMAT = "save_snapshot"
+SNAPSHOT_VERSION = 1
+
+# 싱글 플레이 기본 소유자 (사용자 구분이 생기면 계정 ID)
+DEFAULT_OWNER = "local"
+
+ZSTD_LEVEL = 3
+ZLIB_LEVEL = 6
+
+
+@dataclass(frozen=True)
+class _SnapshotTable:
+    name: str
+    table: str
+    keys: Tuple[str, ...]
+    scope: str  # 세션 범위 조건 (별칭 t, $1 = session_id)
+
+
+_BY_SESSION = "t.session_id = $1"
+_BY_SESSION_ENTITIES = (
+    "t.runtime_entity_id IN (SELECT runtime_entity_id FROM runtime_data.runtime_entities WHERE session_id = $1)"
+)
+_BY_SESSION_OBJECTS = (
+    "t.runtime_object_id IN (SELECT runtime_object_id FROM runtime_data.runtime_objects WHERE session_id = $1)"
+)
+
+# 스냅샷 테이블 (외래 키 순서: 복원도 이 순서로 실행)
+SNAPSHOT_TABLES: Tuple[_SnapshotTable, ...] = (
+    _SnapshotTable("runtime_cells", "runtime_data.runtime_cells", ("runtime_cell_id",), _BY_SESSION),
+    _SnapshotTable("cell_references", "reference_layer.cell_references", ("runtime_cell_id",), _BY_SESSION),
+    _SnapshotTable("runtime_entities", "runtime_data.runtime_entities", ("runtime_entity_id",), _BY_SESSION),
+    _SnapshotTable("entity_references", "reference_layer.entity_references", ("runtime_entity_id",), _BY_SESSION),
+    _SnapshotTable("runtime_objects", "runtime_data.runtime_objects", ("runtime_object_id",), _BY_SESSION),
+    _SnapshotTable("object_references", "reference_layer.object_references", ("runtime_object_id",), _BY_SESSION),
+    _SnapshotTable("runtime_cell_objects", "runtime_data.runtime_cell_objects",
+                   ("runtime_cell_id", "runtime_object_id"), _BY_SESSION_OBJECTS),
+    _SnapshotTable("entity_states", "runtime_data.entity_states", ("state_id",), _BY_SESSION_ENTITIES),
+    _SnapshotTable("object_states", "runtime_data.object_states", ("runtime_object_id",), _BY_SESSION_OBJECTS),
+    _SnapshotTable("session_states", "runtime_data.session_states", ("session_id",), _BY_SESSION),
+)
+
+_SLOT_COLUMNS = """
+    slot_id, session_id::text AS session_id, save_name, player_name, location,
+    play_time, saved_at, chain_length, row_count
+"""
+
+Rows = Dict[str, Dict[str, str]]  # 스냅샷 테이블 이름 -> 키 -> 행 JSON
+
+
+@dataclass
+class SaveSlotMetrics:
+    """저장 슬롯 통계"""
+    full_saves: int = 0
+    incremental_saves: int = 0
+    rows_written: int = 0
+    bytes_written: int = 0
+    restores: int = 0
+    rows_restored: int = 0
+    last_save_ms: float = 0.0
+    last_restore_ms: float = 0.0
+
+
+def _key_expr(keys: Tuple[str, ...]) -> str:
+    if len(keys) == 1:
+        return f't."{keys[0]}"::text'
+    return "concat_ws(':', " + ", ".join(f't."{key}"::text' for key in keys) + ")"
+
+
+def resolve_codec(codec: Optional[str]) -> str:
+    """압축 방식 결정 (zstandard가 없으면 zlib)"""
+    codec = codec or "zlib"
+    if codec not in ("zstd", "zlib"):
+        raise ValueError(f"지원하지 않는 스냅샷 압축 방식: {codec}")
+    if codec == "zstd" and zstandard is None:
+        return "zlib"
+    return codec
+
+
+def compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 저장 데이터를 읽으려면 zstandard 패키지가 필요합니다.")
+        return zstandard.ZstdDecompressor().decompress(data)
+    return zlib.decompress(data)
+
+
+def encode_payload(header: Dict[str, Any], entries: Iterable[Tuple[str, str, str]]) -> bytes:
+    """헤더 JSON 한 줄 + "테이블\\t키\\t행" 줄 (행 JSON에는 줄바꿈/탭이 이스케이프되어 있음)"""
+    lines = [json.dumps(header, ensure_ascii=False)]
+    lines.extend(f"{name}\t{key}\t{row}" for name, key, row in entries)
+    return "\n".join(lines).encode("utf-8")
+
+
+def decode_payload(data: bytes) -> Tuple[Dict[str, Any], List[Tuple[str, str, str]]]:
+    header_line, _, body = data.decode("utf-8").partition("\n")
+    entries = [tuple(line.split("\t", 2)) for line in body.split("\n")] if body else []
+    return json.loads(header_line), entries
+
+
+def row_digest(row: str) -> str:
+    return hashlib.blake2b(row.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def apply_entries(rows: Rows, entries: Iterable[Tuple[str, str, str]]) -> None:
+    """스냅샷 항목 적용 (빈 행은 삭제)"""
+    for name, key, row in entries:
+        table_rows = rows.setdefault(name, {})
+        if row:
+            table_rows[key] = row
+        else:
+            table_rows.pop(key, None)
+
+
+def diff_rows(rows: Rows, digests: Dict[str, str],
+              previous_digests: Dict[str, str]) -> List[Tuple[str, str, str]]:
+    """직전 저장 다이제스트 대비 바뀐 행과 삭제된 행 (삭제는 빈 행)"""
+    changes = [
+        (name, key, row)
+        for name, table_rows in rows.items()
+        for key, row in table_rows.items()
+        if previous_digests.get(f"{name}\t{key}") != digests[f"{name}\t{key}"]
+    ]
+    for entry in previous_digests:
+        if entry not in digests:
+            name, key = entry.split("\t", 1)
+            changes.append((name, key, ""))
+    return changes
+
+
+def _slot_summary(record) -> Dict[str, Any]:
+    saved_at = record["saved_at"]
+    return {
+        "slot_id": record["slot_id"],
+        "session_id": record["session_id"],
+        "save_name": record["save_name"],
+        "player_name": record["player_name"] or "플레이어",
+        "location": record["location"] or "",
+        "play_time": record["play_time"] or 0,
+        "save_date": saved_at.isoformat() if saved_at else "",
+        "snapshots": record["chain_length"],
+        "rows": record["row_count"],
+    }
+
+
+class SaveSlotStore:
+    """저장 슬롯 스냅샷 저장소"""
+
+    def __init__(self,
+                 db_connection: Optional[DatabaseConnection] = None,
+                 codec: Optional[str] = None,
+                 max_incremental_chain: Optional[int] = None,
+                 incremental_max_ratio: Optional[float] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+            codec: 스냅샷 압축 방식 (기본: GAME_CONFIG["save_snapshot_codec"])
+            max_incremental_chain: 전체 스냅샷 뒤 최대 증분 저장 수
+                (기본: GAME_CONFIG["save_max_incremental_chain"], 0이면 항상 전체 스냅샷)
+            incremental_max_ratio: 증분으로 저장할 최대 변경 행 비율
+                (기본: GAME_CONFIG["save_incremental_max_ratio"])
+        """
+        self._db = db_connection
+        self.codec = resolve_codec(codec or GAME_CONFIG["save_snapshot_codec"])
+        self.max_incremental_chain = (GAME_CONFIG["save_max_incremental_chain"]
+                                      if max_incremental_chain is None else max_incremental_chain)
+        self.incremental_max_ratio = incremental_max_ratio or GAME_CONFIG["save_incremental_max_ratio"]
+        self.metrics = SaveSlotMetrics()
+        # 스냅샷 테이블 -> (복원할 컬럼 (생성 컬럼 제외), 병합 충돌 대상 기본 키)
+        self._columns: Optional[Dict[str, Tuple[List[str], List[str]]]] = None
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    # ------------------------------------------------------------------
+    # 조회/삭제
+    # ------------------------------------------------------------------
+
+    async def list_slots(self, owner: str = DEFAULT_OWNER) -> List[Dict[str, Any]]:
+        """소유자의 저장 슬롯 요약 (slot_id 순)"""
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            records = await conn.fetch(
+                f"SELECT {_SLOT_COLUMNS} FROM runtime_data.save_slots WHERE owner = $1 ORDER BY slot_id",
+                owner
+            )
+        return [_slot_summary(record) for record in records]
+
+    async def get_slot(self, slot_id: int, owner: str = DEFAULT_OWNER) -> Optional[Dict[str, Any]]:
+        """저장 슬롯 요약 (없으면 None)"""
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            record = await conn.fetchrow(
+                f"SELECT {_SLOT_COLUMNS} FROM runtime_data.save_slots WHERE owner = $1 AND slot_id = $2",
+                owner, slot_id
+            )
+        return _slot_summary(record) if record else None
+
+    async def delete(self, slot_id: int, owner: str = DEFAULT_OWNER) -> bool:
+        """저장 슬롯 삭제 (스냅샷 체인은 CASCADE)"""
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            result = await conn.execute(
+                "DELETE FROM runtime_data.save_slots WHERE owner = $1 AND slot_id = $2",
+                owner, slot_id
+            )
+        return result != "DELETE 0"
+
+    # ------------------------------------------------------------------
+    # 저장
+    # ------------------------------------------------------------------
+
+    async def save(self,
+                   session_id: str,
+                   slot_id: int,
+                   summary: Dict[str, Any],
+                   owner: str = DEFAULT_OWNER) -> Dict[str, Any]:
+        """
+        세션 스냅샷 저장 (엔티티 상태 write-behind와 세션 시계는 호출 전에 flush 필요)
+
+        Args:
+            summary: 슬롯 목록 표시용 요약 (save_name, player_name, location, play_time, game_state)
+
+        Returns:
+            {"slot_id", "kind": "full" | "incremental", "rows", "bytes"}
+        """
+        session_id = str(session_id)
+        started = time.perf_counter()
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            # 테이블 간 일관된 시점으로 읽기
+            async with conn.transaction(isolation="repeatable_read", readonly=True):
+                session, rows = await self._capture(conn, session_id)
+            digests = {
+                f"{name}\t{key}": row_digest(row)
+                for name, table_rows in rows.items()
+                for key, row in table_rows.items()
+            }
+
+            async with conn.transaction():
+                # 같은 슬롯 동시 저장 직렬화
+                await conn.execute("SELECT pg_advisory_xact_lock(hashtext($1))", f"save_slot:{owner}:{slot_id}")
+                previous = await conn.fetchrow(
+                    """
+                    SELECT session_id::text AS session_id, codec, chain_length, row_digests
+                    FROM runtime_data.save_slots
+                    WHERE owner = $1 AND slot_id = $2
+                    """,
+                    owner, slot_id
+                )
+                changes = self._incremental_changes(previous, session_id, rows, digests)
+                if changes is None:
+                    kind, seq = "full", 1
+                    entries = [(name, key, row) for name, table_rows in rows.items() for key, row in table_rows.items()]
+                    await conn.execute(
+                        "DELETE FROM runtime_data.save_slot_snapshots WHERE owner = $1 AND slot_id = $2",
+                        owner, slot_id
+                    )
+                else:
+                    kind, seq = "incremental", previous["chain_length"] + 1
+                    entries = changes
+
+                header = {
+                    "format": SNAPSHOT_FORMAT,
+                    "version": SNAPSHOT_VERSION,
+                    "kind": kind,
+                    "session_id": session_id,
+                    "session": session,
+                }
+                payload = compress(encode_payload(header, entries), self.codec)
+                digest_lines = "\n".join(f"{entry}\t{digest}" for entry, digest in digests.items())
+                row_digests = compress(digest_lines.encode("utf-8"), self.codec)
+
+                await conn.execute(
+                    """
+                    INSERT INTO runtime_data.save_slots
+                        (owner, slot_id, session_id, save_name, player_name, location, play_time,
+                         game_state, codec, chain_length, row_count, row_digests, saved_at)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7, $8::jsonb, $9, $10, $11, $12, NOW())
+                    ON CONFLICT (owner, slot_id) DO UPDATE
+                    SET session_id = EXCLUDED.session_id,
+                        save_name = EXCLUDED.save_name,
+                        player_name = EXCLUDED.player_name,
+                        location = EXCLUDED.location,
+                        play_time = EXCLUDED.play_time,
+                        game_state = EXCLUDED.game_state,
+                        codec = EXCLUDED.codec,
+                        chain_length = EXCLUDED.chain_length,
+                        row_count = EXCLUDED.row_count,
+                        row_digests = EXCLUDED.row_digests,
+                        saved_at = NOW()
+                    """,
+                    owner, slot_id, session_id,
+                    summary.get("save_name") or f"저장 슬롯 {slot_id}",
+                    summary.get("player_name"),
+                    summary.get("location") or "",
+                    int(summary.get("play_time") or 0),
+                    json.dumps(summary.get("game_state") or {}, ensure_ascii=False, default=str),
+                    self.codec, seq, len(digests), row_digests
+                )
+                await conn.execute(
+                    """
+                    INSERT INTO runtime_data.save_slot_snapshots
+                        (owner, slot_id, seq, kind, codec, payload, row_count)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    """,
+                    owner, slot_id, seq, kind, self.codec, payload, len(entries)
+                )
+
+        if kind == "full":
+            self.metrics.full_saves += 1
+        else:
+            self.metrics.incremental_saves += 1
+        self.metrics.rows_written += len(entries)
+        self.metrics.bytes_written += len(payload)
+        self.metrics.last_save_ms = (time.perf_counter() - started) * 1000
+        return {"slot_id": slot_id, "kind": kind, "rows": len(entries), "bytes": len(payload)}
+
+    async def _capture(self, conn, session_id: str) -> Tuple[Dict[str, Any], Rows]:
+        """세션 행과 스냅샷 테이블 행 (row_to_json 텍스트 그대로)"""
+        session = await conn.fetchrow(
+            """
+            SELECT session_name,
+                   (COALESCE(metadata, '{}'::jsonb) - 'save_slots')::text AS metadata,
+                   player_runtime_entity_id::text AS player_id
+            FROM runtime_data.active_sessions
+            WHERE session_id = $1
+            """,
+            session_id
+        )
+        if session is None:
+            raise ValueError("세션을 찾을 수 없습니다.")
+
+        rows: Rows = {}
+        for spec in SNAPSHOT_TABLES:
+            records = await conn.fetch(
+                f"SELECT {_key_expr(spec.keys)} AS k, row_to_json(t)::text AS r "
+                f"FROM {spec.table} t WHERE {spec.scope}",
+                session_id
+            )
+            rows[spec.name] = {record["k"]: record["r"] for record in records}
+        return {
+            "session_name": session["session_name"],
+            "metadata": json.loads(session["metadata"]),
+            "player_id": session["player_id"],
+        }, rows
+
+    def _incremental_changes(self, previous, session_id: str, rows: Rows,
+                             digests: Dict[str, str]) -> Optional[List[Tuple[str, str, str]]]:
+        """증분으로 저장할 변경 행 (전체 스냅샷이 필요하면 None)"""
+        if previous is None or previous["row_digests"] is None or previous["session_id"] != session_id:
+            return None
+        # chain_length는 전체 스냅샷 1개 + 증분 수
+        if not 1 <= previous["chain_length"] <= self.max_incremental_chain:
+            return None
+
+        previous_digests = {}
+        for line in decompress(previous["row_digests"], previous["codec"]).decode("utf-8").split("\n"):
+            if line:
+                entry, _, digest = line.rpartition("\t")
+                previous_digests[entry] = digest
+
+        changes = diff_rows(rows, digests, previous_digests)
+        if len(changes) > max(len(digests), 1) * self.incremental_max_ratio:
+            return None
+        return changes
+
+    # ------------------------------------------------------------------
+    # 복원
+    # ------------------------------------------------------------------
+
+    async def restore(self, slot_id: int, owner: str = DEFAULT_OWNER) -> Optional[Dict[str, Any]]:
+        """
+        저장 슬롯 스냅샷으로 세션 복원 (세션 캐시 무효화는 호출자가 session_registry.on_load로 처리)
+
+        Returns:
+            슬롯 요약 + "restored" (스냅샷이 없는 이전 형식 슬롯이면 False), 슬롯이 없으면 None
+        """
+        started = time.perf_counter()
+        pool = await self.db.pool
+        async with pool.acquire() as conn:
+            record = await conn.fetchrow(
+                f"SELECT {_SLOT_COLUMNS} FROM runtime_data.save_slots WHERE owner = $1 AND slot_id = $2",
+                owner, slot_id
+            )
+            if record is None:
+                return None
+            slot = _slot_summary(record)
+            snapshots = await conn.fetch(
+                """
+                SELECT kind, codec, payload
+                FROM runtime_data.save_slot_snapshots
+                WHERE owner = $1 AND slot_id = $2
+                ORDER BY seq
+                """,
+                owner, slot_id
+            )
+            if not snapshots:
+                slot["restored"] = False
+                return slot
+            if snapshots[0]["kind"] != "full":
+                raise ValueError(f"저장 슬롯 {slot_id}의 전체 스냅샷이 없습니다.")
+
+            header: Dict[str, Any] = {}
+            rows: Rows = {spec.name: {} for spec in SNAPSHOT_TABLES}
+            for snapshot in snapshots:
+                header, entries = decode_payload(decompress(snapshot["payload"], snapshot["codec"]))
+                apply_entries(rows, entries)
+            session_id = header["session_id"]
+            session = header["session"]
+
+            # 복원한 상태를 미기록 변경이 덮어쓰지 않도록 버림
+            await entity_state_store.discard_session(session_id)
+            columns = await self._restorable_columns(conn)
+
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    INSERT INTO runtime_data.active_sessions
+                        (session_id, session_name, session_state, metadata, last_active_at)
+                    VALUES ($1, $2, 'active', $3::jsonb, NOW())
+                    ON CONFLICT (session_id) DO UPDATE
+                    SET session_name = EXCLUDED.session_name,
+                        session_state = 'active',
+                        metadata = EXCLUDED.metadata,
+                        closed_at = NULL,
+                        last_active_at = NOW(),
+                        updated_at = NOW()
+                    """,
+                    session_id, session["session_name"], json.dumps(session["metadata"], ensure_ascii=False)
+                )
+                for spec in SNAPSHOT_TABLES:
+                    table_columns, conflict_keys = columns[spec.table]
+                    await self._restore_table(conn, spec, session_id, rows[spec.name], table_columns, conflict_keys)
+                await conn.execute(
+                    """
+                    UPDATE runtime_data.active_sessions
+                    SET player_runtime_entity_id = $2::uuid
+                    WHERE session_id = $1
+                    """,
+                    session_id, session.get("player_id")
+                )
+
+        cell_occupancy.invalidate_session(session_id)
+        restored_rows = sum(len(table_rows) for table_rows in rows.values())
+        self.metrics.restores += 1
+        self.metrics.rows_restored += restored_rows
+        self.metrics.last_restore_ms = (time.perf_counter() - started) * 1000
+        logger.info(f"Save slots: restored slot {slot_id} ({restored_rows} rows, "
+                    f"{len(snapshots)} snapshots) in {self.metrics.last_restore_ms:.1f} ms")
+        slot["restored"] = True
+        return slot
+
+    async def _restorable_columns(self, conn) -> Dict[str, Tuple[List[str], List[str]]]:
+        """
+        스냅샷 테이블별 (INSERT 가능한 컬럼, 기본 키 컬럼) 최초 1회 조회
+
+        생성 컬럼은 제외하고, 병합 충돌 대상은 카탈로그의 기본 키를 사용
+        (세션 파티셔닝 적용 시 기본 키에 session_id가 추가됨)
+        """
+        if self._columns is None:
+            tables = [spec.table for spec in SNAPSHOT_TABLES]
+            records = await conn.fetch(
+                """
+                SELECT n.nspname || '.' || c.relname AS table_name, a.attname AS column_name
+                FROM pg_attribute a
+                JOIN pg_class c ON c.oid = a.attrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE n.nspname || '.' || c.relname = ANY($1::text[])
+                  AND a.attnum > 0 AND NOT a.attisdropped AND a.attgenerated = ''
+                ORDER BY a.attrelid, a.attnum
+                """,
+                tables
+            )
+            key_records = await conn.fetch(
+                """
+                SELECT n.nspname || '.' || c.relname AS table_name, a.attname AS column_name
+                FROM pg_index i
+                JOIN pg_class c ON c.oid = i.indrelid
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+                WHERE i.indisprimary
+                  AND n.nspname || '.' || c.relname = ANY($1::text[])
+                ORDER BY a.attrelid, a.attnum
+                """,
+                tables
+            )
+            columns: Dict[str, List[str]] = {table: [] for table in tables}
+            for record in records:
+                columns[record["table_name"]].append(record["column_name"])
+            keys: Dict[str, List[str]] = {table: [] for table in tables}
+            for record in key_records:
+                keys[record["table_name"]].append(record["column_name"])
+            self._columns = {
+                spec.table: (columns[spec.table], keys[spec.table] or list(spec.keys))
+                for spec in SNAPSHOT_TABLES
+            }
+        return self._columns
+
+    @staticmethod
+    async def _restore_table(conn, spec: _SnapshotTable, session_id: str,
+                             table_rows: Dict[str, str], columns: List[str],
+                             conflict_keys: List[str]) -> None:
+        """임시 테이블에 COPY 후 스냅샷에 없는 세션 행 삭제 + 병합 (내용이 같은 행은 갱신하지 않음)"""
+        stage = f"_restore_{spec.name}"
+        await conn.execute(f'CREATE TEMP TABLE "{stage}" (k text PRIMARY KEY, r text NOT NULL) ON COMMIT DROP')
+        if table_rows:
+            await conn.copy_records_to_table(stage, records=list(table_rows.items()), columns=["k", "r"])
+
+        await conn.execute(
+            f'DELETE FROM {spec.table} t WHERE {spec.scope} '
+            f'AND NOT EXISTS (SELECT 1 FROM "{stage}" s WHERE s.k = {_key_expr(spec.keys)})',
+            session_id
+        )
+        if not table_rows:
+            return
+
+        column_list = ", ".join(f'"{column}"' for column in columns)
+        selected = ", ".join(f'p."{column}"' for column in columns)
+        sql = (
+            f'INSERT INTO {spec.table} AS t ({column_list}) '
+            f'SELECT {selected} FROM "{stage}" s '
+            f'CROSS JOIN LATERAL jsonb_populate_record(NULL::{spec.table}, s.r::jsonb) p '
+            f'ON CONFLICT ({", ".join(conflict_keys)}) DO '
+        )
+        updates = [column for column in columns if column not in conflict_keys]
+        if updates:
+            assignments = ", ".join(f'"{column}" = EXCLUDED."{column}"' for column in updates)
+            current = ", ".join(f't."{column}"' for column in updates)
+            incoming = ", ".join(f'EXCLUDED."{column}"' for column in updates)
+            sql += f'UPDATE SET {assignments} WHERE ({current}) IS DISTINCT FROM ({incoming})'
+        else:
+            sql += 'NOTHING'
+        await conn.execute(sql)
+
+    # ------------------------------------------------------------------
+    # 통계
+    # ------------------------------------------------------------------
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "codec": self.codec,
+            "full_saves": metrics.full_saves,
+            "incremental_saves": metrics.incremental_saves,
+            "rows_written": metrics.rows_written,
+            "bytes_written": metrics.bytes_written,
+            "restores": metrics.restores,
+            "rows_restored": metrics.rows_restored,
+            "last_save_ms": round(metrics.last_save_ms, 2),
+            "last_restore_ms": round(metrics.last_restore_ms, 2),
+        }
+
+
+# 전역 저장 슬롯 저장소
+save_slot_store = SaveSlotStore()
@@ -0,0 +1,276 @@
+"""
+세션 런타임 행 정리 (세션 종료 / 인스턴스 정리 / 유휴 세션 회수)
+
+세션 하나의 런타임 행을 한 곳에서 지웁니다.
+
+- 테이블마다 session_id 기준 집합 DELETE 한 번 (entity_states도 IN (SELECT ...) 없이 session_id로)
+  session_id가 채워지기 전에 기록된 entity_states 행(NULL)은 entity_references 조인으로 함께 삭제
+- cell_occupants는 행마다 직접 쓰기 방지 트리거가 걸리지 않도록 동기화 트리거와 같은 방식
+  (session_replication_role = replica, 트랜잭션 한정)으로 한 번에 삭제한 뒤 상위 행 삭제
+- 세션 파티셔닝(database/migrations/add_session_partitioning.sql)이 적용된 테이블은
+  DELETE와 같은 트랜잭션에서 세션 파티션을 TRUNCATE (실패하면 함께 롤백)하고,
+  세션 종료 시에는 커밋 후 빈 파티션을 분리(CONCURRENTLY) 후 DROP
+  적용 여부는 카탈로그(relkind = 'p')로 최초 1회 확인
+- 정리한 테이블별 행 수와 소요 시간을 통계로 유지 (/health/db)
+
+사용 예:
+    from database.session_storage import session_storage
+
+    reclaimed = await session_storage.purge(session_id)                      # 세션 종료
+    reclaimed = await session_storage.purge(session_id, keep_session=True)   # 인스턴스만 정리
+"""
+import logging
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from database.connection import DatabaseConnection
+from database.cell_occupancy import cell_occupancy
+from database.entity_state_store import entity_state_store
+
+logger = logging.getLogger(__name__)
+
+# 세션 단위로 분할할 수 있는 테이블 (스키마, 테이블)
+# entity_references는 triggered_events가 FK로 참조하므로 분할 대상에서 제외
+SESSION_PARTITIONED_TABLES: Tuple[Tuple[str, str], ...] = (
+    ("runtime_data", "entity_states"),
+    ("reference_layer", "cell_references"),
+)
+
+_CELL_OCCUPANTS_SQL = """
+    DELETE FROM runtime_data.cell_occupants co
+    USING runtime_data.runtime_entities re
+    WHERE re.runtime_entity_id = co.runtime_entity_id AND re.session_id = $1
+"""
+
+# session_id 없이 기록된 이전 entity_states 행 (세션 파티셔닝 마이그레이션 전 배포)
+# session_id 조건 DELETE 뒤에 같은 라벨로 실행하여 이전 IN (SELECT ...) 정리와 같은 행을 지움
+_LEGACY_ENTITY_STATES_SQL = """
+    DELETE FROM runtime_data.entity_states
+    WHERE session_id IS NULL
+      AND runtime_entity_id IN (
+          SELECT runtime_entity_id FROM reference_layer.entity_references WHERE session_id = $1
+      )
+"""
+
+# (라벨, SQL) - FK 순서대로 실행. cell_occupants 라벨은 트리거 우회 상태에서 실행
+_INSTANCE_STEPS: Tuple[Tuple[str, str], ...] = (
+    ("runtime_data.entity_states", "DELETE FROM runtime_data.entity_states WHERE session_id = $1"),
+    ("runtime_data.entity_states", _LEGACY_ENTITY_STATES_SQL),
+    ("runtime_data.cell_occupants", _CELL_OCCUPANTS_SQL),
+    ("reference_layer.entity_references", "DELETE FROM reference_layer.entity_references WHERE session_id = $1"),
+    ("reference_layer.cell_references", "DELETE FROM reference_layer.cell_references WHERE session_id = $1"),
+)
+
+_SESSION_STEPS: Tuple[Tuple[str, str], ...] = (
+    ("runtime_data.entity_states", "DELETE FROM runtime_data.entity_states WHERE session_id = $1"),
+    ("runtime_data.entity_states", _LEGACY_ENTITY_STATES_SQL),
+    ("runtime_data.cell_occupants", _CELL_OCCUPANTS_SQL),
+    # active_sessions를 CASCADE 없이 참조하는 로그 테이블
+    ("runtime_data.dialogue_history", "DELETE FROM runtime_data.dialogue_history WHERE session_id = $1"),
+    ("runtime_data.dialogue_states", "DELETE FROM runtime_data.dialogue_states WHERE session_id = $1"),
+    ("runtime_data.action_logs", "DELETE FROM runtime_data.action_logs WHERE session_id = $1"),
+    ("runtime_data.player_choices", "DELETE FROM runtime_data.player_choices WHERE session_id = $1"),
+    ("runtime_data.triggered_events", "DELETE FROM runtime_data.triggered_events WHERE session_id = $1"),
+    ("reference_layer.entity_references", "DELETE FROM reference_layer.entity_references WHERE session_id = $1"),
+    ("reference_layer.cell_references", "DELETE FROM reference_layer.cell_references WHERE session_id = $1"),
+    ("reference_layer.object_references", "DELETE FROM reference_layer.object_references WHERE session_id = $1"),
+    # 셀-엔티티/오브젝트 배치, object_states 등은 CASCADE로 함께 삭제
+    ("runtime_data.runtime_entities", "DELETE FROM runtime_data.runtime_entities WHERE session_id = $1"),
+    ("runtime_data.runtime_objects", "DELETE FROM runtime_data.runtime_objects WHERE session_id = $1"),
+    ("runtime_data.runtime_cells", "DELETE FROM runtime_data.runtime_cells WHERE session_id = $1"),
+    ("runtime_data.active_sessions", "DELETE FROM runtime_data.active_sessions WHERE session_id = $1"),
+)
+
+
+def partition_name(table: str, session_id: str) -> str:
+    """세션 파티션 이름 (마이그레이션의 runtime_data.session_partition_name()과 동일)"""
+    return f"{table}_s_{uuid.UUID(str(session_id)).hex}"
+
+
+def _affected_rows(status: str) -> int:
+    """'DELETE 12' 형식의 명령 상태에서 행 수 추출"""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (ValueError, AttributeError):
+        return 0
+
+
+@dataclass
+class SessionStorageMetrics:
+    """세션 정리 통계"""
+    purges: int = 0
+    failures: int = 0
+    rows_reclaimed: int = 0
+    partitions_dropped: int = 0
+    partitions_truncated: int = 0
+    seconds_spent: float = 0.0
+    last_purge_ms: float = 0.0
+
+
+class SessionStorage:
+    """세션 런타임 행 정리"""
+
+    def __init__(self, db_connection: Optional[DatabaseConnection] = None):
+        """
+        Args:
+            db_connection: 데이터베이스 연결 (기본: 최초 사용 시 생성)
+        """
+        self._db = db_connection
+        self.metrics = SessionStorageMetrics()
+        # 세션 단위로 분할된 테이블 (최초 정리 시 카탈로그에서 확인)
+        self._partitioned: Optional[List[Tuple[str, str]]] = None
+
+    @property
+    def db(self) -> DatabaseConnection:
+        if self._db is None:
+            self._db = DatabaseConnection()
+        return self._db
+
+    async def partitioned_tables(self, conn) -> List[Tuple[str, str]]:
+        """세션 단위로 분할된 테이블 목록 (relkind = 'p')"""
+        if self._partitioned is None:
+            records = await conn.fetch(
+                """
+                SELECT n.nspname AS schema_name, c.relname AS table_name
+                FROM pg_class c
+                JOIN pg_namespace n ON n.oid = c.relnamespace
+                WHERE c.relkind = 'p'
+                  AND n.nspname || '.' || c.relname = ANY($1::text[])
+                """,
+                [f"{schema}.{table}" for schema, table in SESSION_PARTITIONED_TABLES]
+            )
+            self._partitioned = [(r["schema_name"], r["table_name"]) for r in records]
+            if self._partitioned:
+                logger.info(f"Session storage: partitioned tables {self._partitioned}")
+        return self._partitioned
+
+    def refresh_layout(self) -> None:
+        """분할 여부 다시 확인 (마이그레이션 적용 후)"""
+        self._partitioned = None
+
+    async def purge(self, session_id: str, keep_session: bool = False) -> Dict[str, int]:
+        """
+        세션 런타임 행 정리
+
+        Args:
+            session_id: 세션 ID
+            keep_session: True이면 엔티티 상태/참조와 셀 참조만 정리하고 세션은 유지
+                          (분할 테이블은 파티션 TRUNCATE)
+
+        Returns:
+            테이블별 정리된 행 수
+        """
+        session_id = str(session_id)
+        # 삭제될 엔티티의 미기록 상태 변경은 버림
+        await entity_state_store.discard_session(session_id)
+
+        started = time.perf_counter()
+        reclaimed: Dict[str, int] = {}
+        try:
+            pool = await self.db.pool
+            async with pool.acquire() as conn:
+                partitioned = await self.partitioned_tables(conn)
+                async with conn.transaction():
+                    await conn.execute(
+                        """
+                        UPDATE runtime_data.active_sessions
+                        SET player_runtime_entity_id = NULL
+                        WHERE session_id = $1
+                        """,
+                        session_id
+                    )
+                    # 세션 파티션은 TRUNCATE로 비움 (트랜잭션 안이므로 이후 단계가 실패하면 함께 롤백)
+                    for schema, table in partitioned:
+                        rows = await self._truncate_partition(conn, schema, table, session_id)
+                        if rows:
+                            reclaimed[f"{schema}.{table}"] = rows
+                    for label, sql in (_INSTANCE_STEPS if keep_session else _SESSION_STEPS):
+                        if label == "runtime_data.cell_occupants":
+                            # 파생 테이블이므로 직접 쓰기 방지 트리거를 우회해 한 번에 삭제
+                            await conn.execute("SELECT set_config('session_replication_role', 'replica', true)")
+                            rows = _affected_rows(await conn.execute(sql, session_id))
+                            await conn.execute("SELECT set_config('session_replication_role', 'origin', true)")
+                        else:
+                            rows = _affected_rows(await conn.execute(sql, session_id))
+                        if rows:
+                            reclaimed[label] = reclaimed.get(label, 0) + rows
+
+                # 커밋 후 빈 세션 파티션 제거 (분리 CONCURRENTLY는 트랜잭션 밖에서만 가능)
+                if not keep_session:
+                    for schema, table in partitioned:
+                        await self._drop_partition(conn, schema, table, session_id)
+        except Exception:
+            self.metrics.failures += 1
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            self.metrics.seconds_spent += elapsed
+            self.metrics.last_purge_ms = elapsed * 1000
+
+        cell_occupancy.invalidate_session(session_id)
+        total = sum(reclaimed.values())
+        self.metrics.purges += 1
+        self.metrics.rows_reclaimed += total
+        logger.debug(f"Session storage: purged session {session_id} "
+                     f"({total} rows, keep_session={keep_session}) in {self.metrics.last_purge_ms:.1f} ms")
+        return reclaimed
+
+    async def _partition(self, conn, schema: str, table: str, session_id: str) -> Optional[str]:
+        """세션 파티션의 정규화된 이름 (파티션이 없으면 None)"""
+        qualified = f'"{schema}"."{partition_name(table, session_id)}"'
+        if not await conn.fetchval("SELECT to_regclass($1) IS NOT NULL", qualified):
+            return None
+        return qualified
+
+    async def _truncate_partition(self, conn, schema: str, table: str, session_id: str) -> int:
+        """세션 파티션 TRUNCATE (정리된 행 수 반환, 파티션이 없으면 0)"""
+        qualified = await self._partition(conn, schema, table, session_id)
+        if qualified is None:
+            return 0
+        rows = await conn.fetchval(f"SELECT COUNT(*) FROM {qualified}")
+        await conn.execute(f"TRUNCATE {qualified}")
+        self.metrics.partitions_truncated += 1
+        return rows
+
+    async def _drop_partition(self, conn, schema: str, table: str, session_id: str) -> None:
+        """비운 세션 파티션 분리 후 DROP (실패해도 빈 파티션만 남으므로 경고만 기록)"""
+        try:
+            qualified = await self._partition(conn, schema, table, session_id)
+            if qualified is None:
+                return
+            if conn.get_server_version().major >= 14:
+                # 상위 테이블에 SHARE UPDATE EXCLUSIVE만 잡으므로 다른 세션 조회/갱신을 막지 않음
+                try:
+                    await conn.execute(
+                        f'ALTER TABLE "{schema}"."{table}" DETACH PARTITION {qualified} CONCURRENTLY'
+                    )
+                except Exception as e:
+                    logger.warning(f"Session storage: concurrent detach of {qualified} failed, dropping directly: {e}")
+            await conn.execute(f"DROP TABLE IF EXISTS {qualified}")
+            self.metrics.partitions_dropped += 1
+        except Exception as e:
+            logger.warning(f"Session storage: failed to drop empty partition of {schema}.{table} "
+                           f"for session {session_id}: {e}")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 및 통계"""
+        metrics = self.metrics
+        return {
+            "partitioned_tables": (
+                [f"{schema}.{table}" for schema, table in self._partitioned]
+                if self._partitioned is not None else None
+            ),
+            "purges": metrics.purges,
+            "failures": metrics.failures,
+            "rows_reclaimed": metrics.rows_reclaimed,
+            "partitions_dropped": metrics.partitions_dropped,
+            "partitions_truncated": metrics.partitions_truncated,
+            "seconds_spent": round(metrics.seconds_spent, 3),
+            "last_purge_ms": round(metrics.last_purge_ms, 2),
+        }
+
+
+# 전역 세션 정리기
+session_storage = SessionStorage()
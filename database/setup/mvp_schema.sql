@@ -6,6 +6,7 @@
 -- UUID 지원을 위한 확장 설치
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 CREATE EXTENSION IF NOT EXISTS "pgcrypto";
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
 
 -- =====================================================
 -- ENUM 타입 정의
@@ -100,6 +101,8 @@ CREATE TABLE game_data.world_regions (
 );
 
 CREATE INDEX idx_region_type ON game_data.world_regions(region_type);
+CREATE INDEX idx_world_regions_name_trgm ON game_data.world_regions USING GIN (region_name gin_trgm_ops);
+CREATE INDEX idx_world_regions_description_trgm ON game_data.world_regions USING GIN (region_description gin_trgm_ops);
 
 COMMENT ON TABLE game_data.world_regions IS '게임 내 최상위 지역 구분';
 COMMENT ON COLUMN game_data.world_regions.region_properties IS 'JSONB 구조: {"climate": "temperate", "danger_level": 3, "recommended_level": {"min": 1, "max": 10}, ...}';
@@ -120,6 +123,8 @@ CREATE TABLE game_data.world_locations (
 
 CREATE INDEX idx_location_region ON game_data.world_locations(region_id);
 CREATE INDEX idx_location_type ON game_data.world_locations(location_type);
+CREATE INDEX idx_world_locations_name_trgm ON game_data.world_locations USING GIN (location_name gin_trgm_ops);
+CREATE INDEX idx_world_locations_description_trgm ON game_data.world_locations USING GIN (location_description gin_trgm_ops);
 
 COMMENT ON TABLE game_data.world_locations IS '게임 내 구체적 장소 정의';
 COMMENT ON COLUMN game_data.world_locations.location_properties IS 'JSONB 구조: {"background_music": "peaceful_01", "ambient_effects": ["birds", "wind"], "ownership": {"owner_entity_id": "NPC_OWNER_001", "ownership_type": "private"}, "lore": {"history": "...", "legends": [...]}, "detail_sections": [...]}. SSOT 원칙: ownership.owner_entity_id는 entities 테이블을 참조하며, owner_name은 저장하지 않음 (JOIN으로 조회)';
@@ -140,6 +145,8 @@ CREATE TABLE game_data.world_cells (
 );
 
 CREATE INDEX idx_cell_location ON game_data.world_cells(location_id);
+CREATE INDEX idx_world_cells_name_trgm ON game_data.world_cells USING GIN (cell_name gin_trgm_ops);
+CREATE INDEX idx_world_cells_description_trgm ON game_data.world_cells USING GIN (cell_description gin_trgm_ops);
 
 COMMENT ON TABLE game_data.world_cells IS '게임 내 셀 단위 공간 정의';
 COMMENT ON COLUMN game_data.world_cells.cell_properties IS 'JSONB 구조: {"terrain": "grass", "weather": "clear", "ownership": {"owner_entity_id": "NPC_OWNER_001", "is_private": false}, "lore": {"history": "...", "legends": [...]}, "environment": {"terrain": "...", "weather": "...", "lighting": "..."}, "detail_sections": [...]}. SSOT 원칙: ownership.owner_entity_id는 entities 테이블을 참조하며, owner_name은 저장하지 않음 (JOIN으로 조회)';
@@ -239,6 +246,8 @@ CREATE TABLE game_data.entities (
 CREATE INDEX idx_entities_type ON game_data.entities(entity_type);
 CREATE INDEX idx_entities_position_cell ON game_data.entities USING GIN ((default_position_3d -> 'cell_id'));
 CREATE INDEX idx_entities_size ON game_data.entities(entity_size);
+CREATE INDEX idx_entities_name_trgm ON game_data.entities USING GIN (entity_name gin_trgm_ops);
+CREATE INDEX idx_entities_description_trgm ON game_data.entities USING GIN (entity_description gin_trgm_ops);
 
 COMMENT ON TABLE game_data.entities IS '게임 내 모든 엔티티(캐릭터, NPC, 몬스터 등)의 기본 정의';
 COMMENT ON COLUMN game_data.entities.base_stats IS 'JSONB 구조: {"hp": 100, "mp": 50, "strength": 10, ...}';
@@ -279,6 +288,9 @@ CREATE INDEX idx_object_type ON game_data.world_objects(object_type);
 CREATE INDEX idx_world_objects_passable ON game_data.world_objects(passable);
 CREATE INDEX idx_world_objects_movable ON game_data.world_objects(movable);
 CREATE INDEX idx_world_objects_wall_mounted ON game_data.world_objects(wall_mounted);
+CREATE INDEX idx_world_objects_default_cell ON game_data.world_objects(default_cell_id);
+CREATE INDEX idx_world_objects_name_trgm ON game_data.world_objects USING GIN (object_name gin_trgm_ops);
+CREATE INDEX idx_world_objects_description_trgm ON game_data.world_objects USING GIN (object_description gin_trgm_ops);
 
 COMMENT ON TABLE game_data.world_objects IS '게임 내 오브젝트 정의';
 COMMENT ON COLUMN game_data.world_objects.object_type IS 'static, interactive, trigger';
@@ -305,6 +317,8 @@ CREATE TABLE game_data.base_properties (
 );
 
 CREATE INDEX idx_base_properties_type ON game_data.base_properties(type);
+CREATE INDEX idx_base_properties_name_trgm ON game_data.base_properties USING GIN (name gin_trgm_ops);
+CREATE INDEX idx_base_properties_description_trgm ON game_data.base_properties USING GIN (description gin_trgm_ops);
 
 COMMENT ON TABLE game_data.base_properties IS '게임 내 모든 속성들의 기본 정의';
 COMMENT ON COLUMN game_data.base_properties.type IS 'equipment, ability, item, effect';
@@ -829,10 +843,17 @@ END;
 $$ LANGUAGE plpgsql;
 
 -- 동기화 트리거 생성
+-- UPDATE는 위치가 실제로 바뀐 경우에만 실행 (배치 UPDATE가 모든 JSONB 컬럼을 SET해도 불필요한 동기화 없음)
 DROP TRIGGER IF EXISTS trg_sync_cell_occupants_from_position ON runtime_data.entity_states;
+DROP TRIGGER IF EXISTS trg_sync_cell_occupants_from_position_insert ON runtime_data.entity_states;
+CREATE TRIGGER trg_sync_cell_occupants_from_position_insert
+AFTER INSERT ON runtime_data.entity_states
+FOR EACH ROW
+EXECUTE FUNCTION runtime_data.sync_cell_occupants_from_position();
 CREATE TRIGGER trg_sync_cell_occupants_from_position
-AFTER INSERT OR UPDATE OF current_position ON runtime_data.entity_states
+AFTER UPDATE OF current_position ON runtime_data.entity_states
 FOR EACH ROW
+WHEN (OLD.current_position IS DISTINCT FROM NEW.current_position)
 EXECUTE FUNCTION runtime_data.sync_cell_occupants_from_position();
 -- SSOT: 위치의 기록/갱신은 runtime_data.entity_states.current_position이 단일 진실원;
 -- cell_occupants는 조회 편의를 위한 파생 테이블로 서비스 로직만이 갱신하도록 제한한다.
@@ -923,6 +944,13 @@ BEGIN
         ADD CONSTRAINT uq_cell_references_session_cell UNIQUE (session_id, game_cell_id);
     END IF;
 
+    IF NOT EXISTS (
+        SELECT 1 FROM pg_constraint WHERE conname = 'uq_object_references_session_object'
+    ) THEN
+        ALTER TABLE reference_layer.object_references
+        ADD CONSTRAINT uq_object_references_session_object UNIQUE (session_id, game_object_id);
+    END IF;
+
     IF NOT EXISTS (
         SELECT 1 FROM pg_class c JOIN pg_namespace n ON n.oid=c.relnamespace 
         WHERE c.relname = 'idx_entity_states_session_entity' AND n.nspname = 'runtime_data'
@@ -1075,6 +1103,11 @@ CREATE TABLE runtime_data.triggered_events (
 CREATE INDEX idx_triggered_events_session ON runtime_data.triggered_events(session_id);
 CREATE INDEX idx_triggered_events_type ON runtime_data.triggered_events(event_type);
 CREATE INDEX idx_triggered_events_triggered_at ON runtime_data.triggered_events(triggered_at);
+-- entity_references 삭제 시 FK 확인용 (세션 정리에서 행마다 순차 스캔 방지)
+CREATE INDEX idx_triggered_events_source_entity_ref ON runtime_data.triggered_events(source_entity_ref)
+WHERE source_entity_ref IS NOT NULL;
+CREATE INDEX idx_triggered_events_target_entity_ref ON runtime_data.triggered_events(target_entity_ref)
+WHERE target_entity_ref IS NOT NULL;
 
 COMMENT ON TABLE runtime_data.triggered_events IS '트리거 이벤트 테이블';
 COMMENT ON COLUMN runtime_data.triggered_events.event_data IS 'JSONB 구조: 이벤트 세부 데이터';
@@ -1133,6 +1166,8 @@ CREATE TABLE game_data.time_events (
     trigger_minute INTEGER DEFAULT 0,  -- 0-59
     event_data JSONB,
     is_active BOOLEAN DEFAULT true,
+    session_id UUID,  -- 스케줄한 세션 (NULL이면 템플릿 이벤트)
+    repeat_interval INTEGER,  -- 반복 간격 (분 단위, NULL이면 1회성)
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
@@ -1140,6 +1175,7 @@ CREATE TABLE game_data.time_events (
 CREATE INDEX idx_time_events_type ON game_data.time_events(event_type);
 CREATE INDEX idx_time_events_active ON game_data.time_events(is_active);
 CREATE INDEX idx_time_events_trigger_time ON game_data.time_events(trigger_day, trigger_hour, trigger_minute);
+CREATE INDEX idx_time_events_session_active ON game_data.time_events(session_id, is_active);
 
 COMMENT ON TABLE game_data.time_events IS '시간 기반 이벤트 스케줄 (템플릿)';
 COMMENT ON COLUMN game_data.time_events.event_data IS 'JSONB 구조: {"description": "상점 오픈", "affected_entities": ["merchant_001"], "world_changes": {"shop_open": true}}';
@@ -1234,6 +1270,8 @@ CREATE TABLE runtime_data.entity_states (
 );
 
 CREATE INDEX idx_entity_states_entity ON runtime_data.entity_states(runtime_entity_id);
+CREATE INDEX idx_entity_states_current_cell_id ON runtime_data.entity_states(current_cell_id)
+    WHERE current_cell_id IS NOT NULL;
 
 COMMENT ON TABLE runtime_data.entity_states IS '엔티티별 상태 관리 (HP, MP, 위치, 인벤토리 등)';
 COMMENT ON COLUMN runtime_data.entity_states.current_position IS 'SSOT: 위치의 기록/갱신은 runtime_data.entity_states.current_position이 단일 진실원. cell_occupants는 자동 동기화됨';
@@ -1267,10 +1305,51 @@ CREATE TABLE runtime_data.object_states (
     )
 );
 
+ALTER TABLE runtime_data.object_states
+ADD CONSTRAINT uq_object_states_runtime_object UNIQUE (runtime_object_id);
+
 CREATE INDEX idx_object_states_object ON runtime_data.object_states(runtime_object_id);
 
 COMMENT ON TABLE runtime_data.object_states IS '오브젝트별 상태 관리 (내용물, 상태, 위치 등)';
 
+-- Save Slots (저장 슬롯, 세션 FK 없음: 세션이 정리되어도 저장은 유지)
+CREATE TABLE runtime_data.save_slots (
+    owner VARCHAR(100) NOT NULL DEFAULT 'local',
+    slot_id INTEGER NOT NULL,
+    session_id UUID NOT NULL,
+    save_name VARCHAR(200),
+    player_name VARCHAR(100),
+    location VARCHAR(200),
+    play_time INTEGER DEFAULT 0,
+    game_state JSONB,
+    codec VARCHAR(10) NOT NULL DEFAULT 'zlib',
+    chain_length INTEGER NOT NULL DEFAULT 0,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    row_digests BYTEA,
+    saved_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (owner, slot_id)
+);
+
+-- Save Slot Snapshots (full 1개 + incremental 체인, 압축 bytea)
+CREATE TABLE runtime_data.save_slot_snapshots (
+    owner VARCHAR(100) NOT NULL,
+    slot_id INTEGER NOT NULL,
+    seq INTEGER NOT NULL,
+    kind VARCHAR(20) NOT NULL,
+    codec VARCHAR(10) NOT NULL DEFAULT 'zlib',
+    payload BYTEA NOT NULL,
+    row_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (owner, slot_id, seq),
+    FOREIGN KEY (owner, slot_id) REFERENCES runtime_data.save_slots(owner, slot_id) ON DELETE CASCADE,
+    CONSTRAINT chk_save_snapshot_kind CHECK (kind IN ('full', 'incremental'))
+);
+
+COMMENT ON TABLE runtime_data.save_slots IS '저장 슬롯 요약 (owner, slot_id 기본 키 조회)';
+COMMENT ON COLUMN runtime_data.save_slots.row_digests IS '마지막 저장 시점의 행별 다이제스트 (압축, 증분 저장 비교용)';
+COMMENT ON TABLE runtime_data.save_slot_snapshots IS '저장 슬롯 스냅샷 체인 (full 1개 + incremental, 압축 bytea)';
+
 -- =====================================================
 -- MVP v2 핵심 기능을 위한 함수 및 프로시저
 -- =====================================================
@@ -1431,6 +1510,7 @@ CREATE INDEX idx_effect_carriers_type ON game_data.effect_carriers(carrier_type)
 CREATE INDEX idx_effect_carriers_effect_json ON game_data.effect_carriers USING GIN (effect_json);
 CREATE INDEX idx_effect_carriers_constraints_json ON game_data.effect_carriers USING GIN (constraints_json);
 CREATE INDEX idx_effect_carriers_tags ON game_data.effect_carriers USING GIN (tags);
+CREATE INDEX idx_effect_carriers_name_trgm ON game_data.effect_carriers USING GIN (name gin_trgm_ops);
 
 COMMENT ON TABLE game_data.effect_carriers IS '모든 효과의 통일된 관리 (스킬, 버프, 아이템, 축복, 저주, 의식)';
 COMMENT ON COLUMN game_data.effect_carriers.carrier_type IS '효과 타입: skill, buff, item, blessing, curse, ritual';
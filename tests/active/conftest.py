@@ -13,6 +13,7 @@ from database.connection import DatabaseConnection
 from database.repositories.game_data import GameDataRepository
 from database.repositories.runtime_data import RuntimeDataRepository
 from database.repositories.reference_layer import ReferenceLayerRepository
+from database.session_storage import SessionStorage
 
 from app.managers.entity_manager import EntityManager
 from app.managers.cell_manager import CellManager
@@ -137,7 +138,7 @@ async def dialogue_manager(db_connection, repositories, entity_manager):
 @pytest_asyncio.fixture(scope="function")
 async def action_handler(db_connection, repositories, entity_manager, cell_manager):
     """Action Handler 인스턴스"""
-    return ActionHandler(
+    handler = ActionHandler(
         db_connection,
         repositories['game_data_repo'],
         repositories['runtime_data_repo'],
@@ -145,6 +146,11 @@ async def action_handler(db_connection, repositories, entity_manager, cell_manag
         entity_manager,
         cell_manager
     )
+    
+    yield handler
+    
+    # 대기 중인 행동 로그 기록
+    await handler.close()
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -189,16 +195,9 @@ async def test_session(db_connection):
     }
     
     # 세션 정리 (테스트 종료 후)
-    async with pool.acquire() as conn:
-        # 관련 런타임 데이터 삭제 (외래키 제약조건 순서 고려)
-        # dialogue_history가 runtime_entities를 참조하므로 먼저 삭제
-        await conn.execute("DELETE FROM runtime_data.dialogue_history WHERE session_id = $1", session_id)
-        await conn.execute("DELETE FROM runtime_data.dialogue_states WHERE session_id = $1", session_id)
-        await conn.execute("DELETE FROM runtime_data.runtime_entities WHERE session_id = $1", session_id)
-        await conn.execute("DELETE FROM runtime_data.runtime_cells WHERE session_id = $1", session_id)
-        await conn.execute("DELETE FROM runtime_data.active_sessions WHERE session_id = $1", session_id)
-        
-        logger.info(f"[CLEANUP] Test session cleaned up: {session_id}")
+    # 외래키 순서와 cell_occupants 직접 쓰기 방지 트리거는 세션 정리(SessionStorage)가 처리
+    await SessionStorage(db_connection).purge(session_id)
+    logger.info(f"[CLEANUP] Test session cleaned up: {session_id}")
 
 
 # ============================================================================
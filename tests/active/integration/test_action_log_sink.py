@@ -0,0 +1,94 @@
+"""
+행동 로그 배치 싱크 테스트
+행동 로그가 백그라운드 싱크를 통해 배치 기록되는지 검증
+"""
+import pytest
+import uuid
+from datetime import datetime
+
+from database.log_sink import BatchedLogSink, BackpressurePolicy
+from app.handlers.action_result import ActionResult
+from common.utils.logger import logger
+
+
+class TestActionLogSink:
+    """행동 로그 싱크 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_action_logs_flushed_in_batches(self, db_connection, action_handler):
+        """_log_action은 큐에만 적재하고 flush 시 배치로 기록"""
+        session_id = str(uuid.uuid4())
+        pool = await db_connection.pool
+        try:
+            for i in range(25):
+                await action_handler._log_action(
+                    f"ENTITY_{i:03d}", "investigate",
+                    ActionResult.success_result(f"조사 {i}"), session_id
+                )
+
+            sink = action_handler.action_log_sink
+            assert sink.metrics.queued >= 25
+
+            await action_handler.flush_action_logs()
+
+            async with pool.acquire() as conn:
+                count = await conn.fetchval(
+                    "SELECT COUNT(*) FROM runtime_data.action_logs WHERE session_id = $1", session_id
+                )
+                session_exists = await conn.fetchval(
+                    "SELECT EXISTS(SELECT 1 FROM runtime_data.active_sessions WHERE session_id = $1)", session_id
+                )
+            assert count == 25
+            assert session_exists
+            logger.info(f"[OK] Action log sink: {sink.snapshot()}")
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM runtime_data.action_logs WHERE session_id = $1", session_id)
+                await conn.execute("DELETE FROM runtime_data.active_sessions WHERE session_id = $1", session_id)
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest_policy(self, db_connection):
+        """DROP_OLDEST 정책: 큐 초과 시 가장 오래된 레코드 폐기"""
+        sink = BatchedLogSink(
+            db_connection,
+            "action_logs",
+            columns=("session_id", "entity_id", "action", "success", "message", "timestamp"),
+            max_queue_size=10,
+            batch_size=1000,
+            flush_interval=60.0,
+            policy=BackpressurePolicy.DROP_OLDEST
+        )
+        session_id = str(uuid.uuid4())
+        for i in range(15):
+            await sink.enqueue((session_id, f"ENTITY_{i:03d}", "wait", True, None, datetime.now()))
+
+        snapshot = sink.snapshot()
+        assert snapshot["pending"] == 10
+        assert snapshot["dropped"] == 5
+
+        # 세션이 없으므로 기록은 실패 (FK) - 실패 건수로 집계
+        await sink.close()
+        assert sink.metrics.failed == 10
+        assert sink.metrics.flushed == 0
+
+    @pytest.mark.asyncio
+    async def test_spill_to_file_policy(self, db_connection, tmp_path):
+        """SPILL_TO_FILE 정책: 큐 초과분을 JSONL 파일로 기록"""
+        spill_path = tmp_path / "action_logs_spill.jsonl"
+        sink = BatchedLogSink(
+            db_connection,
+            "action_logs",
+            columns=("session_id", "entity_id", "action", "success", "message", "timestamp"),
+            max_queue_size=5,
+            batch_size=1000,
+            flush_interval=60.0,
+            policy=BackpressurePolicy.SPILL_TO_FILE,
+            spill_path=str(spill_path)
+        )
+        session_id = str(uuid.uuid4())
+        for i in range(8):
+            await sink.enqueue((session_id, f"ENTITY_{i:03d}", "wait", True, None, datetime.now()))
+
+        assert sink.metrics.spilled == 3
+        assert len(spill_path.read_text(encoding="utf-8").splitlines()) == 3
+        await sink.close()
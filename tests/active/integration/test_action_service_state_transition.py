@@ -451,3 +451,39 @@ class TestActionServiceStateTransition:
         # Assert
         assert len(object_actions) == 0, "interaction_type이 none이면 액션이 생성되지 않아야 함"
 
+    
+    @pytest.mark.asyncio
+    async def test_object_action_descriptor_reused_across_states(self):
+        """오브젝트 템플릿별 액션 기술자는 한 번만 계산되고 상태별 필터링은 매번 적용"""
+        db = DatabaseConnection()
+        action_service = ActionService(db)
+        
+        # Arrange
+        obj = {
+            "runtime_object_id": "test_lamp_runtime_001",
+            "game_object_id": "OBJ_TEST_LAMP_001",
+            "object_name": "테스트 램프",
+            "properties": {
+                "interactions": {
+                    "light": {"required_state": "unlit"},
+                    "extinguish": {"required_state": "lit", "text": "끄기"}
+                }
+            }
+        }
+        properties = obj["properties"]
+        
+        # Act
+        descriptor = action_service._get_object_action_descriptor(obj, properties)
+        cached_descriptor = action_service._get_object_action_descriptor(obj, properties)
+        unlit_actions = action_service._build_object_actions(
+            obj, obj["runtime_object_id"], descriptor, "unlit", properties
+        )
+        lit_actions = action_service._build_object_actions(
+            obj, obj["runtime_object_id"], descriptor, "lit", properties
+        )
+        
+        # Assert
+        assert cached_descriptor is descriptor, "같은 템플릿의 기술자는 재사용되어야 함"
+        assert [a['action_type'] for a in unlit_actions] == ['examine', 'light']
+        assert [a['action_type'] for a in lit_actions] == ['examine', 'extinguish']
+        assert lit_actions[1]['text'] == "테스트 램프 끄기"
@@ -0,0 +1,58 @@
+"""
+프로세스 공유 연결 풀 테스트
+여러 DatabaseConnection 인스턴스가 하나의 풀을 공유하는지 검증
+"""
+import pytest
+from database.connection import DatabaseConnection, pool_registry, get_pool_metrics
+from common.utils.logger import logger
+
+
+class TestConnectionPoolRegistry:
+    """공유 연결 풀 레지스트리 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_connections_share_single_pool(self, db_connection):
+        """서비스/매니저마다 생성되는 DatabaseConnection이 같은 풀을 사용"""
+        other = DatabaseConnection()
+        try:
+            pool_a = await db_connection.pool
+            pool_b = await other.pool
+            assert pool_a is pool_b
+            assert pool_a.ref_count >= 2
+            logger.info(f"[OK] Shared pool handles: {pool_a.ref_count}")
+        finally:
+            await other.close()
+
+        # 다른 핸들이 닫혀도 공유 풀은 유지됨
+        assert await db_connection.execute_scalar_query("SELECT 1") == 1
+
+    @pytest.mark.asyncio
+    async def test_pool_metrics(self, db_connection):
+        """acquire 통계와 in_use/idle 지표 기록"""
+        pool = await db_connection.pool
+        before = pool.metrics.acquire_count
+
+        async with pool.acquire() as conn:
+            snapshot = pool.snapshot()
+            assert snapshot["in_use"] >= 1
+            await conn.fetchval("SELECT 1")
+
+        assert pool.metrics.acquire_count == before + 1
+
+        metrics = get_pool_metrics()
+        key = "{}#{}".format(*pool.key)
+        assert key in metrics
+        for field in ("in_use", "idle", "avg_wait_ms", "max_wait_ms", "acquire_timeouts"):
+            assert field in metrics[key]
+        logger.info(f"[OK] Pool metrics: {metrics[key]}")
+
+    @pytest.mark.asyncio
+    async def test_last_handle_closes_pool(self):
+        """마지막 참조가 반환되면 풀 종료"""
+        db = DatabaseConnection(role="pool_registry_test")
+        pool = await db.pool
+        assert pool.ref_count == 1
+
+        await db.close()
+        assert pool.raw_pool.is_closing()
+        assert pool.key not in pool_registry._pools
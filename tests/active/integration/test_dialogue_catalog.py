@@ -0,0 +1,88 @@
+"""
+대화 카탈로그 인덱스 테스트
+소유 키 기반 컨텍스트/주제 조회, 전역 주제, 무효화 검증
+"""
+import pytest
+
+from app.managers.dialogue_catalog import DialogueCatalog, DialogueCatalogIndex
+from common.utils.logger import logger
+
+
+def _context(dialogue_id: str, entity_id=None, priority: int = 1) -> dict:
+    return {
+        "dialogue_id": dialogue_id,
+        "title": dialogue_id,
+        "content": f"content {dialogue_id}",
+        "entity_id": entity_id,
+        "priority": priority,
+        "entity_personality": "neutral",
+        "available_topics": '{"topics": ["greeting"]}',
+        "constraints": None,
+    }
+
+
+def _topic(topic_id: str, dialogue_id: str, topic_type: str) -> dict:
+    return {
+        "topic_id": topic_id,
+        "dialogue_id": dialogue_id,
+        "topic_type": topic_type,
+        "content": f"topic {topic_id}",
+        "conditions": None,
+    }
+
+
+class TestDialogueCatalog:
+    """대화 카탈로그 테스트 클래스"""
+
+    def test_owner_keys_match_exactly(self):
+        """소유 키는 정확히 일치해야 함 (NPC_1이 NPC_10의 컨텍스트를 가져가지 않음)"""
+        index = DialogueCatalogIndex(
+            [_context("CTX_NPC_10", "NPC_10"), _context("CTX_GLOBAL", None, priority=3)],
+            [_topic("T1", "CTX_NPC_10", "trade"), _topic("T2", "CTX_GLOBAL", "greeting")]
+        )
+
+        assert index.context_for(("runtime-1", "NPC_1")) is None
+        assert index.context_for(("runtime-10", "NPC_10"))["dialogue_id"] == "CTX_NPC_10"
+        assert index.topic_for(("NPC_1",), "trade") is None
+        assert index.topic_for(("NPC_10",), "trade")["topic_id"] == "T1"
+        assert index.context_for(("NPC_10",))["available_topics"] == {"topics": ["greeting"]}
+        logger.info("[OK] Exact owner key match passed")
+
+    def test_topic_types_and_defaults(self):
+        """NPC 주제 = 소유 주제 + 전역 주제, 평균 우선순위 계산"""
+        index = DialogueCatalogIndex(
+            [_context("CTX_A", "NPC_A", priority=1), _context("CTX_G", "", priority=3)],
+            [_topic("T1", "CTX_A", "trade"), _topic("T2", "CTX_G", "greeting"), _topic("T3", "CTX_G", "lore")]
+        )
+
+        assert index.owned_topic_types(("NPC_A",)) == ["trade"]
+        assert index.npc_topic_types(("NPC_A",)) == ["greeting", "lore", "trade"]
+        assert index.npc_topic_types(("NPC_B",)) == ["greeting", "lore"]
+        assert index.topic_types == ["greeting", "lore", "trade"]
+        assert index.default_priority == 2
+        assert [context["dialogue_id"] for context in index.global_contexts] == ["CTX_G"]
+        logger.info("[OK] Topic types passed")
+
+    def test_add_context_registers_owner(self):
+        """대화 기록용 컨텍스트 등록 시 재로드 없이 소유 키로 조회"""
+        index = DialogueCatalogIndex([], [])
+        index.add_context(_context("ctx_runtime-1_trade", "runtime-1"))
+
+        assert index.context_for(("runtime-1", "NPC_A"))["dialogue_id"] == "ctx_runtime-1_trade"
+        logger.info("[OK] Add context passed")
+
+    @pytest.mark.asyncio
+    async def test_catalog_loads_once_until_invalidated(self, db_with_templates, db_connection):
+        """카탈로그는 한 번만 로드되고 무효화 후 다시 로드"""
+        catalog = DialogueCatalog(db_connection)
+
+        first = await catalog.get_index()
+        second = await catalog.get_index()
+        assert first is second
+        assert catalog.loads == 1
+
+        catalog.invalidate()
+        third = await catalog.get_index()
+        assert third is not first
+        assert catalog.loads == 2
+        logger.info(f"[OK] Catalog load/invalidate passed: {catalog.snapshot()}")
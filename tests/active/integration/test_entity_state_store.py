@@ -0,0 +1,108 @@
+"""
+엔티티 상태 저장소 테스트
+write-through/write-behind 기록, 변경 병합, 세션 단위 flush(session_id 없이 변경한 엔티티 포함) 검증
+"""
+import pytest
+
+from database.entity_state_store import EntityStateStore
+from common.utils.logger import logger
+
+
+async def _create_npc(entity_manager, session_id: str) -> str:
+    results = await entity_manager.create_entities(
+        [{"static_entity_id": "NPC_VILLAGER_001", "custom_position": {"x": 0.0, "y": 0.0}}],
+        session_id
+    )
+    assert results[0].status == "success", results[0].message
+    return results[0].entity_id
+
+
+async def _fetch_state(db_connection, runtime_entity_id: str):
+    pool = await db_connection.pool
+    async with pool.acquire() as conn:
+        return await conn.fetchrow(
+            "SELECT current_stats, current_position FROM runtime_data.entity_states WHERE runtime_entity_id = $1",
+            runtime_entity_id
+        )
+
+
+class TestEntityStateStore:
+    """엔티티 상태 저장소 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_write_through_updates_immediately(self, db_with_templates, db_connection, entity_manager,
+                                                     test_session):
+        """write-through는 변경마다 즉시 기록"""
+        npc_id = await _create_npc(entity_manager, test_session["session_id"])
+        store = EntityStateStore(db_connection, write_behind=False)
+
+        await store.merge_stats(npc_id, {"hp": 42})
+
+        row = await _fetch_state(db_connection, npc_id)
+        assert row["current_stats"]["hp"] == 42
+        assert store.metrics.writes == 1
+        logger.info("[OK] Write-through passed")
+
+    @pytest.mark.asyncio
+    async def test_write_behind_coalesces_until_flush(self, db_with_templates, db_connection, entity_manager,
+                                                      test_session):
+        """write-behind는 flush 전까지 메모리에만 반영하고 flush 시 마지막 값만 기록"""
+        session_id = test_session["session_id"]
+        npc_id = await _create_npc(entity_manager, session_id)
+        store = EntityStateStore(db_connection, write_behind=True, flush_interval=60.0, max_dirty_age_seconds=60.0)
+
+        try:
+            for hp in range(10):
+                await store.merge_stats(npc_id, {"hp": hp}, session_id=session_id)
+            await store.set_fields(npc_id, session_id=session_id, current_position={"x": 3.0, "y": 4.0})
+
+            # 메모리 상태는 최신, DB는 아직 이전 값
+            state = await store.get(npc_id)
+            assert state["current_stats"]["hp"] == 9
+            row = await _fetch_state(db_connection, npc_id)
+            assert (row["current_position"] or {}).get("x") != 3.0
+
+            assert await store.flush(session_id) == 1
+            row = await _fetch_state(db_connection, npc_id)
+            assert row["current_stats"]["hp"] == 9
+            assert row["current_position"]["x"] == 3.0
+            assert store.metrics.flushes == 1
+        finally:
+            await store.close()
+        logger.info(f"[OK] Write-behind coalescing passed: {store.snapshot()}")
+
+    @pytest.mark.asyncio
+    async def test_session_flush_includes_changes_without_session_id(self, db_with_templates, db_connection,
+                                                                     entity_manager, test_session):
+        """session_id 없이 변경한 엔티티도 소유 세션을 찾아 세션 단위 flush에 포함"""
+        session_id = test_session["session_id"]
+        npc_id = await _create_npc(entity_manager, session_id)
+        store = EntityStateStore(db_connection, write_behind=True, flush_interval=60.0, max_dirty_age_seconds=60.0)
+
+        try:
+            await store.set_fields(npc_id, current_position={"x": 7.0, "y": 1.0})
+            await store.set_fields(npc_id, current_stats={"hp": 12})
+
+            assert await store.flush(session_id) == 1
+            row = await _fetch_state(db_connection, npc_id)
+            assert row["current_position"]["x"] == 7.0
+            assert row["current_stats"]["hp"] == 12
+        finally:
+            await store.close()
+        logger.info("[OK] Session flush without session_id passed")
+
+    @pytest.mark.asyncio
+    async def test_discard_session_drops_pending_changes(self, db_with_templates, db_connection, entity_manager,
+                                                         test_session):
+        """세션 종료 시 미기록 변경은 버려짐"""
+        session_id = test_session["session_id"]
+        npc_id = await _create_npc(entity_manager, session_id)
+        store = EntityStateStore(db_connection, write_behind=True, flush_interval=60.0, max_dirty_age_seconds=60.0)
+
+        await store.merge_stats(npc_id, {"hp": 1}, session_id=session_id)
+        await store.discard_session(session_id)
+
+        assert store.snapshot()["dirty"] == 0
+        assert await store.flush() == 0
+        await store.close()
+        logger.info("[OK] Discard session passed")
@@ -0,0 +1,68 @@
+"""
+인벤토리 다중 아이템 변경(apply_delta) 테스트
+한 트랜잭션 적용, 수량 부족 시 전체 미적용, 동시 변경 시 수량 유실 없음 검증
+"""
+import asyncio
+
+import pytest
+
+from app.managers.inventory_manager import InventoryManager
+from common.utils.logger import logger
+
+
+async def _create_npc(entity_manager, session_id: str) -> str:
+    results = await entity_manager.create_entities(
+        [{"static_entity_id": "NPC_VILLAGER_001", "custom_position": {"x": 0.0, "y": 0.0}}],
+        session_id
+    )
+    assert results[0].status == "success", results[0].message
+    return results[0].entity_id
+
+
+class TestInventoryDelta:
+    """인벤토리 다중 아이템 변경 테스트 클래스"""
+
+    def test_item_delta_sums_duplicates(self):
+        """같은 아이템은 수량이 합산됨"""
+        assert InventoryManager.item_delta(["ITEM_A", "ITEM_A", "ITEM_B"], -1) == {"ITEM_A": -2, "ITEM_B": -1}
+        logger.info("[OK] Item delta passed")
+
+    @pytest.mark.asyncio
+    async def test_apply_delta_is_all_or_nothing(self, db_with_templates, db_connection, entity_manager,
+                                                 test_session):
+        """재료가 하나라도 부족하면 아무 변경도 적용되지 않음"""
+        npc_id = await _create_npc(entity_manager, test_session["session_id"])
+        inventory_manager = InventoryManager(db_connection)
+
+        await inventory_manager.apply_delta(npc_id, {"ITEM_TEST_HERB": 2, "ITEM_TEST_WATER": 1})
+        before = await inventory_manager.get_inventory(npc_id)
+
+        with pytest.raises(ValueError):
+            await inventory_manager.apply_delta(
+                npc_id, {"ITEM_TEST_HERB": -2, "ITEM_TEST_SALT": -1, "ITEM_TEST_SOUP": 1}
+            )
+        assert await inventory_manager.get_inventory(npc_id) == before
+
+        inventory = await inventory_manager.apply_delta(
+            npc_id, {"ITEM_TEST_HERB": -2, "ITEM_TEST_WATER": -1, "ITEM_TEST_SOUP": 1}
+        )
+        assert inventory["quantities"].get("ITEM_TEST_SOUP") == 1
+        assert "ITEM_TEST_HERB" not in inventory["items"]
+        assert "ITEM_TEST_WATER" not in inventory["quantities"]
+        assert await inventory_manager.get_inventory(npc_id) == inventory
+        logger.info("[OK] All-or-nothing delta passed")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_deltas_do_not_lose_updates(self, db_with_templates, db_connection, entity_manager,
+                                                         test_session):
+        """동시 변경은 행 잠금으로 직렬화되어 수량이 유실되지 않음"""
+        npc_id = await _create_npc(entity_manager, test_session["session_id"])
+        inventory_manager = InventoryManager(db_connection)
+
+        await asyncio.gather(*[
+            inventory_manager.apply_delta(npc_id, {"ITEM_TEST_COIN": 1}) for _ in range(20)
+        ])
+
+        inventory = await inventory_manager.get_inventory(npc_id)
+        assert inventory["quantities"]["ITEM_TEST_COIN"] == 20
+        logger.info("[OK] Concurrent delta passed")
@@ -0,0 +1,109 @@
+"""
+월드 에디터 목록 페이지/일괄 처리 테스트
+키셋 페이지(중복/누락 없음), fields 프로젝션, 일괄 조회 순서, 일괄 변경 트랜잭션 검증
+"""
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from app.services.world_editor.list_query_service import (
+    ListQueryService, WORLD_OBJECT_LIST, decode_cursor, encode_cursor, parse_fields
+)
+from common.utils.logger import logger
+
+
+@pytest_asyncio.fixture
+async def list_objects(db_connection):
+    """목록 테스트용 월드 오브젝트 (테스트 후 삭제)"""
+    prefix = f"OBJ_LIST_{uuid.uuid4().hex[:8]}_"
+    object_ids = [f"{prefix}{i:03d}" for i in range(25)]
+
+    pool = await db_connection.pool
+    async with pool.acquire() as conn:
+        await conn.executemany(
+            """
+            INSERT INTO game_data.world_objects (object_id, object_type, object_name, properties)
+            VALUES ($1, 'static', $2, '{"weight": 1}'::jsonb)
+            """,
+            [(object_id, f"Crate {i}") for i, object_id in enumerate(object_ids)]
+        )
+    yield object_ids
+
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM game_data.world_objects WHERE object_id LIKE $1", prefix + '%')
+
+
+class TestListQuery:
+    """목록 페이지/일괄 처리 테스트 클래스"""
+
+    def test_cursor_and_fields_parsing(self):
+        """커서 왕복, 잘못된 커서/필드는 ValueError"""
+        assert decode_cursor(encode_cursor("OBJ_A")) == "OBJ_A"
+        assert parse_fields(" object_id, object_name ,") == ["object_id", "object_name"]
+        assert parse_fields(None) is None
+
+        service = ListQueryService(WORLD_OBJECT_LIST, db_connection=object())
+        with pytest.raises(ValueError):
+            decode_cursor("???")
+        with pytest.raises(ValueError):
+            service._select(["object_id", "password"])
+        logger.info("[OK] Cursor/fields parsing passed")
+
+    @pytest.mark.asyncio
+    async def test_pages_cover_rows_once_with_projection(self, db_connection, list_objects):
+        """커서 페이지는 키 순서로 모든 행을 한 번씩 반환하고, 요청 필드만 포함"""
+        service = ListQueryService(WORLD_OBJECT_LIST, db_connection)
+
+        seen, cursor = [], None
+        while True:
+            page = await service.fetch_page(limit=7, cursor=cursor, fields=["object_name"])
+            for item in page["items"]:
+                assert set(item) == {"object_id", "object_name"}
+            seen.extend(item["object_id"] for item in page["items"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert seen == sorted(seen)
+        assert len(seen) == len(set(seen))
+        assert [object_id for object_id in seen if object_id in list_objects] == list_objects
+        logger.info(f"[OK] Keyset pages passed: {len(seen)} rows")
+
+    @pytest.mark.asyncio
+    async def test_batch_get_keeps_request_order(self, db_connection, list_objects):
+        """일괄 조회는 요청 순서대로 반환하고 없는 ID는 missing으로 보고"""
+        service = ListQueryService(WORLD_OBJECT_LIST, db_connection)
+        ids = [list_objects[5], "OBJ_DOES_NOT_EXIST", list_objects[1], list_objects[5]]
+
+        result = await service.batch_get(ids, fields=["properties"])
+        assert [item["object_id"] for item in result["items"]] == [list_objects[5], list_objects[1]]
+        assert result["items"][0]["properties"] == {"weight": 1}
+        assert result["missing"] == ["OBJ_DOES_NOT_EXIST"]
+        logger.info("[OK] Batch get passed")
+
+    @pytest.mark.asyncio
+    async def test_batch_update_groups_fields_in_one_transaction(self, db_connection, list_objects):
+        """필드 조합이 다른 변경도 한 번에 적용되고, 잘못된 필드가 있으면 아무것도 바뀌지 않음"""
+        service = ListQueryService(WORLD_OBJECT_LIST, db_connection)
+
+        result = await service.batch_update([
+            {"object_id": list_objects[0], "object_name": "Renamed Crate"},
+            {"object_id": list_objects[1], "object_name": "Heavy Crate", "properties": {"weight": 50}},
+            {"object_id": list_objects[2], "passable": True},
+            {"object_id": "OBJ_DOES_NOT_EXIST", "object_name": "Ghost"},
+        ])
+        items = {item["object_id"]: item for item in result["items"]}
+        assert items[list_objects[0]]["object_name"] == "Renamed Crate"
+        assert items[list_objects[1]]["properties"] == {"weight": 50}
+        assert items[list_objects[2]]["passable"] is True
+        assert result["missing"] == ["OBJ_DOES_NOT_EXIST"]
+
+        with pytest.raises(ValueError):
+            await service.batch_update([
+                {"object_id": list_objects[3], "object_name": "Should Not Apply"},
+                {"object_id": list_objects[4], "created_at": "2020-01-01"},
+            ])
+        unchanged = await service.batch_get([list_objects[3]], fields=["object_name"])
+        assert unchanged["items"][0]["object_name"] == "Crate 3"
+        logger.info("[OK] Batch update passed")
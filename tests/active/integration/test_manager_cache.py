@@ -0,0 +1,133 @@
+"""
+매니저 캐시 테스트
+크기 제한/TTL/LRU 캐시 동작과 매니저의 세션 단위 캐시 무효화 검증
+"""
+import asyncio
+import time
+import uuid
+import pytest
+
+from common.utils.ttl_cache import TTLCache, invalidate_session_caches
+from database.cell_occupancy import CellOccupancyMap
+from common.utils.logger import logger
+
+
+class TestTTLCache:
+    """TTLCache 테스트 클래스"""
+
+    def test_lru_eviction(self):
+        """max_size 초과 시 가장 오래 사용되지 않은 항목 제거"""
+        cache = TTLCache("test", max_size=3)
+        for i in range(3):
+            cache.set(i, f"value_{i}")
+
+        cache.get(0)  # 0을 최근 사용으로 갱신
+        cache.set(3, "value_3")
+
+        assert 0 in cache
+        assert 1 not in cache
+        assert len(cache) == 3
+        assert cache.stats.evictions == 1
+
+    def test_ttl_expiration(self):
+        """TTL 경과 항목은 miss 처리"""
+        cache = TTLCache("test", max_size=10, ttl_seconds=0.05)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+        time.sleep(0.06)
+        assert cache.get("key") is None
+        assert cache.stats.expirations == 1
+        assert len(cache) == 0
+
+    def test_session_invalidation(self):
+        """세션 태그 단위 일괄 무효화"""
+        cache = TTLCache("test", max_size=100)
+        for i in range(10):
+            cache.set(f"a_{i}", i, session_id="session_a")
+            cache.set(f"b_{i}", i, session_id="session_b")
+
+        assert cache.invalidate_session("session_a") == 10
+        assert len(cache) == 10
+        assert all(f"b_{i}" in cache for i in range(10))
+        assert cache.invalidate_session("session_a") == 0
+
+    @pytest.mark.asyncio
+    async def test_get_or_load_coalesces_concurrent_loads(self):
+        """같은 키의 동시 로드는 한 번만 수행"""
+        cache = TTLCache("test", max_size=10)
+        load_count = 0
+
+        async def loader():
+            nonlocal load_count
+            load_count += 1
+            await asyncio.sleep(0.01)
+            return "loaded"
+
+        results = await asyncio.gather(*[cache.get_or_load("key", loader) for _ in range(20)])
+
+        assert results == ["loaded"] * 20
+        assert load_count == 1
+
+    def test_on_evict_callback(self):
+        """LRU 제거 시에만 on_evict 호출 (무효화는 제외)"""
+        evicted = []
+        cache = TTLCache("test", max_size=2, on_evict=lambda key, value: evicted.append((key, value)))
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("b")
+        cache.set("c", 3)
+        cache.set("d", 4)
+
+        assert evicted == [("a", 1)]
+
+    def test_invalidate_session_caches(self):
+        """세션 태그 항목은 생성된 모든 캐시에서 한 번에 무효화 (다른 세션 항목은 유지)"""
+        first, second = TTLCache("first"), TTLCache("second")
+        first.set("a", 1, session_id="S1")
+        second.set("b", 2, session_id="S1")
+        second.set("c", 3, session_id="S2")
+
+        assert invalidate_session_caches("S1") == 2
+        assert "a" not in first and "b" not in second
+        assert second.get("c") == 3
+
+    def test_cell_occupancy_reverse_index_eviction(self):
+        """역색인에서 밀려난 엔티티의 셀 집합은 무효화 (이동 후 유령 점유자 없음)"""
+        occupancy = CellOccupancyMap(db_connection=object(), max_cells=1)
+        cell_a, cell_b = str(uuid.uuid4()), str(uuid.uuid4())
+        entity_ids = [str(uuid.uuid4()) for _ in range(51)]
+
+        # 역색인 상한(max_cells * 50)을 넘겨 첫 엔티티를 밀어냄
+        occupancy._cells.set(cell_a, set(entity_ids[:1]))
+        for entity_id in entity_ids:
+            occupancy.move(entity_id, cell_a)
+        assert occupancy.peek(cell_a) is None
+
+        # 다시 로드된 집합에서 이동하면 이전 셀에서 빠짐
+        occupancy._cells.set(cell_a, set(entity_ids))
+        occupancy.move(entity_ids[-1], cell_b)
+        assert entity_ids[-1] not in occupancy.peek(cell_a)
+
+
+class TestManagerCache:
+    """매니저 캐시 통합 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_entity_cache_session_invalidation(self, db_with_templates, entity_manager, test_session):
+        """엔티티 캐시가 세션 단위로 무효화되는지 확인"""
+        session_id = test_session['session_id']
+        result = await entity_manager.create_entity("NPC_VILLAGER_001", session_id)
+        assert result.status == "success", result.message
+        entity_id = result.entity_id
+
+        get_result = await entity_manager.get_entity(entity_id)
+        assert get_result.success
+        assert get_result.message == "캐시에서 조회"
+
+        removed = await entity_manager.invalidate_session_cache(session_id)
+        assert removed >= 1
+
+        stats = entity_manager.get_cache_stats()
+        assert stats["invalidations"] >= 1
+        logger.info(f"[OK] Entity cache stats: {stats}")
@@ -0,0 +1,173 @@
+"""
+프로젝트 NDJSON 내보내기/가져오기 테스트
+줄 분할, 스테이징 COPY 병합(같은 키는 마지막 줄 우선, 행이 제공한 컬럼만), 실패 시 전체 롤백, 내보내기 왕복 검증
+"""
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from app.services.world_editor.project_service import ProjectService, iter_ndjson_lines
+from common.utils.logger import logger
+
+
+async def _aiter(items):
+    for item in items:
+        yield item
+
+
+async def _collect(lines):
+    return [line async for line in lines]
+
+
+def _line(section: str, row: dict) -> str:
+    return json.dumps({"table": section, "row": row}, ensure_ascii=False)
+
+
+@pytest_asyncio.fixture
+async def project_tag(db_connection):
+    """가져오기 테스트용 ID 태그 (테스트 후 삭제)"""
+    tag = uuid.uuid4().hex[:8].upper()
+    yield tag
+
+    pool = await db_connection.pool
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM game_data.world_cells WHERE cell_id LIKE $1", f"CELL_BULK_{tag}%")
+        await conn.execute("DELETE FROM game_data.world_locations WHERE location_id LIKE $1", f"LOC_BULK_{tag}%")
+        await conn.execute("DELETE FROM game_data.world_regions WHERE region_id LIKE $1", f"REG_BULK_{tag}%")
+
+
+def _world_lines(tag: str):
+    return [
+        json.dumps({"format": "ndjson", "version": "1.0.0"}),
+        _line("regions", {"region_id": f"REG_BULK_{tag}", "region_name": "초안 지역",
+                          "region_properties": {"climate": "temperate"}}),
+        _line("locations", {"location_id": f"LOC_BULK_{tag}", "region_id": f"REG_BULK_{tag}",
+                            "location_name": "벌크 마을", "location_properties": {"lore": {"history": "..."}}}),
+        _line("cells", {"cell_id": f"CELL_BULK_{tag}", "location_id": f"LOC_BULK_{tag}",
+                        "cell_name": "벌크 광장", "matrix_width": 20, "matrix_height": 10}),
+        # 같은 키가 다시 나오면 마지막 줄 우선
+        _line("regions", {"region_id": f"REG_BULK_{tag}", "region_name": "벌크 지역",
+                          "region_properties": {"climate": "cold"}}),
+        "",
+    ]
+
+
+class TestProjectBulk:
+    """프로젝트 NDJSON 내보내기/가져오기 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_iter_ndjson_lines_handles_split_chunks(self):
+        """청크 경계에서 잘린 줄/UTF-8 문자도 온전한 줄로 합쳐짐"""
+        data = '{"a": "지역"}\n{"b": 2}\n{"c": 3}'.encode("utf-8")
+        chunks = [data[i:i + 5] for i in range(0, len(data), 5)]
+
+        lines = await _collect(iter_ndjson_lines(_aiter(chunks)))
+        assert lines == ['{"a": "지역"}', '{"b": 2}', '{"c": 3}']
+        logger.info("[OK] NDJSON line split passed")
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_merges_in_fk_order(self, db_connection, project_tag):
+        """스테이징 후 외래 키 순서로 병합되고, 다시 가져오면 갱신됨"""
+        service = ProjectService(db_connection)
+
+        result = await service.bulk_import(_aiter(_world_lines(project_tag)))
+        assert result["stats"] == {"regions": 2, "locations": 1, "cells": 1}
+        assert set(result["timings_ms"]) == {"regions", "locations", "cells"}
+
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            region = await conn.fetchrow(
+                "SELECT region_name, region_properties::text AS props FROM game_data.world_regions WHERE region_id = $1",
+                f"REG_BULK_{project_tag}"
+            )
+            cell = await conn.fetchrow(
+                "SELECT location_id, matrix_width FROM game_data.world_cells WHERE cell_id = $1",
+                f"CELL_BULK_{project_tag}"
+            )
+        assert region["region_name"] == "벌크 지역"
+        assert json.loads(region["props"]) == {"climate": "cold"}
+        assert cell["location_id"] == f"LOC_BULK_{project_tag}"
+        assert cell["matrix_width"] == 20
+
+        # 다시 가져오면 ON CONFLICT로 갱신
+        await service.bulk_import(_aiter([
+            _line("cells", {"cell_id": f"CELL_BULK_{project_tag}", "location_id": f"LOC_BULK_{project_tag}",
+                            "cell_name": "벌크 광장", "matrix_width": 30, "matrix_height": 10})
+        ]))
+        async with pool.acquire() as conn:
+            width = await conn.fetchval(
+                "SELECT matrix_width FROM game_data.world_cells WHERE cell_id = $1", f"CELL_BULK_{project_tag}"
+            )
+        assert width == 30
+        logger.info("[OK] Bulk import merge passed")
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_updates_only_supplied_columns(self, db_connection, project_tag):
+        """행마다 제공한 컬럼만 병합 (빠진 키는 기존 값 유지, 뒤 행에만 있는 키도 반영)"""
+        service = ProjectService(db_connection)
+        region_id, other_id = f"REG_BULK_{project_tag}", f"REG_BULK_{project_tag}_2"
+        await service.bulk_import(_aiter([
+            _line("regions", {"region_id": region_id, "region_name": "벌크 지역", "region_description": "기존 설명"})
+        ]))
+
+        await service.bulk_import(_aiter([
+            _line("regions", {"region_id": region_id, "region_name": "새 이름"}),
+            _line("regions", {"region_id": other_id, "region_name": "다른 지역", "region_type": "forest"}),
+        ]))
+
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            rows = {
+                row["region_id"]: row for row in await conn.fetch(
+                    "SELECT region_id, region_name, region_description, region_type "
+                    "FROM game_data.world_regions WHERE region_id = ANY($1::text[])",
+                    [region_id, other_id]
+                )
+            }
+        assert rows[region_id]["region_name"] == "새 이름"
+        assert rows[region_id]["region_description"] == "기존 설명"
+        assert rows[other_id]["region_type"] == "forest"
+        logger.info("[OK] Bulk import partial rows passed")
+
+    @pytest.mark.asyncio
+    async def test_bulk_import_is_all_or_nothing(self, db_connection, project_tag):
+        """잘못된 줄이 있으면 앞서 스테이징된 행도 적용되지 않음"""
+        service = ProjectService(db_connection)
+        lines = _world_lines(project_tag) + [_line("unknown_section", {"id": 1})]
+
+        with pytest.raises(ValueError):
+            await service.bulk_import(_aiter(lines))
+
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            exists = await conn.fetchval(
+                "SELECT EXISTS (SELECT 1 FROM game_data.world_regions WHERE region_id = $1)",
+                f"REG_BULK_{project_tag}"
+            )
+        assert not exists
+        logger.info("[OK] Bulk import rollback passed")
+
+    @pytest.mark.asyncio
+    async def test_stream_export_round_trip(self, db_connection, project_tag):
+        """스트리밍 내보내기 결과를 그대로 가져오면 같은 행 수가 병합됨"""
+        service = ProjectService(db_connection)
+        await service.bulk_import(_aiter(_world_lines(project_tag)))
+
+        lines = await _collect(service.stream_export())
+        header = json.loads(lines[0])
+        entries = [json.loads(line) for line in lines[1:]]
+        assert header["format"] == "ndjson"
+
+        exported_cells = [entry["row"] for entry in entries if entry["table"] == "cells"]
+        assert any(row["cell_id"] == f"CELL_BULK_{project_tag}" and row["cell_name"] == "벌크 광장"
+                   for row in exported_cells)
+
+        counts = {}
+        for entry in entries:
+            counts[entry["table"]] = counts.get(entry["table"], 0) + 1
+
+        result = await service.bulk_import(_aiter(lines))
+        assert result["stats"] == counts
+        logger.info(f"[OK] Stream export round trip passed: {counts}")
@@ -0,0 +1,84 @@
+"""
+요청 트레이싱 테스트
+미들웨어/span API/링 버퍼/JSONL 기록 검증
+"""
+import asyncio
+import json
+import pytest
+
+from common.utils.tracing import Tracer, TracingMiddleware
+from common.utils.logger import logger
+
+
+def _make_app(tracer: Tracer):
+    """span과 DB 기록을 남기는 테스트용 ASGI 앱"""
+    async def app(scope, receive, send):
+        with tracer.span("Service.call", session_id="session_a") as span:
+            tracer.record_db(0.002)
+            tracer.record_rows(3)
+            span.set(rows=3)
+            await asyncio.sleep(0)
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"{}"})
+    return app
+
+
+async def _call(middleware, path: str):
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        pass
+
+    await middleware({"type": "http", "method": "GET", "path": path}, receive, send)
+
+
+class TestRequestTracing:
+    """요청 트레이싱 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_trace_recorded_with_spans_and_db_time(self):
+        """요청별 span/DB 시간/행 수가 기록되는지 확인"""
+        tracer = Tracer(enabled=True, buffer_size=10)
+        middleware = TracingMiddleware(_make_app(tracer), tracer=tracer)
+
+        await _call(middleware, "/api/gameplay/actions/abc")
+
+        traces = tracer.get_traces()
+        assert len(traces) == 1
+        trace = traces[0]
+        assert trace["status_code"] == 200
+        assert trace["db_calls"] == 1
+        assert trace["db_rows"] == 3
+        assert trace["spans"][0]["name"] == "Service.call"
+        assert trace["spans"][0]["attrs"]["rows"] == 3
+        logger.info(f"[OK] Trace: {trace}")
+
+    @pytest.mark.asyncio
+    async def test_ring_buffer_and_disabled_passthrough(self):
+        """링 버퍼 크기 제한 및 비활성 시 기록 없음"""
+        tracer = Tracer(enabled=True, buffer_size=3)
+        middleware = TracingMiddleware(_make_app(tracer), tracer=tracer)
+
+        for i in range(5):
+            await _call(middleware, f"/api/test/{i}")
+        assert [t["path"] for t in tracer.get_traces()] == ["/api/test/4", "/api/test/3", "/api/test/2"]
+
+        tracer.clear()
+        tracer.configure(enabled=False)
+        await _call(middleware, "/api/test/disabled")
+        assert tracer.get_traces() == []
+
+    @pytest.mark.asyncio
+    async def test_jsonl_export(self, tmp_path):
+        """JSONL 파일 기록 (QueueHandler)"""
+        path = tmp_path / "traces.jsonl"
+        tracer = Tracer(enabled=True, buffer_size=10, jsonl_path=str(path))
+        middleware = TracingMiddleware(_make_app(tracer), tracer=tracer)
+
+        await _call(middleware, "/api/test/jsonl")
+        tracer.shutdown()
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1
+        assert json.loads(lines[0])["path"] == "/api/test/jsonl"
@@ -0,0 +1,214 @@
+"""
+저장 슬롯 스냅샷 테스트
+스냅샷 형식 왕복, 증분 저장(바뀐 행만), 저장 시점 상태 복원, 정리된 세션 재생성,
+불러오기 후 매니저 캐시 무효화 검증
+"""
+import json
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from app.core.session_registry import session_registry
+from app.managers.object_state_manager import ObjectStateManager
+from database.repositories.game_data import GameDataRepository
+from database.repositories.reference_layer import ReferenceLayerRepository
+from database.repositories.runtime_data import RuntimeDataRepository
+from database.save_slot_store import (
+    SaveSlotStore, apply_entries, compress, decode_payload, decompress, diff_rows, encode_payload, row_digest
+)
+from common.utils.logger import logger
+
+
+ENTITY_COUNT = 20
+
+
+@pytest_asyncio.fixture
+async def save_owner(db_connection):
+    """테스트 전용 저장 소유자 (테스트 후 슬롯 삭제)"""
+    owner = f"test_{uuid.uuid4().hex[:8]}"
+    yield owner
+
+    pool = await db_connection.pool
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM runtime_data.save_slots WHERE owner = $1", owner)
+
+
+async def _populate_session(conn, session_id: str):
+    """셀 1개와 엔티티(런타임/참조/상태) 생성 후 엔티티 ID 반환"""
+    cell_id = uuid.uuid4()
+    entity_ids = [uuid.uuid4() for _ in range(ENTITY_COUNT)]
+    await conn.execute("""
+        INSERT INTO runtime_data.runtime_cells (runtime_cell_id, game_cell_id, session_id)
+        VALUES ($1, 'CELL_VILLAGE_SQUARE_001', $2)
+    """, cell_id, session_id)
+    await conn.execute("""
+        INSERT INTO reference_layer.cell_references (runtime_cell_id, game_cell_id, session_id, cell_type)
+        VALUES ($1, 'CELL_VILLAGE_SQUARE_001', $2, 'outdoor')
+    """, cell_id, session_id)
+    await conn.execute("""
+        INSERT INTO runtime_data.runtime_entities (runtime_entity_id, game_entity_id, session_id)
+        SELECT id, 'NPC_VILLAGER_001', $2 FROM unnest($1::uuid[]) AS id
+    """, entity_ids, session_id)
+    await conn.execute("""
+        INSERT INTO runtime_data.entity_states (runtime_entity_id, session_id, current_stats, current_position)
+        SELECT id, $2, '{"hp": 100}'::jsonb, jsonb_build_object('x', 0.0, 'y', 0.0, 'runtime_cell_id', $3::text)
+        FROM unnest($1::uuid[]) AS id
+    """, entity_ids, session_id, str(cell_id))
+    return entity_ids
+
+
+async def _hp(conn, entity_id) -> int:
+    stats = await conn.fetchval(
+        "SELECT current_stats::text FROM runtime_data.entity_states WHERE runtime_entity_id = $1", entity_id
+    )
+    return json.loads(stats)["hp"]
+
+
+async def _set_hp(conn, entity_id, hp: int) -> None:
+    await conn.execute(
+        "UPDATE runtime_data.entity_states SET current_stats = jsonb_build_object('hp', $2::int) "
+        "WHERE runtime_entity_id = $1",
+        entity_id, hp
+    )
+
+
+class TestSaveSlotStore:
+    """저장 슬롯 스냅샷 테스트 클래스"""
+
+    def test_payload_round_trip_and_diff(self):
+        """헤더/행 줄 형식 왕복, 다이제스트 비교로 바뀐 행과 삭제된 행만 추출"""
+        rows = {"entity_states": {"A": '{"hp": 1}', "B": '{"note": "tab\\tand\\nnewline"}'}}
+        header = {"format": "save_snapshot", "kind": "full", "session_id": "S1"}
+        entries = [(name, key, row) for name, table_rows in rows.items() for key, row in table_rows.items()]
+        payload = compress(encode_payload(header, entries), "zlib")
+        decoded_header, decoded_entries = decode_payload(decompress(payload, "zlib"))
+        assert decoded_header == header
+        assert decoded_entries == entries
+
+        digests = {f"entity_states\t{key}": row_digest(row) for key, row in rows["entity_states"].items()}
+        changed = {"entity_states": {"A": '{"hp": 2}', "C": '{"hp": 3}'}}
+        changed_digests = {f"entity_states\t{key}": row_digest(row) for key, row in changed["entity_states"].items()}
+        diff = diff_rows(changed, changed_digests, digests)
+        assert sorted(diff) == [("entity_states", "A", '{"hp": 2}'), ("entity_states", "B", ""),
+                                ("entity_states", "C", '{"hp": 3}')]
+
+        apply_entries(rows, diff)
+        assert rows == changed
+        logger.info("[OK] Snapshot payload passed")
+
+    @pytest.mark.asyncio
+    async def test_incremental_save_and_restore(self, db_with_templates, db_connection, test_session, save_owner):
+        """두 번째 저장은 바뀐 행만 담고, 불러오기는 마지막 저장 시점으로 되돌림"""
+        session_id = test_session['session_id']
+        store = SaveSlotStore(db_connection, codec="zlib")
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            entity_ids = await _populate_session(conn, session_id)
+
+        first = await store.save(session_id, 1, {"save_name": "첫 저장"}, owner=save_owner)
+        assert first["kind"] == "full"
+        assert first["rows"] >= ENTITY_COUNT * 2
+
+        async with pool.acquire() as conn:
+            await _set_hp(conn, entity_ids[0], 40)
+        second = await store.save(session_id, 1, {"save_name": "두 번째 저장"}, owner=save_owner)
+        assert second["kind"] == "incremental"
+        assert second["rows"] == 1
+
+        # 저장 이후 변경: 스탯 변경 + 엔티티 삭제
+        async with pool.acquire() as conn:
+            await _set_hp(conn, entity_ids[0], 5)
+            await _set_hp(conn, entity_ids[1], 5)
+            await conn.execute("DELETE FROM runtime_data.runtime_entities WHERE runtime_entity_id = $1", entity_ids[2])
+
+        slot = await store.restore(1, owner=save_owner)
+        assert slot["restored"] is True
+        assert slot["save_name"] == "두 번째 저장"
+        assert slot["snapshots"] == 2
+        async with pool.acquire() as conn:
+            assert await _hp(conn, entity_ids[0]) == 40
+            assert await _hp(conn, entity_ids[1]) == 100
+            assert await _hp(conn, entity_ids[2]) == 100
+            assert await conn.fetchval(
+                "SELECT COUNT(*) FROM runtime_data.runtime_entities WHERE session_id = $1", session_id
+            ) == ENTITY_COUNT
+
+        assert [s["slot_id"] for s in await store.list_slots(owner=save_owner)] == [1]
+        assert await store.delete(1, owner=save_owner) is True
+        assert await store.restore(1, owner=save_owner) is None
+        logger.info("[OK] Incremental save/restore passed")
+
+    @pytest.mark.asyncio
+    async def test_restore_recreates_ended_session(self, db_with_templates, db_connection, test_session, save_owner):
+        """세션이 정리된 뒤에도 저장 슬롯으로 세션과 런타임 행을 다시 만듦"""
+        session_id = test_session['session_id']
+        store = SaveSlotStore(db_connection, codec="zlib")
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            entity_ids = await _populate_session(conn, session_id)
+
+        await store.save(session_id, 2, {"save_name": "정리 전"}, owner=save_owner)
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM runtime_data.runtime_entities WHERE session_id = $1", session_id)
+            await conn.execute("DELETE FROM runtime_data.runtime_cells WHERE session_id = $1", session_id)
+            await conn.execute("DELETE FROM runtime_data.active_sessions WHERE session_id = $1", session_id)
+
+        slot = await store.restore(2, owner=save_owner)
+        assert slot["restored"] is True
+        async with pool.acquire() as conn:
+            assert await conn.fetchval(
+                "SELECT session_state FROM runtime_data.active_sessions WHERE session_id = $1", session_id
+            ) == 'active'
+            assert await conn.fetchval(
+                "SELECT COUNT(*) FROM runtime_data.entity_states WHERE session_id = $1", session_id
+            ) == ENTITY_COUNT
+            assert await conn.fetchval(
+                "SELECT COUNT(*) FROM reference_layer.cell_references WHERE session_id = $1", session_id
+            ) == 1
+            assert await _hp(conn, entity_ids[0]) == 100
+        logger.info("[OK] Restore into ended session passed")
+
+    @pytest.mark.asyncio
+    async def test_load_invalidates_object_state_cache(self, db_with_templates, db_connection, test_session,
+                                                       save_owner):
+        """불러오기 후 오브젝트 상태는 캐시가 아닌 저장 시점 상태로 조회"""
+        session_id = test_session['session_id']
+        object_id = f"OBJ_SAVE_{uuid.uuid4().hex[:8].upper()}"
+        store = SaveSlotStore(db_connection, codec="zlib")
+        manager = ObjectStateManager(
+            db_connection,
+            GameDataRepository(db_connection),
+            RuntimeDataRepository(db_connection),
+            ReferenceLayerRepository(db_connection)
+        )
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await conn.execute("""
+                INSERT INTO game_data.world_objects
+                (object_id, object_type, object_name, object_description, interaction_type, properties)
+                VALUES ($1, 'container', 'Save Test Chest', 'save slot test object', 'open_close', '{}'::jsonb)
+            """, object_id)
+
+        try:
+            assert (await manager.update_object_state(None, object_id, session_id, state="open")).success
+            await store.save(session_id, 3, {"save_name": "상자 열림"}, owner=save_owner)
+
+            # 저장 이후 변경이 캐시에 남음
+            await manager.update_object_state(None, object_id, session_id, state="closed")
+            cached = await manager.get_object_state(None, object_id, session_id)
+            assert cached.object_state["current_state"] == "closed"
+
+            slot = await store.restore(3, owner=save_owner)
+            assert slot["restored"] is True
+            session_registry.on_load(session_id)
+
+            loaded = await manager.get_object_state(None, object_id, session_id)
+            assert loaded.object_state["current_state"] == "open"
+        finally:
+            session_registry.on_end(session_id)
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM reference_layer.object_references WHERE session_id = $1", session_id)
+                await conn.execute("DELETE FROM runtime_data.runtime_objects WHERE session_id = $1", session_id)
+                await conn.execute("DELETE FROM game_data.world_objects WHERE object_id = $1", object_id)
+        logger.info("[OK] Load invalidates object state cache passed")
@@ -0,0 +1,92 @@
+"""
+통합 검색 테스트
+점수 정렬(완전 > 접두 > 부분 일치), 오타 허용, 키셋 커서 페이지, 잘못된 커서 처리 검증
+"""
+import uuid
+
+import pytest
+import pytest_asyncio
+
+from app.services.world_editor.search_service import SearchService, decode_cursor, encode_cursor
+from common.utils.logger import logger
+
+
+@pytest_asyncio.fixture
+async def search_objects(db_connection):
+    """검색용 월드 오브젝트 (테스트 후 삭제)"""
+    tag = uuid.uuid4().hex[:8]
+    names = [
+        f"Lantern{tag}",                # 완전 일치
+        f"Lantern{tag} Post",           # 접두 일치
+        f"Old Lantern{tag}",            # 부분 일치
+        f"Lanturn{tag} Hook",           # 오타
+        *[f"Lantern{tag} Crate {i:02d}" for i in range(12)],
+    ]
+    objects = [(f"OBJ_SEARCH_{tag}_{i:02d}", name) for i, name in enumerate(names)]
+
+    pool = await db_connection.pool
+    async with pool.acquire() as conn:
+        await conn.executemany(
+            """
+            INSERT INTO game_data.world_objects (object_id, object_type, object_name, object_description)
+            VALUES ($1, 'static', $2, '검색 테스트 오브젝트')
+            """,
+            objects
+        )
+    yield {"tag": tag, "objects": dict(objects)}
+
+    async with pool.acquire() as conn:
+        await conn.execute(
+            "DELETE FROM game_data.world_objects WHERE object_id LIKE $1",
+            f"OBJ_SEARCH_{tag}_%"
+        )
+
+
+class TestSearchService:
+    """통합 검색 테스트 클래스"""
+
+    def test_cursor_round_trip(self):
+        """커서는 점수/타입/ID를 그대로 복원하고, 잘못된 커서는 ValueError"""
+        assert decode_cursor(encode_cursor(1.2345678901234567, "item", "ITEM_A")) == \
+            (1.2345678901234567, "item", "ITEM_A")
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+        logger.info("[OK] Cursor round trip passed")
+
+    @pytest.mark.asyncio
+    async def test_ranking_and_typo_tolerance(self, db_connection, search_objects):
+        """완전 일치 > 접두 일치 > 부분 일치 순으로 정렬되고, 오타가 있는 이름도 검색됨"""
+        tag = search_objects["tag"]
+        service = SearchService(db_connection)
+
+        response = await service.search(f"Lantern{tag}", entity_types=["world_object"], limit=100)
+        names = [item.name for item in response.results]
+        assert names[0] == f"Lantern{tag}"
+        assert names.index(f"Lantern{tag} Post") < names.index(f"Old Lantern{tag}")
+        assert f"Lanturn{tag} Hook" in names
+        assert response.entity_type_counts == {"world_object": len(search_objects["objects"])}
+        assert response.next_cursor is None
+
+        scores = [item.metadata["score"] for item in response.results]
+        assert scores == sorted(scores, reverse=True)
+        logger.info("[OK] Search ranking passed")
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination_covers_all_results_once(self, db_connection, search_objects):
+        """커서로 이어 조회한 페이지들은 한 번의 전체 조회와 같은 순서/항목"""
+        tag = search_objects["tag"]
+        service = SearchService(db_connection)
+        full = await service.search(f"Lantern{tag}", entity_types=["world_object"], limit=100)
+
+        paged, cursor = [], None
+        while True:
+            page = await service.search(f"Lantern{tag}", entity_types=["world_object"], limit=5, cursor=cursor)
+            assert len(page.results) <= 5
+            paged.extend(item.entity_id for item in page.results)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert paged == [item.entity_id for item in full.results]
+        assert len(set(paged)) == len(paged)
+        logger.info("[OK] Search cursor pagination passed")
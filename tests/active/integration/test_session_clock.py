@@ -0,0 +1,133 @@
+"""
+세션 게임 시계 테스트
+한 번만 로드, 시간 진행, 예약 이벤트 실행 순서, 배치 기록, 핸들러 시간 소모 연동,
+NPC 행동 시간 소모 제외, 유휴 시계 제거 검증
+"""
+import pytest
+
+from app.handlers.time_interactions.wait_handler import WaitHandler
+from app.systems.session_clock import SessionClockService, frozen_clock
+from app.systems.time_system import GameTime
+from common.utils.logger import logger
+
+
+async def _stored_time(db_connection, session_id: str) -> GameTime:
+    pool = await db_connection.pool
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(
+            """
+            SELECT current_day, current_hour, current_minute
+            FROM runtime_data.session_states
+            WHERE session_id = $1::uuid
+            """,
+            session_id
+        )
+    return GameTime(day=row['current_day'], hour=row['current_hour'], minute=row['current_minute'])
+
+
+class TestSessionClock:
+    """세션 게임 시계 테스트 클래스"""
+
+    @pytest.mark.asyncio
+    async def test_advance_loads_once_and_flushes_latest_time(self, db_connection, test_session):
+        """세션 시간은 한 번만 로드되고, 여러 번 진행해도 마지막 값 한 번만 기록됨"""
+        session_id = test_session["session_id"]
+        clock = SessionClockService(db_connection, flush_interval=60.0)
+        try:
+            start = await clock.now(session_id)
+            for _ in range(10):
+                await clock.advance(session_id, 15)
+            now = await clock.now(session_id)
+
+            assert now.to_minutes() - start.to_minutes() == 150
+            assert clock.metrics.loads == 1
+
+            assert await clock.flush(session_id) == 1
+            assert await clock.flush(session_id) == 0
+            assert (await _stored_time(db_connection, session_id)).to_minutes() == now.to_minutes()
+        finally:
+            await clock.close()
+        logger.info(f"[OK] Session clock load/flush passed: {clock.snapshot()}")
+
+    @pytest.mark.asyncio
+    async def test_due_events_fire_in_order(self, db_connection, test_session):
+        """진행 구간에 기한이 된 이벤트가 시각 순서대로 실행되고 반복 이벤트는 다시 예약됨"""
+        session_id = test_session["session_id"]
+        clock = SessionClockService(db_connection, flush_interval=60.0)
+        fired = []
+
+        async def record(event_data):
+            fired.append(event_data["name"])
+
+        try:
+            base = (await clock.now(session_id)).to_minutes()
+            await clock.schedule(session_id, "late", "test", GameTime.from_minutes(base + 50),
+                                 {"name": "late"}, handler=record)
+            await clock.schedule(session_id, "early", "test", GameTime.from_minutes(base + 10),
+                                 {"name": "early"}, handler=record)
+            await clock.schedule(session_id, "tick", "test", GameTime.from_minutes(base + 20),
+                                 {"name": "tick"}, handler=record, repeat_interval=20)
+            cancelled = await clock.schedule(session_id, "cancelled", "test", GameTime.from_minutes(base + 5),
+                                             {"name": "cancelled"}, handler=record)
+            assert clock.cancel(session_id, cancelled)
+
+            await clock.advance(session_id, 5)
+            assert fired == []
+
+            await clock.advance(session_id, 55)
+            assert fired == ["early", "tick", "tick", "late", "tick"]
+            assert clock.snapshot()["scheduled_events"] == 1
+        finally:
+            await clock.close()
+        logger.info("[OK] Session clock events passed")
+
+    @pytest.mark.asyncio
+    async def test_handler_time_cost_uses_session_clock(self, db_connection, test_session):
+        """액션 핸들러의 시간 소모가 세션 시계에 적용됨"""
+        session_id = test_session["session_id"]
+        clock = SessionClockService(db_connection, flush_interval=60.0)
+        handler = WaitHandler(db_connection=db_connection, clock=clock)
+        try:
+            before = (await clock.now(session_id)).to_minutes()
+            result = await handler.handle("player", parameters={"hours": 2, "session_id": session_id})
+
+            assert result.success
+            assert (await clock.now(session_id)).to_minutes() - before == 120
+        finally:
+            await clock.close()
+        logger.info("[OK] Handler time cost passed")
+
+    @pytest.mark.asyncio
+    async def test_frozen_clock_skips_time_cost(self, db_connection, test_session):
+        """frozen_clock() 안의 액션(NPC 루틴)은 세션 시계를 진행하지 않음"""
+        session_id = test_session["session_id"]
+        clock = SessionClockService(db_connection, flush_interval=60.0)
+        handler = WaitHandler(db_connection=db_connection, clock=clock)
+        try:
+            before = (await clock.now(session_id)).to_minutes()
+            with frozen_clock():
+                result = await handler.handle("npc", parameters={"hours": 3, "session_id": session_id})
+
+            assert result.success
+            assert (await clock.now(session_id)).to_minutes() == before
+            assert clock.metrics.advances == 0
+        finally:
+            await clock.close()
+        logger.info("[OK] Frozen clock passed")
+
+    @pytest.mark.asyncio
+    async def test_idle_clocks_are_evicted(self, db_connection, test_session):
+        """기록할 변경과 예약 이벤트가 없는 유휴 시계만 메모리에서 제거"""
+        session_id = test_session["session_id"]
+        clock = SessionClockService(db_connection, flush_interval=60.0, idle_timeout_minutes=1)
+        try:
+            await clock.advance(session_id, 10)
+            clock._clocks[session_id].last_used -= 120
+            assert clock.evict_idle() == 0  # 아직 기록되지 않은 변경이 있음
+
+            await clock.flush(session_id)
+            assert clock.evict_idle() == 1
+            assert clock.snapshot()["resident"] == 0
+        finally:
+            await clock.close()
+        logger.info("[OK] Idle clock eviction passed")
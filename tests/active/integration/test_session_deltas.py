@@ -0,0 +1,155 @@
+"""
+세션 게임플레이 델타 스트림 테스트
+seq/resume 재전송, 재동기화, 셀 입출입 델타, 액션 목록 디바운스 푸시 검증
+"""
+import asyncio
+import uuid
+
+import pytest
+
+from app.systems.session_deltas import SessionDeltaStream
+from database.cell_occupancy import CellOccupancyMap
+from common.utils.logger import logger
+
+
+class TestSessionDeltas:
+    """세션 델타 스트림 테스트 클래스"""
+
+    def test_seq_and_replay(self):
+        """seq는 1부터 증가하고, 버퍼 안의 누락은 재전송, 벗어나면 스냅샷 필요(None)"""
+        stream = SessionDeltaStream(buffer_size=4)
+        received = []
+        token = stream.attach("S1", received.append)
+
+        # 연결이 없는 세션은 버려짐
+        assert stream.publish("S2", "time_advanced", {"minutes": 1}) is None
+
+        for minute in range(6):
+            stream.publish("S1", "time_advanced", {"minute": minute})
+        assert [m["seq"] for m in received] == [1, 2, 3, 4, 5, 6]
+        stream_id, seq = stream.position("S1")
+        assert seq == 6
+
+        assert [m["seq"] for m in stream.replay("S1", stream_id, 3)] == [4, 5, 6]
+        assert stream.replay("S1", stream_id, 6) == []
+        assert stream.replay("S1", stream_id, 1) is None      # 버퍼 밖
+        assert stream.replay("S1", "old-stream", 5) is None   # 다른 stream
+        assert stream.replay("S1", stream_id, 9) is None      # 미래 seq
+
+        stream.detach("S1", token)
+        assert stream.position("S1") is None
+        logger.info("[OK] Delta seq/replay passed")
+
+    def test_resync_issues_new_stream(self):
+        """재동기화는 새 stream ID를 알리고 이전 seq로는 resume할 수 없음"""
+        stream = SessionDeltaStream()
+        received = []
+        stream.attach("S1", received.append)
+        stream.publish("S1", "time_advanced", {"minute": 1})
+        old_stream, _ = stream.position("S1")
+
+        stream.resync("S1")
+        assert received[-1] == {"type": "resync", "stream": stream.position("S1")[0]}
+        assert stream.position("S1")[0] != old_stream
+        assert stream.replay("S1", old_stream, 1) is None
+        assert stream.publish("S1", "time_advanced", {"minute": 2}) == 1
+        logger.info("[OK] Delta resync passed")
+
+    def test_cell_entries_and_player_moves(self):
+        """플레이어 셀에 들어오고 나가는 엔티티, 플레이어 이동이 델타로 전달"""
+        stream = SessionDeltaStream()
+        occupancy = CellOccupancyMap(db_connection=object())
+        occupancy.add_listener(stream.on_entity_moved)
+
+        cell_a, cell_b = str(uuid.uuid4()), str(uuid.uuid4())
+        player, npc = str(uuid.uuid4()), str(uuid.uuid4())
+        received = []
+        stream.attach("S1", received.append)
+        stream.watch("S1", player, cell_a)
+
+        occupancy.move(npc, cell_a)
+        occupancy.move(npc, cell_b)
+        occupancy.move(player, cell_b)
+        occupancy.move(npc, None)
+
+        kinds = [(m["kind"], m["data"].get("entity_id")) for m in received]
+        assert kinds == [
+            ("entity_entered", npc),
+            ("entity_left", npc),
+            ("player_moved", None),
+            ("entity_left", npc),
+        ]
+        assert received[2]["data"]["cell_id"] == cell_b
+
+        # 플레이어 엔티티 기준 발행
+        assert stream.publish_for_entity(player, "inventory_delta", {"changes": {}}) == 5
+        assert stream.publish_for_entity(npc, "inventory_delta", {"changes": {}}) is None
+
+        stream.discard("S1")
+        occupancy.move(npc, cell_b)
+        assert len(received) == 5
+        assert stream.snapshot()["watched_cells"] == 0
+        logger.info("[OK] Cell entry/exit deltas passed")
+
+    @pytest.mark.asyncio
+    async def test_actions_pushed_once_after_debounce(self):
+        """연속 상태 변경은 액션 재계산 한 번으로 합치고, 목록이 같으면 푸시하지 않음"""
+        stream = SessionDeltaStream(actions_debounce=0.01)
+        calls = []
+        actions = [{"action_id": "look", "action_type": "observe"}]
+
+        async def provider(session_id):
+            calls.append(session_id)
+            return actions
+
+        stream.actions_provider = provider
+        received = []
+        stream.attach("S1", received.append)
+        stream.remember_actions("S1", [])
+
+        for i in range(5):
+            stream.publish("S1", "object_state", {"runtime_object_id": f"OBJ_{i}", "state": "open"})
+        stream.publish("S1", "time_advanced", {"minutes": 1})
+        await asyncio.sleep(0.05)
+
+        assert calls == ["S1"]
+        assert received[-1]["kind"] == "actions"
+        assert received[-1]["data"]["actions"] == actions
+
+        # 같은 목록이면 재계산만 하고 푸시하지 않음
+        stream.publish("S1", "object_state", {"runtime_object_id": "OBJ_0", "state": "closed"})
+        await asyncio.sleep(0.05)
+        assert len(calls) == 2
+        assert stream.metrics.action_pushes == 1
+
+        await stream.close()
+        assert stream.snapshot()["channels"] == 0
+        logger.info("[OK] Debounced actions push passed")
+
+    @pytest.mark.asyncio
+    async def test_actions_recomputed_after_change_during_refresh(self):
+        """재계산 중 들어온 상태 변경은 끝난 뒤 한 번 더 재계산해 최신 목록을 푸시"""
+        stream = SessionDeltaStream(actions_debounce=0.01)
+        calls = []
+
+        async def provider(session_id):
+            calls.append(session_id)
+            if len(calls) == 1:
+                # 목록 계산 중 상태 변경 (이미 조회한 상태는 바뀌기 전 값)
+                stream.publish("S1", "object_state", {"runtime_object_id": "OBJ_1", "state": "open"})
+                return [{"action_id": "open"}]
+            return [{"action_id": "close"}]
+
+        stream.actions_provider = provider
+        received = []
+        stream.attach("S1", received.append)
+
+        stream.publish("S1", "object_state", {"runtime_object_id": "OBJ_1", "state": "closed"})
+        await asyncio.sleep(0.05)
+
+        assert len(calls) == 2
+        pushed = [m["data"]["actions"] for m in received if m.get("kind") == "actions"]
+        assert pushed[-1] == [{"action_id": "close"}]
+
+        await stream.close()
+        logger.info("[OK] Actions recomputed after concurrent change")
@@ -0,0 +1,200 @@
+"""
+세션 정리 / 유휴 세션 회수 테스트
+session_id 기준 일괄 정리(점유 파생 행 포함), 인스턴스만 정리(session_id 없는 이전 상태 행 포함),
+유휴 세션 회수와 상주 세션 제외 검증
+"""
+import uuid
+
+import pytest
+
+from app.core.session_reaper import SessionReaper
+from app.core.session_registry import session_registry
+from database.session_storage import _SESSION_STEPS, SessionStorage, partition_name
+from common.utils.logger import logger
+
+
+ENTITY_COUNT = 10
+# 다른 세션이 회수되지 않도록 테스트 세션만 해당되는 유휴 기준 (약 5년)
+TIMEOUT_MINUTES = 5 * 365 * 24 * 60
+
+
+# 세션당 게임 엔티티 참조는 하나뿐이므로 (uq_entity_references_session_entity) 엔티티마다 별도 템플릿 사용
+GAME_ENTITY_IDS = [f"NPC_REAPER_TEST_{i:03d}" for i in range(ENTITY_COUNT)]
+
+
+async def _ensure_entity_templates(conn) -> None:
+    """NPC_VILLAGER_001을 복제한 테스트용 엔티티 템플릿 생성 (이미 있으면 유지)"""
+    await conn.execute("""
+        INSERT INTO game_data.entities (entity_id, entity_type, entity_name, entity_description, base_stats,
+                                        default_equipment, default_abilities, default_inventory, entity_properties)
+        SELECT t.id, e.entity_type, e.entity_name, e.entity_description, e.base_stats,
+               e.default_equipment, e.default_abilities, e.default_inventory, e.entity_properties
+        FROM game_data.entities e CROSS JOIN unnest($1::text[]) AS t(id)
+        WHERE e.entity_id = 'NPC_VILLAGER_001'
+        ON CONFLICT (entity_id) DO NOTHING
+    """, GAME_ENTITY_IDS)
+
+
+async def _populate_session(conn, session_id: str) -> None:
+    """셀 1개와 엔티티(런타임/참조/상태) 생성 (entity_states 트리거로 cell_occupants도 생성)"""
+    cell_id = uuid.uuid4()
+    entity_ids = [uuid.uuid4() for _ in range(ENTITY_COUNT)]
+    await _ensure_entity_templates(conn)
+    await conn.execute("""
+        INSERT INTO runtime_data.runtime_cells (runtime_cell_id, game_cell_id, session_id)
+        VALUES ($1, 'CELL_VILLAGE_SQUARE_001', $2)
+    """, cell_id, session_id)
+    await conn.execute("""
+        INSERT INTO reference_layer.cell_references (runtime_cell_id, game_cell_id, session_id, cell_type)
+        VALUES ($1, 'CELL_VILLAGE_SQUARE_001', $2, 'outdoor')
+    """, cell_id, session_id)
+    await conn.execute("""
+        INSERT INTO runtime_data.runtime_entities (runtime_entity_id, game_entity_id, session_id)
+        SELECT id, game_id, $3 FROM unnest($1::uuid[], $2::text[]) AS t(id, game_id)
+    """, entity_ids, GAME_ENTITY_IDS, session_id)
+    await conn.execute("""
+        INSERT INTO reference_layer.entity_references (runtime_entity_id, game_entity_id, session_id, entity_type)
+        SELECT id, game_id, $3, 'npc' FROM unnest($1::uuid[], $2::text[]) AS t(id, game_id)
+    """, entity_ids, GAME_ENTITY_IDS, session_id)
+    await conn.execute("""
+        INSERT INTO runtime_data.entity_states (runtime_entity_id, session_id, current_stats, current_position)
+        SELECT id, $2, '{"hp": 100}'::jsonb, jsonb_build_object('x', 0.0, 'y', 0.0, 'runtime_cell_id', $3::text)
+        FROM unnest($1::uuid[]) AS id
+    """, entity_ids, session_id, str(cell_id))
+
+
+async def _count(conn, table: str, session_id: str) -> int:
+    return await conn.fetchval(f"SELECT COUNT(*) FROM {table} WHERE session_id = $1", session_id)
+
+
+async def _make_idle(conn, session_id: str) -> None:
+    await conn.execute(
+        "UPDATE runtime_data.active_sessions SET last_active_at = NOW() - INTERVAL '10 years' "
+        "WHERE session_id = $1",
+        session_id
+    )
+
+
+class TestSessionReaper:
+    """세션 정리 / 유휴 세션 회수 테스트 클래스"""
+
+    def test_partition_name(self):
+        """세션 파티션 이름은 마이그레이션 함수와 같은 규칙 (테이블_s_UUID hex)"""
+        session_id = "0f8fad5b-d9cb-469f-a165-70867728950e"
+        assert partition_name("entity_states", session_id) == "entity_states_s_0f8fad5bd9cb469fa16570867728950e"
+        assert len(partition_name("cell_references", session_id)) <= 63
+        logger.info("[OK] Partition name passed")
+
+    @pytest.mark.asyncio
+    async def test_purge_session(self, db_with_templates, db_connection, test_session):
+        """세션 정리는 점유 파생 행까지 한 번에 지우고 테이블별 행 수를 반환"""
+        session_id = test_session['session_id']
+        storage = SessionStorage(db_connection)
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await _populate_session(conn, session_id)
+
+        reclaimed = await storage.purge(session_id)
+        assert reclaimed.get("runtime_data.entity_states", 0) == ENTITY_COUNT
+        assert reclaimed["runtime_data.cell_occupants"] == ENTITY_COUNT
+        assert reclaimed["runtime_data.runtime_entities"] == ENTITY_COUNT
+        assert reclaimed["runtime_data.active_sessions"] == 1
+
+        async with pool.acquire() as conn:
+            assert await _count(conn, "runtime_data.runtime_entities", session_id) == 0
+            assert await _count(conn, "runtime_data.active_sessions", session_id) == 0
+            assert await _count(conn, "reference_layer.cell_references", session_id) == 0
+
+        snapshot = storage.snapshot()
+        assert snapshot["purges"] == 1
+        assert snapshot["rows_reclaimed"] == sum(reclaimed.values())
+        logger.info(f"[OK] Session purge passed ({snapshot['rows_reclaimed']} rows)")
+
+    @pytest.mark.asyncio
+    async def test_purge_failure_keeps_session_rows(self, db_with_templates, db_connection, test_session,
+                                                    monkeypatch):
+        """정리 도중 실패하면 세션 파티션을 포함한 모든 행이 그대로 남음"""
+        session_id = test_session['session_id']
+        storage = SessionStorage(db_connection)
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await _populate_session(conn, session_id)
+
+        failing_step = ("fail", "SELECT 1 / 0 WHERE $1::uuid IS NOT NULL")
+        monkeypatch.setattr("database.session_storage._SESSION_STEPS", _SESSION_STEPS + (failing_step,))
+        with pytest.raises(Exception):
+            await storage.purge(session_id)
+
+        async with pool.acquire() as conn:
+            assert await _count(conn, "runtime_data.entity_states", session_id) == ENTITY_COUNT
+            assert await _count(conn, "runtime_data.runtime_entities", session_id) == ENTITY_COUNT
+            assert await _count(conn, "reference_layer.cell_references", session_id) == 1
+            assert await _count(conn, "runtime_data.active_sessions", session_id) == 1
+        assert storage.snapshot()["failures"] == 1
+
+        # 남은 행은 정상 정리 (cell_occupants는 픽스처 정리에서 직접 지울 수 없음)
+        monkeypatch.undo()
+        await storage.purge(session_id)
+        logger.info("[OK] Purge rollback passed")
+
+    @pytest.mark.asyncio
+    async def test_purge_instances_keeps_session(self, db_with_templates, db_connection, test_session):
+        """인스턴스 정리는 엔티티 상태/참조와 셀 참조만 지우고 세션은 유지 (session_id 없는 이전 상태 행 포함)"""
+        session_id = test_session['session_id']
+        storage = SessionStorage(db_connection)
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await _populate_session(conn, session_id)
+            legacy_entity_id = None
+            # session_id가 채워지기 전에 기록된 상태 행 (분할 적용 후에는 session_id NOT NULL)
+            if ("runtime_data", "entity_states") not in await storage.partitioned_tables(conn):
+                legacy_entity_id = await conn.fetchval("""
+                    UPDATE runtime_data.entity_states SET session_id = NULL
+                    WHERE state_id = (SELECT state_id FROM runtime_data.entity_states WHERE session_id = $1 LIMIT 1)
+                    RETURNING runtime_entity_id
+                """, session_id)
+
+        reclaimed = await storage.purge(session_id, keep_session=True)
+        assert reclaimed["runtime_data.entity_states"] == ENTITY_COUNT
+        async with pool.acquire() as conn:
+            assert await _count(conn, "runtime_data.entity_states", session_id) == 0
+            if legacy_entity_id is not None:
+                assert await conn.fetchval(
+                    "SELECT COUNT(*) FROM runtime_data.entity_states WHERE runtime_entity_id = $1", legacy_entity_id
+                ) == 0
+            assert await _count(conn, "reference_layer.entity_references", session_id) == 0
+            assert await _count(conn, "reference_layer.cell_references", session_id) == 0
+            assert await _count(conn, "runtime_data.active_sessions", session_id) == 1
+        logger.info("[OK] Instance purge passed")
+
+    @pytest.mark.asyncio
+    async def test_reaper_skips_resident_sessions(self, db_with_templates, db_connection, test_session):
+        """유휴 세션은 회수하고, 메모리에 상주 중인 세션은 last_active_at만 갱신"""
+        session_id = test_session['session_id']
+        reaper = SessionReaper(db_connection, storage=SessionStorage(db_connection),
+                               timeout_minutes=TIMEOUT_MINUTES, batch_size=10, pause_seconds=0)
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await _populate_session(conn, session_id)
+            await _make_idle(conn, session_id)
+
+        session_registry.get(session_id)
+        try:
+            assert await reaper.run_once() == 0
+            async with pool.acquire() as conn:
+                assert await _count(conn, "runtime_data.active_sessions", session_id) == 1
+        finally:
+            session_registry.on_end(session_id)
+
+        async with pool.acquire() as conn:
+            await _make_idle(conn, session_id)
+        assert await reaper.run_once() == 1
+        async with pool.acquire() as conn:
+            assert await _count(conn, "runtime_data.active_sessions", session_id) == 0
+            assert await _count(conn, "runtime_data.runtime_entities", session_id) == 0
+
+        snapshot = reaper.snapshot()
+        assert snapshot["sessions_reaped"] == 1
+        assert snapshot["rows_reclaimed"] > ENTITY_COUNT
+        assert snapshot["passes"] == 2
+        logger.info(f"[OK] Session reaper passed ({snapshot['last_pass_ms']} ms)")
@@ -0,0 +1,117 @@
+"""
+GameSession 레지스트리 테스트
+세션 재사용/유휴 만료/LRU 상한/수명 주기 훅/플레이어 캐시 검증
+"""
+import pytest
+
+from app.core.session_registry import SessionRegistry
+from database.connection import DatabaseConnection
+from common.utils.logger import logger
+
+
+class TestSessionRegistry:
+    """GameSession 레지스트리 테스트 클래스"""
+
+    def test_same_session_reused_with_shared_connection(self):
+        """같은 세션 ID는 같은 GameSession을 반환하고 모든 세션이 DB 연결을 공유"""
+        db = DatabaseConnection()
+        registry = SessionRegistry(max_sessions=10, idle_timeout_minutes=60, db_connection=db)
+
+        first = registry.get("session_a")
+        second = registry.get("session_a")
+        other = registry.get("session_b")
+
+        assert first is second
+        assert first is not other
+        assert first.db is db and other.db is db
+        assert registry.stats()["created"] == 2
+        logger.info(f"[OK] Registry stats: {registry.stats()}")
+
+    def test_lru_bound_and_idle_eviction(self):
+        """상한 초과 시 가장 오래 사용되지 않은 세션 제거, 유휴 세션 만료"""
+        registry = SessionRegistry(max_sessions=2, idle_timeout_minutes=60, db_connection=DatabaseConnection())
+
+        registry.get("session_a")
+        registry.get("session_b")
+        registry.get("session_a")  # session_b가 가장 오래 사용되지 않음
+        registry.get("session_c")
+
+        assert "session_a" in registry
+        assert "session_b" not in registry
+        assert "session_c" in registry
+
+        # 유휴 시간 경과 처리
+        registry._sessions["session_a"].last_access -= registry.idle_timeout_seconds + 1
+        assert registry.evict_idle() == 1
+        assert "session_a" not in registry
+        assert len(registry) == 1
+        logger.info("[OK] LRU/idle eviction passed")
+
+    @pytest.mark.asyncio
+    async def test_lifecycle_hooks(self):
+        """on_load는 캐시를 새로 구성하고 on_end는 세션을 해제"""
+        registry = SessionRegistry(max_sessions=10, idle_timeout_minutes=60, db_connection=DatabaseConnection())
+
+        session = registry.get("session_a")
+        session._player_refs = [{"runtime_entity_id": "player_1", "is_player": True}]
+        assert session.player_id == "player_1"
+
+        registry.invalidate_player("player_1")
+        assert session.player_id is None
+
+        reloaded = registry.on_load("session_a")
+        assert reloaded is not session
+
+        registry.on_end("session_a")
+        assert "session_a" not in registry
+        logger.info("[OK] Lifecycle hooks passed")
+
+    @pytest.mark.asyncio
+    async def test_empty_player_lookup_not_cached(self, db_connection, test_session):
+        """플레이어가 아직 없는 세션은 조회 결과를 캐시하지 않음 (세션 생성 중 요청 대비)"""
+        registry = SessionRegistry(max_sessions=10, idle_timeout_minutes=60, db_connection=db_connection)
+        session = registry.get(test_session["session_id"])
+
+        players = await session.get_player_entities()
+
+        assert players == []
+        assert session._player_refs is None
+        assert registry.get(test_session["session_id"]) is session
+        logger.info("[OK] Empty player lookup not cached")
+
+    @pytest.mark.asyncio
+    async def test_player_state_not_cached(self, db_connection, test_session):
+        """플레이어 참조만 캐시하고 상태는 세션 밖 변경(전투/아이템 등)까지 매번 반영"""
+        import uuid
+        from database.entity_state_store import entity_state_store
+
+        session_id = test_session["session_id"]
+        player_id = uuid.uuid4()
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await conn.execute("""
+                INSERT INTO runtime_data.runtime_entities (runtime_entity_id, game_entity_id, session_id)
+                VALUES ($1, 'NPC_VILLAGER_001', $2)
+            """, player_id, session_id)
+            await conn.execute("""
+                INSERT INTO reference_layer.entity_references
+                (runtime_entity_id, game_entity_id, session_id, entity_type, is_player)
+                VALUES ($1, 'NPC_VILLAGER_001', $2, 'player', TRUE)
+            """, player_id, session_id)
+            await conn.execute("""
+                INSERT INTO runtime_data.entity_states (runtime_entity_id, session_id, current_stats)
+                VALUES ($1, $2, '{"hp": 100}'::jsonb)
+            """, player_id, session_id)
+
+        registry = SessionRegistry(max_sessions=10, idle_timeout_minutes=60, db_connection=db_connection)
+        session = registry.get(session_id)
+        players = await session.get_player_entities()
+        assert players[0]["current_stats"]["hp"] == 100
+        assert session.player_id == player_id
+
+        # GameSession을 거치지 않는 변경 (전투 피해 등)
+        await entity_state_store.merge_stats(player_id, {"hp": 40}, session_id=session_id)
+        players = await session.get_player_entities()
+        assert players[0]["current_stats"]["hp"] == 40
+        await entity_state_store.flush(session_id)
+        logger.info("[OK] Player state read through entity_state_store")
@@ -0,0 +1,96 @@
+"""
+셀 공간 인덱스 테스트
+격자 조회 결과가 전체 거리 계산과 같은지, 갱신/제외/통과 가능 객체 처리 검증
+"""
+import math
+import random
+
+from app.services.world_editor.collision_service import check_collision, get_collision_radius
+from app.services.world_editor.spatial_index import SpatialGrid, WorldSpatialIndex
+from common.utils.logger import logger
+
+SIZES = ["tiny", "small", "medium", "large", "huge", "gargantuan"]
+
+
+def _random_entities(rng: random.Random, count: int):
+    return {
+        f"NPC_{i}": ({"x": rng.uniform(0, 50), "y": rng.uniform(0, 50), "z": rng.choice([0.0, 1.5])},
+                     rng.choice(SIZES))
+        for i in range(count)
+    }
+
+
+def _grid(entities) -> SpatialGrid:
+    grid = SpatialGrid()
+    for entity_id, (position, size) in entities.items():
+        grid.upsert(entity_id, position, get_collision_radius(size), {"entity_size": size})
+    return grid
+
+
+class TestSpatialIndex:
+    """셀 공간 인덱스 테스트 클래스"""
+
+    def test_collisions_match_full_scan(self):
+        """격자 충돌 검사 결과 = 셀 전체 check_collision 결과"""
+        rng = random.Random(7)
+        entities = _random_entities(rng, 500)
+        grid = _grid(entities)
+
+        queries = [({"x": rng.uniform(-5, 55), "y": rng.uniform(-5, 55), "z": 0.0}, rng.choice(SIZES))
+                   for _ in range(300)]
+        results = grid.check_collisions([(position, get_collision_radius(size)) for position, size in queries])
+
+        for (position, size), hits in zip(queries, results):
+            expected = {entity_id for entity_id, (other, other_size) in entities.items()
+                        if check_collision(position, size, other, other_size)}
+            assert {hit[0] for hit in hits} == expected
+        logger.info("[OK] Grid collisions match full scan passed")
+
+    def test_query_radius_sorted_and_inclusive(self):
+        """반경 조회는 경계를 포함하고 거리순으로 정렬됨"""
+        grid = SpatialGrid(bucket_size=2.0)
+        grid.upsert("A", {"x": 3.0, "y": 0.0}, 0.5)
+        grid.upsert("B", {"x": 1.0, "y": 0.0}, 0.5)
+        grid.upsert("C", {"x": 0.0, "y": 0.0, "z": 3.5}, 0.5)
+        grid.upsert("D", {"x": 30.0, "y": 30.0}, 0.5)
+
+        hits = grid.query_radius({"x": 0.0, "y": 0.0}, 3.0)
+        assert [hit[0] for hit in hits] == ["B", "A"]
+        assert math.isclose(hits[1][1], 3.0)
+        logger.info("[OK] Query radius passed")
+
+    def test_upsert_moves_and_remove(self):
+        """위치 갱신은 버킷을 옮기고, 제거/제외 ID는 결과에서 빠짐"""
+        grid = SpatialGrid()
+        grid.upsert("A", {"x": 0.0, "y": 0.0}, 0.5)
+        grid.upsert("B", {"x": 0.5, "y": 0.0}, 0.5)
+
+        assert [hit[0] for hit in grid.collisions({"x": 0.0, "y": 0.0}, 0.5, exclude_id="A")] == ["B"]
+
+        grid.upsert("B", {"x": 40.0, "y": 40.0}, 0.5)
+        assert grid.collisions({"x": 0.0, "y": 0.0}, 0.5, exclude_id="A") == []
+        assert [hit[0] for hit in grid.collisions({"x": 40.0, "y": 40.5}, 0.5)] == ["B"]
+
+        assert grid.remove("B")
+        assert not grid.remove("B")
+        assert len(grid) == 1
+        logger.info("[OK] Grid upsert/remove passed")
+
+    def test_world_index_write_path_updates_loaded_cells(self):
+        """로드된 셀 격자만 쓰기 경로에서 갱신되고, 통과 가능 객체는 제외됨"""
+        index = WorldSpatialIndex()
+        index._entity_grids.set("CELL_A", SpatialGrid())
+        index._object_grids.set("CELL_A", SpatialGrid())
+
+        index.upsert_entity("NPC_1", {"x": 1.0, "y": 1.0, "cell_id": "CELL_A"}, "large", "Guard")
+        assert "NPC_1" in index._entity_grids.peek("CELL_A")
+
+        # 로드되지 않은 셀로 이동하면 이전 격자에서 제거 (새 셀은 다음 로드 시 DB에서 읽음)
+        index.upsert_entity("NPC_1", {"x": 1.0, "y": 1.0, "cell_id": "CELL_B"}, "large", "Guard")
+        assert "NPC_1" not in index._entity_grids.peek("CELL_A")
+
+        index.upsert_object("OBJ_DOOR", "CELL_A", {"x": 2.0, "y": 2.0}, width=1.0, depth=0.2)
+        assert "OBJ_DOOR" in index._object_grids.peek("CELL_A")
+        index.upsert_object("OBJ_DOOR", "CELL_A", {"x": 2.0, "y": 2.0}, width=1.0, depth=0.2, passable=True)
+        assert "OBJ_DOOR" not in index._object_grids.peek("CELL_A")
+        logger.info("[OK] World index write path passed")
@@ -0,0 +1,125 @@
+"""
+월드 에디터 WebSocket 팬아웃 테스트
+토픽 구독 필터, 연속 업데이트 합치기, 느린 소비자 퇴출, 단일 직렬화 검증
+"""
+import asyncio
+import json
+
+import pytest
+
+from app.ui.backend.websocket_hub import WebSocketHub, SLOW_CONSUMER_CLOSE_CODE, message_topics
+from common.utils.logger import logger
+
+
+class FakeWebSocket:
+    """send_text 기록용 가짜 WebSocket (blocked이면 전송이 끝나지 않음)"""
+
+    def __init__(self, blocked: bool = False):
+        self.sent = []
+        self.closed_code = None
+        self._release = asyncio.Event()
+        if not blocked:
+            self._release.set()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await self._release.wait()
+        self.sent.append(text)
+
+    async def close(self, code: int = 1000):
+        self.closed_code = code
+
+    @property
+    def messages(self):
+        return [json.loads(text) for text in self.sent]
+
+
+async def _drain():
+    """writer 태스크가 큐를 비울 때까지 잠시 양보"""
+    await asyncio.sleep(0.01)
+
+
+class TestWebSocketHub:
+    """WebSocket 팬아웃 테스트 클래스"""
+
+    def test_message_topics(self):
+        """메시지 data의 범위 키로 토픽 생성"""
+        assert message_topics({"pin_id": "PIN_1", "region_id": "REG_1", "cell_id": "CELL_1"}) == \
+            ["region:REG_1", "cell:CELL_1"]
+        assert message_topics({"pin_id": "PIN_1"}) == []
+        assert message_topics(None) == []
+        logger.info("[OK] Message topics passed")
+
+    @pytest.mark.asyncio
+    async def test_topic_subscription_filters_messages(self):
+        """구독한 토픽의 메시지만 받고, 구독이 없는 연결은 모두 받음"""
+        hub = WebSocketHub(flush_interval=0.01)
+        region_a, region_b, everyone = FakeWebSocket(), FakeWebSocket(), FakeWebSocket()
+        await hub.connect(region_a, topics=["region:REG_A"])
+        await hub.connect(region_b)
+        await hub.connect(everyone)
+        hub.subscribe(region_b, "region:REG_B")
+
+        hub.publish({"type": "map_update", "data": {"region_id": "REG_A"}}, topics=["region:REG_A"])
+        hub.publish({"type": "map_update", "data": {"region_id": "REG_B"}}, topics=["region:REG_B"])
+        hub.publish({"type": "map_update", "data": {}})
+        await _drain()
+
+        assert [m["data"].get("region_id") for m in region_a.messages] == ["REG_A", None]
+        assert [m["data"].get("region_id") for m in region_b.messages] == ["REG_B", None]
+        assert len(everyone.messages) == 3
+        # 메시지는 한 번만 직렬화되어 모든 연결이 같은 문자열을 받음
+        assert everyone.sent[2] is region_a.sent[1]
+
+        assert hub.unsubscribe(region_a) == set()
+        hub.publish({"type": "map_update", "data": {"region_id": "REG_B"}}, topics=["region:REG_B"])
+        await _drain()
+        assert len(region_a.messages) == 3
+
+        await hub.close()
+        assert hub.snapshot()["connections"] == 0
+        logger.info("[OK] Topic subscription passed")
+
+    @pytest.mark.asyncio
+    async def test_rapid_updates_are_coalesced(self):
+        """같은 오브젝트의 연속 업데이트는 flush 주기마다 마지막 상태 하나만 전송"""
+        hub = WebSocketHub(flush_interval=0.01)
+        client = FakeWebSocket()
+        await hub.connect(client)
+
+        for x in range(50):
+            hub.publish({"type": "pin_update", "data": {"pin_id": "PIN_1", "x": x}}, coalesce_key="pin_update:PIN_1")
+        hub.publish({"type": "pin_update", "data": {"pin_id": "PIN_2", "x": 7}}, coalesce_key="pin_update:PIN_2")
+        await asyncio.sleep(0.05)
+
+        assert [(m["data"]["pin_id"], m["data"]["x"]) for m in client.messages] == [("PIN_1", 49), ("PIN_2", 7)]
+        assert hub.metrics.coalesced == 49
+
+        await hub.close()
+        logger.info("[OK] Coalescing passed")
+
+    @pytest.mark.asyncio
+    async def test_slow_consumer_is_evicted(self):
+        """송신 큐가 가득 찬 연결만 퇴출되고 나머지는 계속 받음"""
+        hub = WebSocketHub(queue_size=4, flush_interval=0.01)
+        slow, fast = FakeWebSocket(blocked=True), FakeWebSocket()
+        await hub.connect(slow)
+        await hub.connect(fast)
+
+        for i in range(10):
+            hub.publish({"type": "road_update", "data": {"road_id": f"ROAD_{i}"}})
+            await _drain()
+
+        assert len(fast.messages) == 10
+        assert slow.closed_code == SLOW_CONSUMER_CLOSE_CODE
+        assert hub.active_connections == {fast}
+        assert hub.metrics.evicted == 1
+
+        # 퇴출된 연결의 disconnect는 무시
+        hub.disconnect(slow)
+        assert hub.snapshot()["connections"] == 1
+
+        await hub.close()
+        logger.info("[OK] Slow consumer eviction passed")
@@ -12,8 +12,96 @@ import pytest_asyncio
 import asyncio
 import time
 import uuid
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from common.utils.logger import logger
+from common.utils.jsonb_handler import encode_jsonb
+
+
+class _TimeSystemStub:
+    """시간 소모만 기록하는 TimeSystem 대역 (세션 시계 진행/델타 발행 없음)"""
+    
+    def __init__(self):
+        self.advanced_minutes = 0
+    
+    async def advance_time(self, minutes: int = 1):
+        self.advanced_minutes += minutes
+
+
+@pytest_asyncio.fixture(scope="function")
+async def time_system_stub(action_handler):
+    """action_handler의 모든 액션 핸들러에 TimeSystem 대역 주입"""
+    from app.handlers.action_handler_base import ActionHandlerBase
+    
+    stub = _TimeSystemStub()
+    for handler in vars(action_handler).values():
+        if isinstance(handler, ActionHandlerBase):
+            handler.time_system = stub
+    return stub
+
+
+@pytest_asyncio.fixture(scope="function")
+async def seed_session_entities(db_connection, test_session):
+    """
+    벤치마크용 세션 엔티티 일괄 생성 (셀/런타임/참조/상태, 트리거로 cell_occupants 포함)
+    
+    seed(entity_count, cell_count=1, stats=None, inventory=None) -> (cell_ids, entity_ids)
+    엔티티는 셀에 순서대로 나눠 배치되며, 테스트 종료 시 세션 행을 정리합니다.
+    세션당 게임 엔티티 참조는 하나뿐이므로 엔티티마다 NPC_VILLAGER_001을 복제한 템플릿(NPC_BENCH_*)을 씁니다.
+    """
+    session_id = test_session['session_id']
+    pool = await db_connection.pool
+    
+    async def seed(entity_count: int, cell_count: int = 1, stats: Optional[Dict[str, Any]] = None,
+                   inventory: Optional[Dict[str, Any]] = None) -> Tuple[List[uuid.UUID], List[uuid.UUID]]:
+        cell_ids = [uuid.uuid4() for _ in range(cell_count)]
+        entity_ids = [uuid.uuid4() for _ in range(entity_count)]
+        game_entity_ids = [f"NPC_BENCH_{i:05d}" for i in range(entity_count)]
+        async with pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute("""
+                    INSERT INTO game_data.entities (entity_id, entity_type, entity_name, entity_description,
+                                                    base_stats, default_equipment, default_abilities,
+                                                    default_inventory, entity_properties)
+                    SELECT t.id, e.entity_type, e.entity_name, e.entity_description, e.base_stats,
+                           e.default_equipment, e.default_abilities, e.default_inventory, e.entity_properties
+                    FROM game_data.entities e CROSS JOIN unnest($1::text[]) AS t(id)
+                    WHERE e.entity_id = 'NPC_VILLAGER_001'
+                    ON CONFLICT (entity_id) DO NOTHING
+                """, game_entity_ids)
+                await conn.execute("""
+                    INSERT INTO runtime_data.runtime_cells (runtime_cell_id, game_cell_id, session_id)
+                    SELECT id, 'CELL_VILLAGE_SQUARE_001', $2 FROM unnest($1::uuid[]) AS id
+                """, cell_ids, session_id)
+                await conn.execute("""
+                    INSERT INTO runtime_data.runtime_entities (runtime_entity_id, game_entity_id, session_id)
+                    SELECT id, game_id, $3 FROM unnest($1::uuid[], $2::text[]) AS t(id, game_id)
+                """, entity_ids, game_entity_ids, session_id)
+                await conn.execute("""
+                    INSERT INTO reference_layer.entity_references
+                    (runtime_entity_id, game_entity_id, session_id, entity_type, is_player)
+                    SELECT id, game_id, $3, 'npc', FALSE FROM unnest($1::uuid[], $2::text[]) AS t(id, game_id)
+                """, entity_ids, game_entity_ids, session_id)
+                await conn.execute("""
+                    INSERT INTO runtime_data.entity_states
+                    (runtime_entity_id, session_id, current_stats, current_position, inventory)
+                    SELECT e.id, $3, $5::jsonb,
+                           jsonb_build_object('x', 0.0, 'y', 0.0, 'runtime_cell_id', ($2::uuid[])[e.n % $4 + 1]::text),
+                           $6::jsonb
+                    FROM unnest($1::uuid[]) WITH ORDINALITY AS e(id, n)
+                """, entity_ids, cell_ids, session_id, cell_count,
+                    encode_jsonb(stats or {}), encode_jsonb(inventory or {}))
+        return cell_ids, entity_ids
+    
+    yield seed
+    
+    from database.session_storage import SessionStorage
+    
+    # cell_occupants는 직접 삭제할 수 없으므로 세션 정리와 같은 방식으로 인스턴스 행부터 정리
+    await SessionStorage(db_connection).purge(session_id, keep_session=True)
+    async with pool.acquire() as conn:
+        await conn.execute("DELETE FROM reference_layer.entity_references WHERE session_id = $1", session_id)
+        await conn.execute("DELETE FROM runtime_data.runtime_entities WHERE session_id = $1", session_id)
+        await conn.execute("DELETE FROM runtime_data.runtime_cells WHERE session_id = $1", session_id)
 
 
 @pytest.mark.asyncio
@@ -35,31 +123,24 @@ class TestPerformance:
         
         start_time = time.time()
         
-        # 대량 엔티티 생성
-        async def create_entity_batch(batch_size: int) -> List[Dict[str, Any]]:
-            tasks = []
-            for i in range(batch_size):
-                template = templates[i % len(templates)]
-                task = entity_manager.create_entity(
-                    static_entity_id=template,
-                    session_id=session_id,
-                    custom_position={"x": float(i), "y": float(i)}
-                )
-                tasks.append(task)
-            return await asyncio.gather(*tasks)
-        
-        # 배치 단위로 생성 (메모리 효율성)
+        # 배치 단위로 생성 (배치당 하나의 트랜잭션)
         batch_size = 100
         all_results = []
         
         for batch_start in range(0, entity_count, batch_size):
             batch_end = min(batch_start + batch_size, entity_count)
-            current_batch_size = batch_end - batch_start
+            batch = [
+                {
+                    "static_entity_id": templates[i % len(templates)],
+                    "custom_position": {"x": float(i), "y": float(i)}
+                }
+                for i in range(batch_start, batch_end)
+            ]
             
-            batch_results = await create_entity_batch(current_batch_size)
+            batch_results = await entity_manager.create_entities(batch, session_id)
             all_results.extend(batch_results)
             
-            logger.info(f"[PERFORMANCE] Batch {batch_start//batch_size + 1} completed: {current_batch_size} entities")
+            logger.info(f"[PERFORMANCE] Batch {batch_start//batch_size + 1} completed: {len(batch)} entities")
         
         end_time = time.time()
         total_time = end_time - start_time
@@ -399,3 +480,1258 @@ class TestPerformance:
         assert gc_effectiveness >= 0.0, f"GC not effective: {gc_effectiveness:.1f}%"
         
         logger.info(f"[OK] Memory usage optimization test passed")
+    
+    async def test_cell_content_load_scaling(self, db_with_templates, cell_manager):
+        """
+        시나리오: 셀 진입(컨텐츠 로딩) 지연 시간 vs 오브젝트 수
+        1. 10 / 100 / 1000개 오브젝트가 배치된 벤치마크 셀 생성
+        2. 캐시가 비어 있는 상태에서 첫 로딩(런타임 오브젝트 생성 포함) 측정
+        3. 레퍼런스가 이미 존재하는 상태에서 재로딩 측정
+        """
+        object_counts = [10, 100, 1000]
+        pool = await db_with_templates.pool
+        
+        logger.info(f"[PERFORMANCE] Starting cell content load scaling test: {object_counts}")
+        
+        for object_count in object_counts:
+            game_cell_id = f"CELL_BENCH_{object_count:04d}"
+            session_id = str(uuid.uuid4())
+            object_ids = [f"OBJ_BENCH_{object_count:04d}_{i:04d}" for i in range(object_count)]
+            
+            async with pool.acquire() as conn:
+                await conn.execute("""
+                    INSERT INTO game_data.world_cells
+                    (cell_id, location_id, cell_name, matrix_width, matrix_height, cell_description)
+                    SELECT $1, location_id, $2, matrix_width, matrix_height, 'benchmark cell'
+                    FROM game_data.world_cells
+                    WHERE cell_id = 'CELL_VILLAGE_SQUARE_001'
+                    ON CONFLICT (cell_id) DO NOTHING
+                """, game_cell_id, f"Benchmark Cell {object_count}")
+                await conn.executemany("""
+                    INSERT INTO game_data.world_objects
+                    (object_id, object_type, object_name, object_description,
+                     default_cell_id, default_position, interaction_type, properties)
+                    VALUES ($1, 'furniture', $2, 'benchmark object', $3, $4::jsonb, 'examine', '{}'::jsonb)
+                    ON CONFLICT (object_id) DO NOTHING
+                """, [
+                    (object_id, f"Bench Object {i}", game_cell_id, f'{{"x": {i % 20}, "y": {i // 20}}}')
+                    for i, object_id in enumerate(object_ids)
+                ])
+            
+            try:
+                cell_result = await cell_manager.create_cell(
+                    static_cell_id=game_cell_id,
+                    session_id=session_id
+                )
+                assert cell_result.success, cell_result.message
+                runtime_cell_id = cell_result.cell.cell_id
+                
+                # 첫 진입: 런타임 오브젝트/레퍼런스/상태 생성 포함
+                await cell_manager.clear_cache()
+                cold_start = time.time()
+                cold_result = await cell_manager.load_cell_content(runtime_cell_id)
+                cold_time = time.time() - cold_start
+                
+                # 재진입: 레퍼런스는 존재하고 캐시만 비어 있는 상태
+                await cell_manager.clear_cache()
+                warm_start = time.time()
+                warm_result = await cell_manager.load_cell_content(runtime_cell_id)
+                warm_time = time.time() - warm_start
+                
+                assert cold_result.success and warm_result.success
+                assert len(cold_result.content.objects) == object_count
+                assert len(warm_result.content.objects) == object_count
+                
+                logger.info(
+                    f"[PERFORMANCE] Cell content load objects={object_count}: "
+                    f"cold={cold_time * 1000:.1f} ms, warm={warm_time * 1000:.1f} ms"
+                )
+                
+                assert cold_time <= 5.0, f"Cold cell load too slow: {cold_time:.2f}s for {object_count} objects"
+            finally:
+                async with pool.acquire() as conn:
+                    await conn.execute("DELETE FROM reference_layer.object_references WHERE session_id = $1", session_id)
+                    await conn.execute("DELETE FROM runtime_data.runtime_objects WHERE session_id = $1", session_id)
+                    await conn.execute("DELETE FROM reference_layer.cell_references WHERE session_id = $1", session_id)
+                    await conn.execute("DELETE FROM runtime_data.runtime_cells WHERE session_id = $1", session_id)
+                    await conn.execute("DELETE FROM runtime_data.active_sessions WHERE session_id = $1", session_id)
+                    await conn.execute("DELETE FROM game_data.world_objects WHERE default_cell_id = $1", game_cell_id)
+                    await conn.execute("DELETE FROM game_data.world_cells WHERE cell_id = $1", game_cell_id)
+        
+        logger.info(f"[OK] Cell content load scaling test passed")
+    
+    @pytest.mark.asyncio
+    async def test_jsonb_decode_cost(self):
+        """JSONB 디코딩 비용 테스트 (entity_states/world_objects 행 10,000개 기준)"""
+        import json
+        from common.utils.jsonb_handler import decode_jsonb, parse_jsonb_data, get_json_backend
+        
+        logger.info("[PERFORMANCE] Starting JSONB decode cost test")
+        
+        row_count = 10000
+        rows = []
+        for i in range(row_count):
+            if i % 2 == 0:
+                # entity_states 행 (current_stats, current_position, inventory)
+                rows.append(json.dumps({
+                    "current_stats": {"hp": 100, "mp": 50, "strength": 12, "agility": 10, "level": i % 20 + 1},
+                    "current_position": {"x": i % 100, "y": i % 37, "runtime_cell_id": str(uuid.uuid4())},
+                    "inventory": {"items": [f"ITEM_{j:04d}" for j in range(5)], "quantities": {"ITEM_0000": 3}},
+                    "active_effects": [],
+                    "equipped_items": {"equipped": ["WEAPON_SWORD_001"]}
+                }, ensure_ascii=False))
+            else:
+                # world_objects 행 (properties, interaction_hooks, possible_states)
+                rows.append(json.dumps({
+                    "object_name": f"상자 {i}",
+                    "properties": {"material": "wood", "weight": 12.5, "locked": i % 3 == 0},
+                    "interaction_hooks": {"open": "change_state", "examine": "show_description"},
+                    "possible_states": ["closed", "open", "broken"]
+                }, ensure_ascii=False))
+        
+        start = time.time()
+        stdlib_rows = [json.loads(row) for row in rows]
+        stdlib_time = time.time() - start
+        
+        start = time.time()
+        codec_rows = [decode_jsonb(row) for row in rows]
+        codec_time = time.time() - start
+        
+        # 코덱이 디코딩한 결과는 parse_jsonb_data에서 그대로 통과
+        start = time.time()
+        passthrough_rows = [parse_jsonb_data(row) for row in codec_rows]
+        passthrough_time = time.time() - start
+        
+        assert codec_rows == stdlib_rows
+        assert all(a is b for a, b in zip(passthrough_rows, codec_rows))
+        
+        logger.info(f"[PERFORMANCE] JSONB decode per {row_count} rows: "
+                    f"json={stdlib_time * 1000:.1f} ms, {get_json_backend()}={codec_time * 1000:.1f} ms, "
+                    f"parse_jsonb_data passthrough={passthrough_time * 1000:.1f} ms")
+        
+        assert passthrough_time < stdlib_time, "parse_jsonb_data should be a passthrough for decoded rows"
+        
+        logger.info(f"[OK] JSONB decode cost test passed")
+    
+    @pytest.mark.asyncio
+    async def test_action_log_sink_throughput(self, db_with_templates, action_handler):
+        """행동 로그 기록 비용 테스트 (동기 INSERT vs 배치 싱크)"""
+        from datetime import datetime
+        from app.handlers.action_result import ActionResult
+        
+        logger.info("[PERFORMANCE] Starting action log sink throughput test")
+        
+        log_count = 2000
+        session_id = str(uuid.uuid4())
+        pool = await db_with_templates.pool
+        result = ActionResult.success_result("벤치마크 행동")
+        
+        try:
+            async with pool.acquire() as conn:
+                await conn.execute("""
+                    INSERT INTO runtime_data.active_sessions (session_id, session_name, session_state)
+                    VALUES ($1, 'Log Sink Benchmark', 'active')
+                """, session_id)
+            
+            # 기존 방식: 행동마다 커넥션 획득 + INSERT
+            start = time.time()
+            for i in range(log_count):
+                async with pool.acquire() as conn:
+                    await conn.execute("""
+                        INSERT INTO runtime_data.action_logs 
+                        (session_id, entity_id, action, success, message, timestamp)
+                        VALUES ($1, $2, $3, $4, $5, $6)
+                    """, session_id, f"ENTITY_{i % 50}", "wait", True, result.message, datetime.now())
+            inline_time = time.time() - start
+            
+            # 배치 싱크: 행동 경로에서는 큐 적재만 수행
+            start = time.time()
+            for i in range(log_count):
+                await action_handler._log_action(f"ENTITY_{i % 50}", "wait", result, session_id)
+            enqueue_time = time.time() - start
+            await action_handler.flush_action_logs()
+            total_time = time.time() - start
+            
+            async with pool.acquire() as conn:
+                count = await conn.fetchval(
+                    "SELECT COUNT(*) FROM runtime_data.action_logs WHERE session_id = $1", session_id
+                )
+            assert count == log_count * 2
+            
+            snapshot = action_handler.action_log_sink.snapshot()
+            logger.info(f"[PERFORMANCE] Action logs x{log_count}: inline={inline_time * 1000:.1f} ms, "
+                        f"sink enqueue={enqueue_time * 1000:.1f} ms, sink total={total_time * 1000:.1f} ms")
+            logger.info(f"[PERFORMANCE] Log sink stats: {snapshot}")
+            
+            assert snapshot["dropped"] == 0
+            assert enqueue_time < inline_time, "Enqueue should be cheaper than inline INSERT"
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM runtime_data.action_logs WHERE session_id = $1", session_id)
+                await conn.execute("DELETE FROM runtime_data.active_sessions WHERE session_id = $1", session_id)
+        
+        logger.info(f"[OK] Action log sink throughput test passed")
+    
+    @pytest.mark.asyncio
+    async def test_entity_cache_soak(self, entity_manager):
+        """엔티티 캐시 장기 실행 테스트 (500개 세션, 100,000개 엔티티)"""
+        import resource
+        from app.managers.entity_manager import EntityData, EntityType
+        
+        logger.info("[PERFORMANCE] Starting entity cache soak test")
+        
+        session_count = 500
+        entities_per_session = 200
+        cache = entity_manager._entity_cache
+        cache.clear()
+        
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        start = time.time()
+        
+        # 세션을 순차 진행: 생성 후 최근 생성된 엔티티 위주로 재조회, 종료 세션은 무효화
+        for s in range(session_count):
+            session_id = str(uuid.uuid4())
+            entity_ids = []
+            for e in range(entities_per_session):
+                entity_id = str(uuid.uuid4())
+                cache.set(entity_id, EntityData(
+                    entity_id=entity_id,
+                    name=f"NPC {s}-{e}",
+                    entity_type=EntityType.NPC,
+                    properties={"hp": 100, "mp": 50, "level": e % 20 + 1},
+                    position={"x": float(e), "y": float(s)}
+                ), session_id=session_id)
+                entity_ids.append(entity_id)
+            
+            for _ in range(3):
+                for entity_id in entity_ids[-50:]:
+                    result = await entity_manager.get_entity(entity_id)
+                    assert result.success
+            
+            if s % 5 == 4:
+                await entity_manager.invalidate_session_cache(session_id)
+        
+        elapsed = time.time() - start
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        stats = entity_manager.get_cache_stats()
+        
+        logger.info(f"[PERFORMANCE] Entity cache soak: {session_count * entities_per_session} entities, "
+                    f"{session_count} sessions in {elapsed:.2f}s")
+        logger.info(f"[PERFORMANCE] Cache size={stats['size']}/{stats['max_size']}, "
+                    f"hit_rate={stats['hit_rate'] * 100:.1f}%, evictions={stats['evictions']}, "
+                    f"invalidations={stats['invalidations']}")
+        logger.info(f"[PERFORMANCE] Peak RSS: before={rss_before / 1024:.1f} MB, after={rss_after / 1024:.1f} MB")
+        
+        # 캐시는 max_size를 넘지 않음 (무제한 dict였다면 100,000개 유지)
+        assert stats["size"] <= stats["max_size"]
+        assert stats["hit_rate"] >= 0.9
+        
+        logger.info(f"[OK] Entity cache soak test passed")
+    
+    @pytest.mark.asyncio
+    async def test_time_event_scheduler_tick_cost(self):
+        """TimeSystem 스케줄러 틱 비용 테스트 (100,000개 대기 이벤트)"""
+        from app.systems.time_system import TimeSystem, GameTime
+        
+        logger.info("[PERFORMANCE] Starting time event scheduler test")
+        
+        event_count = 100000
+        time_system = TimeSystem()
+        time_system.set_time(GameTime(day=1, hour=0, minute=0))
+        
+        fired = []
+        
+        async def handler(event_data):
+            fired.append(event_data["index"])
+        
+        # 1분 간격으로 100,000개 이벤트 스케줄 (약 69일 분량)
+        start = time.perf_counter()
+        event_ids = []
+        for i in range(event_count):
+            event_ids.append(await time_system.schedule_event(
+                event_name=f"event_{i}",
+                event_type="benchmark",
+                trigger_time=GameTime.from_minutes(i + 1),
+                event_data={"index": i},
+                handler=handler
+            ))
+        schedule_time = time.perf_counter() - start
+        
+        # 기한이 없는 틱: 대기 이벤트 수와 무관해야 함
+        idle_ticks = 10000
+        start = time.perf_counter()
+        for _ in range(idle_ticks):
+            await time_system._check_scheduled_events()
+        idle_tick_us = (time.perf_counter() - start) / idle_ticks * 1_000_000
+        
+        # 절반 취소 (지연 삭제)
+        start = time.perf_counter()
+        for event_id in event_ids[::2]:
+            await time_system.cancel_event(event_id)
+        cancel_time = time.perf_counter() - start
+        
+        # 가속 틱: 한 틱에 100분 진행 → 건너뛴 분의 이벤트도 모두 실행
+        time_system._log_event = lambda event: asyncio.sleep(0)
+        ticks = 100
+        start = time.perf_counter()
+        for _ in range(ticks):
+            await time_system.advance_time(100)
+            await time_system._check_scheduled_events()
+        busy_tick_us = (time.perf_counter() - start) / ticks * 1_000_000
+        
+        logger.info(f"[PERFORMANCE] Schedule {event_count} events: {schedule_time:.2f}s")
+        logger.info(f"[PERFORMANCE] Idle tick: {idle_tick_us:.2f} us/tick with {event_count} pending")
+        logger.info(f"[PERFORMANCE] Cancel {event_count // 2} events: {cancel_time:.2f}s")
+        logger.info(f"[PERFORMANCE] Catch-up tick (100 min/tick): {busy_tick_us:.1f} us/tick, fired={len(fired)}")
+        
+        # 100분 x 100틱 = 10,000분 중 취소되지 않은 홀수 인덱스 이벤트만 순서대로 실행
+        assert fired == list(range(1, ticks * 100, 2))
+        assert idle_tick_us < 1000
+        
+        logger.info(f"[OK] Time event scheduler test passed")
+    
+    @pytest.mark.asyncio
+    async def test_headless_village_simulation_speed(self, db_with_templates, db_connection, test_session):
+        """헤드리스 100일 마을 시뮬레이션 속도 (시뮬레이션 일/초)"""
+        from app.systems.time_system import TimeSystem, GameTime
+        
+        logger.info("[PERFORMANCE] Starting headless village simulation test")
+        
+        session_id = test_session['session_id']
+        days = 100
+        npc_ids = ["NPC_VILLAGER_001", "NPC_MERCHANT_001", "NPC_GOBLIN_001"]
+        
+        async def run_village(time_system: TimeSystem) -> Dict[str, Any]:
+            stats = {"routines": 0, "interactions": {npc_id: 0 for npc_id in npc_ids}}
+            
+            async def routine(event_data):
+                # 시간대별 상호작용 판정 (NPCBehavior.interact_with_others와 같은 방식)
+                stats["routines"] += 1
+                if time_system.rng_for(event_data["npc_id"]).random() <= time_system.get_interaction_probability():
+                    stats["interactions"][event_data["npc_id"]] += 1
+            
+            for i, npc_id in enumerate(npc_ids):
+                await time_system.schedule_event(
+                    event_name=f"{npc_id} routine",
+                    event_type="npc_routine",
+                    trigger_time=GameTime(day=1, hour=6, minute=i),
+                    event_data={"npc_id": npc_id, "session_id": session_id},
+                    handler=routine,
+                    repeat_interval=60
+                )
+            
+            await time_system.run_until(GameTime(day=days + 1, hour=5, minute=59),
+                                        checkpoint_interval_minutes=24 * 60)
+            return stats
+        
+        time_system = TimeSystem(seed=42)
+        await time_system.initialize()
+        try:
+            await time_system.start_headless(session_id)
+            start = time.perf_counter()
+            stats = await run_village(time_system)
+            elapsed = time.perf_counter() - start
+        finally:
+            await time_system.cleanup()
+            # 실행된 이벤트 로그가 세션을 참조하므로 세션 정리 전에 삭제
+            pool = await db_connection.pool
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    "DELETE FROM runtime_data.triggered_events WHERE session_id = $1", session_id
+                )
+        
+        # 같은 시드로 다시 실행하면 같은 결과 (DB 체크포인트 없이)
+        replay = TimeSystem(seed=42)
+        replay._log_event = lambda event: asyncio.sleep(0)
+        replay_stats = await run_village(replay)
+        
+        days_per_second = days / elapsed
+        logger.info(f"[PERFORMANCE] Headless village: {days} days in {elapsed:.2f}s "
+                    f"({days_per_second:.1f} simulated days/sec)")
+        logger.info(f"[PERFORMANCE] Routines: {stats['routines']}, interactions: {stats['interactions']}")
+        
+        assert stats["routines"] == days * 24 * len(npc_ids)
+        assert replay_stats == stats
+        assert days_per_second >= 10.0, f"Simulation too slow: {days_per_second:.1f} days/sec"
+        
+        logger.info(f"[OK] Headless village simulation test passed")
+    
+    @pytest.mark.asyncio
+    async def test_npc_routine_scaling(self, db_with_templates, db_connection, entity_manager, cell_manager,
+                                       dialogue_manager, action_handler, time_system_stub, test_session):
+        """NPC 루틴 동시 실행 스케일링 (5 → 5,000 NPC, 시간 소모는 TimeSystem 대역으로)"""
+        from app.systems.npc_behavior import NPCBehavior
+        from app.systems.time_system import TimeSystem, TimePeriod
+        
+        logger.info("[PERFORMANCE] Starting NPC routine scaling test")
+        
+        npc_behavior = NPCBehavior(
+            db_connection, entity_manager, cell_manager,
+            dialogue_manager, action_handler, TimeSystem(seed=7)
+        )
+        
+        session_id = test_session['session_id']
+        pool = await db_connection.pool
+        timings = {}
+        try:
+            await self._run_npc_routine_scaling(npc_behavior, session_id, timings)
+        finally:
+            await action_handler.flush_action_logs()
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM runtime_data.action_logs WHERE session_id = $1", session_id)
+        
+        # 스케줄은 로드 시 한 번 정렬됨
+        first_schedule = npc_behavior.npc_routines["NPC_BENCH_00000"]["schedules"][TimePeriod.MORNING.value]
+        assert [s["priority"] for s in first_schedule] == [1, 2]
+        assert timings[5000] < 30.0
+        # NPC 행동은 시간을 소모하지 않음
+        assert time_system_stub.advanced_minutes == 0
+        
+        logger.info(f"[OK] NPC routine scaling test passed")
+    
+    async def _run_npc_routine_scaling(self, npc_behavior, session_id: str, timings: Dict[int, float]):
+        from app.systems.time_system import TimePeriod
+        
+        for npc_count in (5, 50, 500, 5000):
+            # 절반은 아침 스케줄, 나머지는 밤 스케줄만 보유 (아침 틱에서는 실행 대상 아님)
+            routines = {}
+            for i in range(npc_count):
+                period = TimePeriod.MORNING.value if i % 2 == 0 else TimePeriod.NIGHT.value
+                routines[f"NPC_BENCH_{i:05d}"] = {
+                    "name": f"Bench NPC {i}",
+                    "type": "npc",
+                    "schedules": {
+                        period: [
+                            {"action_type": "wait", "priority": 2, "conditions": {}, "action_data": {}},
+                            {"action_type": "wait", "priority": 1, "conditions": {}, "action_data": {}}
+                        ]
+                    }
+                }
+            npc_behavior.set_npc_routines(routines, session_id=session_id)
+            
+            start = time.perf_counter()
+            outcome = await npc_behavior.execute_all_routines(TimePeriod.MORNING)
+            elapsed = time.perf_counter() - start
+            timings[npc_count] = elapsed
+            
+            assert len(outcome) == (npc_count + 1) // 2
+            assert all(outcome.values())
+            logger.info(f"[PERFORMANCE] {npc_count} NPCs ({len(outcome)} due): "
+                        f"{elapsed * 1000:.1f}ms ({len(outcome) / elapsed:.0f} routines/sec)")
+    
+    @pytest.mark.asyncio
+    async def test_entity_state_write_behind_throughput(self, db_with_templates, db_connection, entity_manager,
+                                                       test_session):
+        """NPC 상태 변경 처리량: write-through vs write-behind (배치 UPDATE ... FROM unnest)"""
+        from database.entity_state_store import EntityStateStore
+        
+        logger.info("[PERFORMANCE] Starting entity state write-behind test")
+        
+        session_id = test_session['session_id']
+        results = await entity_manager.create_entities(
+            [{"static_entity_id": template_id, "custom_position": {"x": 0.0, "y": 0.0}}
+             for template_id in ("NPC_VILLAGER_001", "NPC_MERCHANT_001", "NPC_GOBLIN_001")],
+            session_id
+        )
+        npc_ids = [result.entity_id for result in results if result.status == "success"]
+        assert npc_ids, "NPC 생성 실패"
+        
+        async def mutate(store: EntityStateStore, count: int) -> float:
+            start = time.perf_counter()
+            for i in range(count):
+                npc_id = npc_ids[i % len(npc_ids)]
+                await store.merge_stats(npc_id, {"hp": i, "stamina": i % 100}, session_id=session_id)
+                await store.set_fields(npc_id, session_id=session_id,
+                                       current_position={"x": float(i), "y": float(i % 10)})
+            await store.flush()
+            return time.perf_counter() - start
+        
+        # write-through: 변경마다 UPDATE
+        through_store = EntityStateStore(db_connection, write_behind=False)
+        through_count = 300
+        through_elapsed = await mutate(through_store, through_count)
+        through_rate = through_count * 2 / through_elapsed
+        
+        # write-behind: 메모리 변경 후 배치 flush (주기 flush가 끼어들지 않도록 긴 주기)
+        behind_store = EntityStateStore(db_connection, write_behind=True, flush_interval=60.0,
+                                        max_dirty_age_seconds=60.0)
+        behind_count = 3000
+        try:
+            behind_elapsed = await mutate(behind_store, behind_count)
+        finally:
+            await behind_store.close()
+        behind_rate = behind_count * 2 / behind_elapsed
+        
+        logger.info(f"[PERFORMANCE] Write-through: {through_rate:.0f} mutations/sec "
+                    f"({through_store.metrics.writes} UPDATEs)")
+        logger.info(f"[PERFORMANCE] Write-behind: {behind_rate:.0f} mutations/sec "
+                    f"({behind_store.metrics.flushes} flushes, {behind_store.metrics.flushed_entities} rows)")
+        
+        # 마지막 변경 값이 기록되었는지 확인
+        last_index = behind_count - 1
+        last_npc = npc_ids[last_index % len(npc_ids)]
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT current_stats, current_position FROM runtime_data.entity_states WHERE runtime_entity_id = $1",
+                last_npc
+            )
+        assert row['current_stats']['hp'] == last_index
+        assert row['current_position']['x'] == float(last_index)
+        assert behind_store.metrics.flushes <= 2
+        assert behind_rate > through_rate
+        
+        logger.info(f"[OK] Entity state write-behind test passed")
+    
+    @pytest.mark.asyncio
+    async def test_cell_occupancy_lookup_scaling(self, db_with_templates, db_connection, seed_session_entities):
+        """
+        시나리오: 100k entity_states / 1k 셀에서 "셀에 누가 있는가" 조회 비용
+        1. JSONB 문자열 비교 (current_position->>'runtime_cell_id', 순차 스캔)
+        2. current_cell_id 인덱스 조회
+        3. 셀 점유 맵 (첫 조회만 인덱스 조회, 이후 메모리)
+        """
+        from database.cell_occupancy import CellOccupancyMap
+        
+        cell_count = 1000
+        entities_per_cell = 100
+        sample_cells = 50
+        pool = await db_connection.pool
+        
+        logger.info(f"[PERFORMANCE] Starting cell occupancy lookup test: "
+                    f"{cell_count * entities_per_cell} entity_states / {cell_count} cells")
+        
+        setup_start = time.time()
+        cell_ids, entity_ids = await seed_session_entities(cell_count * entities_per_cell, cell_count)
+        async with pool.acquire() as conn:
+            await conn.execute("ANALYZE runtime_data.entity_states")
+        logger.info(f"[PERFORMANCE] Setup: {time.time() - setup_start:.1f}s")
+        
+        targets = cell_ids[:sample_cells]
+        
+        # 1. JSONB 문자열 비교
+        async with pool.acquire() as conn:
+            start = time.perf_counter()
+            for cell_id in targets:
+                rows = await conn.fetch(
+                    "SELECT runtime_entity_id FROM runtime_data.entity_states "
+                    "WHERE current_position->>'runtime_cell_id' = $1",
+                    str(cell_id)
+                )
+                assert len(rows) == entities_per_cell
+            jsonb_ms = (time.perf_counter() - start) * 1000 / sample_cells
+            
+            # 2. current_cell_id 인덱스
+            start = time.perf_counter()
+            for cell_id in targets:
+                rows = await conn.fetch(
+                    "SELECT runtime_entity_id FROM runtime_data.entity_states WHERE current_cell_id = $1::uuid",
+                    cell_id
+                )
+                assert len(rows) == entities_per_cell
+            indexed_ms = (time.perf_counter() - start) * 1000 / sample_cells
+        
+        # 3. 셀 점유 맵 (첫 조회: 인덱스 로드, 반복 조회: 메모리)
+        occupancy = CellOccupancyMap(db_connection, max_cells=cell_count)
+        start = time.perf_counter()
+        for cell_id in targets:
+            assert len(await occupancy.occupants(cell_id)) == entities_per_cell
+        cold_ms = (time.perf_counter() - start) * 1000 / sample_cells
+        
+        repeats = 100
+        start = time.perf_counter()
+        for _ in range(repeats):
+            for cell_id in targets:
+                await occupancy.occupants(cell_id)
+        warm_us = (time.perf_counter() - start) * 1_000_000 / (sample_cells * repeats)
+        
+        # 이동 반영: 한 엔티티를 다른 셀로 옮기면 두 셀 집합이 즉시 갱신됨
+        moved = str(entity_ids[0])
+        source = None
+        for cell_id in targets:
+            if moved in await occupancy.occupants(cell_id):
+                source = cell_id
+                break
+        assert source is not None
+        destination = next(cell_id for cell_id in targets if cell_id != source)
+        occupancy.move(moved, destination)
+        assert moved not in await occupancy.occupants(source)
+        assert moved in await occupancy.occupants(destination)
+        
+        logger.info(f"[PERFORMANCE] JSONB text predicate: {jsonb_ms:.2f} ms/cell")
+        logger.info(f"[PERFORMANCE] current_cell_id index: {indexed_ms:.2f} ms/cell")
+        logger.info(f"[PERFORMANCE] Occupancy map: cold {cold_ms:.2f} ms/cell, warm {warm_us:.1f} us/cell "
+                    f"({occupancy.snapshot()['cells']['hits']} hits)")
+        
+        assert indexed_ms < jsonb_ms, "인덱스 조회가 JSONB 문자열 비교보다 느림"
+        assert warm_us / 1000 < indexed_ms, "점유 맵 조회가 인덱스 조회보다 느림"
+        
+        logger.info(f"[OK] Cell occupancy lookup test passed")
+    
+    @pytest.mark.asyncio
+    async def test_dialogue_catalog_throughput(self, db_with_templates, entity_manager, dialogue_manager):
+        """
+        시나리오: 대화 카탈로그 인덱스 적용 전후 대화 처리량 (readme 기준: 275 dialogues/sec)
+        1. 매 대화마다 카탈로그 무효화 (대화마다 카탈로그 조회, 적용 전 조회 비용 상한)
+        2. 카탈로그 유지 (대화 시작/진행에 카탈로그 조회 없음)
+        """
+        from app.managers.dialogue_catalog import DialogueCatalog
+        
+        session_id = str(uuid.uuid4())
+        dialogue_count = 200
+        
+        player_result = await entity_manager.create_entity(static_entity_id="NPC_VILLAGER_001", session_id=session_id)
+        npc_result = await entity_manager.create_entity(static_entity_id="NPC_MERCHANT_001", session_id=session_id)
+        assert player_result.status == "success" and npc_result.status == "success"
+        player_id, npc_id = player_result.entity_id, npc_result.entity_id
+        
+        catalog = DialogueCatalog()
+        dialogue_manager.catalog = catalog
+        
+        async def run_dialogues(invalidate_each: bool) -> float:
+            start = time.perf_counter()
+            for _ in range(dialogue_count):
+                if invalidate_each:
+                    catalog.invalidate()
+                start_result = await dialogue_manager.start_dialogue(
+                    player_id=player_id, npc_id=npc_id, session_id=session_id
+                )
+                assert start_result.success, start_result.message
+                continue_result = await dialogue_manager.continue_dialogue(
+                    player_id=player_id, npc_id=npc_id, session_id=session_id, topic="trade"
+                )
+                assert continue_result.success, continue_result.message
+            return dialogue_count / (time.perf_counter() - start)
+        
+        logger.info(f"[PERFORMANCE] Starting dialogue catalog test: {dialogue_count} dialogues")
+        
+        reload_rate = await run_dialogues(invalidate_each=True)
+        reload_loads = catalog.loads
+        
+        await run_dialogues(invalidate_each=False)  # 워밍업 (대화 기록 컨텍스트 등록)
+        loads_before = catalog.loads
+        indexed_rate = await run_dialogues(invalidate_each=False)
+        
+        logger.info(f"[PERFORMANCE] Catalog reloaded per dialogue: {reload_rate:.1f} dialogues/sec "
+                    f"({reload_loads} catalog loads)")
+        logger.info(f"[PERFORMANCE] Catalog index: {indexed_rate:.1f} dialogues/sec "
+                    f"({catalog.loads - loads_before} catalog loads) - readme baseline 275 dialogues/sec")
+        
+        # 인덱스 유지 시 대화 중 카탈로그 조회 없음
+        assert catalog.loads == loads_before
+        assert indexed_rate > reload_rate
+        
+        logger.info(f"[OK] Dialogue catalog test passed")
+    
+    @pytest.mark.asyncio
+    async def test_available_actions_polling(self, db_with_templates, db_connection):
+        """
+        시나리오: 액션마다 폴링되는 사용 가능한 액션 조회 비용
+        1. 메모이즈/셀 참조 맵/오브젝트 기술자 캐시를 매번 비운 조회 (일괄 파이프라인만 적용)
+        2. 상태 변경이 없는 반복 조회 (메모이즈 적중)
+        3. 상태 변경 후 조회 (다시 계산)
+        """
+        from app.core.game_manager import GameManager
+        from app.core.state_version import state_versions
+        from app.services.gameplay.action_service import ActionService
+        from database.repositories.game_data import GameDataRepository
+        from database.repositories.runtime_data import RuntimeDataRepository
+        from database.repositories.reference_layer import ReferenceLayerRepository
+        from database.factories.game_data_factory import GameDataFactory
+        from database.factories.instance_factory import InstanceFactory
+        
+        game_manager = GameManager(
+            db_connection=db_connection,
+            game_data_repo=GameDataRepository(db_connection),
+            runtime_data_repo=RuntimeDataRepository(db_connection),
+            reference_layer_repo=ReferenceLayerRepository(db_connection),
+            game_data_factory=GameDataFactory(db_connection),
+            instance_factory=InstanceFactory(db_connection)
+        )
+        session_id = await game_manager.start_new_game("NPC_VILLAGER_001")
+        assert session_id is not None
+        
+        action_service = ActionService(db_connection)
+        poll_count = 200
+        
+        async def poll(clear_caches: bool) -> float:
+            start = time.perf_counter()
+            for _ in range(poll_count):
+                if clear_caches:
+                    action_service._action_memo.clear()
+                    action_service._cell_ref_maps.clear()
+                    action_service._object_descriptors.clear()
+                    await action_service.object_state_manager.clear_cache()
+                actions = await action_service.get_available_actions(session_id)
+                assert actions
+            return (time.perf_counter() - start) / poll_count * 1000
+        
+        logger.info(f"[PERFORMANCE] Starting available actions polling test: {poll_count} polls")
+        
+        cold_ms = await poll(clear_caches=True)
+        warm_ms = await poll(clear_caches=False)
+        
+        # 상태 변경 후 다시 계산되는지 확인
+        version = state_versions.bump(session_id)
+        await action_service.get_available_actions(session_id)
+        memo_versions = [action_service._action_memo.peek(key)[0] for key in action_service._action_memo]
+        assert memo_versions == [version]
+        
+        logger.info(f"[PERFORMANCE] Batched pipeline (caches cleared): {cold_ms:.2f}ms/poll")
+        logger.info(f"[PERFORMANCE] Memoized (no state change): {warm_ms:.2f}ms/poll")
+        logger.info(f"[PERFORMANCE] Action memo: {action_service._action_memo.snapshot()}")
+        
+        assert warm_ms < cold_ms
+        
+        logger.info(f"[OK] Available actions polling test passed")
+    
+    @pytest.mark.asyncio
+    async def test_action_time_cost_latency(self, db_connection, test_session):
+        """
+        시나리오: 조합 등 액션의 시간 소모 적용 비용
+        1. 기존 방식: 액션마다 TimeSystem()을 새로 만들어 advance_time (세션과 무관한 시계)
+        2. 세션 시계: 세션 시간을 한 번 로드한 뒤 메모리에서 진행, 주기 배치 기록
+        """
+        from app.systems.session_clock import SessionClockService
+        from app.systems.time_system import TimeSystem
+        
+        session_id = test_session['session_id']
+        action_count = 2000
+        time_cost = 10  # 조합 기본 시간 소모
+        
+        logger.info(f"[PERFORMANCE] Starting action time cost test: {action_count} actions")
+        
+        start = time.perf_counter()
+        for _ in range(action_count):
+            await TimeSystem().advance_time(minutes=time_cost)
+        legacy_ms = (time.perf_counter() - start) / action_count * 1000
+        
+        clock = SessionClockService(db_connection, flush_interval=60.0)
+        try:
+            start_minutes = (await clock.now(session_id)).to_minutes()
+            start = time.perf_counter()
+            for _ in range(action_count):
+                await clock.advance(session_id, time_cost)
+            clock_ms = (time.perf_counter() - start) / action_count * 1000
+            await clock.flush(session_id)
+        finally:
+            await clock.close()
+        
+        logger.info(f"[PERFORMANCE] TimeSystem() per action: {legacy_ms:.4f}ms/action")
+        logger.info(f"[PERFORMANCE] Session clock: {clock_ms:.4f}ms/action ({clock.snapshot()})")
+        
+        # 세션 시간이 누적되어 한 번에 기록되었는지 확인
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            row = await conn.fetchrow(
+                "SELECT current_day, current_hour, current_minute FROM runtime_data.session_states "
+                "WHERE session_id = $1::uuid",
+                session_id
+            )
+        stored = row['current_day'], row['current_hour'], row['current_minute']
+        expected = start_minutes + action_count * time_cost
+        assert (stored[0] - 1) * 1440 + stored[1] * 60 + stored[2] == expected
+        assert clock.metrics.loads == 1
+        assert clock.metrics.flushes == 1
+        assert clock_ms < legacy_ms
+        
+        logger.info(f"[OK] Action time cost test passed")
+    
+    @pytest.mark.asyncio
+    async def test_spatial_collision_checks(self):
+        """
+        시나리오: 2,000개 Entity가 있는 셀에서 10,000회 충돌 검사
+        1. 기존 방식: 검사마다 셀 전체를 순회하며 check_collision (표본 500회로 측정)
+        2. 셀 격자 인덱스: check_collisions 일괄 검사 (NumPy 있으면 벡터화)
+        """
+        import random
+        from app.services.world_editor.collision_service import check_collision, get_collision_radius
+        from app.services.world_editor.spatial_index import SpatialGrid, np
+        
+        rng = random.Random(42)
+        sizes = ["tiny", "small", "medium", "large", "huge"]
+        entities = [
+            (f"NPC_{i}", {"x": rng.uniform(0, 100), "y": rng.uniform(0, 100), "z": 0.0}, rng.choice(sizes))
+            for i in range(2000)
+        ]
+        queries = [{"x": rng.uniform(0, 100), "y": rng.uniform(0, 100), "z": 0.0} for _ in range(10000)]
+        
+        logger.info(f"[PERFORMANCE] Starting spatial collision test: {len(queries)} checks, "
+                    f"{len(entities)} entities (backend: {'numpy' if np is not None else 'python'})")
+        
+        sample = queries[:500]
+        start = time.perf_counter()
+        scan_results = [
+            {entity_id for entity_id, position, size in entities if check_collision(query, "medium", position, size)}
+            for query in sample
+        ]
+        scan_ms = (time.perf_counter() - start) / len(sample) * 1000
+        
+        start = time.perf_counter()
+        grid = SpatialGrid()
+        for entity_id, position, size in entities:
+            grid.upsert(entity_id, position, get_collision_radius(size))
+        build_ms = (time.perf_counter() - start) * 1000
+        
+        start = time.perf_counter()
+        results = grid.check_collisions([(query, get_collision_radius("medium")) for query in queries])
+        grid_ms = (time.perf_counter() - start) / len(queries) * 1000
+        
+        assert [{hit[0] for hit in hits} for hits in results[:len(sample)]] == scan_results
+        
+        logger.info(f"[PERFORMANCE] Full cell scan: {scan_ms:.4f}ms/check "
+                    f"(~{scan_ms * len(queries) / 1000:.1f}s for {len(queries)})")
+        logger.info(f"[PERFORMANCE] Grid index: {grid_ms:.4f}ms/check "
+                    f"({grid_ms * len(queries):.0f}ms for {len(queries)}, build {build_ms:.1f}ms)")
+        
+        assert grid_ms < scan_ms
+        
+        logger.info(f"[OK] Spatial collision test passed")
+    
+    @pytest.mark.asyncio
+    async def test_unified_search_on_large_world(self, db_connection):
+        """
+        시나리오: 100,000개 오브젝트가 있는 월드에서 통합 검색
+        1. 기존 방식: 타입별 ILIKE '%검색어%' 순차 조회 7회 (순위/페이지 없음)
+        2. 통합 검색: 트라이그램 인덱스 + UNION ALL 한 번의 쿼리, 점수순 첫 페이지
+        3. 커서로 다음 페이지 조회
+        """
+        from app.services.world_editor.search_service import SearchService
+        
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            if not await conn.fetchval("SELECT EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"):
+                pytest.skip("pg_trgm 미설치: database/migrations/add_search_trgm_indexes.sql 실행 필요")
+        
+        row_count = 100_000
+        words = ['Oak', 'Iron', 'Silver', 'Dusty', 'Broken', 'Lantern', 'Barrel', 'Crate', 'Anvil', 'Banner']
+        prefix = f"OBJ_BENCH_{uuid.uuid4().hex[:8]}_"
+        
+        logger.info(f"[PERFORMANCE] Starting unified search test: {row_count} objects")
+        
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO game_data.world_objects (object_id, object_type, object_name, object_description)
+                SELECT $1 || g,
+                       'static',
+                       ($2::text[])[1 + g % 10] || ' ' || ($2::text[])[1 + (g / 10) % 10] || ' ' || g,
+                       'Generated object ' || g
+                FROM generate_series(1, $3) AS g
+                """,
+                prefix, words, row_count
+            )
+            await conn.execute("ANALYZE game_data.world_objects")
+        
+        try:
+            query = "Silver Lantern 4252"
+            runs = 20
+            
+            async def legacy_search():
+                pattern = f"%{query}%"
+                async with pool.acquire() as conn:
+                    for sql in (
+                        "SELECT region_id FROM game_data.world_regions WHERE region_name ILIKE $1 OR region_description ILIKE $1 LIMIT 100",
+                        "SELECT location_id FROM game_data.world_locations WHERE location_name ILIKE $1 OR location_description ILIKE $1 LIMIT 100",
+                        "SELECT cell_id FROM game_data.world_cells WHERE cell_name ILIKE $1 OR cell_description ILIKE $1 LIMIT 100",
+                        "SELECT entity_id FROM game_data.entities WHERE entity_name ILIKE $1 OR entity_description ILIKE $1 LIMIT 100",
+                        "SELECT object_id FROM game_data.world_objects WHERE object_name ILIKE $1 OR object_description ILIKE $1 LIMIT 100",
+                        "SELECT effect_id FROM game_data.effect_carriers WHERE name ILIKE $1 LIMIT 100",
+                        "SELECT i.item_id FROM game_data.items i LEFT JOIN game_data.base_properties bp ON i.base_property_id = bp.property_id WHERE bp.name ILIKE $1 OR bp.description ILIKE $1 LIMIT 100",
+                    ):
+                        await conn.fetch(sql, pattern)
+            
+            start = time.perf_counter()
+            for _ in range(runs):
+                await legacy_search()
+            legacy_ms = (time.perf_counter() - start) / runs * 1000
+            
+            service = SearchService(db_connection)
+            start = time.perf_counter()
+            for _ in range(runs):
+                first_page = await service.search(query, limit=20)
+            search_ms = (time.perf_counter() - start) / runs * 1000
+            
+            # 오타 허용: 'Lantren'도 Lantern 오브젝트를 찾음
+            typo = await service.search("Silver Lantren 4252", entity_types=["world_object"], limit=20)
+            
+            start = time.perf_counter()
+            second_page = await service.search(query, limit=20, cursor=first_page.next_cursor)
+            next_page_ms = (time.perf_counter() - start) * 1000
+            
+            assert first_page.results[0].name == query
+            assert any(item.name == query for item in typo.results)
+            assert first_page.next_cursor is not None
+            assert not {item.entity_id for item in first_page.results} & {item.entity_id for item in second_page.results}
+            
+            logger.info(f"[PERFORMANCE] Legacy 7x ILIKE scans: {legacy_ms:.2f}ms/search")
+            logger.info(f"[PERFORMANCE] Unified trigram search (ranked page): {search_ms:.2f}ms/search")
+            logger.info(f"[PERFORMANCE] Next page via cursor: {next_page_ms:.2f}ms")
+            
+            assert search_ms < legacy_ms * 2
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM game_data.world_objects WHERE object_id LIKE $1", prefix + '%')
+        
+        logger.info(f"[OK] Unified search test passed")
+    
+    @pytest.mark.asyncio
+    async def test_project_ndjson_export_import(self, db_connection, tmp_path):
+        """
+        시나리오: 500,000개 오브젝트가 있는 월드의 프로젝트 내보내기/가져오기
+        1. NDJSON 스트리밍 내보내기를 파일로 기록 (서버 측 커서, 메모리 피크 측정)
+        2. 생성한 오브젝트 삭제 후 파일에서 가져오기 (스테이징 COPY + ON CONFLICT 병합, 한 트랜잭션)
+        """
+        import tracemalloc
+        from app.services.world_editor.project_service import ProjectService, iter_ndjson_lines
+        
+        row_count = 500_000
+        prefix = f"OBJ_BULK_{uuid.uuid4().hex[:8]}_"
+        export_path = tmp_path / "project.ndjson"
+        service = ProjectService(db_connection)
+        
+        logger.info(f"[PERFORMANCE] Starting project NDJSON export/import test: {row_count} objects")
+        
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO game_data.world_objects
+                (object_id, object_type, object_name, object_description, properties)
+                SELECT $1 || g, 'static', 'Crate ' || g, 'Generated object ' || g,
+                       jsonb_build_object('weight', g % 50, 'tags', jsonb_build_array('bench'))
+                FROM generate_series(1, $2) AS g
+                """,
+                prefix, row_count
+            )
+        
+        async def read_file_chunks():
+            with open(export_path, 'rb') as f:
+                while True:
+                    chunk = f.read(1 << 20)
+                    if not chunk:
+                        break
+                    yield chunk
+        
+        try:
+            tracemalloc.start()
+            start = time.perf_counter()
+            exported = 0
+            with open(export_path, 'w', encoding='utf-8') as f:
+                async for line in service.stream_export():
+                    f.write(line)
+                    exported += 1
+            export_s = time.perf_counter() - start
+            _, export_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM game_data.world_objects WHERE object_id LIKE $1", prefix + '%')
+            
+            tracemalloc.start()
+            start = time.perf_counter()
+            result = await service.bulk_import(iter_ndjson_lines(read_file_chunks()))
+            import_s = time.perf_counter() - start
+            _, import_peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            
+            async with pool.acquire() as conn:
+                restored = await conn.fetchval(
+                    "SELECT COUNT(*) FROM game_data.world_objects WHERE object_id LIKE $1", prefix + '%'
+                )
+            
+            logger.info(f"[PERFORMANCE] NDJSON export: {exported} lines in {export_s:.2f}s "
+                        f"({export_path.stat().st_size / 1e6:.1f}MB, peak {export_peak / 1e6:.1f}MB)")
+            logger.info(f"[PERFORMANCE] Staged COPY import: {sum(result['stats'].values())} rows in {import_s:.2f}s "
+                        f"(peak {import_peak / 1e6:.1f}MB)")
+            logger.info(f"[PERFORMANCE] Import timings: {result['timings_ms']}")
+            
+            assert restored == row_count
+            assert result['stats']['world_objects'] >= row_count
+            # 메모리는 행 수가 아니라 배치/prefetch 크기에 비례
+            assert export_peak < 50e6
+            assert import_peak < 50e6
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM game_data.world_objects WHERE object_id LIKE $1", prefix + '%')
+        
+        logger.info(f"[OK] Project NDJSON export/import test passed")
+    
+    @pytest.mark.asyncio
+    async def test_editor_list_pagination(self, db_connection):
+        """
+        시나리오: 50,000개 오브젝트가 있는 월드의 에디터 목록 로드
+        1. 기존 방식: get_all_world_objects()로 전체 행을 응답 모델로 변환
+        2. 키셋 페이지: 목록 표시에 필요한 필드만 1000행씩 조회
+        3. 일괄 조회/변경: 500개 ID를 한 번의 요청으로 처리
+        """
+        from app.services.world_editor.list_query_service import ListQueryService, WORLD_OBJECT_LIST
+        from app.services.world_editor.world_object_service import WorldObjectService
+        
+        row_count = 50_000
+        prefix = f"OBJ_PAGE_{uuid.uuid4().hex[:8]}_"
+        
+        logger.info(f"[PERFORMANCE] Starting editor list pagination test: {row_count} objects")
+        
+        pool = await db_connection.pool
+        async with pool.acquire() as conn:
+            await conn.execute(
+                """
+                INSERT INTO game_data.world_objects (object_id, object_type, object_name, properties)
+                SELECT $1 || lpad(g::text, 6, '0'), 'static', 'Crate ' || g,
+                       jsonb_build_object('weight', g % 50, 'notes', repeat('x', 200))
+                FROM generate_series(1, $2) AS g
+                """,
+                prefix, row_count
+            )
+        
+        try:
+            start = time.perf_counter()
+            all_objects = await WorldObjectService(db_connection).get_all_world_objects()
+            get_all_ms = (time.perf_counter() - start) * 1000
+            
+            service = ListQueryService(WORLD_OBJECT_LIST, db_connection)
+            start = time.perf_counter()
+            first_page = await service.fetch_page(limit=1000, fields=["object_name", "default_cell_id"])
+            first_page_ms = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            paged, cursor = 0, None
+            while True:
+                page = await service.fetch_page(limit=1000, cursor=cursor, fields=["object_name", "default_cell_id"])
+                paged += len(page["items"])
+                cursor = page["next_cursor"]
+                if cursor is None:
+                    break
+            all_pages_ms = (time.perf_counter() - start) * 1000
+            
+            ids = [f"{prefix}{i:06d}" for i in range(1, 501)]
+            start = time.perf_counter()
+            fetched = await service.batch_get(ids, fields=["object_name"])
+            batch_get_ms = (time.perf_counter() - start) * 1000
+            
+            start = time.perf_counter()
+            updated = await service.batch_update([{"object_id": object_id, "object_name": "Moved Crate"} for object_id in ids])
+            batch_update_ms = (time.perf_counter() - start) * 1000
+            
+            logger.info(f"[PERFORMANCE] get_all_world_objects: {len(all_objects)} rows in {get_all_ms:.0f}ms")
+            logger.info(f"[PERFORMANCE] First keyset page (1000 rows, 3 fields): {first_page_ms:.1f}ms")
+            logger.info(f"[PERFORMANCE] All keyset pages: {paged} rows in {all_pages_ms:.0f}ms")
+            logger.info(f"[PERFORMANCE] Batch get 500: {batch_get_ms:.1f}ms, batch update 500: {batch_update_ms:.1f}ms")
+            
+            assert paged == len(all_objects)
+            assert len(fetched["items"]) == 500
+            assert len(updated["items"]) == 500
+            assert first_page_ms < get_all_ms
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM game_data.world_objects WHERE object_id LIKE $1", prefix + '%')
+        
+        logger.info(f"[OK] Editor list pagination test passed")
+    
+    @pytest.mark.asyncio
+    async def test_websocket_fanout_500_clients(self):
+        """
+        시나리오: 500개 에디터 클라이언트에 pin_update 브로드캐스트 (1개는 느린 클라이언트)
+        1. 기존 방식: 연결마다 send_json을 순서대로 await (느린 클라이언트가 전체를 막음, 표본 10회로 측정)
+        2. 팬아웃 허브: 한 번 직렬화 후 연결별 큐에 넣고, 큐가 가득 찬 느린 클라이언트는 퇴출
+        3. 드래그 중 연속 업데이트는 flush 주기마다 마지막 상태 하나로 합쳐짐
+        """
+        import json
+        from app.ui.backend.websocket_hub import WebSocketHub
+        
+        client_count = 500
+        broadcast_count = 100
+        slow_delay = 0.05
+        
+        class SimulatedClient:
+            def __init__(self, delay: float = 0.0):
+                self.delay = delay
+                self.received = 0
+            
+            async def accept(self):
+                pass
+            
+            async def send_json(self, message):
+                await self.send_text(json.dumps(message))
+            
+            async def send_text(self, text):
+                await asyncio.sleep(self.delay)
+                self.received += 1
+            
+            async def close(self, code: int = 1000):
+                pass
+        
+        def make_clients():
+            return [SimulatedClient(slow_delay if i == 0 else 0.0) for i in range(client_count)]
+        
+        messages = [{"type": "pin_update", "data": {"pin_id": f"PIN_{i}", "x": i, "y": i}} for i in range(broadcast_count)]
+        
+        logger.info(f"[PERFORMANCE] Starting WebSocket fan-out test: {client_count} clients (1 slow), "
+                    f"{broadcast_count} broadcasts")
+        
+        # 기존 방식: 순차 send_json
+        legacy_clients = make_clients()
+        sample = messages[:10]
+        start = time.perf_counter()
+        for message in sample:
+            for client in legacy_clients:
+                await client.send_json(message)
+        legacy_ms = (time.perf_counter() - start) / len(sample) * 1000
+        
+        hub = WebSocketHub(queue_size=32, flush_interval=0.02)
+        clients = make_clients()
+        for client in clients:
+            await hub.connect(client)
+        
+        try:
+            publish_s = 0.0
+            start = time.perf_counter()
+            for message in messages:
+                publish_start = time.perf_counter()
+                hub.publish(message)
+                publish_s += time.perf_counter() - publish_start
+                await asyncio.sleep(0.002)
+            publish_ms = publish_s / len(messages) * 1000
+            
+            deadline = time.perf_counter() + 10
+            while any(client.received < len(messages) for client in clients[1:]) and time.perf_counter() < deadline:
+                await asyncio.sleep(0.01)
+            delivered_ms = (time.perf_counter() - start) * 1000
+            fast_delivered = all(client.received == len(messages) for client in clients[1:])
+            
+            # 드래그: 같은 핀 200회 업데이트 -> 주기마다 하나
+            before = clients[1].received
+            for x in range(200):
+                hub.publish({"type": "pin_update", "data": {"pin_id": "PIN_DRAG", "x": x}}, coalesce_key="pin_update:PIN_DRAG")
+                if x % 50 == 49:
+                    await asyncio.sleep(0.025)
+            await asyncio.sleep(0.1)
+            drag_sent = clients[1].received - before
+            
+            logger.info(f"[PERFORMANCE] Sequential send_json: {legacy_ms:.1f}ms/broadcast")
+            logger.info(f"[PERFORMANCE] Fan-out hub: publish {publish_ms:.2f}ms/broadcast, "
+                        f"{broadcast_count} broadcasts delivered in {delivered_ms:.0f}ms, evicted {hub.metrics.evicted}")
+            logger.info(f"[PERFORMANCE] Drag coalescing: 200 updates -> {drag_sent} messages per client")
+            
+            assert fast_delivered
+            assert hub.metrics.evicted == 1
+            assert drag_sent < 20
+            assert publish_ms < legacy_ms
+        finally:
+            await hub.close()
+        
+        logger.info(f"[OK] WebSocket fan-out test passed")
+    
+    @pytest.mark.asyncio
+    async def test_save_slot_snapshot_latency(self, db_with_templates, db_connection, test_session,
+                                              seed_session_entities):
+        """
+        시나리오: 엔티티 5k 세션 저장/불러오기
+        1. 전체 스냅샷 저장 (압축 bytea 하나)
+        2. 50개 엔티티 상태 변경 후 증분 저장 (바뀐 행만)
+        3. 저장 이후 상태를 망가뜨린 뒤 불러오기 (COPY 스테이징 + 병합)
+        """
+        from database.save_slot_store import SaveSlotStore
+        
+        session_id = test_session['session_id']
+        entity_count = 5000
+        changed_count = 50
+        owner = f"perf_{uuid.uuid4().hex[:8]}"
+        pool = await db_connection.pool
+        store = SaveSlotStore(db_connection)
+        
+        logger.info(f"[PERFORMANCE] Starting save slot test: {entity_count} entities, codec {store.codec}")
+        
+        _, entity_ids = await seed_session_entities(
+            entity_count,
+            stats={"hp": 100, "mp": 50},
+            inventory={"items": [{"item_id": "ITEM_BREAD_001", "quantity": 2}]}
+        )
+        
+        try:
+            # 1. 전체 스냅샷
+            start = time.perf_counter()
+            full = await store.save(session_id, 1, {"save_name": "perf"}, owner=owner)
+            full_ms = (time.perf_counter() - start) * 1000
+            
+            # 2. 증분 저장
+            async with pool.acquire() as conn:
+                await conn.execute("""
+                    UPDATE runtime_data.entity_states SET current_stats = '{"hp": 10, "mp": 50}'::jsonb
+                    WHERE runtime_entity_id = ANY($1::uuid[])
+                """, entity_ids[:changed_count])
+            start = time.perf_counter()
+            incremental = await store.save(session_id, 1, {"save_name": "perf"}, owner=owner)
+            incremental_ms = (time.perf_counter() - start) * 1000
+            
+            # 3. 불러오기 (저장 이후 변경 되돌림)
+            async with pool.acquire() as conn:
+                await conn.execute("""
+                    UPDATE runtime_data.entity_states SET current_stats = '{"hp": 1, "mp": 0}'::jsonb
+                    WHERE runtime_entity_id = ANY($1::uuid[])
+                """, entity_ids[:500])
+            start = time.perf_counter()
+            slot = await store.restore(1, owner=owner)
+            restore_ms = (time.perf_counter() - start) * 1000
+            
+            async with pool.acquire() as conn:
+                restored_hp = await conn.fetch("""
+                    SELECT current_stats->>'hp' AS hp, COUNT(*) AS n FROM runtime_data.entity_states
+                    WHERE session_id = $1 GROUP BY 1
+                """, session_id)
+            hp_counts = {row['hp']: row['n'] for row in restored_hp}
+            
+            logger.info(f"[PERFORMANCE] Full save: {full_ms:.0f}ms, {full['rows']} rows, {full['bytes'] / 1024:.0f} KiB")
+            logger.info(f"[PERFORMANCE] Incremental save: {incremental_ms:.0f}ms, "
+                        f"{incremental['rows']} rows, {incremental['bytes'] / 1024:.1f} KiB")
+            logger.info(f"[PERFORMANCE] Restore: {restore_ms:.0f}ms ({slot['snapshots']} snapshots)")
+            
+            assert full['kind'] == 'full' and incremental['kind'] == 'incremental'
+            assert incremental['rows'] == changed_count
+            assert incremental['bytes'] < full['bytes'] / 10
+            assert hp_counts == {'10': changed_count, '100': entity_count - changed_count}
+            assert restore_ms < 30000
+        finally:
+            async with pool.acquire() as conn:
+                await conn.execute("DELETE FROM runtime_data.save_slots WHERE owner = $1", owner)
+        
+        logger.info(f"[OK] Save slot snapshot test passed")
+    
+    @pytest.mark.asyncio
+    async def test_session_purge_latency(self, db_with_templates, db_connection, test_session,
+                                         seed_session_entities):
+        """
+        시나리오: 엔티티 5k 세션 종료
+        1. 엔티티 5k (런타임/참조/상태, 트리거로 cell_occupants 5k) 생성
+        2. session_storage로 세션 정리 (session_id 기준 집합 DELETE, 분할 테이블은 파티션 TRUNCATE 후 커밋 뒤 DROP)
+        """
+        from database.session_storage import SessionStorage
+        
+        session_id = test_session['session_id']
+        entity_count = 5000
+        pool = await db_connection.pool
+        storage = SessionStorage(db_connection)
+        
+        logger.info(f"[PERFORMANCE] Starting session purge test: {entity_count} entities")
+        
+        await seed_session_entities(entity_count, stats={"hp": 100})
+        
+        start = time.perf_counter()
+        reclaimed = await storage.purge(session_id)
+        purge_ms = (time.perf_counter() - start) * 1000
+        
+        async with pool.acquire() as conn:
+            remaining = await conn.fetchval(
+                "SELECT COUNT(*) FROM runtime_data.runtime_entities WHERE session_id = $1", session_id
+            )
+        
+        snapshot = storage.snapshot()
+        logger.info(f"[PERFORMANCE] Session purge: {purge_ms:.0f}ms, {sum(reclaimed.values())} rows "
+                    f"(partitioned: {snapshot['partitioned_tables']})")
+        
+        assert remaining == 0
+        assert reclaimed['runtime_data.runtime_entities'] == entity_count
+        assert purge_ms < 30000
+        
+        logger.info(f"[OK] Session purge test passed")
@@ -158,6 +158,23 @@ class TestTimeSystem:
         finally:
             await time_system.cleanup()
     
+    async def test_rng_for_is_order_independent(self):
+        """키별 난수는 시드/게임 분/키로 결정되어 뽑는 순서와 관계없이 재현됨"""
+        npc_ids = ["NPC_VILLAGER_001", "NPC_MERCHANT_001", "NPC_GOBLIN_001"]
+        time_system = TimeSystem(seed=42)
+        time_system.set_time(GameTime(day=1, hour=8, minute=0))
+        
+        forward = {npc_id: time_system.rng_for(npc_id).random() for npc_id in npc_ids}
+        backward = {npc_id: time_system.rng_for(npc_id).random() for npc_id in reversed(npc_ids)}
+        assert forward == backward
+        assert len(set(forward.values())) == len(npc_ids)
+        
+        # 다음 틱에는 다른 값
+        time_system.set_time(GameTime(day=1, hour=8, minute=1))
+        assert time_system.rng_for(npc_ids[0]).random() != forward[npc_ids[0]]
+        
+        logger.info("[OK] 키별 난수 재현 테스트 성공")
+    
     async def test_schedule_event(self, db_with_templates, test_session):
         """이벤트 스케줄링 테스트"""
         time_system = TimeSystem()
@@ -328,3 +345,85 @@ class TestTimeSystem:
         finally:
             await time_system.cleanup()
 
+    
+    async def test_scheduled_events_catch_up(self, db_with_templates, db_connection, test_session):
+        """가속 틱에서 건너뛴 분의 이벤트/반복 이벤트 실행 테스트"""
+        session_id = test_session if isinstance(test_session, str) else test_session['session_id']
+        time_system = TimeSystem()
+        await time_system.initialize()
+        
+        try:
+            time_system.set_time(GameTime(day=1, hour=10, minute=0))
+            
+            fired = []
+            
+            async def handler(event_data):
+                fired.append(event_data["name"])
+            
+            await time_system.schedule_event(
+                "once", "test", GameTime(day=1, hour=10, minute=7),
+                {"name": "once", "session_id": session_id}, handler=handler
+            )
+            await time_system.schedule_event(
+                "repeat", "test", GameTime(day=1, hour=10, minute=5),
+                {"name": "repeat", "session_id": session_id}, handler=handler, repeat_interval=10
+            )
+            cancelled_id = await time_system.schedule_event(
+                "cancelled", "test", GameTime(day=1, hour=10, minute=3),
+                {"name": "cancelled", "session_id": session_id}, handler=handler
+            )
+            await time_system.cancel_event(cancelled_id)
+            
+            # 한 번에 30분 진행 (10:05, 10:07, 10:15, 10:25 실행)
+            await time_system.advance_time(30)
+            await time_system._check_scheduled_events()
+            
+            assert fired == ["repeat", "once", "repeat", "repeat"]
+            assert len(time_system.get_scheduled_events()) == 1
+            assert time_system.next_event_time() == GameTime(day=1, hour=10, minute=35)
+            
+            logger.info("[OK] 스케줄 이벤트 따라잡기 테스트 성공")
+            
+        finally:
+            await time_system.cleanup()
+            # 실행된 이벤트 로그가 세션을 참조하므로 세션 정리 전에 삭제
+            pool = await db_connection.pool
+            async with pool.acquire() as conn:
+                await conn.execute(
+                    "DELETE FROM runtime_data.triggered_events WHERE session_id = $1", session_id
+                )
+
+    
+    async def test_custom_event_id_persistence(self, db_with_templates, test_session):
+        """UUID가 아닌 사용자 지정 event_id 이벤트 저장/복원 테스트"""
+        session_id = test_session if isinstance(test_session, str) else test_session['session_id']
+        time_system = TimeSystem()
+        await time_system.initialize()
+        restored = TimeSystem()
+        await restored.initialize()
+        
+        try:
+            await time_system.schedule_event(
+                "shop_open", "test", GameTime(day=1, hour=9, minute=0),
+                {"name": "shop_open", "session_id": session_id}, event_id="shop_open_daily"
+            )
+            await time_system.schedule_event(
+                "rain", "test", GameTime(day=1, hour=12, minute=0),
+                {"name": "rain", "session_id": session_id}
+            )
+            assert await time_system.save_scheduled_events(session_id) == 2
+            
+            assert await restored.load_scheduled_events(session_id) == 2
+            events = {event.event_id: event for event in restored.get_scheduled_events()}
+            assert "shop_open_daily" in events
+            assert "_event_id" not in events["shop_open_daily"].event_data
+            
+            # UUID가 아닌 세션 ID는 오류 없이 저장/복원하지 않음
+            assert await time_system.save_scheduled_events("not-a-session") == 0
+            assert await restored.load_scheduled_events("not-a-session") == 0
+            
+            logger.info("[OK] 사용자 지정 이벤트 ID 저장/복원 테스트 성공")
+            
+        finally:
+            await time_system.cleanup()
+            await restored.cleanup()